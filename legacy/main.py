@@ -1,6 +1,7 @@
 import sys
 import os
 import logging
+import multiprocessing
 
 
 def configure_import_paths():
@@ -276,4 +277,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # The dictionary scanner starts worker processes; frozen builds need this
+    multiprocessing.freeze_support()
     main()
@@ -1,7 +1,7 @@
 import shutil
 import os
 from typing import TYPE_CHECKING, Any
-from PyQt6.QtCore import QSettings, QObject, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal
 from utils.path_helpers import get_settings_path
 from interfaces.settings_manager_interface import ISettingsManager
 from .construct_tab_settings import ConstructTabSettings
@@ -16,6 +16,7 @@ from .global_settings.global_settings import GlobalSettings
 from .visibility_settings.visibility_settings import VisibilitySettings
 from .codex_exporter_settings import CodexExporterSettings
 from .sequence_card_tab_settings import SequenceCardTabSettings
+from .settings_store import get_settings_store
 
 
 class LegacySettingsManager(
@@ -28,8 +29,8 @@ class LegacySettingsManager(
 
         self._ensure_settings_file_exists()
 
-        # Load settings
-        self.settings = QSettings(get_settings_path(), QSettings.Format.IniFormat)
+        # Load settings, held in memory and written to disk in the background
+        self.settings = get_settings_store(get_settings_path())
 
         # Load other settings categories
         self.global_settings = GlobalSettings(self)
@@ -83,6 +84,10 @@ class LegacySettingsManager(
         """Set a setting value in the specified section."""
         self.settings.setValue(f"{section}/{key}", value)
 
+    def batch(self):
+        """Context in which setting changes are written and reported once."""
+        return self.settings.batch()
+
     def get_global_settings(self):
         """Get the global settings object."""
         return self.global_settings
@@ -0,0 +1,161 @@
+import atexit
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from PyQt6.QtCore import QEvent, QObject, QSettings
+
+# Seconds between the first unsaved change and the write to disk. Changes
+# made in the meantime are written together.
+WRITE_DELAY = 0.5
+
+
+class SettingsStore(QObject):
+    """
+    The settings file, held in memory and written to disk behind the UI.
+
+    QSettings keeps its values in memory already, but rewrites the whole
+    file on the next pass of the event loop after every change, so
+    dragging a splitter or slider writes settings.ini dozens of times a
+    second on the GUI thread. The store decides when it is written
+    instead: a change marks it dirty and the file is written WRITE_DELAY
+    seconds later, on a timer thread, where QSettings saves it to a
+    temporary file and moves that into place.
+
+    Changes made inside batch() are written together and reported to
+    observers as one set of changes. The store answers the QSettings calls
+    the settings classes make (value, setValue, remove, contains and
+    sync), so it stands in for the QSettings they were given before.
+    """
+
+    def __init__(self, path: str, write_delay: float = WRITE_DELAY) -> None:
+        super().__init__()
+        self.path = path
+        self.write_delay = write_delay
+        self.settings = QSettings(path, QSettings.Format.IniFormat)
+        self.settings.installEventFilter(self)
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._batch_depth = 0
+        self._batch_changes: dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._observers: list[Callable[[dict[str, Any]], None]] = []
+        atexit.register(self.flush)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        # QSettings asks for its own write after a change; the store's
+        # timer takes care of that
+        return event.type() == QEvent.Type.UpdateRequest
+
+    def value(
+        self, key: str, defaultValue: Any = None, type: Optional[type] = None
+    ) -> Any:
+        if type is None:
+            return self.settings.value(key, defaultValue)
+        return self.settings.value(key, defaultValue, type=type)
+
+    def setValue(self, key: str, value: Any) -> None:
+        with self._lock:
+            self.settings.setValue(key, value)
+        self._changed(key, value)
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self.settings.remove(key)
+        self._changed(key, None)
+
+    def contains(self, key: str) -> bool:
+        return self.settings.contains(key)
+
+    def sync(self) -> None:
+        """Write any unsaved changes now, as QSettings.sync() does."""
+        self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator["SettingsStore"]:
+        """
+        Group changes, such as those made while a control is dragged, into
+        one write and one notification when the outermost batch ends.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                changes = {}
+                if self._batch_depth == 0:
+                    changes, self._batch_changes = self._batch_changes, {}
+                    if changes:
+                        self._schedule_flush()
+            if changes:
+                self._notify_observers(changes)
+
+    def flush(self) -> None:
+        """Write any unsaved changes to the file now."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+            # Every QSettings for a file shares its unsaved changes, so one
+            # made on this thread writes those made through self.settings
+            writer = QSettings(self.path, QSettings.Format.IniFormat)
+            writer.sync()
+            if writer.status() != QSettings.Status.NoError:
+                with self._lock:
+                    self._dirty = True
+                raise OSError(f"Could not write settings to {self.path}")
+
+    def register_observer(self, callback: Callable[[dict[str, Any]], None]) -> None:
+        """
+        Call callback with the changed keys and their new values (None for
+        removed keys) after every change, or once per batch.
+        """
+        if callback not in self._observers:
+            self._observers.append(callback)
+
+    def unregister_observer(
+        self, callback: Callable[[dict[str, Any]], None]
+    ) -> None:
+        """Remove an observer."""
+        if callback in self._observers:
+            self._observers.remove(callback)
+
+    def _changed(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._dirty = True
+            if self._batch_depth:
+                self._batch_changes[key] = value
+                return
+            self._schedule_flush()
+        self._notify_observers({key: value})
+
+    def _schedule_flush(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self.write_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _notify_observers(self, changes: dict[str, Any]) -> None:
+        for callback in list(self._observers):
+            callback(changes)
+
+
+_stores: dict[str, SettingsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_settings_store(path: str) -> SettingsStore:
+    """Return the process-wide store for the settings file at path."""
+    key = os.path.normcase(os.path.abspath(path))
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = SettingsStore(path)
+        return _stores[key]
@@ -58,8 +58,9 @@ class VisibilitySettings:
 
         # Prevent turning off both colors
         if not visible and not self.get_motion_visibility(other_color):
-            self.settings.setValue(f"visibility/{color}_motion", False)
-            self.settings.setValue(f"visibility/{other_color}_motion", True)
+            with self.settings.batch():
+                self.settings.setValue(f"visibility/{color}_motion", False)
+                self.settings.setValue(f"visibility/{other_color}_motion", True)
             return
 
         # Normal case
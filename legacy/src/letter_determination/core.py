@@ -23,15 +23,21 @@ class LetterDeterminer:
         self.json_handler = LetterDeterminationJsonHandler(json_manager)
         self.comparator = MotionComparator(pictograph_dataset)
         self.attribute_manager = AttributeManager(self.json_handler)
-
-        self.strategies = [DualFloatStrategy, NonHybridShiftStrategy]
+        self.strategies = self._create_strategies()
 
     def update_pictograph_dataset(
         self, pictograph_dataset: dict[Letter, list[dict]]
     ) -> None:
-        """Update the pictograph dataset and refresh the comparator."""
+        """Update the pictograph dataset and refresh the comparator and its index."""
         self.pictograph_dataset = pictograph_dataset
         self.comparator = MotionComparator(pictograph_dataset)
+        self.strategies = self._create_strategies()
+
+    def _create_strategies(self) -> list["LetterDeterminationStrategy"]:
+        return [
+            DualFloatStrategy(self.comparator, self.attribute_manager),
+            NonHybridShiftStrategy(self.comparator, self.attribute_manager),
+        ]
 
     def determine_letter(
         self, pictograph_data: dict, swap_prop_rot_dir: bool = False
@@ -44,11 +50,7 @@ class LetterDeterminer:
         ):
             return None
 
-        for strategy_class in self.strategies:
-            strategy: "LetterDeterminationStrategy" = strategy_class(
-                self.comparator, self.attribute_manager
-            )
-
+        for strategy in self.strategies:
             if strategy.applies_to(pictograph_data):
                 letter: Letter = strategy.execute(
                     pictograph_data, swap_prop_rot_dir=swap_prop_rot_dir
@@ -94,11 +96,10 @@ class LetterDeterminer:
         pictograph_data_copy[RED_ATTRS] = red_copy
         pictograph_data_copy[BLUE_ATTRS] = blue_copy
 
-        for letter, examples in self.pictograph_dataset.items():
-            for example in examples:
-                if self.comparator.compare(pictograph_data, example):
-                    logger.debug(f"Fallback search found match: {letter}")
-                    return letter
+        letter = self.comparator.find_letter(pictograph_data)
+        if letter is not None:
+            logger.debug(f"Fallback search found match: {letter}")
+            return letter
 
         logger.debug("Fallback search: no matches found")
         return None
@@ -0,0 +1,137 @@
+from typing import Hashable, Optional
+
+from data.constants import (
+    BLUE_ATTRS,
+    END_LOC,
+    END_POS,
+    FLOAT,
+    MOTION_TYPE,
+    PROP_ROT_DIR,
+    RED_ATTRS,
+    START_LOC,
+    START_POS,
+)
+from enums.letter.letter import Letter
+
+
+def freeze_attributes(attrs: dict) -> tuple:
+    """Hashable form of a motion's attributes; equal dicts freeze equally."""
+    return tuple(sorted(attrs.items()))
+
+
+def shift_references(example: dict) -> tuple[dict, dict]:
+    """
+    The example motions a float and its shift are compared against.
+
+    Returns (reference_for_float, reference_for_non_float).
+    """
+    example_blue = example[BLUE_ATTRS]
+    example_red = example[RED_ATTRS]
+    reference_for_non_float = (
+        example_blue if example_red[MOTION_TYPE] == FLOAT else example_red
+    )
+    reference_for_float = (
+        example_blue if reference_for_non_float == example_red else example_red
+    )
+    return reference_for_float, reference_for_non_float
+
+
+def shift_key(
+    float_start_loc, float_end_loc, float_rot_dir, float_motion_type, non_float: dict
+) -> tuple:
+    """
+    Key for float/shift matching. The shift's prop rot dir is left out
+    because an OPP direction inverts it; callers check it per candidate.
+    """
+    return (
+        float_start_loc,
+        float_end_loc,
+        float_rot_dir,
+        float_motion_type,
+        non_float.get(START_LOC),
+        non_float.get(END_LOC),
+        non_float.get(MOTION_TYPE),
+    )
+
+
+class LetterIndex:
+    """
+    Hash indexes over the pictograph dataset, built once per dataset.
+
+    Letter lookups used to scan every example of every letter. Each index
+    maps the attributes a comparison checks for equality to the examples
+    that have them, in dataset order, so a lookup returns the same letter
+    the scan would have found first.
+
+    - by_motion_types: (start_pos, end_pos, blue motion type, red motion
+      type) to the first example with them
+    - by_attributes: the frozen blue and red attributes to the first
+      example with them
+    - by_shift: shift_key of an example's float and shift references to
+      every example with it
+    """
+
+    def __init__(self, dataset: dict[Letter, list[dict]]):
+        self.by_motion_types: dict[tuple, tuple[int, Letter]] = {}
+        self.by_attributes: dict[tuple, tuple[int, Letter]] = {}
+        self.by_shift: dict[tuple, list[tuple[Letter, dict]]] = {}
+
+        position = 0
+        for letter, examples in dataset.items():
+            for example in examples:
+                blue, red = example[BLUE_ATTRS], example[RED_ATTRS]
+                self._add_first(
+                    self.by_motion_types,
+                    (
+                        example.get(START_POS),
+                        example.get(END_POS),
+                        blue.get(MOTION_TYPE),
+                        red.get(MOTION_TYPE),
+                    ),
+                    position,
+                    letter,
+                )
+                self._add_first(
+                    self.by_attributes,
+                    (freeze_attributes(blue), freeze_attributes(red)),
+                    position,
+                    letter,
+                )
+
+                reference_for_float, reference_for_non_float = shift_references(
+                    example
+                )
+                key = shift_key(
+                    reference_for_float.get(START_LOC),
+                    reference_for_float.get(END_LOC),
+                    reference_for_float.get(PROP_ROT_DIR),
+                    reference_for_float.get(MOTION_TYPE),
+                    reference_for_non_float,
+                )
+                self.by_shift.setdefault(key, []).append((letter, example))
+                position += 1
+        self.size = position
+
+    @staticmethod
+    def _add_first(index: dict, key: Hashable, position: int, letter: Letter):
+        if key not in index:
+            index[key] = (position, letter)
+
+    def first_match(
+        self, motion_types_key: tuple, attributes_key: tuple
+    ) -> Optional[Letter]:
+        """The earliest example matching either key, or None."""
+        matches = [
+            match
+            for match in (
+                self.by_motion_types.get(motion_types_key),
+                self.by_attributes.get(attributes_key),
+            )
+            if match is not None
+        ]
+        if not matches:
+            return None
+        return min(matches, key=lambda match: match[0])[1]
+
+    def shift_candidates(self, key: tuple) -> list[tuple[Letter, dict]]:
+        return self.by_shift.get(key, [])
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from data.constants import (
     ANTI,
     BLUE_ATTRS,
@@ -15,21 +17,67 @@ from data.constants import (
     START_LOC,
     START_POS,
 )
+from enums.letter.letter import Letter
+from .letter_index import LetterIndex, freeze_attributes, shift_key
 
 
 class MotionComparator:
     def __init__(self, dataset: dict[str, list[dict]]):
         self.dataset = dataset
+        self.index = LetterIndex(dataset)
+
+    def find_letter(self, pictograph_data: dict) -> Optional[Letter]:
+        """
+        Return the letter of the first example, in dataset order, that
+        compare() matches, using the index instead of scanning the dataset.
+        """
+        blue_copy, red_copy, blue_motion_type, red_motion_type = (
+            self._prefloat_copies(pictograph_data)
+        )
+        try:
+            return self.index.first_match(
+                (
+                    pictograph_data[START_POS],
+                    pictograph_data[END_POS],
+                    blue_motion_type,
+                    red_motion_type,
+                ),
+                (freeze_attributes(blue_copy), freeze_attributes(red_copy)),
+            )
+        except TypeError:  # Unhashable attribute values
+            for letter, examples in self.dataset.items():
+                for example in examples:
+                    if self.compare(pictograph_data, example):
+                        return letter
+            return None
+
+    def shift_candidates(
+        self, float_attrs: dict, non_float_attrs: dict
+    ) -> list[tuple[Letter, dict]]:
+        """
+        Examples, in dataset order, whose float and shift references share
+        the float's prefloat motion and the shift's locations and motion type.
+        """
+        key = shift_key(
+            float_attrs[START_LOC],
+            float_attrs[END_LOC],
+            float_attrs[PREFLOAT_PROP_ROT_DIR],
+            float_attrs[PREFLOAT_MOTION_TYPE],
+            non_float_attrs,
+        )
+        try:
+            return self.index.shift_candidates(key)
+        except TypeError:  # Unhashable attribute values
+            return [
+                (letter, example)
+                for letter, examples in self.dataset.items()
+                for example in examples
+            ]
 
     def compare(self, pictograph_data: dict, example: dict) -> bool:
-        blue_attrs, red_attrs = pictograph_data[BLUE_ATTRS], pictograph_data[RED_ATTRS]
-        blue_copy, red_copy = blue_attrs.copy(), red_attrs.copy()
-
-        self._update_prefloat_attrs(blue_attrs, red_attrs, blue_copy, red_copy)
-        self._update_prefloat_attrs(red_attrs, blue_attrs, red_copy, blue_copy)
-
-        red_motion_type = self._get_motion_type(red_copy)
-        blue_motion_type = self._get_motion_type(blue_copy)
+        blue_copy, red_copy, blue_motion_type, red_motion_type = (
+            self._prefloat_copies(pictograph_data)
+        )
 
         if (
             pictograph_data[START_POS] == example[START_POS]
@@ -43,6 +91,21 @@ class MotionComparator:
 
         return example[BLUE_ATTRS] == blue_copy and example[RED_ATTRS] == red_copy
 
+    def _prefloat_copies(self, pictograph_data: dict) -> tuple[dict, dict, str, str]:
+        """Copies of both motions with prefloat attributes, and their motion types."""
+        blue_attrs, red_attrs = pictograph_data[BLUE_ATTRS], pictograph_data[RED_ATTRS]
+        blue_copy, red_copy = blue_attrs.copy(), red_attrs.copy()
+
+        self._update_prefloat_attrs(blue_attrs, red_attrs, blue_copy, red_copy)
+        self._update_prefloat_attrs(red_attrs, blue_attrs, red_copy, blue_copy)
+
+        return (
+            blue_copy,
+            red_copy,
+            self._get_motion_type(blue_copy),
+            self._get_motion_type(red_copy),
+        )
+
     def _update_prefloat_attrs(self, attrs, other_attrs, copy, other_copy):
         if attrs[MOTION_TYPE] == FLOAT:
             copy[PREFLOAT_MOTION_TYPE] = other_attrs[MOTION_TYPE]
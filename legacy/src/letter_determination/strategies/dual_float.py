@@ -29,12 +29,8 @@ class DualFloatStrategy(LetterDeterminationStrategy):
         )
 
     def _match_exact(self, pictograph_data: dict) -> DeterminationResult:
-        """Mirror original example-by-example matching"""
-        for letter, examples in self.comparator.dataset.items():
-            for example in examples:
-                if self.comparator.compare(pictograph_data, example):
-                    return letter
-        return None
+        """Mirror original example-by-example matching, through the index"""
+        return self.comparator.find_letter(pictograph_data)
 
     def applies_to(self, pictograph: dict) -> bool:
         """This strategy only applies when both motions are FLOAT and have valid attributes."""
@@ -21,6 +21,7 @@ from data.constants import (
     START_LOC,
 )
 from letter_determination.determination_result import DeterminationResult
+from letter_determination.services.letter_index import shift_references
 from letter_determination.strategies.base_strategy import LetterDeterminationStrategy
 
 
@@ -112,12 +113,11 @@ class NonHybridShiftStrategy(LetterDeterminationStrategy):
         non_float_attrs: dict,
     ) -> Optional[str]:
         """Match using prefloat-aware comparison"""
-        for letter, examples in self.comparator.dataset.items():
-            for example in examples:
-                if self._matches_example(
-                    pictograph, float_attr, non_float_attrs, example
-                ):
-                    return letter
+        for letter, example in self.comparator.shift_candidates(
+            float_attr, non_float_attrs
+        ):
+            if self._matches_example(pictograph, float_attr, non_float_attrs, example):
+                return letter
         return None
 
     def _matches_example(
@@ -129,17 +129,8 @@ class NonHybridShiftStrategy(LetterDeterminationStrategy):
     ) -> bool:
         """Corrected comparison logic that avoids searching for FLOAT in examples"""
 
-        # Get example components (neither will be FLOAT)
-        example_blue = example[BLUE_ATTRS]
-        example_red = example[RED_ATTRS]
-
         # Identify the shift motion in the example (since it has no floats)
-        reference_for_non_float = (
-            example_blue if example_red[MOTION_TYPE] == FLOAT else example_red
-        )
-        reference_for_float = (
-            example_blue if reference_for_non_float == example_red else example_red
-        )
+        reference_for_float, reference_for_non_float = shift_references(example)
 
         # Ensure we are comparing the float motion against the example’s shift motion
         float_match = (
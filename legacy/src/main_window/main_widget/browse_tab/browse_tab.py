@@ -20,6 +20,8 @@ from .deletion_handler.browse_tab_deletion_handler import BrowseTabDeletionHandl
 from .browse_tab_selection_handler import BrowseTabSelectionHandler
 from .sequence_viewer.sequence_viewer import SequenceViewer
 from .browse_tab_state import BrowseTabState
+from .dictionary_scan_worker import DictionaryScanWorker
+from src.legacy_settings_manager.global_settings.app_context import AppContext
 
 if TYPE_CHECKING:
     from main_window.main_widget.main_widget import MainWidget
@@ -56,6 +58,13 @@ class BrowseTab(QWidget):
         self.state = BrowseTabState(self.browse_settings)
         self.metadata_extractor = MetaDataExtractor()
 
+        # Index any new or changed thumbnails in the background so filtering
+        # and sorting never have to open PNGs on the GUI thread
+        self.scan_worker = DictionaryScanWorker(self)
+        self._initialization_pending = False
+        self.scan_worker.finished.connect(self._on_metadata_scan_finished)
+        self.scan_worker.start()
+
         self.ui_updater = BrowseTabUIUpdater(self)
 
         self.filter_manager = BrowseTabFilterManager(self)
@@ -81,6 +90,7 @@ class BrowseTab(QWidget):
         self.get = BrowseTabGetter(self)
 
         self.persistence_manager = BrowseTabPersistenceManager(self)
+        self.scan_worker.progress.connect(self._on_metadata_scan_progress)
 
         # FILTER RESPONSIVENESS FIX: Simple deferred initialization
         QTimer.singleShot(100, self._complete_initialization)
@@ -193,6 +203,12 @@ class BrowseTab(QWidget):
 
         logger = logging.getLogger(__name__)
 
+        if self.scan_worker.isRunning():
+            # Restore the saved filter once the metadata index is warm
+            self._initialization_pending = True
+            return
+        self._initialization_pending = False
+
         try:
             # Apply saved browse state
             self.persistence_manager.apply_saved_browse_state()
@@ -222,6 +238,20 @@ class BrowseTab(QWidget):
             except:
                 pass
 
+    def _on_metadata_scan_progress(self, indexed: int, total: int):
+        progress_bar = self.sequence_picker.progress_bar
+        if indexed < total:
+            progress_bar.set_value(int(indexed / total * 100))
+            progress_bar.show()
+        else:
+            progress_bar.hide()
+
+    def _on_metadata_scan_finished(self):
+        AppContext.dictionary_data_manager().reload()
+        self.sequence_picker.filter_stack.author_section.refresh_authors()
+        if self._initialization_pending:
+            self._complete_initialization()
+
     def _simple_activation(self):
         """
         Simple, safe activation to ensure filter buttons work.
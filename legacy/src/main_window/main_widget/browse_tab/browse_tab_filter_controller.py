@@ -23,6 +23,7 @@ class BrowseTabFilterController:
             # Fallback: try direct access for backward compatibility
             self.fade_manager = getattr(browse_tab.main_widget, "fade_manager", None)
         self.metadata_extractor = browse_tab.metadata_extractor
+        self.metadata_index = self.metadata_extractor.index
 
     def apply_filter(self, filter_criteria: Union[str, dict], fade=True):
         # FILTER RESPONSIVENESS FIX: Check actual current tab state, not just settings
@@ -246,17 +247,11 @@ class BrowseTabFilterController:
         ]
 
     def _dict_filter_length(self, length_value):
-        base_words = self._base_words()
-        fm = self.filter_manager
         try:
             target_length = int(length_value)
         except ValueError:
             raise ValueError(f"Invalid length '{length_value}'; expected integer.")
-        return [
-            (word, thumbs, fm._get_sequence_length(thumbs[0]))
-            for word, thumbs in base_words
-            if fm._get_sequence_length(thumbs[0]) == target_length
-        ]
+        return self._filter_by_record(lambda record: record.length == target_length)
 
     def _dict_filter_level(self, level_value):
         base_words = self._base_words()
@@ -276,22 +271,11 @@ class BrowseTabFilterController:
         return results
 
     def _dict_filter_author(self, author_value):
-        base_words = self._base_words()
-        fm = self.filter_manager
-        return [
-            (w, t, fm._get_sequence_length(t[0]))
-            for w, t in base_words
-            if self.metadata_extractor.get_author(t[0]) == author_value
-        ]
+        return self._filter_by_record(lambda record: record.author == author_value)
 
     def _dict_filter_starting_pos(self, pos_value):
-        base_words = self._base_words()
-        fm = self.filter_manager
-        result = []
-        for w, t in base_words:
-            if self.metadata_extractor.get_start_pos(t[0]) == pos_value.lower():
-                result.append((w, t, fm._get_sequence_length(t[0])))
-        return result
+        pos_value = pos_value.lower()
+        return self._filter_by_record(lambda record: record.start_pos == pos_value)
 
     def _dict_filter_favorites(self, _unused):
         return self.filter_manager.filter_favorites()
@@ -300,17 +284,23 @@ class BrowseTabFilterController:
         return self.filter_manager.filter_most_recent()
 
     def _dict_filter_grid_mode(self, grid_mode_value):
-        base_words = self._base_words()
-        fm = self.filter_manager
-        return [
-            (w, t, fm._get_sequence_length(t[0]))
-            for w, t in base_words
-            if self.metadata_extractor.get_grid_mode(t[0]) == grid_mode_value
-        ]
+        return self._filter_by_record(
+            lambda record: record.grid_mode == grid_mode_value
+        )
 
     def _dict_filter_show_all(self, _unused):
         return self.filter_manager.filter_all_sequences()
 
+    def _filter_by_record(self, predicate) -> list[tuple[str, list[str], int]]:
+        """Filter base words on the indexed metadata of their first thumbnail."""
+        base_words = self._base_words()
+        records = self.metadata_index.records(thumbs[0] for _, thumbs in base_words)
+        return [
+            (word, thumbs, records[thumbs[0]].length)
+            for word, thumbs in base_words
+            if predicate(records[thumbs[0]])
+        ]
+
     def _base_words(self) -> list[tuple[str, list[str]]]:
         all_words = self.browse_tab.get.base_words()
         base_words = []
@@ -0,0 +1,22 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from main_window.main_widget.dictionary_scanner import DictionaryScanner
+
+
+class DictionaryScanWorker(QThread):
+    """Runs the dictionary metadata scan off the GUI thread."""
+
+    batch_indexed = pyqtSignal(list)  # thumbnail paths
+    progress = pyqtSignal(int, int)  # indexed, total
+
+    def __init__(self, parent=None, scanner: DictionaryScanner = None):
+        super().__init__(parent)
+        self.scanner = scanner or DictionaryScanner()
+
+    def run(self):
+        stale = self.scanner.stale_thumbnails()
+        indexed = 0
+        for batch in self.scanner.scan(stale):
+            indexed += len(batch)
+            self.batch_indexed.emit(batch)
+            self.progress.emit(indexed, len(stale))
@@ -1,11 +1,10 @@
 # data_manager.py
 import os
-import json
 from datetime import datetime
 from typing import Optional
 from dataclasses import dataclass, field
 
-from PIL import Image
+from main_window.main_widget.metadata_index import get_metadata_index
 from utils.path_helpers import get_data_path
 
 
@@ -28,6 +27,11 @@ class DictionaryDataManager:
     _has_loaded: bool = field(default=False, init=False)
 
     def load_all_sequences(self) -> None:
+        """
+        Build the records from the metadata index. Thumbnails the index has
+        not caught up with yet have no metadata until reload() is called
+        after the browse tab's background scan has finished.
+        """
         if self._has_loaded:
             return
         dictionary_dir = get_data_path("dictionary")
@@ -62,6 +66,11 @@ class DictionaryDataManager:
 
         self._has_loaded = True
 
+    def reload(self) -> None:
+        """Forget the records so the next query rebuilds them from the index."""
+        self._loaded_records = []
+        self._has_loaded = False
+
     def _find_thumbnails(self, folder: str) -> list[str]:
         """
         Your existing logic to find .png / .jpg / etc.
@@ -87,48 +96,45 @@ class DictionaryDataManager:
         first_thumb = thumbnails[0]
         meta_dict = {}
         try:
-            with Image.open(first_thumb) as im:
-                info = im.info
-                metadata_json = info.get("metadata")
-                if metadata_json:
-                    metadata: dict = json.loads(metadata_json)
-                    raw = metadata.get("sequence", {})[0]
-                    # e.g. raw = {"author": "Bob", "level": 2, "date_added": "2023-12-01T10:00:00", ...}
-                    meta_dict["author"] = raw.get("author")
-                    meta_dict["grid_mode"] = raw.get("grid_mode")
-                    meta_dict["level"] = raw.get("level")
-                    meta_dict["is_favorite"] = raw.get("is_favorite")
-
-                    date_str = raw.get("date_added")
-                    if date_str:
-                        try:
-                            meta_dict["date_added"] = datetime.fromisoformat(date_str)
-                        except ValueError:
-                            meta_dict["date_added"] = None
-
-                    # Extract sequence details
-                    sequence = raw.get("sequence", [])
-                    if sequence:
-                        first_sequence = sequence[0]
-                        meta_dict["word"] = first_sequence.get("word")
-                        meta_dict["prop_type"] = first_sequence.get("prop_type")
-                        meta_dict["is_circular"] = first_sequence.get("is_circular")
-                        meta_dict["can_be_CAP"] = first_sequence.get("can_be_CAP")
-                        meta_dict["is_strict_rotational_CAP"] = first_sequence.get(
-                            "is_strict_rotational_CAP"
-                        )
-                        meta_dict["is_strict_mirrored_CAP"] = first_sequence.get(
-                            "is_strict_mirrored_CAP"
-                        )
-                        meta_dict["is_strict_swapped_CAP"] = first_sequence.get(
-                            "is_strict_swapped_CAP"
-                        )
-                        meta_dict["is_mirrored_swapped_CAP"] = first_sequence.get(
-                            "is_mirrored_swapped_CAP"
-                        )
-                        meta_dict["is_rotational_swapped_CAP"] = first_sequence.get(
-                            "is_rotational_swapped_CAP"
-                        )
+            metadata = get_metadata_index().indexed_metadata(first_thumb)
+            if metadata:
+                raw = metadata.get("sequence", {})[0]
+                # e.g. raw = {"author": "Bob", "level": 2, "date_added": "2023-12-01T10:00:00", ...}
+                meta_dict["author"] = raw.get("author")
+                meta_dict["grid_mode"] = raw.get("grid_mode")
+                meta_dict["level"] = raw.get("level")
+                meta_dict["is_favorite"] = raw.get("is_favorite")
+
+                date_str = raw.get("date_added")
+                if date_str:
+                    try:
+                        meta_dict["date_added"] = datetime.fromisoformat(date_str)
+                    except ValueError:
+                        meta_dict["date_added"] = None
+
+                # Extract sequence details
+                sequence = raw.get("sequence", [])
+                if sequence:
+                    first_sequence = sequence[0]
+                    meta_dict["word"] = first_sequence.get("word")
+                    meta_dict["prop_type"] = first_sequence.get("prop_type")
+                    meta_dict["is_circular"] = first_sequence.get("is_circular")
+                    meta_dict["can_be_CAP"] = first_sequence.get("can_be_CAP")
+                    meta_dict["is_strict_rotational_CAP"] = first_sequence.get(
+                        "is_strict_rotational_CAP"
+                    )
+                    meta_dict["is_strict_mirrored_CAP"] = first_sequence.get(
+                        "is_strict_mirrored_CAP"
+                    )
+                    meta_dict["is_strict_swapped_CAP"] = first_sequence.get(
+                        "is_strict_swapped_CAP"
+                    )
+                    meta_dict["is_mirrored_swapped_CAP"] = first_sequence.get(
+                        "is_mirrored_swapped_CAP"
+                    )
+                    meta_dict["is_rotational_swapped_CAP"] = first_sequence.get(
+                        "is_rotational_swapped_CAP"
+                    )
         except FileNotFoundError:
             print(f"[WARNING] Thumbnail not found: {first_thumb}")
         except Exception as e:
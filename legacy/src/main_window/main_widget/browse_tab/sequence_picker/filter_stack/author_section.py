@@ -40,6 +40,22 @@ class AuthorSection(FilterSectionBase):
 
         layout: QVBoxLayout = self.layout()
 
+        self.grid_layout = QGridLayout()
+        self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.grid_layout.setHorizontalSpacing(20)
+        self.grid_layout.setVerticalSpacing(20)
+        self.refresh_authors()
+
+        layout.addLayout(self.grid_layout)
+        layout.addStretch(1)
+
+    def refresh_authors(self):
+        """
+        Rebuild the author buttons from the data manager, e.g. once the
+        background dictionary scan has indexed authors it had not seen yet.
+        """
+        self._clear_author_grid()
+
         # Using the new data manager:
         data_manager = AppContext.dictionary_data_manager()
         all_authors = data_manager.get_distinct_authors()
@@ -50,23 +66,27 @@ class AuthorSection(FilterSectionBase):
             these_records = data_manager.get_records_by_author(author)
             self.sequence_counts[author] = len(these_records)
 
-        grid_layout = QGridLayout()
-        grid_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        grid_layout.setHorizontalSpacing(20)
-        grid_layout.setVerticalSpacing(20)
-
         row, col = 0, 0
         for author in sorted(self.sequence_counts.keys()):
             vbox = self._create_author_vbox(author)
-            grid_layout.addLayout(vbox, row, col)
+            self.grid_layout.addLayout(vbox, row, col)
 
             col += 1
             if col >= self.MAX_COLUMNS:
                 col = 0
                 row += 1
 
-        layout.addLayout(grid_layout)
-        layout.addStretch(1)
+    def _clear_author_grid(self):
+        while self.grid_layout.count():
+            vbox = self.grid_layout.takeAt(0).layout()
+            while vbox.count():
+                widget = vbox.takeAt(0).widget()
+                if widget is not None:
+                    widget.deleteLater()
+            vbox.deleteLater()
+        self.buttons.clear()
+        self.tally_labels.clear()
+        self.sequence_counts.clear()
 
     def _create_author_vbox(self, author: str) -> QVBoxLayout:
         vbox = QVBoxLayout()
@@ -93,6 +113,8 @@ class AuthorSection(FilterSectionBase):
         seq_text = "sequence" if count == 1 else "sequences"
         lbl = QLabel(f"{count} {seq_text}")
         lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Match the font color already applied to the section
+        lbl.setStyleSheet(self.header_label.styleSheet())
         self.tally_labels[author] = lbl
         return lbl
 
@@ -1,10 +1,9 @@
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING
 from enums.letter.letter_type import LetterType
 from main_window.main_widget.metadata_extractor import MetaDataExtractor
+from main_window.main_widget.metadata_index import get_metadata_index
 from ..browse_tab_section_header import BrowseTabSectionHeader
-from PIL import Image
 
 if TYPE_CHECKING:
     from .sequence_picker import SequencePicker
@@ -108,25 +107,14 @@ class SequencePickerSectionManager:
 
     def get_date_added(self, thumbnails):
         dates = []
-        for thumbnail in thumbnails:
-            try:
-                image = Image.open(thumbnail)
-                info = image.info
-                metadata = info.get("metadata")
-                if metadata:
-                    metadata_dict = json.loads(metadata)
-                    date_added = metadata_dict.get("date_added")
-                    if date_added:
-                        try:
-                            dates.append(datetime.fromisoformat(date_added))
-                        except ValueError:
-                            print(
-                                f"[WARNING] Could not parse date for {thumbnail}"
-                            )  # Added logging
-            except FileNotFoundError as e:
-                print(f"[WARNING] File not found: {thumbnail} - {e}")
-                continue 
-            except Exception as e:
-                print(f"[ERROR] An error occurred while processing {thumbnail}: {e}")
+        records = get_metadata_index().records(thumbnails)
+        for thumbnail, record in records.items():
+            if record.date_added:
+                try:
+                    dates.append(datetime.fromisoformat(record.date_added))
+                except ValueError:
+                    print(
+                        f"[WARNING] Could not parse date for {thumbnail}"
+                    )  # Added logging
 
         return max(dates, default=datetime.min)
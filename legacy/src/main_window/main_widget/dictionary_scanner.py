@@ -0,0 +1,123 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, Optional
+
+from main_window.main_widget.metadata_index import (
+    MetadataIndex,
+    ThumbnailRecord,
+    get_metadata_index,
+    parse_record,
+)
+from main_window.main_widget.thumbnail_finder import ThumbnailFinder
+from utils.path_helpers import get_data_path
+from utils.png_metadata import read_png_text
+
+BATCH_SIZE = 32
+# Below this many stale thumbnails, starting worker processes costs more
+# than reading the files in-process.
+PARALLEL_THRESHOLD = 96
+
+logger = logging.getLogger(__name__)
+
+
+ScannedThumbnail = tuple[str, int, int, Optional[str], ThumbnailRecord]
+
+
+def read_thumbnail_batch(paths: list[str]) -> list[ScannedThumbnail]:
+    """
+    Read and parse the embedded metadata of a batch of thumbnails.
+
+    Runs in a worker process and returns picklable tuples of
+    (path, mtime_ns, size, raw metadata, record). Each file is stat-ed before
+    it is read, so a file that changes mid-scan is re-read on next lookup.
+    """
+    results = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            raw = read_png_text(path, "metadata")
+            record = parse_record(raw)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read metadata from {path}: {e}")
+            continue
+        results.append((path, stat.st_mtime_ns, stat.st_size, raw, record))
+    return results
+
+
+class DictionaryScanner:
+    """
+    Brings the metadata index up to date with the dictionary folder.
+
+    Word folders are listed with ThumbnailFinder, thumbnails the index
+    already knows are skipped, and the remaining PNG text chunks are read by
+    a process pool. Results are indexed and yielded batch by batch so the
+    browse tab can consume them while the scan is still running.
+    """
+
+    def __init__(
+        self,
+        index: Optional[MetadataIndex] = None,
+        dictionary_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        batch_size: int = BATCH_SIZE,
+    ):
+        self.index = index or get_metadata_index()
+        self.dictionary_dir = dictionary_dir or get_data_path("dictionary")
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.thumbnail_finder = ThumbnailFinder()
+
+    def find_thumbnails(self) -> dict[str, list[str]]:
+        thumbnails = {}
+        for word in os.listdir(self.dictionary_dir):
+            word_dir = os.path.join(self.dictionary_dir, word)
+            if os.path.isdir(word_dir) and "__pycache__" not in word:
+                thumbnails[word] = self.thumbnail_finder.find_thumbnails(word_dir)
+        return thumbnails
+
+    def stale_thumbnails(
+        self, thumbnails_by_word: Optional[dict[str, list[str]]] = None
+    ) -> list[str]:
+        """Return every dictionary thumbnail that is missing from the index or out of date."""
+        if thumbnails_by_word is None:
+            thumbnails_by_word = self.find_thumbnails()
+        paths = [
+            path
+            for word_thumbnails in thumbnails_by_word.values()
+            for path in word_thumbnails
+            if path.lower().endswith(".png")
+        ]
+        return self.index.stale_paths(paths)
+
+    def scan(
+        self, stale: Optional[list[str]] = None, parallel: bool = True
+    ) -> Iterator[list[str]]:
+        """Index the stale thumbnails, yielding the paths of each finished batch."""
+        if stale is None:
+            stale = self.stale_thumbnails()
+        batches = [
+            stale[i : i + self.batch_size]
+            for i in range(0, len(stale), self.batch_size)
+        ]
+
+        if not parallel or len(stale) < PARALLEL_THRESHOLD or os.cpu_count() == 1:
+            for batch in batches:
+                yield self._ingest(read_thumbnail_batch(batch))
+            return
+
+        pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = [pool.submit(read_thumbnail_batch, batch) for batch in batches]
+            for future in as_completed(futures):
+                yield self._ingest(future.result())
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def run(self, parallel: bool = True) -> int:
+        """Scan to completion and return the number of thumbnails indexed."""
+        return sum(len(batch) for batch in self.scan(parallel=parallel))
+
+    def _ingest(self, scanned: list[ScannedThumbnail]) -> list[str]:
+        self.index.add_scanned(scanned)
+        return [scanned_thumbnail[0] for scanned_thumbnail in scanned]
@@ -4,7 +4,7 @@ from main_window.main_widget.generate_tab.circular.CAP_type import CAPType
 from PyQt6.QtWidgets import QApplication
 
 if TYPE_CHECKING:
-    from ..circular_sequence_builder import CircularSequenceBuilder
+    from ...sequence_generation_engine import SequenceGenerationEngine
 
 
 class CAPExecutor:
@@ -12,7 +12,7 @@ class CAPExecutor:
 
     CAP_TYPE: CAPType | None = None
 
-    def __init__(self, circular_sequence_generator: "CircularSequenceBuilder"):
+    def __init__(self, circular_sequence_generator: "SequenceGenerationEngine"):
         self.circular_sequence_generator = circular_sequence_generator
 
     def create_CAPs(self, sequence: list[dict], **kwargs):
@@ -1,7 +1,6 @@
 from data.constants import *
 from main_window.main_widget.generate_tab.circular.CAP_type import CAPType
 from .CAP_executor import CAPExecutor
-from PyQt6.QtWidgets import QApplication
 from data.locations import vertical_loc_mirror_map
 from data.positions_maps import mirrored_swapped_positions
 from enums.letter.complementary_letter_getter import ComplementaryLetterGetter
@@ -32,16 +31,6 @@ class MirroredComplementaryCAPExecutor(CAPExecutor):
             sequence.append(next_pictograph)
             last_entry = next_pictograph
 
-            # Add to UI
-            sequence_workbench = self.circular_sequence_generator.sequence_workbench
-            sequence_workbench.beat_frame.beat_factory.create_new_beat_and_add_to_sequence(
-                next_pictograph,
-                override_grow_sequence=True,
-                update_word=True,
-                update_image_export_preview=False,
-            )
-            QApplication.processEvents()
-
     def can_perform_CAP(self, sequence: list[dict]) -> bool:
         """Ensures that the sequence can be mirrored."""
         return (
@@ -63,9 +52,9 @@ class MirroredComplementaryCAPExecutor(CAPExecutor):
 
         new_entry = {
             BEAT: beat_number,
-            LETTER: ComplementaryLetterGetter().get_complimentary_letter(
-                previous_matching_beat[LETTER]
-            ),
+            LETTER: ComplementaryLetterGetter()
+            .get_complimentary_letter(previous_matching_beat[LETTER])
+            .value,
             START_POS: previous_entry[END_POS],
             END_POS: self.get_mirrored_position(previous_matching_beat),
             TIMING: previous_matching_beat[TIMING],
@@ -80,12 +69,12 @@ class MirroredComplementaryCAPExecutor(CAPExecutor):
 
         # Ensure orientations are set properly
         new_entry[BLUE_ATTRS][END_ORI] = (
-            self.circular_sequence_generator.json_manager.ori_calculator.calculate_end_ori(
+            self.circular_sequence_generator.ori_calculator.calculate_end_ori(
                 new_entry, BLUE
             )
         )
         new_entry[RED_ATTRS][END_ORI] = (
-            self.circular_sequence_generator.json_manager.ori_calculator.calculate_end_ori(
+            self.circular_sequence_generator.ori_calculator.calculate_end_ori(
                 new_entry, RED
             )
         )
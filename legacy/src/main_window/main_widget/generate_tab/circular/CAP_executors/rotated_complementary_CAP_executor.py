@@ -38,7 +38,6 @@ from data.CAP_executors.rotated_loc_maps import (
     loc_map_static,
     hand_rot_dir_map,
 )
-from PyQt6.QtWidgets import QApplication
 from enums.letter.complementary_letter_getter import ComplementaryLetterGetter
 
 from main_window.main_widget.generate_tab.circular.CAP_type import CAPType
@@ -47,16 +46,17 @@ from .CAP_executor import CAPExecutor
 from data.positions_maps import positions_map
 
 if TYPE_CHECKING:
-    from ..circular_sequence_builder import CircularSequenceBuilder
+    from ...sequence_generation_engine import SequenceGenerationEngine
 
 
 class RotatedComplementaryCAPExecutor(CAPExecutor):
 
-    def __init__(self, circular_sequence_generator: "CircularSequenceBuilder"):
+    def __init__(self, circular_sequence_generator: "SequenceGenerationEngine"):
         self.circular_sequence_generator = circular_sequence_generator
         self.hand_rot_dir_calculator = HandpathCalculator()
 
     def create_CAPs(self, sequence: list[dict]):
+        slice_size = self.get_slice_size(sequence)
         start_position_entry = (
             sequence.pop(0) if SEQUENCE_START_POSITION in sequence[0] else None
         )
@@ -65,12 +65,9 @@ class RotatedComplementaryCAPExecutor(CAPExecutor):
 
         new_entries = []
         next_beat_number = last_entry[BEAT] + 1
-        slice_size = self.get_slice_size()
-
-        sequence_workbench = (
-            self.circular_sequence_generator.main_widget.sequence_workbench
+        entries_to_add = self.determine_how_many_entries_to_add(
+            sequence_length, slice_size
         )
-        entries_to_add = self.determine_how_many_entries_to_add(sequence_length)
         for _ in range(entries_to_add):
             next_pictograph = self.create_new_rotated_CAP_entry(
                 sequence,
@@ -82,50 +79,36 @@ class RotatedComplementaryCAPExecutor(CAPExecutor):
             new_entries.append(next_pictograph)
             sequence.append(next_pictograph)
 
-            sequence_workbench.beat_frame.beat_factory.create_new_beat_and_add_to_sequence(
-                next_pictograph,
-                override_grow_sequence=True,
-                update_word=True,
-                update_image_export_preview=False,
-            )
-            QApplication.processEvents()
-
             last_entry = next_pictograph
             next_beat_number += 1
 
-        sequence_workbench.current_word_label.update_current_word_label()
-
         if start_position_entry:
             start_position_entry[BEAT] = 0
             sequence.insert(0, start_position_entry)
 
-    def determine_how_many_entries_to_add(self, sequence_length: int) -> int:
-        if self.is_quartered_CAP():
+    def determine_how_many_entries_to_add(
+        self, sequence_length: int, slice_size: str
+    ) -> int:
+        if slice_size == "quartered":
             return sequence_length * 3
-        elif self.is_halved_CAP():
+        elif slice_size == "halved":
             return sequence_length
         return 0
 
-    def is_quartered_CAP(self) -> bool:
-        sequence = (
-            self.circular_sequence_generator.json_manager.loader_saver.load_current_sequence()
-        )
+    def is_quartered_CAP(self, sequence: list[dict]) -> bool:
         start_pos = sequence[1][END_POS]
         end_pos = sequence[-1][END_POS]
         return (start_pos, end_pos) in quartered_CAPs
 
-    def is_halved_CAP(self) -> bool:
-        sequence = (
-            self.circular_sequence_generator.json_manager.loader_saver.load_current_sequence()
-        )
+    def is_halved_CAP(self, sequence: list[dict]) -> bool:
         start_pos = sequence[1][END_POS]
         end_pos = sequence[-1][END_POS]
         return (start_pos, end_pos) in halved_CAPs
 
-    def get_slice_size(self) -> str:
-        if self.is_halved_CAP():
+    def get_slice_size(self, sequence: list[dict]) -> str:
+        if self.is_halved_CAP(sequence):
             return "halved"
-        elif self.is_quartered_CAP():
+        elif self.is_quartered_CAP(sequence):
             return "quartered"
         return ""
 
@@ -159,9 +142,9 @@ class RotatedComplementaryCAPExecutor(CAPExecutor):
 
         new_entry = {
             BEAT: beat_number,
-            LETTER: ComplementaryLetterGetter().get_complimentary_letter(
-                previous_matching_beat[LETTER]
-            ),
+            LETTER: ComplementaryLetterGetter()
+            .get_complimentary_letter(previous_matching_beat[LETTER])
+            .value,
             START_POS: previous_entry[END_POS],
             END_POS: self.calculate_new_end_pos(previous_matching_beat, previous_entry),
             TIMING: previous_matching_beat[TIMING],
@@ -194,12 +177,12 @@ class RotatedComplementaryCAPExecutor(CAPExecutor):
             ][PREFLOAT_PROP_ROT_DIR]
 
         new_entry[BLUE_ATTRS][END_ORI] = (
-            self.circular_sequence_generator.json_manager.ori_calculator.calculate_end_ori(
+            self.circular_sequence_generator.ori_calculator.calculate_end_ori(
                 new_entry, BLUE
             )
         )
         new_entry[RED_ATTRS][END_ORI] = (
-            self.circular_sequence_generator.json_manager.ori_calculator.calculate_end_ori(
+            self.circular_sequence_generator.ori_calculator.calculate_end_ori(
                 new_entry, RED
             )
         )
@@ -38,7 +38,6 @@ from data.CAP_executors.rotated_loc_maps import (
     loc_map_static,
     hand_rot_dir_map,
 )
-from PyQt6.QtWidgets import QApplication
 
 from main_window.main_widget.generate_tab.circular.CAP_type import CAPType
 from objects.motion.managers.handpath_calculator import HandpathCalculator
@@ -46,12 +45,12 @@ from .CAP_executor import CAPExecutor
 from data.positions_maps import positions_map
 
 if TYPE_CHECKING:
-    from ..circular_sequence_builder import CircularSequenceBuilder
+    from ...sequence_generation_engine import SequenceGenerationEngine
 
 
 class RotatedSwappedCAPExecutor(CAPExecutor):
 
-    def __init__(self, circular_sequence_generator: "CircularSequenceBuilder"):
+    def __init__(self, circular_sequence_generator: "SequenceGenerationEngine"):
         self.circular_sequence_generator = circular_sequence_generator
         self.hand_rot_dir_calculator = HandpathCalculator()
 
@@ -64,10 +63,6 @@ class RotatedSwappedCAPExecutor(CAPExecutor):
 
         new_entries = []
         next_beat_number = last_entry[BEAT] + 1
-
-        sequence_workbench = (
-            self.circular_sequence_generator.main_widget.sequence_workbench
-        )
         for _ in range(sequence_length):
             next_pictograph = self.create_new_rotated_CAP_entry(
                 sequence,
@@ -78,19 +73,9 @@ class RotatedSwappedCAPExecutor(CAPExecutor):
             new_entries.append(next_pictograph)
             sequence.append(next_pictograph)
 
-            sequence_workbench.beat_frame.beat_factory.create_new_beat_and_add_to_sequence(
-                next_pictograph,
-                override_grow_sequence=True,
-                update_word=True,
-                update_image_export_preview=False,
-            )
-            QApplication.processEvents()
-
             last_entry = next_pictograph
             next_beat_number += 1
 
-        sequence_workbench.current_word_label.update_current_word_label()
-
         if start_position_entry:
             start_position_entry[BEAT] = 0
             sequence.insert(0, start_position_entry)
@@ -154,12 +139,12 @@ class RotatedSwappedCAPExecutor(CAPExecutor):
             ][PREFLOAT_PROP_ROT_DIR]
 
         new_entry[BLUE_ATTRS][END_ORI] = (
-            self.circular_sequence_generator.json_manager.ori_calculator.calculate_end_ori(
+            self.circular_sequence_generator.ori_calculator.calculate_end_ori(
                 new_entry, BLUE
             )
         )
         new_entry[RED_ATTRS][END_ORI] = (
-            self.circular_sequence_generator.json_manager.ori_calculator.calculate_end_ori(
+            self.circular_sequence_generator.ori_calculator.calculate_end_ori(
                 new_entry, RED
             )
         )
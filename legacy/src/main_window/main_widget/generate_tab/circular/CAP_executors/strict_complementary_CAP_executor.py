@@ -1,7 +1,6 @@
 from data.constants import *
 from main_window.main_widget.generate_tab.circular.CAP_type import CAPType
 from .CAP_executor import CAPExecutor
-from PyQt6.QtWidgets import QApplication
 from enums.letter.complementary_letter_getter import ComplementaryLetterGetter
 
 
@@ -9,9 +8,6 @@ class StrictComplementaryCAPExecutor(CAPExecutor):
 
     def __init__(self, circular_sequence_generator):
         super().__init__(circular_sequence_generator)
-        self.letter_determiner = (
-            circular_sequence_generator.main_widget.letter_determiner
-        )
 
     def create_CAPs(self, sequence: list[dict]):
         """Creates complementary CAPs for a circular sequence."""
@@ -33,16 +29,6 @@ class StrictComplementaryCAPExecutor(CAPExecutor):
             sequence.append(next_pictograph)
             last_entry = next_pictograph
 
-            # Add to UI
-            sequence_workbench = self.circular_sequence_generator.sequence_workbench
-            sequence_workbench.beat_frame.beat_factory.create_new_beat_and_add_to_sequence(
-                next_pictograph,
-                override_grow_sequence=True,
-                update_word=True,
-                update_image_export_preview=False,
-            )
-            QApplication.processEvents()
-
     def can_perform_CAP(self, sequence: list[dict]) -> bool:
         """Ensures that the sequence can be complementary."""
         ends_at_start = sequence[-1][END_POS] == sequence[1][END_POS]
@@ -62,9 +48,9 @@ class StrictComplementaryCAPExecutor(CAPExecutor):
 
         new_entry = {
             BEAT: beat_number,
-            LETTER: ComplementaryLetterGetter().get_complimentary_letter(
-                previous_matching_beat[LETTER]
-            ),
+            LETTER: ComplementaryLetterGetter()
+            .get_complimentary_letter(previous_matching_beat[LETTER])
+            .value,
             START_POS: previous_entry[END_POS],
             END_POS: previous_matching_beat[END_POS],
             TIMING: previous_matching_beat[TIMING],
@@ -79,12 +65,12 @@ class StrictComplementaryCAPExecutor(CAPExecutor):
 
         # Ensure orientations are set properly
         new_entry[BLUE_ATTRS][END_ORI] = (
-            self.circular_sequence_generator.json_manager.ori_calculator.calculate_end_ori(
+            self.circular_sequence_generator.ori_calculator.calculate_end_ori(
                 new_entry, BLUE
             )
         )
         new_entry[RED_ATTRS][END_ORI] = (
-            self.circular_sequence_generator.json_manager.ori_calculator.calculate_end_ori(
+            self.circular_sequence_generator.ori_calculator.calculate_end_ori(
                 new_entry, RED
             )
         )
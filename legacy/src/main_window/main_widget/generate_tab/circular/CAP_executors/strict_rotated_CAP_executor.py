@@ -1,3 +1,4 @@
+from copy import deepcopy
 from typing import TYPE_CHECKING
 from data.quartered_CAPs import quartered_CAPs
 from data.halved_CAPs import halved_CAPs
@@ -41,7 +42,6 @@ from data.CAP_executors.rotated_loc_maps import (
 )
 from data.locations import vertical_loc_mirror_map
 
-from PyQt6.QtWidgets import QApplication
 
 from main_window.main_widget.generate_tab.circular.CAP_type import CAPType
 from objects.motion.managers.handpath_calculator import HandpathCalculator
@@ -49,12 +49,12 @@ from .CAP_executor import CAPExecutor
 from data.positions_maps import positions_map
 
 if TYPE_CHECKING:
-    from ..circular_sequence_builder import CircularSequenceBuilder
+    from ...sequence_generation_engine import SequenceGenerationEngine
 
 
 class StrictRotatedCAPExecutor(CAPExecutor):
 
-    def __init__(self, circular_sequence_generator: "CircularSequenceBuilder"):
+    def __init__(self, circular_sequence_generator: "SequenceGenerationEngine"):
         self.circular_sequence_generator = circular_sequence_generator
         self.hand_rot_dir_calculator = HandpathCalculator()
 
@@ -64,6 +64,8 @@ class StrictRotatedCAPExecutor(CAPExecutor):
         slice_size: str = None,
         end_mirrored: bool = False,
     ):
+        if not slice_size:
+            slice_size = self.get_slice_size(sequence)
         start_position_entry = (
             sequence.pop(0) if SEQUENCE_START_POSITION in sequence[0] else None
         )
@@ -72,12 +74,6 @@ class StrictRotatedCAPExecutor(CAPExecutor):
 
         new_entries = []
         next_beat_number = last_entry[BEAT] + 1
-        if not slice_size:
-            slice_size = self.get_slice_size()
-
-        sequence_workbench = (
-            self.circular_sequence_generator.main_widget.sequence_workbench
-        )
         if slice_size == "halved":
             entries_to_add = sequence_length
         elif slice_size == "quartered":
@@ -98,51 +94,37 @@ class StrictRotatedCAPExecutor(CAPExecutor):
             new_entries.append(next_pictograph)
             sequence.append(next_pictograph)
 
-            sequence_workbench.beat_frame.beat_factory.create_new_beat_and_add_to_sequence(
-                next_pictograph,
-                override_grow_sequence=True,
-                update_word=False,
-                update_image_export_preview=False,
-            )
-            QApplication.processEvents()
-
             last_entry = next_pictograph
             next_beat_number += 1
 
-        sequence_workbench.current_word_label.update_current_word_label()
-
         if start_position_entry:
             start_position_entry[BEAT] = 0
             sequence.insert(0, start_position_entry)
         return sequence
 
-    def determine_how_many_entries_to_add(self, sequence_length: int) -> int:
-        if self.is_quartered_CAP():
+    def determine_how_many_entries_to_add(
+        self, sequence_length: int, slice_size: str
+    ) -> int:
+        if slice_size == "quartered":
             return sequence_length * 3
-        elif self.is_halved_CAP():
+        elif slice_size == "halved":
             return sequence_length
         return 0
 
-    def is_quartered_CAP(self) -> bool:
-        sequence = (
-            self.circular_sequence_generator.json_manager.loader_saver.load_current_sequence()
-        )
+    def is_quartered_CAP(self, sequence: list[dict]) -> bool:
         start_pos = sequence[1][END_POS]
         end_pos = sequence[-1][END_POS]
         return (start_pos, end_pos) in quartered_CAPs
 
-    def is_halved_CAP(self) -> bool:
-        sequence = (
-            self.circular_sequence_generator.json_manager.loader_saver.load_current_sequence()
-        )
+    def is_halved_CAP(self, sequence: list[dict]) -> bool:
         start_pos = sequence[1][END_POS]
         end_pos = sequence[-1][END_POS]
         return (start_pos, end_pos) in halved_CAPs
 
-    def get_slice_size(self) -> str:
-        if self.is_halved_CAP():
+    def get_slice_size(self, sequence: list[dict]) -> str:
+        if self.is_halved_CAP(sequence):
             return "halved"
-        elif self.is_quartered_CAP():
+        elif self.is_quartered_CAP(sequence):
             return "quartered"
         return ""
 
@@ -183,18 +165,14 @@ class StrictRotatedCAPExecutor(CAPExecutor):
                 slice_size,
             )
             current_end_pos = sequence[-1][END_POS]
-            #  use the letters data stored in the main widget to find a letter that can get you from the current end pos to the new end pos
-            pictograph_dataset = (
-                self.circular_sequence_generator.main_widget.pictograph_dataset
-            )
-            possible_last_beats: list[dict] = []
-            for letter in pictograph_dataset:
-                for pictograph_data in pictograph_dataset[letter]:
-                    if (
-                        pictograph_data.get(START_POS) == current_end_pos
-                        and pictograph_data.get(END_POS) == new_end_pos
-                    ):
-                        possible_last_beats.append(pictograph_data)
+            #  find a pictograph that can get you from the current end pos to the new end pos
+            possible_last_beats: list[dict] = [
+                pictograph_data
+                for pictograph_data in self.circular_sequence_generator.options_from(
+                    current_end_pos
+                )
+                if pictograph_data.get(END_POS) == new_end_pos
+            ]
             if len(possible_last_beats) == 0:
                 raise ValueError(
                     f"Could not find a pictograph that goes from {current_end_pos} to {new_end_pos}"
@@ -203,7 +181,7 @@ class StrictRotatedCAPExecutor(CAPExecutor):
                 # randomize the selection of the last beat
                 import random
 
-                new_entry = random.choice(possible_last_beats)
+                new_entry = deepcopy(random.choice(possible_last_beats))
                 new_entry[BLUE_ATTRS][TURNS] = previous_matching_beat[BLUE_ATTRS][TURNS]
                 new_entry[RED_ATTRS][TURNS] = previous_matching_beat[RED_ATTRS][TURNS]
                 new_entry[BEAT] = beat_number
@@ -239,12 +217,12 @@ class StrictRotatedCAPExecutor(CAPExecutor):
                 new_entry[BLUE_ATTRS][START_ORI] = previous_entry[BLUE_ATTRS][END_ORI]
                 new_entry[RED_ATTRS][START_ORI] = previous_entry[RED_ATTRS][END_ORI]
                 new_entry[BLUE_ATTRS][END_ORI] = (
-                    self.circular_sequence_generator.json_manager.ori_calculator.calculate_end_ori(
+                    self.circular_sequence_generator.ori_calculator.calculate_end_ori(
                         new_entry, BLUE
                     )
                 )
                 new_entry[RED_ATTRS][END_ORI] = (
-                    self.circular_sequence_generator.json_manager.ori_calculator.calculate_end_ori(
+                    self.circular_sequence_generator.ori_calculator.calculate_end_ori(
                         new_entry, RED
                     )
                 )
@@ -311,12 +289,12 @@ class StrictRotatedCAPExecutor(CAPExecutor):
             ][PREFLOAT_PROP_ROT_DIR]
 
         new_entry[BLUE_ATTRS][END_ORI] = (
-            self.circular_sequence_generator.json_manager.ori_calculator.calculate_end_ori(
+            self.circular_sequence_generator.ori_calculator.calculate_end_ori(
                 new_entry, BLUE
             )
         )
         new_entry[RED_ATTRS][END_ORI] = (
-            self.circular_sequence_generator.json_manager.ori_calculator.calculate_end_ori(
+            self.circular_sequence_generator.ori_calculator.calculate_end_ori(
                 new_entry, RED
             )
         )
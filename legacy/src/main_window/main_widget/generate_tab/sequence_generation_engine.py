@@ -0,0 +1,490 @@
+import random
+from typing import Any, Collection, Optional
+
+from data.constants import (
+    ALPHA1,
+    ANTI,
+    BEAT,
+    BETA5,
+    BLUE,
+    BLUE_ATTRS,
+    CLOCKWISE,
+    COUNTER_CLOCKWISE,
+    DASH,
+    DIAMOND,
+    DIRECTION,
+    END_LOC,
+    END_ORI,
+    END_POS,
+    FLOAT,
+    GAMMA11,
+    GRID_MODE,
+    IN,
+    LETTER,
+    MOTION_TYPE,
+    NO_ROT,
+    PREFLOAT_MOTION_TYPE,
+    PREFLOAT_PROP_ROT_DIR,
+    PRO,
+    PROP_ROT_DIR,
+    RED,
+    RED_ATTRS,
+    SEQUENCE_START_POSITION,
+    START_LOC,
+    START_ORI,
+    START_POS,
+    STATIC,
+    TIMING,
+    TURNS,
+    VERTICAL,
+)
+from data.positions_maps import (
+    mirrored_positions,
+    mirrored_swapped_positions,
+    rotated_and_swapped_positions,
+    swapped_positions,
+)
+from main_window.main_widget.json_manager.json_ori_calculator import (
+    JsonOriCalculator,
+)
+from utils.word_simplifier import WordSimplifier
+
+from .circular.CAP_executor_factory import CAPExecutorFactory
+from .circular.CAP_executors.CAP_executor import CAPExecutor
+from .circular.CAP_type import CAPType
+from .circular.utils.end_position_selector import RotatedEndPositionSelector
+from .circular.utils.pictograph_selector import PictographSelector
+from .circular.utils.rotation_determiner import RotationDeterminer
+from .circular.utils.word_length_calculator import WordLengthCalculator
+from .turn_intensity_manager import TurnIntensityManager
+
+
+class SequenceGenerationEngine:
+    """
+    Generates freeform and circular sequences as plain beat dicts, without
+    the sequence workbench or the construct tab's option picker.
+
+    The dataset is indexed by start position once and only the option picked
+    for each beat is copied, so whole sequences are built in memory. The
+    builders add the generated beats to the beat frame afterwards, and
+    generate_many produces sequences in bulk for test corpora.
+    """
+
+    START_POSITIONS = [ALPHA1, BETA5, GAMMA11]
+
+    def __init__(
+        self,
+        pictograph_dataset: dict[Any, list[dict[str, Any]]],
+        ori_calculator: Optional[JsonOriCalculator] = None,
+    ) -> None:
+        self.pictograph_dataset = pictograph_dataset
+        self.ori_calculator = ori_calculator or JsonOriCalculator()
+        self.options_by_start_pos: dict[str, list[dict[str, Any]]] = {}
+        for group in pictograph_dataset.values():
+            for item in group:
+                self.options_by_start_pos.setdefault(item.get(START_POS), []).append(
+                    item
+                )
+        self.executors: dict[CAPType, CAPExecutor] = {
+            cap_type: CAPExecutorFactory.create_executor(cap_type, self)
+            for cap_type in CAPType
+        }
+
+    def options_from(self, start_pos: str) -> list[dict[str, Any]]:
+        """The dataset entries starting at start_pos. These are not copies."""
+        return self.options_by_start_pos.get(start_pos, [])
+
+    def new_sequence(self) -> list[dict[str, Any]]:
+        """A sequence holding metadata and a random diamond start position."""
+        start_pos = random.choice(self.START_POSITIONS)
+        for item in self.options_from(start_pos):
+            if item.get(END_POS) == start_pos:
+                return [
+                    {"word": "", GRID_MODE: DIAMOND},
+                    self._start_position_entry(item),
+                ]
+        raise LookupError(f"No matching start position found for: {start_pos}")
+
+    def _start_position_entry(self, item: dict[str, Any]) -> dict[str, Any]:
+        def attributes(motion: dict[str, Any]) -> dict[str, Any]:
+            return {
+                START_LOC: motion[START_LOC],
+                END_LOC: motion[END_LOC],
+                START_ORI: IN,
+                END_ORI: IN,
+                PROP_ROT_DIR: NO_ROT,
+                TURNS: 0,
+                MOTION_TYPE: motion[MOTION_TYPE],
+            }
+
+        return {
+            BEAT: 0,
+            SEQUENCE_START_POSITION: item[END_POS].rstrip("0123456789"),
+            LETTER: item[LETTER],
+            END_POS: item[END_POS],
+            TIMING: item[TIMING],
+            DIRECTION: item[DIRECTION],
+            BLUE_ATTRS: attributes(item[BLUE_ATTRS]),
+            RED_ATTRS: attributes(item[RED_ATTRS]),
+        }
+
+    def generate_many(
+        self,
+        count: int,
+        length: int,
+        turn_intensity: float = 1,
+        level: int = 1,
+        prop_continuity: str = "continuous",
+        CAP_type: Optional[CAPType] = None,
+        slice_size: str = "halved",
+        letters: Optional[Collection[str]] = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Generates count sequences from random start positions. Sequences are
+        freeform unless a CAP_type is given.
+        """
+        sequences = []
+        for _ in range(count):
+            sequence = self.new_sequence()
+            if CAP_type is None:
+                self.generate_freeform(
+                    sequence, length, turn_intensity, level, prop_continuity, letters
+                )
+            else:
+                self.generate_circular(
+                    sequence,
+                    length,
+                    turn_intensity,
+                    level,
+                    slice_size,
+                    CAP_type,
+                    prop_continuity,
+                )
+            sequence[0]["word"] = WordSimplifier.simplify_repeated_word(
+                "".join(beat[LETTER] for beat in sequence[2:])
+            )
+            sequences.append(sequence)
+        return sequences
+
+    def generate_freeform(
+        self,
+        sequence: list[dict[str, Any]],
+        length: int,
+        turn_intensity: float,
+        level: int,
+        prop_continuity: str = "continuous",
+        letters: Optional[Collection[str]] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Extends the sequence to length beats and returns the new beats.
+        letters limits the options to those letters; None allows all of them.
+        """
+        blue_rot_dir, red_rot_dir = RotationDeterminer.get_rotation_dirs(
+            prop_continuity
+        )
+        if letters is not None:
+            letters = set(letters)
+
+        length_of_sequence_upon_start = len(sequence) - 2
+
+        turn_manager = TurnIntensityManager(length, level, turn_intensity)
+        turns_blue, turns_red = turn_manager.allocate_turns_for_blue_and_red()
+
+        new_beats = []
+        for i in range(length - length_of_sequence_upon_start):
+            options = self._next_options(sequence)
+            if letters is not None:
+                options = [option for option in options if option[LETTER] in letters]
+            if prop_continuity == "continuous":
+                options = self.filter_options_by_rotation(
+                    options, blue_rot_dir, red_rot_dir
+                )
+
+            next_beat = self._copy_option(random.choice(options))
+            if level == 2 or level == 3:
+                next_beat = self.set_turns(next_beat, turns_blue[i], turns_red[i])
+
+            self.update_start_orientations(next_beat, sequence[-1])
+            self.update_dash_static_prop_rot_dirs(
+                next_beat, prop_continuity, blue_rot_dir, red_rot_dir
+            )
+            self.update_end_orientations(next_beat)
+            self.update_beat_number(next_beat, sequence)
+            sequence.append(next_beat)
+            new_beats.append(next_beat)
+        return new_beats
+
+    def generate_circular(
+        self,
+        sequence: list[dict[str, Any]],
+        length: int,
+        turn_intensity: float,
+        level: int,
+        slice_size: str,
+        CAP_type: CAPType,
+        prop_continuity: str = "continuous",
+    ) -> list[dict[str, Any]]:
+        """
+        Generates the word part of a circular sequence, completes it with the
+        CAP_type's executor and returns the new beats.
+        """
+        CAP_type = CAPType(CAP_type)
+        first_new_beat = len(sequence)
+        blue_rot_dir, red_rot_dir = RotationDeterminer.get_rotation_dirs(
+            prop_continuity
+        )
+
+        word_length, available_range = WordLengthCalculator.calculate(
+            CAP_type, slice_size, length, len(sequence)
+        )
+        if CAP_type in [
+            CAPType.MIRRORED_ROTATED,
+            CAPType.MIRRORED_COMPLEMENTARY_ROTATED,
+        ]:
+            word_length = int(word_length / 2)
+            available_range = int(available_range / 2)
+
+        turn_manager = TurnIntensityManager(word_length, level, turn_intensity)
+        turns_blue, turns_red = turn_manager.allocate_turns_for_blue_and_red()
+
+        for i in range(available_range):
+            options = self._next_options(sequence)
+            if prop_continuity == "continuous":
+                options = self.filter_options_by_rotation(
+                    options, blue_rot_dir, red_rot_dir
+                )
+
+            if i == available_range - 1:
+                expected_end_pos = self._determine_expected_end_pos(
+                    sequence, CAP_type, slice_size
+                )
+                option = PictographSelector.select_pictograph(options, expected_end_pos)
+            else:
+                option = random.choice(options)
+
+            next_beat = self._copy_option(option)
+            if level in (2, 3):
+                next_beat = self.set_turns(next_beat, turns_blue[i], turns_red[i])
+
+            if next_beat[BLUE_ATTRS][MOTION_TYPE] in [DASH, STATIC] or next_beat[
+                RED_ATTRS
+            ][MOTION_TYPE] in [DASH, STATIC]:
+                self.update_dash_static_prop_rot_dirs(
+                    next_beat, prop_continuity, blue_rot_dir, red_rot_dir
+                )
+
+            self.update_start_orientations(next_beat, sequence[-1])
+            self.update_end_orientations(next_beat)
+            self.update_beat_number(next_beat, sequence)
+            sequence.append(next_beat)
+
+        self.apply_CAPs(sequence, CAP_type, slice_size)
+        return sequence[first_new_beat:]
+
+    def _next_options(self, sequence: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        last = sequence[-1] if not sequence[-1].get("is_placeholder") else sequence[-2]
+        return self.options_from(last.get(END_POS))
+
+    @staticmethod
+    def _copy_option(option: dict[str, Any]) -> dict[str, Any]:
+        """Copies a dataset entry; only its motion attributes are nested."""
+        copied = dict(option)
+        copied[BLUE_ATTRS] = dict(option[BLUE_ATTRS])
+        copied[RED_ATTRS] = dict(option[RED_ATTRS])
+        return copied
+
+    def _determine_expected_end_pos(
+        self, sequence: list[dict[str, Any]], CAP_type: CAPType, slice_size: str
+    ) -> str:
+        start_pos = sequence[1][END_POS]
+        end_pos_selectors = {
+            CAPType.STRICT_ROTATED: lambda: RotatedEndPositionSelector.determine_rotated_end_pos(
+                slice_size, start_pos
+            ),
+            CAPType.STRICT_MIRRORED: lambda: mirrored_positions[VERTICAL][start_pos],
+            CAPType.MIRRORED_SWAPPED: lambda: mirrored_swapped_positions[VERTICAL][
+                start_pos
+            ],
+            CAPType.STRICT_SWAPPED: lambda: swapped_positions[start_pos],
+            CAPType.SWAPPED_COMPLEMENTARY: lambda: swapped_positions[start_pos],
+            CAPType.STRICT_COMPLEMENTARY: lambda: start_pos,
+            CAPType.ROTATED_COMPLEMENTARY: lambda: RotatedEndPositionSelector.determine_rotated_end_pos(
+                "halved", start_pos
+            ),
+            CAPType.MIRRORED_COMPLEMENTARY: lambda: mirrored_positions[VERTICAL][
+                start_pos
+            ],
+            CAPType.ROTATED_SWAPPED: lambda: rotated_and_swapped_positions[start_pos],
+            CAPType.MIRRORED_ROTATED: lambda: (
+                RotatedEndPositionSelector.determine_rotated_end_pos(
+                    "halved", start_pos
+                )
+            ),
+            CAPType.MIRRORED_COMPLEMENTARY_ROTATED: lambda: (
+                RotatedEndPositionSelector.determine_rotated_end_pos(
+                    "halved", start_pos
+                )
+            ),
+        }
+
+        end_pos_selector = end_pos_selectors.get(CAP_type)
+        if end_pos_selector:
+            return end_pos_selector()
+        else:
+            raise ValueError(
+                "CAP type not implemented yet. Please implement the CAP type."
+            )
+
+    def apply_CAPs(
+        self, sequence: list[dict[str, Any]], cap_type: CAPType, slice_size: str
+    ) -> None:
+        executor = self.executors.get(cap_type)
+        if executor and CAPType(cap_type) in [
+            CAPType.MIRRORED_ROTATED,
+            CAPType.MIRRORED_COMPLEMENTARY_ROTATED,
+        ]:
+            strict_rotated_executor = self.executors.get(CAPType.STRICT_ROTATED)
+            sequence = strict_rotated_executor.create_CAPs(
+                sequence, slice_size="halved", end_mirrored=True
+            )
+            if cap_type == CAPType.MIRRORED_COMPLEMENTARY_ROTATED:
+                self.executors.get(CAPType.MIRRORED_COMPLEMENTARY).create_CAPs(sequence)
+            elif cap_type == CAPType.MIRRORED_ROTATED:
+                self.executors.get(CAPType.STRICT_MIRRORED).create_CAPs(sequence)
+
+        elif executor and CAPType(cap_type) in [
+            CAPType.STRICT_ROTATED,
+        ]:
+            sequence = executor.create_CAPs(sequence, slice_size=slice_size)
+        elif executor:
+            executor.create_CAPs(sequence)
+        else:
+            raise ValueError(f"No executor found for CAP type: {cap_type.name}")
+
+    def update_start_orientations(
+        self, next_data: dict[str, Any], last_data: dict[str, dict[str, str]]
+    ) -> None:
+        """
+        Updates the start orientations of the next beat based on the end orientations of the last beat.
+        Ensures no None values are assigned.
+        """
+        blue_end_ori = last_data[BLUE_ATTRS].get(END_ORI)
+        red_end_ori = last_data[RED_ATTRS].get(END_ORI)
+
+        if blue_end_ori is None or red_end_ori is None:
+            raise ValueError(
+                "End orientations cannot be None. Ensure the previous beat has valid orientations."
+            )
+
+        next_data[BLUE_ATTRS][START_ORI] = blue_end_ori
+        next_data[RED_ATTRS][START_ORI] = red_end_ori
+
+    def update_end_orientations(self, next_data: dict[str, Any]) -> None:
+        """
+        Updates the end orientations of the next beat using the orientation calculator.
+        """
+        blue_end_ori = self.ori_calculator.calculate_end_ori(next_data, BLUE)
+        red_end_ori = self.ori_calculator.calculate_end_ori(next_data, RED)
+
+        if blue_end_ori is None or red_end_ori is None:
+            raise ValueError(
+                "Calculated end orientations cannot be None. Please check the input data and orientation calculator."
+            )
+
+        next_data[BLUE_ATTRS][END_ORI] = blue_end_ori
+        next_data[RED_ATTRS][END_ORI] = red_end_ori
+
+    def update_dash_static_prop_rot_dirs(
+        self,
+        next_beat: dict[str, Any],
+        prop_continuity: str,
+        blue_rot_dir: str,
+        red_rot_dir: str,
+    ) -> None:
+        """
+        Updates the prop rotation directions for dash/static motion types.
+        """
+
+        def update_attr(color: str, rot_dir: str):
+            motion_data = next_beat[f"{color}_attributes"]
+            if motion_data.get(MOTION_TYPE) in [DASH, STATIC]:
+                turns = motion_data.get(TURNS, 0)
+                if prop_continuity == "continuous":
+                    motion_data[PROP_ROT_DIR] = rot_dir if turns > 0 else NO_ROT
+                else:
+                    if turns > 0:
+                        self._set_random_prop_rot_dir(next_beat, color)
+                    else:
+                        motion_data[PROP_ROT_DIR] = NO_ROT
+
+                if motion_data[PROP_ROT_DIR] == NO_ROT and turns > 0:
+                    raise ValueError(
+                        f"{color.capitalize()} prop rotation direction cannot be {NO_ROT} when turns are greater than 0."
+                    )
+
+        update_attr(BLUE, blue_rot_dir)
+        update_attr(RED, red_rot_dir)
+
+    def _set_random_prop_rot_dir(self, next_data: dict[str, Any], color: str) -> None:
+        """Randomly sets the prop rotation direction for the specified color."""
+        if color == BLUE:
+            next_data[BLUE_ATTRS][PROP_ROT_DIR] = random.choice(
+                [CLOCKWISE, COUNTER_CLOCKWISE]
+            )
+        elif color == RED:
+            next_data[RED_ATTRS][PROP_ROT_DIR] = random.choice(
+                [CLOCKWISE, COUNTER_CLOCKWISE]
+            )
+
+    def update_beat_number(
+        self, next_data: dict[str, Any], sequence: list
+    ) -> dict[str, Any]:
+        """Sets the beat number based on the sequence length."""
+        next_data[BEAT] = len(sequence) - 1
+        return next_data
+
+    def filter_options_by_rotation(
+        self, options: list[dict[str, Any]], blue_rot: str, red_rot: str
+    ) -> list[dict[str, Any]]:
+        """Filters options to match the given rotation directions."""
+        return [
+            opt
+            for opt in options
+            if (
+                opt[BLUE_ATTRS].get(PROP_ROT_DIR) in [blue_rot, NO_ROT]
+                and opt[RED_ATTRS].get(PROP_ROT_DIR) in [red_rot, NO_ROT]
+            )
+        ] or options
+
+    def _set_float_turns(self, next_beat: dict[str, Any], color: str) -> None:
+        """
+        Handles cases where turns are 'fl', adjusting motion type and rotation properties.
+        """
+        attr = next_beat[f"{color}_attributes"]
+        if attr.get(MOTION_TYPE) in [PRO, ANTI]:
+            attr[TURNS] = "fl"
+            attr[PREFLOAT_MOTION_TYPE] = attr[MOTION_TYPE]
+            attr[PREFLOAT_PROP_ROT_DIR] = attr[PROP_ROT_DIR]
+            attr[MOTION_TYPE] = FLOAT
+            attr[PROP_ROT_DIR] = NO_ROT
+        else:
+            attr[TURNS] = 0
+
+    def set_turns(
+        self, next_beat: dict[str, Any], turn_blue: float, turn_red: float
+    ) -> dict[str, Any]:
+        """
+        Sets the number of turns for both blue and red attributes.
+        Adjusts motion types if special flag 'fl' is present.
+        """
+        if turn_blue == "fl":
+            self._set_float_turns(next_beat, BLUE)
+        else:
+            next_beat[BLUE_ATTRS][TURNS] = turn_blue
+
+        if turn_red == "fl":
+            self._set_float_turns(next_beat, RED)
+        else:
+            next_beat[RED_ATTRS][TURNS] = turn_red
+
+        return next_beat
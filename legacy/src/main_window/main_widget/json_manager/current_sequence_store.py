@@ -0,0 +1,206 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+from typing import Callable, Optional
+
+from utils.file_modes import match_file_mode
+
+# Seconds between the first unsaved edit and the write to disk. Edits made
+# in the meantime are written together.
+WRITE_DELAY = 0.5
+
+
+def _copy_json(value):
+    """Copy decoded JSON, several times faster than deepcopy."""
+    if type(value) is dict:
+        copied = value.copy()
+        for key, item in value.items():
+            if type(item) in (dict, list):
+                copied[key] = _copy_json(item)
+        return copied
+    return [
+        _copy_json(item) if type(item) in (dict, list) else item for item in value
+    ]
+
+
+class CurrentSequenceStore:
+    """
+    The current sequence, held in memory and written to disk behind the UI.
+
+    The file is read once. Every save replaces the in-memory sequence,
+    appends it to a journal next to the file and notifies observers; the
+    file itself is rewritten WRITE_DELAY seconds later, on a timer thread,
+    so a burst of edits costs a single write. The file is written to a
+    temporary name and moved into place, and the journal is removed once
+    it has been, so a journal that still holds records on the next start
+    belongs to edits that never reached the file and is replayed.
+
+    The sequence is kept as it would be read back from the file, so loads
+    behave exactly like the file reads they replace.
+    """
+
+    def __init__(self, path: str, write_delay: float = WRITE_DELAY) -> None:
+        self.path = path
+        self.journal_path = f"{path}.journal"
+        self.write_delay = write_delay
+        self._sequence: Optional[list[dict]] = None
+        self._loaded = False
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._observers: list[Callable[[list[dict]], None]] = []
+        atexit.register(self.flush)
+
+    @property
+    def sequence(self) -> Optional[list[dict]]:
+        """
+        The stored sequence, or None if the file is missing, empty or
+        invalid. This is the store's own copy and must not be modified.
+        """
+        if not self._loaded:
+            self._load()
+        return self._sequence
+
+    def load(self) -> Optional[list[dict]]:
+        """A copy of the stored sequence that the caller may modify."""
+        with self._lock:
+            if self.sequence is None:
+                return None
+            return _copy_json(self._sequence)
+
+    def save(self, sequence: list[dict]) -> None:
+        """Store sequence, journal it and schedule the write to disk."""
+        text = json.dumps(sequence, ensure_ascii=False)
+        with self._lock:
+            self._append_to_journal(text)
+            self._sequence = json.loads(text)
+            self._loaded = True
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(self.write_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+            stored = self._sequence
+        self._notify_observers(stored)
+
+    def flush(self) -> None:
+        """Write any unsaved edits to the file now."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return
+                sequence = self._sequence
+                self._dirty = False
+            try:
+                self._write(sequence)
+            except OSError:
+                with self._lock:
+                    self._dirty = True
+                raise
+            with self._lock:
+                if not self._dirty:
+                    self._truncate_journal()
+
+    def register_observer(self, callback: Callable[[list[dict]], None]) -> None:
+        """
+        Call callback with the stored sequence after every save. The
+        sequence passed is the store's own copy and must not be modified.
+        """
+        if callback not in self._observers:
+            self._observers.append(callback)
+
+    def unregister_observer(self, callback: Callable[[list[dict]], None]) -> None:
+        """Remove an observer."""
+        if callback in self._observers:
+            self._observers.remove(callback)
+
+    def _notify_observers(self, sequence: list[dict]) -> None:
+        for callback in list(self._observers):
+            callback(sequence)
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            recovered = self._read_journal()
+            self._sequence = recovered if recovered is not None else self._read_file()
+            self._dirty = recovered is not None
+            self._loaded = True
+        if self._dirty:
+            self.flush()
+
+    def _read_file(self) -> Optional[list[dict]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                sequence = json.loads(file.read().strip() or "null")
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if not sequence or not isinstance(sequence, list):
+            return None
+        return sequence
+
+    def _read_journal(self) -> Optional[list[dict]]:
+        """The last complete record in the journal, if there is one."""
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as journal:
+                lines = journal.read().splitlines()
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+        for line in reversed(lines):
+            try:
+                sequence = json.loads(line)
+            except json.JSONDecodeError:
+                # A record cut short by a crash
+                continue
+            if sequence and isinstance(sequence, list):
+                return sequence
+        return None
+
+    def _append_to_journal(self, text: str) -> None:
+        try:
+            with open(self.journal_path, "a", encoding="utf-8") as journal:
+                journal.write(text + "\n")
+        except OSError:
+            # The write to the file is still scheduled; only recovery is lost
+            pass
+
+    def _truncate_journal(self) -> None:
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+
+    def _write(self, sequence: list[dict]) -> None:
+        directory, filename = os.path.split(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=f".{filename}.", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(sequence, file, indent=4, ensure_ascii=False)
+                file.flush()
+                os.fsync(file.fileno())
+            match_file_mode(temp_path, self.path)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+_stores: dict[str, CurrentSequenceStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_current_sequence_store(path: str) -> CurrentSequenceStore:
+    """Return the process-wide store for the sequence file at path."""
+    key = os.path.normcase(os.path.abspath(path))
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = CurrentSequenceStore(path)
+        return _stores[key]
@@ -1,34 +1,195 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
 from data.constants import (
     BLUE,
     BLUE_ATTRS,
+    CLOCK,
+    COUNTER,
+    END_LOC,
     END_ORI,
+    IN,
+    MOTION_TYPE,
+    OUT,
+    PROP_ROT_DIR,
     RED,
     RED_ATTRS,
+    START_LOC,
     START_ORI,
+    TURNS,
 )
 
 if TYPE_CHECKING:
     from main_window.main_widget.json_manager.json_manager import JsonManager
 
+ORIENTATIONS = [IN, OUT, CLOCK, COUNTER]
+# Stands for an orientation the transition tables can't resolve
+UNRESOLVED = len(ORIENTATIONS)
+
 
 class JsonOriValidationEngine:
     def __init__(self, json_manager: "JsonManager") -> None:
         self.json_manager = json_manager
         self.ori_calculator = self.json_manager.ori_calculator
+        self._transition_rows: dict[tuple, list[int]] = {}
 
-    def validate_and_update_json_orientations(self, is_current_sequence=False) -> None:
-        """Iterates through the sequence, updating start and end orientations to ensure continuity."""
-        for index, _ in enumerate(self.sequence):
-            if index > 1:
-                if self.sequence[index].get("is_placeholder", False):
-                    continue
-                self.update_json_entry_start_orientation(index)
-                self.update_json_entry_end_orientation(index)
+    def validate_and_update_json_orientations(
+        self, is_current_sequence=False, start_index: Optional[int] = None
+    ) -> None:
+        """
+        Iterates through the sequence, updating start and end orientations to ensure continuity.
+        With a start_index, only the beats that an edit to that beat affects
+        are updated, see propagate_orientations.
+        """
+        if start_index is None:
+            for index, _ in enumerate(self.sequence):
+                if index > 1:
+                    if self.sequence[index].get("is_placeholder", False):
+                        continue
+                    self.update_json_entry_start_orientation(index)
+                    self.update_json_entry_end_orientation(index)
+        else:
+            self.propagate_orientations(self.sequence, start_index)
 
         if is_current_sequence:
             self.json_manager.loader_saver.save_current_sequence(self.sequence)
 
+    def propagate_orientations(self, sequence: list[dict], start_index: int) -> int:
+        """
+        Updates orientations from the beat at start_index on, for a sequence
+        that was continuous before that beat was edited. Stops at the first
+        later beat whose end orientations come out unchanged, as the beats
+        after it already start where it ends. Returns how many beats were
+        updated.
+        """
+        if start_index < 0:
+            start_index += len(sequence)
+        start_index = max(start_index, 2)
+        previous_pictograph = None
+        for index in range(start_index - 1, 0, -1):
+            if not sequence[index].get("is_placeholder", False):
+                previous_pictograph = sequence[index]
+                break
+        if previous_pictograph is None:
+            return 0
+
+        updated = 0
+        for index in range(start_index, len(sequence)):
+            pictograph = sequence[index]
+            if pictograph.get("is_placeholder", False):
+                continue
+            blue_end_ori = pictograph[BLUE_ATTRS].get(END_ORI)
+            red_end_ori = pictograph[RED_ATTRS].get(END_ORI)
+            self.validate_single_pictograph(pictograph, previous_pictograph)
+            updated += 1
+            if (
+                index > start_index
+                and pictograph[BLUE_ATTRS][END_ORI] == blue_end_ori
+                and pictograph[RED_ATTRS][END_ORI] == red_end_ori
+            ):
+                break
+            previous_pictograph = pictograph
+        return updated
+
+    def validate_sequences(self, sequences: list[list[dict]]) -> None:
+        """
+        Validates many sequences at once, such as a whole dictionary,
+        updating their orientations in place as run() does.
+
+        The start to end orientation table of each distinct motion is worked
+        out with the ori calculator once, then all the sequences are stepped
+        through together, a beat position at a time, with NumPy. A sequence
+        that reaches an orientation the tables can't resolve is validated
+        on its own instead, so that it fails as it would in run().
+        """
+        sequences = [sequence for sequence in sequences if len(sequence) > 2]
+        beats = [
+            [beat for beat in sequence[2:] if not beat.get("is_placeholder", False)]
+            for sequence in sequences
+        ]
+        length = max(map(len, beats), default=0)
+        ori_indexes = {ori: index for index, ori in enumerate(ORIENTATIONS)}
+
+        # Row 0 keeps the orientation, for padding after shorter sequences
+        rows = [list(range(UNRESOLVED + 1))]
+        row_by_motion: dict[tuple, int] = {}
+        motions = np.zeros((len(sequences), length, 2), dtype=np.intp)
+        oris = np.empty((len(sequences), 2), dtype=np.intp)
+        for n, (sequence, sequence_beats) in enumerate(zip(sequences, beats)):
+            for c, attrs in enumerate((BLUE_ATTRS, RED_ATTRS)):
+                start_ori = sequence[1][attrs].get(END_ORI)
+                oris[n, c] = ori_indexes.get(start_ori, UNRESOLVED)
+                for b, beat in enumerate(sequence_beats):
+                    motion = self._motion_key(beat[attrs])
+                    row = row_by_motion.get(motion)
+                    if row is None:
+                        row = row_by_motion[motion] = len(rows)
+                        rows.append(self._transition_row(motion))
+                    motions[n, b, c] = row
+        transitions = np.array(rows, dtype=np.intp)
+
+        start_oris = np.empty((len(sequences), length, 2), dtype=np.intp)
+        end_oris = np.empty((len(sequences), length, 2), dtype=np.intp)
+        for b in range(length):
+            start_oris[:, b] = oris
+            oris = transitions[motions[:, b], oris]
+            end_oris[:, b] = oris
+        unresolved = (oris == UNRESOLVED).any(axis=1)
+
+        for n, (sequence, sequence_beats) in enumerate(zip(sequences, beats)):
+            if unresolved[n]:
+                self.sequence = sequence
+                self.validate_and_update_json_orientations()
+                continue
+            for beat, starts, ends in zip(
+                sequence_beats, start_oris[n].tolist(), end_oris[n].tolist()
+            ):
+                beat[BLUE_ATTRS][START_ORI] = ORIENTATIONS[starts[0]]
+                beat[RED_ATTRS][START_ORI] = ORIENTATIONS[starts[1]]
+                beat[BLUE_ATTRS][END_ORI] = ORIENTATIONS[ends[0]]
+                beat[RED_ATTRS][END_ORI] = ORIENTATIONS[ends[1]]
+
+    @staticmethod
+    def _motion_key(attributes: dict) -> tuple:
+        return (
+            attributes.get(MOTION_TYPE),
+            attributes.get(TURNS),
+            attributes.get(PROP_ROT_DIR),
+            attributes.get(START_LOC),
+            attributes.get(END_LOC),
+        )
+
+    def _transition_row(self, motion: tuple) -> list[int]:
+        """The end orientation index of motion for each start orientation."""
+        row = self._transition_rows.get(motion)
+        if row is None:
+            motion_type, turns, prop_rot_dir, start_loc, end_loc = motion
+            row = []
+            for start_ori in ORIENTATIONS:
+                attributes = {
+                    MOTION_TYPE: motion_type,
+                    TURNS: turns,
+                    PROP_ROT_DIR: prop_rot_dir,
+                    START_LOC: start_loc,
+                    END_LOC: end_loc,
+                    START_ORI: start_ori,
+                }
+                try:
+                    end_ori = self.ori_calculator.calculate_end_ori(
+                        {BLUE_ATTRS: attributes}, BLUE
+                    )
+                except (KeyError, TypeError, ValueError):
+                    end_ori = None
+                row.append(
+                    ORIENTATIONS.index(end_ori)
+                    if end_ori in ORIENTATIONS
+                    else UNRESOLVED
+                )
+            row.append(UNRESOLVED)
+            self._transition_rows[motion] = row
+        return row
+
     def validate_single_pictograph(
         self, pictograph: dict, previous_pictograph: dict
     ) -> dict:
@@ -74,11 +235,17 @@ class JsonOriValidationEngine:
             pictograph_data[f"{color}_attributes"][END_ORI] = end_ori
             self.sequence[index] = pictograph_data
 
-    def run(self, is_current_sequence=False) -> None:
-        """Public method to run the sequence validation and update process."""
+    def run(
+        self, is_current_sequence=False, start_index: Optional[int] = None
+    ) -> None:
+        """
+        Public method to run the sequence validation and update process.
+        Pass the index of an edited beat as start_index to only update the
+        beats the edit affects.
+        """
         if is_current_sequence:
             self.sequence = self.json_manager.loader_saver.load_current_sequence()
-        self.validate_and_update_json_orientations(is_current_sequence)
+        self.validate_and_update_json_orientations(is_current_sequence, start_index)
 
     def validate_last_pictograph(self) -> None:
         """Validates the most recently added pictograph dict."""
@@ -1,4 +1,4 @@
-import json
+import copy
 from typing import TYPE_CHECKING, Optional
 from data.constants import (
     BEAT,
@@ -14,6 +14,10 @@ from data.constants import (
     RED_ATTRS,
     SEQUENCE_START_POSITION,
 )
+from main_window.main_widget.json_manager.current_sequence_store import (
+    CurrentSequenceStore,
+    get_current_sequence_store,
+)
 from main_window.main_widget.sequence_level_evaluator import SequenceLevelEvaluator
 from main_window.main_widget.sequence_properties_manager.sequence_properties_manager_factory import (
     SequencePropertiesManagerFactory,
@@ -74,37 +78,26 @@ class SequenceDataLoaderSaver:
                 SequencePropertiesManagerFactory.create_legacy()
             )
 
-    def load_current_sequence(self) -> list[dict]:
-        try:
-            with open(self.current_sequence_json, "r", encoding="utf-8") as file:
-                content = file.read().strip()
-                if not content:
-                    return self.get_default_sequence()
-
-                sequence = json.loads(content)
-                if not sequence or not isinstance(sequence, list):
-                    return self.get_default_sequence()
-
-            return sequence
+    @property
+    def store(self) -> CurrentSequenceStore:
+        """The in-memory store backing current_sequence.json."""
+        return get_current_sequence_store(self.current_sequence_json)
 
-        except (FileNotFoundError, json.JSONDecodeError):
-            # Create the file with default data if it doesn't exist
-            default_sequence = self.get_default_sequence()
+    def load_current_sequence(self) -> list[dict]:
+        sequence = self.store.load()
+        if sequence is None:
+            # Create the file with default data if it is missing or invalid
+            sequence = self.get_default_sequence()
             try:
-                # Ensure the directory exists before creating the file
-                import os
-
-                directory = os.path.dirname(self.current_sequence_json)
-                if directory:
-                    os.makedirs(directory, exist_ok=True)
-
-                # Create the file directly to avoid circular dependencies during initialization
-                with open(self.current_sequence_json, "w", encoding="utf-8") as file:
-                    json.dump(default_sequence, file, indent=4, ensure_ascii=False)
+                self.store.save(sequence)
             except Exception:
-                # If we can't create the file, just return the default sequence
+                # If we can't store it, just return the default sequence
                 pass
-            return default_sequence
+        return sequence
+
+    def _stored_sequence(self) -> list[dict]:
+        """The current sequence for read-only lookups, without copying it."""
+        return self.store.sequence or self.load_current_sequence()
 
     def get_default_sequence(self) -> list[dict]:
         """Return a default sequence if JSON is missing, empty, or invalid."""
@@ -168,39 +161,39 @@ class SequenceDataLoaderSaver:
 
         # Add beat numbers to each beat at the beginning
         beat_number = 0
-        for beat in sequence:
+        for index, beat in enumerate(sequence):
             if LETTER in beat or SEQUENCE_START_POSITION in beat:
                 beat_data_with_beat_number = {BEAT: beat_number}
                 beat_data_with_beat_number.update(beat)
-                sequence[sequence.index(beat)] = beat_data_with_beat_number
+                sequence[index] = beat_data_with_beat_number
                 beat_number += 1
 
-        with open(self.current_sequence_json, "w", encoding="utf-8") as file:
-            json.dump(sequence, file, indent=4, ensure_ascii=False)
+        # Written to current_sequence.json shortly after, off the UI thread
+        self.store.save(sequence)
 
     def clear_current_sequence_file(self):
         self.save_current_sequence([])
 
     def get_json_prop_rot_dir(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence()
+        sequence = self._stored_sequence()
         if sequence:
             return sequence[index][f"{color}_attributes"].get(PROP_ROT_DIR, 0)
         return 0
 
     def get_json_motion_type(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence()
+        sequence = self._stored_sequence()
         if sequence:
             return sequence[index][f"{color}_attributes"].get(MOTION_TYPE, 0)
         return 0
 
     def get_json_prefloat_prop_rot_dir(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence()
+        sequence = self._stored_sequence()
         if sequence:
             return sequence[index][f"{color}_attributes"].get(PREFLOAT_PROP_ROT_DIR, "")
         return 0
 
     def get_json_prefloat_motion_type(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence()
+        sequence = self._stored_sequence()
         if sequence:
             return sequence[index][f"{color}_attributes"].get(
                 PREFLOAT_MOTION_TYPE,
@@ -231,13 +224,13 @@ class SequenceDataLoaderSaver:
         return 0
 
     def load_last_beat_data(self) -> dict:
-        sequence = self.load_current_sequence()
+        sequence = self._stored_sequence()
         if sequence:
-            return sequence[-1]
+            return copy.deepcopy(sequence[-1])
         return {}
 
     def get_json_turns(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence()
+        sequence = self._stored_sequence()
         if sequence:
             return sequence[index][f"{color}_attributes"].get("turns", 0)
         return 0
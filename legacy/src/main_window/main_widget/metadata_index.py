@@ -0,0 +1,336 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Iterable, NamedTuple, Optional
+
+from PIL import Image
+
+from data.constants import DIAMOND, END_POS, GRID_MODE, SEQUENCE_START_POSITION
+from utils.path_helpers import get_user_editable_resource_path
+from utils.png_metadata import read_png_text
+
+INDEX_FILENAME = "metadata_index.db"
+SCHEMA_VERSION = 1
+
+
+class ThumbnailRecord(NamedTuple):
+    """The browse-relevant fields of one thumbnail's embedded metadata."""
+
+    has_metadata: bool = False
+    author: Optional[str] = None
+    level: Optional[int] = None
+    length: int = 0
+    start_pos: Optional[str] = None
+    grid_mode: str = DIAMOND
+    is_favorite: bool = False
+    date_added: Optional[str] = None
+    tags: tuple[str, ...] = ()
+
+
+EMPTY_RECORD = ThumbnailRecord()
+
+
+class MetadataIndex:
+    """
+    On-disk index of the metadata embedded in dictionary thumbnails.
+
+    Each thumbnail is keyed by its path and validated against its mtime and
+    size on every lookup, so a PNG is only opened when it is new or has
+    changed since it was last indexed. The browse fields are kept in memory;
+    the full metadata JSON stays in SQLite until someone asks for it.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or get_user_editable_resource_path(INDEX_FILENAME)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        self._records: dict[str, tuple[int, int, ThumbnailRecord]] = (
+            self._load_records()
+        )
+
+    def record(self, path: str) -> ThumbnailRecord:
+        """Return the indexed fields for a thumbnail, re-reading it if it changed."""
+        with self._lock:
+            try:
+                return self._lookup(path)
+            finally:
+                self._commit()
+
+    def records(self, paths: Iterable[str]) -> dict[str, ThumbnailRecord]:
+        """Look up many thumbnails at once; unreadable files get an empty record."""
+        results = {}
+        with self._lock:
+            try:
+                for path in paths:
+                    try:
+                        results[path] = self._lookup(path)
+                    except Exception as e:
+                        self.logger.warning(f"Could not index {path}: {e}")
+                        results[path] = EMPTY_RECORD
+            finally:
+                self._commit()
+        return results
+
+    def metadata(self, path: str) -> Optional[dict]:
+        """Return the full embedded metadata of a thumbnail, or None if it has none."""
+        with self._lock:
+            try:
+                if not self._lookup(path).has_metadata:
+                    return None
+            finally:
+                self._commit()
+            row = self._connection.execute(
+                "SELECT metadata FROM thumbnails WHERE path = ?", (path,)
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def indexed_metadata(self, path: str) -> Optional[dict]:
+        """
+        Return a thumbnail's metadata if the index is up to date for it,
+        without reading the file otherwise. For callers on the GUI thread
+        that can wait for the background scan to index the rest.
+        """
+        with self._lock:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                return None
+            if not self._is_current(path, stat):
+                return None
+            if not self._records[path][2].has_metadata:
+                return None
+            row = self._connection.execute(
+                "SELECT metadata FROM thumbnails WHERE path = ?", (path,)
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def store(self, path: str, metadata: Optional[dict]) -> None:
+        """Record metadata that was just written to a thumbnail."""
+        raw = json.dumps(metadata) if metadata is not None else None
+        stat = os.stat(path)
+        with self._lock:
+            try:
+                self._index(path, stat.st_mtime_ns, stat.st_size, raw)
+            finally:
+                self._commit()
+
+    def stale_paths(self, paths: Iterable[str]) -> list[str]:
+        """Return the thumbnails that are new or have changed since they were indexed."""
+        stale = []
+        with self._lock:
+            try:
+                for path in paths:
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        self._forget(path)
+                        continue
+                    if not self._is_current(path, stat):
+                        stale.append(path)
+            finally:
+                self._commit()
+        return stale
+
+    def add_scanned(
+        self,
+        scanned: Iterable[tuple[str, int, int, Optional[str], ThumbnailRecord]],
+    ) -> None:
+        """Index (path, mtime_ns, size, raw metadata, record) tuples read elsewhere."""
+        with self._lock:
+            try:
+                for path, mtime_ns, size, raw, record in scanned:
+                    self._index(path, mtime_ns, size, raw, record)
+            finally:
+                self._commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM thumbnails")
+            self._connection.commit()
+            self._records.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self._commit()
+            self._connection.close()
+
+    def _lookup(self, path: str) -> ThumbnailRecord:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._forget(path)
+            raise
+
+        if self._is_current(path, stat):
+            return self._records[path][2]
+
+        if path.lower().endswith(".png"):
+            raw = read_png_text(path, "metadata")
+        else:
+            with Image.open(path) as img:
+                raw = img.info.get("metadata")
+        return self._index(path, stat.st_mtime_ns, stat.st_size, raw)
+
+    def _is_current(self, path: str, stat: os.stat_result) -> bool:
+        cached = self._records.get(path)
+        return (
+            cached is not None
+            and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size
+        )
+
+    def _index(
+        self,
+        path: str,
+        mtime_ns: int,
+        size: int,
+        raw: Optional[str],
+        record: Optional[ThumbnailRecord] = None,
+    ):
+        if record is None:
+            record = parse_record(raw)
+        self._connection.execute(
+            "INSERT OR REPLACE INTO thumbnails VALUES "
+            "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                mtime_ns,
+                size,
+                record.has_metadata,
+                record.author,
+                record.level,
+                record.length,
+                record.start_pos,
+                record.grid_mode,
+                record.is_favorite,
+                record.date_added,
+                json.dumps(record.tags),
+                raw,
+            ),
+        )
+        self._dirty = True
+        self._records[path] = (mtime_ns, size, record)
+        return record
+
+    def _forget(self, path: str) -> None:
+        if self._records.pop(path, None) is not None:
+            self._connection.execute("DELETE FROM thumbnails WHERE path = ?", (path,))
+            self._dirty = True
+
+    def _commit(self) -> None:
+        if self._dirty:
+            self._connection.commit()
+            self._dirty = False
+
+    def _create_schema(self) -> None:
+        (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            self._connection.execute("DROP TABLE IF EXISTS thumbnails")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS thumbnails (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                has_metadata INTEGER NOT NULL,
+                author TEXT,
+                level INTEGER,
+                length INTEGER NOT NULL,
+                start_pos TEXT,
+                grid_mode TEXT NOT NULL,
+                is_favorite INTEGER NOT NULL,
+                date_added TEXT,
+                tags TEXT NOT NULL,
+                metadata TEXT
+            )
+            """
+        )
+        self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._connection.commit()
+
+    def _load_records(self) -> dict[str, tuple[int, int, ThumbnailRecord]]:
+        rows = self._connection.execute(
+            "SELECT path, mtime_ns, size, has_metadata, author, level, length, "
+            "start_pos, grid_mode, is_favorite, date_added, tags FROM thumbnails"
+        )
+        records = {}
+        for (path, mtime_ns, size, has_metadata, author, level, length,
+             start_pos, grid_mode, is_favorite, date_added, tags) in rows:
+            records[path] = (
+                mtime_ns,
+                size,
+                ThumbnailRecord(
+                    bool(has_metadata),
+                    author,
+                    level,
+                    length,
+                    start_pos,
+                    grid_mode,
+                    bool(is_favorite),
+                    date_added,
+                    tuple(json.loads(tags)),
+                ),
+            )
+        return records
+
+
+def parse_record(raw: Optional[str]) -> ThumbnailRecord:
+    """Build the indexed fields from a thumbnail's raw metadata JSON."""
+    return _record_from_metadata(json.loads(raw)) if raw else EMPTY_RECORD
+
+
+def _record_from_metadata(metadata: dict) -> ThumbnailRecord:
+    sequence = metadata.get("sequence")
+    if not sequence:
+        return ThumbnailRecord(
+            has_metadata=True,
+            is_favorite=bool(metadata.get("is_favorite", False)),
+            date_added=metadata.get("date_added"),
+            tags=tuple(metadata.get("tags", [])),
+        )
+
+    header = sequence[0]
+    return ThumbnailRecord(
+        has_metadata=True,
+        author=header.get("author"),
+        level=header.get("level"),
+        length=len(sequence) - 2,
+        start_pos=_start_pos(sequence),
+        grid_mode=header.get(GRID_MODE, DIAMOND),
+        is_favorite=bool(metadata.get("is_favorite", False)),
+        date_added=metadata.get("date_added"),
+        tags=tuple(metadata.get("tags", [])),
+    )
+
+
+def _start_pos(sequence: list[dict]) -> Optional[str]:
+    if len(sequence) < 2:
+        return None
+    start_pos_entry = sequence[1]
+    if SEQUENCE_START_POSITION in start_pos_entry:
+        return start_pos_entry[SEQUENCE_START_POSITION]
+    end_pos = start_pos_entry.get(END_POS, "")
+    for position in ("alpha", "beta", "gamma"):
+        if end_pos.startswith(position):
+            return position
+    return None
+
+
+_shared_index: Optional[MetadataIndex] = None
+_shared_index_lock = threading.Lock()
+
+
+def get_metadata_index() -> MetadataIndex:
+    """Return the process-wide metadata index, opening it on first use."""
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = MetadataIndex()
+        return _shared_index
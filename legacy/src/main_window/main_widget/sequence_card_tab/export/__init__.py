@@ -5,6 +5,7 @@ from .export_ui_manager import ExportUIManager
 from .page_image_data_extractor import PageImageDataExtractor
 from .export_grid_calculator import ExportGridCalculator
 from .export_page_renderer import ExportPageRenderer
+from .sequence_card_export_pipeline import SequenceCardExportPipeline
 
 __all__ = [
     "SequenceCardImageExporter",
@@ -14,4 +15,5 @@ __all__ = [
     "PageImageDataExtractor",
     "ExportGridCalculator",
     "ExportPageRenderer",
+    "SequenceCardExportPipeline",
 ]
@@ -1,6 +1,5 @@
 # src/main_window/main_widget/sequence_card_tab/export/image_exporter.py
 from datetime import datetime
-import json
 import os
 import gc
 import time
@@ -8,15 +7,14 @@ import psutil
 import io
 from PyQt6.QtGui import QImage
 from PyQt6.QtCore import QBuffer, Qt
-from typing import TYPE_CHECKING
-from PIL import Image, PngImagePlugin
-import numpy as np
-from PyQt6.QtWidgets import QApplication
+from typing import TYPE_CHECKING, Optional
+from PIL import Image
 
 from main_window.main_widget.browse_tab.temp_beat_frame.temp_beat_frame import (
     TempBeatFrame,
 )
 
+from data.constants import SEQUENCE_START_POSITION
 from main_window.main_widget.metadata_extractor import MetaDataExtractor
 from main_window.main_widget.sequence_workbench.legacy_beat_frame.image_export_manager.image_export_manager import (
     ImageExportManager,
@@ -25,10 +23,66 @@ from utils.path_helpers import (
     get_dictionary_path,
     get_sequence_card_image_exporter_path,
 )
+from utils.png_encoder import get_png_encoder, qimage_to_pil, save_png
+from utils.reversal_detector import ReversalDetector
+from .sequence_card_export_pipeline import (
+    ExportJob,
+    ExportManifest,
+    SequenceCardExportPipeline,
+    list_export_jobs,
+)
 
 if TYPE_CHECKING:
     from ..tab import SequenceCardTab
 
+# Export options for sequence cards, with all required metadata visible
+SEQUENCE_CARD_EXPORT_OPTIONS = {
+    "add_word": True,  # Show the word
+    "add_user_info": True,  # Show author info
+    "add_difficulty_level": True,  # Show difficulty level
+    "add_date": True,  # Show date
+    "add_note": True,  # Show any notes
+    "add_beat_numbers": True,  # Show beat numbers
+    "add_reversal_symbols": True,  # Show reversal symbols
+    "combined_grids": False,  # Don't use combined grids
+    "include_start_position": True,  # Include start position
+}
+
+# Options the image creator reads for every card. add_note and add_date are
+# not drawn, and add_reversal_symbols only matters when there is a reversal.
+CARD_RENDER_OPTIONS = (
+    "add_word",
+    "add_user_info",
+    "add_difficulty_level",
+    "add_beat_numbers",
+    "include_start_position",
+    "combined_grids",
+)
+
+
+def has_reversals(sequence: list[dict]) -> bool:
+    """Whether any beat reverses a prop rotation, as BeatReversalProcessor sees it."""
+    sequence_so_far = []
+    for beat_data in sequence[2:]:
+        filtered = [
+            beat
+            for beat in sequence_so_far
+            if not beat.get(SEQUENCE_START_POSITION)
+            and not beat.get("is_placeholder", False)
+        ]
+        if any(ReversalDetector.detect_reversal(filtered, beat_data).values()):
+            return True
+        sequence_so_far.append(beat_data)
+    return False
+
+
+def card_export_options(sequence: list[dict], options: dict) -> dict:
+    """The export options that change how this sequence's card is drawn."""
+    keys = list(CARD_RENDER_OPTIONS)
+    if has_reversals(sequence):
+        keys.append("add_reversal_symbols")
+    return {key: options.get(key) for key in keys}
+
 
 class SequenceCardImageExporter:
     def __init__(self, sequence_card_tab: "SequenceCardTab"):
@@ -41,112 +95,101 @@ class SequenceCardImageExporter:
         self.metadata_extractor = MetaDataExtractor()
         self.progress_dialog = None
         self.cancel_requested = False
+        self.pipeline: Optional[SequenceCardExportPipeline] = None
 
-        # Optimized batch processing settings
-        self.batch_size = 15  # Process 15 images at a time for better throughput
-        self.memory_check_interval = 5  # Check memory every 5 images
+        # Parallel encoding settings (cards are encoded on the shared PNG encoder)
+        self.max_in_flight = 8  # Rendered cards waiting to be encoded
         self.max_memory_usage_mb = 2000  # Force GC if memory exceeds 2GB
         self.quality_settings = {
-            "png_compression": 1,  # MAXIMUM QUALITY: 0-9, lower is better quality (changed from 6 to 1)
+            "png_profile": "fast",  # PNG is lossless; cards are regenerated, so favour speed
             "high_quality": True,  # Use high quality rendering
         }
 
-    def export_all_images(self):
+    def export_all_images(self) -> dict:
         """
         Dynamically renders sequences from the dictionary with consistent export settings.
 
         This method:
-        1. Loads sequences directly from the dictionary
-        2. Applies consistent export settings to all sequences
-        3. Organizes sequences by word
-        4. Exports them to the dedicated sequence_card_images directory
-        5. Uses smart caching to avoid regenerating unchanged images
-        6. Processes images in batches to limit memory usage
-        7. Implements memory management to prevent out-of-memory errors
+        1. Lists the dictionary sequences once into a work list
+        2. Skips cards whose export manifest entry matches the source file
+           and the export options that affect the card
+        3. Renders the remaining cards with consistent export settings
+        4. Encodes and writes them on the PNG encoder's pool, with a bounded number
+           of rendered cards held in memory
+        5. Exports them to the dedicated sequence_card_images directory
+
+        Returns:
+            dict: total, regenerated, skipped and failed counts
         """
         dictionary_path = get_dictionary_path()
         export_path = get_sequence_card_image_exporter_path()
-
-        # Create the export directory if it doesn't exist
-        if not os.path.exists(export_path):
-            os.makedirs(export_path)
+        os.makedirs(export_path, exist_ok=True)
 
         print(f"Loading sequences from dictionary: {dictionary_path}")
         print(f"Exporting to: {export_path}")
 
-        # Get all word folders in the dictionary
-        word_folders = []
-        for item in os.listdir(dictionary_path):
-            item_path = os.path.join(dictionary_path, item)
-            if os.path.isdir(item_path) and not item.startswith("__"):
-                word_folders.append(item)
-
-        # Count total sequences first for progress tracking
-        total_sequences = self._count_total_sequences(dictionary_path, word_folders)
-
-        # Check initial memory usage
-        self._check_and_manage_memory()
-
-        # Initialize statistics
-        processed_sequences = 0
-        regenerated_count = 0
-        skipped_count = 0
-        failed_count = 0
+        jobs = list_export_jobs(dictionary_path, export_path)
+        print(f"Total sequences to process: {len(jobs)}")
 
+        self.cancel_requested = False
+        self.pipeline = SequenceCardExportPipeline(
+            self._render_card,
+            self._write_card,
+            export_options=SEQUENCE_CARD_EXPORT_OPTIONS,
+            card_options=card_export_options,
+            is_stale=lambda job: self._needs_regeneration(
+                job.source_path, job.output_path
+            )[0],
+            max_in_flight=self.max_in_flight,
+            submit=get_png_encoder().run,
+        )
+        self.pipeline.progress.connect(self._on_export_progress)
         try:
-            # Count total sequences for batch processing
-            all_sequences = []
-            for word in word_folders:
-                word_path = os.path.join(dictionary_path, word)
-                for sequence_file in os.listdir(word_path):
-                    if sequence_file.endswith(".png") and not sequence_file.startswith(
-                        "__"
-                    ):
-                        all_sequences.append((word, sequence_file))
-
-            total_sequences = len(all_sequences)
-            print(f"Total sequences to process: {total_sequences}")
-
-            # Process sequences in batches
-            batch_size = self.batch_size
-            for batch_start in range(0, total_sequences, batch_size):
-                if self.cancel_requested:
-                    break
-
-                batch_end = min(batch_start + batch_size, total_sequences)
-                print(
-                    f"Processing batch {batch_start//batch_size + 1} of {(total_sequences + batch_size - 1)//batch_size} (sequences {batch_start+1}-{batch_end})"
-                )
-
-                # Process the current batch
-                processed_sequences, regenerated_count, skipped_count, failed_count = (
-                    self._process_sequence_batch(
-                        word_folders,
-                        dictionary_path,
-                        export_path,
-                        batch_start,
-                        batch_end,
-                        processed_sequences,
-                        total_sequences,
-                        regenerated_count,
-                        skipped_count,
-                        failed_count,
-                    )
-                )
-
-                # Force garbage collection between batches
-                self._check_and_manage_memory(force_cleanup=True)
+            stats = self.pipeline.run(jobs, ExportManifest(export_path))
+        finally:
+            self.pipeline = None
+            self._check_and_manage_memory(force_cleanup=True)
 
-                # Process events to keep UI responsive
-                QApplication.processEvents()
+        print(
+            f"Sequence cards: {stats['regenerated']} regenerated, "
+            f"{stats['skipped']} up to date, {stats['failed']} failed"
+        )
+        return stats
+
+    def _render_card(self, job: ExportJob) -> Optional[tuple[QImage, dict]]:
+        """Render one card on the GUI thread."""
+        metadata = self.metadata_extractor.extract_metadata_from_file(job.source_path)
+        if not metadata or "sequence" not in metadata:
+            return None
+
+        sequence = metadata["sequence"]
+        self.temp_beat_frame.load_sequence(sequence)
+        # create_sequence_image adds layout keys to the options it is given
+        qimage = self.export_manager.image_creator.create_sequence_image(
+            sequence,
+            dict(SEQUENCE_CARD_EXPORT_OPTIONS),
+            dictionary=False,
+            fullscreen_preview=False,
+        )
 
-        except Exception:
-            pass
-        finally:
-            pass
+        metadata = dict(metadata)
+        metadata["export_options"] = dict(SEQUENCE_CARD_EXPORT_OPTIONS)
+        metadata["export_date"] = datetime.now().isoformat()
+        return qimage, metadata
+
+    def _write_card(self, job: ExportJob, qimage: QImage, metadata: dict) -> None:
+        """Convert, encode and atomically write one card on a worker thread."""
+        save_png(
+            self.qimage_to_pil(qimage),
+            job.output_path,
+            profile=self.quality_settings["png_profile"],
+            metadata=metadata,
+        )
 
-            # Final memory cleanup
-            self._check_and_manage_memory(force_cleanup=True)
+    def _on_export_progress(self, finished: int, total: int) -> None:
+        self.sequence_card_tab.header.description_label.setText(
+            f"Generating sequence images... ({finished}/{total})"
+        )
 
     def get_all_images(self, path: str) -> list[str]:
         images = []
@@ -208,33 +251,13 @@ class SequenceCardImageExporter:
                     Qt.TransformationMode.SmoothTransformation,
                 )
 
-            # Convert to ARGB32 format
-            qimage = qimage.convertToFormat(QImage.Format.Format_ARGB32)
-            width, height = qimage.width(), qimage.height()
-
-            # Get image data
-            ptr = qimage.bits()
-            ptr.setsize(height * width * 4)
-
-            # Process in chunks to reduce memory pressure
+            # Wrap the pixels without copying them
             try:
-                # Create numpy array with copy=True to ensure memory safety
-                arr = np.array(ptr, copy=True).reshape((height, width, 4))
-
-                # Convert from ARGB to RGBA
-                arr = arr[..., [2, 1, 0, 3]]
-
-                # Create PIL image
-                pil_image = Image.fromarray(arr, "RGBA")
-
-                # Clear the numpy array to free memory
-                arr = None
-
-                return pil_image
+                return qimage_to_pil(qimage)
 
             except MemoryError:
-                # If we hit a memory error during numpy processing, try a different approach
-                print("Memory error during numpy processing, trying alternative method")
+                # If we hit a memory error during conversion, try a different approach
+                print("Memory error during conversion, trying alternative method")
                 return self._alternative_qimage_to_pil(qimage)
 
         except MemoryError as e:
@@ -277,27 +300,11 @@ class SequenceCardImageExporter:
             error_image = Image.new("RGBA", (400, 300), (255, 0, 0, 128))
             return error_image
 
-    def _create_png_info(self, metadata: dict) -> PngImagePlugin.PngInfo:
-        info = PngImagePlugin.PngInfo()
-        info.add_text("metadata", json.dumps(metadata))
-        return info
-
     def _on_cancel_requested(self):
         """Handle cancel button click in the progress dialog."""
         self.cancel_requested = True
-
-    def _count_total_sequences(self, dictionary_path: str, word_folders: list) -> int:
-        """Count the total number of sequences for progress tracking."""
-        total = 0
-        for word in word_folders:
-            word_path = os.path.join(dictionary_path, word)
-            sequences = [
-                f
-                for f in os.listdir(word_path)
-                if f.endswith(".png") and not f.startswith("__")
-            ]
-            total += len(sequences)
-        return total
+        if self.pipeline:
+            self.pipeline.cancel()
 
     def _check_and_manage_memory(self, force_cleanup: bool = False) -> float:
         """
@@ -336,7 +343,11 @@ class SequenceCardImageExporter:
         self, source_path: str, output_path: str
     ) -> tuple[bool, str]:
         """
-        Determine if an image needs to be regenerated.
+        Determine if an image needs to be regenerated from both PNGs' metadata.
+
+        Only used for cards without an export manifest entry, i.e. cards
+        exported before the manifest existed; every later check is a stat
+        and a manifest lookup.
 
         Args:
             source_path: Path to the source sequence file
@@ -385,136 +396,3 @@ class SequenceCardImageExporter:
         except Exception as e:
             print(f"Error checking if regeneration is needed: {e}")
             return True, f"Error during check: {str(e)}"
-
-    def _process_sequence_batch(
-        self,
-        word_folders: list,
-        dictionary_path: str,
-        export_path: str,
-        start_index: int,
-        end_index: int,
-        processed_sequences: int,
-        total_sequences: int,
-        regenerated_count: int,
-        skipped_count: int,
-        failed_count: int,
-    ) -> tuple[int, int, int, int]:
-        """
-        Process a batch of sequences to limit memory usage.
-
-        Args:
-            word_folders: List of word folders to process
-            dictionary_path: Path to the dictionary
-            export_path: Path to export the images
-            start_index: Start index of the batch
-            end_index: End index of the batch
-            processed_sequences: Number of sequences processed so far
-            total_sequences: Total number of sequences to process
-            regenerated_count: Number of sequences regenerated so far
-            skipped_count: Number of sequences skipped so far
-            failed_count: Number of sequences failed so far
-
-        Returns:
-            tuple: (processed_sequences, regenerated_count, skipped_count, failed_count)
-        """
-        # Flatten the list of sequences for batch processing
-        all_sequences = []
-        for word in word_folders:
-            word_path = os.path.join(dictionary_path, word)
-            for sequence_file in os.listdir(word_path):
-                if sequence_file.endswith(".png") and not sequence_file.startswith(
-                    "__"
-                ):
-                    all_sequences.append((word, sequence_file))
-
-        # Process only the current batch
-        batch_sequences = all_sequences[start_index:end_index]
-
-        # Process each sequence in the batch
-        for word, sequence_file in batch_sequences:
-            if self.cancel_requested:
-                break
-
-            word_path = os.path.join(dictionary_path, word)
-            sequence_path = os.path.join(word_path, sequence_file)
-
-            # Create word-specific folder in the export directory
-            word_export_path = os.path.join(export_path, word)
-            os.makedirs(word_export_path, exist_ok=True)
-
-            output_path = os.path.join(word_export_path, sequence_file)
-
-            # Check memory usage every few images
-            if processed_sequences % self.memory_check_interval == 0:
-                self._check_and_manage_memory()
-
-            # Process events to keep UI responsive
-            QApplication.processEvents()
-
-            # Check if we need to regenerate this image
-            needs_regeneration, reason = self._needs_regeneration(
-                sequence_path, output_path
-            )
-
-            if needs_regeneration:
-                # Extract metadata
-                metadata = self.metadata_extractor.extract_metadata_from_file(
-                    sequence_path
-                )
-                if metadata and "sequence" in metadata:
-                    sequence = metadata["sequence"]
-
-                    # Set export options with all required metadata visible
-                    options = {
-                        "add_word": True,  # Show the word
-                        "add_user_info": True,  # Show author info
-                        "add_difficulty_level": True,  # Show difficulty level
-                        "add_date": True,  # Show date
-                        "add_note": True,  # Show any notes
-                        "add_beat_numbers": True,  # Show beat numbers
-                        "add_reversal_symbols": True,  # Show reversal symbols
-                        "combined_grids": False,  # Don't use combined grids
-                        "include_start_position": True,  # Include start position
-                    }
-
-                    try:
-                        # Generate the image
-                        self.temp_beat_frame.load_sequence(sequence)
-                        qimage = (
-                            self.export_manager.image_creator.create_sequence_image(
-                                sequence,
-                                options,
-                                dictionary=False,
-                                fullscreen_preview=False,
-                            )
-                        )
-
-                        # Convert to PIL image for better compression
-                        pil_image = self.qimage_to_pil(qimage)
-
-                        # Add metadata to the image
-                        metadata["export_options"] = options
-                        metadata["export_date"] = datetime.now().isoformat()
-                        png_info = self._create_png_info(metadata)
-
-                        # Save with optimized compression
-                        pil_image.save(
-                            output_path,
-                            "PNG",
-                            compress_level=self.quality_settings["png_compression"],
-                            pnginfo=png_info,
-                        )
-
-                        regenerated_count += 1
-
-                    except Exception:
-                        failed_count += 1
-                else:
-                    failed_count += 1
-            else:
-                # Skip regeneration
-                skipped_count += 1
-
-            processed_sequences += 1
-
-        return processed_sequences, regenerated_count, skipped_count, failed_count
@@ -0,0 +1,321 @@
+# src/main_window/main_widget/sequence_card_tab/export/sequence_card_export_pipeline.py
+"""
+Streaming export of dictionary sequences to sequence card images.
+
+The dictionary is listed once into a work list. Cards whose manifest entry
+still matches their source file and the current export options are skipped
+without rendering. The rest are rendered on the GUI thread (the beat frame
+is a widget) and handed to a thread pool that converts, encodes and writes
+the PNG, by default one owned by the run. A semaphore bounds how many
+rendered cards are held in memory.
+"""
+import hashlib
+import json
+import os
+import queue
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QImage
+from PyQt6.QtWidgets import QApplication
+
+from utils.file_modes import match_file_mode
+from utils.png_metadata import read_png_text
+
+MANIFEST_FILENAME = "export_manifest.json"
+MANIFEST_VERSION = 2
+
+
+def content_hash(value) -> str:
+    """Stable hash of JSON-serialisable content."""
+    data = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def read_source_metadata(path: str) -> Optional[dict]:
+    """Read the metadata chunk of a dictionary PNG without decoding it."""
+    try:
+        text = read_png_text(path)
+        return json.loads(text) if text else None
+    except (OSError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class ExportJob:
+    """One dictionary sequence and the card image it exports to."""
+
+    word: str
+    source_path: str
+    output_path: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.word}/{os.path.basename(self.output_path)}"
+
+
+def list_export_jobs(dictionary_path: str, export_path: str) -> list[ExportJob]:
+    """List every dictionary sequence in a single pass over the word folders."""
+    jobs = []
+    with os.scandir(dictionary_path) as words:
+        for word in sorted(words, key=lambda entry: entry.name):
+            if not word.is_dir() or word.name.startswith("__"):
+                continue
+            with os.scandir(word.path) as files:
+                for file in sorted(files, key=lambda entry: entry.name):
+                    if file.name.endswith(".png") and not file.name.startswith("__"):
+                        jobs.append(
+                            ExportJob(
+                                word.name,
+                                file.path,
+                                os.path.join(export_path, word.name, file.name),
+                            )
+                        )
+    return jobs
+
+
+class ExportManifest:
+    """
+    Records what each exported card was rendered from.
+
+    Entries are keyed by "<word>/<file>" and hold the source mtime_ns and
+    size, a hash of the source sequence, the export options that affected
+    the card and their hash, and the output path. A card is current when its
+    output exists, the options it recorded still have the same values, and
+    its source either has the same stat or, if it was touched (tags and
+    favorites are written back into the PNG), the same sequence.
+
+    The manifest is a JSON file next to the exported cards.
+    """
+
+    def __init__(self, export_path: str):
+        self.path = os.path.join(export_path, MANIFEST_FILENAME)
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self._entries = data.get("cards", {})
+        except (OSError, ValueError):
+            pass
+
+    def has_entry(self, job: ExportJob) -> bool:
+        with self._lock:
+            return job.key in self._entries
+
+    def is_current(self, job: ExportJob, export_options: dict) -> bool:
+        with self._lock:
+            entry = self._entries.get(job.key)
+        if entry is None or not os.path.exists(job.output_path):
+            return False
+        try:
+            source = os.stat(job.source_path)
+        except OSError:
+            return False
+
+        options = {key: export_options.get(key) for key in entry["option_keys"]}
+        if content_hash(options) != entry["options_hash"]:
+            return False
+        if (
+            entry["source_mtime_ns"] == source.st_mtime_ns
+            and entry["source_size"] == source.st_size
+        ):
+            return True
+
+        metadata = read_source_metadata(job.source_path)
+        sequence = metadata.get("sequence") if metadata else None
+        if sequence is None or content_hash(sequence) != entry["sequence_hash"]:
+            return False
+        with self._lock:
+            entry["source_mtime_ns"] = source.st_mtime_ns
+            entry["source_size"] = source.st_size
+        return True
+
+    def record(self, job: ExportJob, sequence: list, card_options: dict) -> None:
+        """Record an exported card and the options that affected it."""
+        source = os.stat(job.source_path)
+        with self._lock:
+            self._entries[job.key] = {
+                "source_mtime_ns": source.st_mtime_ns,
+                "source_size": source.st_size,
+                "sequence_hash": content_hash(sequence),
+                "option_keys": sorted(card_options),
+                "options_hash": content_hash(card_options),
+                "output": job.output_path,
+            }
+
+    def discard(self, job: ExportJob) -> None:
+        with self._lock:
+            self._entries.pop(job.key, None)
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        with self._lock:
+            data = json.dumps(
+                {"version": MANIFEST_VERSION, "cards": self._entries}, sort_keys=True
+            )
+        directory = os.path.dirname(self.path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            match_file_mode(tmp_path, self.path)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class SequenceCardExportPipeline(QObject):
+    """
+    Runs an export work list: stale check, render, then parallel encode.
+
+    render(job) runs on the calling (GUI) thread and returns the card image
+    and the metadata to embed (including "sequence"), or None if the
+    sequence cannot be rendered. write(job, image, metadata) runs on a
+    worker thread and must write the card to job.output_path.
+
+    card_options(sequence, export_options) picks the options that affect a
+    card, so changing any other option leaves it current. By default every
+    option does.
+
+    is_stale(job) is consulted for cards without a manifest entry, so cards
+    exported before the manifest existed are adopted instead of re-rendered.
+
+    submit(function, *args) runs the encoding work and returns a Future; it
+    lets the export share an existing pool, such as the PNG encoder's.
+    Without it, each run encodes on its own pool of max_workers threads.
+    """
+
+    progress = pyqtSignal(int, int)  # cards finished, total cards
+    finished = pyqtSignal(dict)
+
+    def __init__(
+        self,
+        render: Callable[[ExportJob], Optional[tuple[QImage, dict]]],
+        write: Callable[[ExportJob, QImage, dict], None],
+        export_options: Optional[dict] = None,
+        card_options: Optional[Callable[[list, dict], dict]] = None,
+        is_stale: Optional[Callable[[ExportJob], bool]] = None,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        submit: Optional[Callable[..., Future]] = None,
+    ):
+        super().__init__()
+        self.render = render
+        self.write = write
+        self.export_options = dict(export_options or {})
+        self.card_options = card_options or (lambda sequence, options: options)
+        self.is_stale = is_stale
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_in_flight = max_in_flight or self.max_workers * 2
+        self.submit = submit
+        self.cancel_requested = False
+
+    def cancel(self) -> None:
+        self.cancel_requested = True
+
+    def run(self, jobs: list[ExportJob], manifest: ExportManifest) -> dict:
+        """Export jobs, returning the regenerated/skipped/failed counts."""
+        stats = {"total": len(jobs), "regenerated": 0, "skipped": 0, "failed": 0}
+        slots = threading.BoundedSemaphore(self.max_in_flight)
+        written: "queue.SimpleQueue[tuple[ExportJob, bool]]" = queue.SimpleQueue()
+        in_flight = 0
+        finished = 0
+
+        def encode(job: ExportJob, image: QImage, metadata: dict) -> None:
+            try:
+                self.write(job, image, metadata)
+                self._record(manifest, job, metadata.get("sequence", []))
+                written.put((job, True))
+            except Exception:
+                manifest.discard(job)
+                written.put((job, False))
+            finally:
+                slots.release()
+
+        def collect(block: bool) -> None:
+            nonlocal in_flight, finished
+            while in_flight:
+                try:
+                    _, ok = written.get(block=block)
+                except queue.Empty:
+                    return
+                in_flight -= 1
+                finished += 1
+                stats["regenerated" if ok else "failed"] += 1
+                self.progress.emit(finished, len(jobs))
+                block = False
+
+        if self.submit is None:
+            own_pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="card-export"
+            )
+        else:
+            own_pool = nullcontext()
+        with own_pool as pool:
+            submit = self.submit or pool.submit
+            for job in jobs:
+                if self.cancel_requested:
+                    break
+                collect(block=False)
+
+                if self._is_current(job, manifest):
+                    stats["skipped"] += 1
+                    finished += 1
+                    self.progress.emit(finished, len(jobs))
+                    continue
+
+                os.makedirs(os.path.dirname(job.output_path), exist_ok=True)
+                try:
+                    rendered = self.render(job)
+                except Exception:
+                    rendered = None
+                if rendered is None:
+                    stats["failed"] += 1
+                    finished += 1
+                    self.progress.emit(finished, len(jobs))
+                    continue
+
+                # Blocks while max_in_flight cards are waiting to be encoded
+                slots.acquire()
+                try:
+                    submit(encode, job, *rendered)
+                except Exception:
+                    # e.g. the pool has shut down; encode will never run
+                    slots.release()
+                    manifest.discard(job)
+                    stats["failed"] += 1
+                    finished += 1
+                    self.progress.emit(finished, len(jobs))
+                    continue
+                in_flight += 1
+                QApplication.processEvents()
+
+            while in_flight:
+                collect(block=True)
+
+        manifest.save()
+        self.finished.emit(stats)
+        return stats
+
+    def _is_current(self, job: ExportJob, manifest: ExportManifest) -> bool:
+        if manifest.has_entry(job):
+            return manifest.is_current(job, self.export_options)
+        if self.is_stale is None or not os.path.exists(job.output_path):
+            return False
+        metadata = read_source_metadata(job.source_path)
+        if not metadata or self.is_stale(job):
+            return False
+        self._record(manifest, job, metadata.get("sequence", []))
+        return True
+
+    def _record(self, manifest: ExportManifest, job: ExportJob, sequence: list):
+        options = self.card_options(sequence, self.export_options)
+        manifest.record(job, sequence, options)
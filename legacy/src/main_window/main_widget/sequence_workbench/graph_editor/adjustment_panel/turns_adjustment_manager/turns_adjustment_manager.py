@@ -282,10 +282,18 @@ class TurnsAdjustmentManager(QObject):
         return "standard"
 
     def _sync_external_state(self):
-        AppContext.main_widget().json_manager.ori_validation_engine.run(True)
+        beat_frame = self._get_sequence_beat_frame()
+        # Only the edited beat and the beats after it can change orientation
+        start_index = (
+            beat_frame.get.index_of_currently_selected_beat() + 2
+            if beat_frame
+            else None
+        )
+        AppContext.main_widget().json_manager.ori_validation_engine.run(
+            True, start_index
+        )
         sequence = AppContext.json_manager().loader_saver.load_current_sequence()
 
-        beat_frame = self._get_sequence_beat_frame()
         if beat_frame:
             beat_frame.updater.update_beats_from(sequence)
 
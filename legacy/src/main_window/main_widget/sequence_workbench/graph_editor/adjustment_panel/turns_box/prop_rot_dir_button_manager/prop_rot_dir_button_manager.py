@@ -174,7 +174,7 @@ class PropRotDirButtonManager:
             json_index, motion.state.color, motion.state.prop_rot_dir
         )
         self.graph_editor.main_widget.json_manager.ori_validation_engine.run(
-            is_current_sequence=True
+            is_current_sequence=True, start_index=json_index
         )
         self.graph_editor.sequence_workbench.beat_frame.updater.update_beats_from_current_sequence_json()
         self.graph_editor.main_widget.sequence_workbench.current_word_label.set_current_word(
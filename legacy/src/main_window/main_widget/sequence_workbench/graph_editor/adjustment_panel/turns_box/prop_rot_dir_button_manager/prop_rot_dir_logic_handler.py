@@ -183,7 +183,7 @@ class PropRotDirLogicHandler(QObject):
 
         # Run orientation validation
         self.turns_box.graph_editor.main_widget.json_manager.ori_validation_engine.run(
-            is_current_sequence=True
+            is_current_sequence=True, start_index=json_index
         )
 
         # Detect reversals
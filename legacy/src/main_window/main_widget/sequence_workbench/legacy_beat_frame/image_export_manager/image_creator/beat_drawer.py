@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING
-from PyQt6.QtGui import QPainter, QImage, QPixmap
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter, QImage
 
 from base_widgets.pictograph.elements.views.beat_view import (
     LegacyBeatView,
@@ -8,6 +7,9 @@ from base_widgets.pictograph.elements.views.beat_view import (
 from main_window.main_widget.sequence_workbench.legacy_beat_frame.image_export_manager.image_creator.combined_grid_handler import (
     CombinedGridHandler,
 )
+from main_window.main_widget.sequence_workbench.legacy_beat_frame.image_export_manager.image_creator.beat_renderer import (
+    BeatRenderer,
+)
 
 
 if TYPE_CHECKING:
@@ -19,6 +21,7 @@ class BeatDrawer:
         self.image_creator = image_creator
         self.beat_frame = image_creator.export_manager.beat_frame
         self.combined_grid_handler = CombinedGridHandler(image_creator)
+        self.renderer = BeatRenderer(self.combined_grid_handler)
 
     def draw_beats(
         self,
@@ -33,6 +36,9 @@ class BeatDrawer:
         """
         Draw beats onto the image using the specified layout.
 
+        Beats are rendered off-screen at beat_size by the BeatRenderer, so the
+        beat views do not need to be shown.
+
         Parameters:
             column_count: Number of columns in the image layout
             row_count: Number of rows in the image layout
@@ -56,10 +62,14 @@ class BeatDrawer:
         )
 
         if include_start_pos:
-            start_pos_pixmap = self._grab_pixmap(
-                self.beat_frame.start_pos_view, beat_size, beat_size, use_combined_grids
+            self.renderer.draw_beat(
+                painter,
+                self.beat_frame.start_pos_view.beat,
+                0,
+                additional_height_top,
+                beat_size,
+                use_combined_grids,
             )
-            painter.drawPixmap(0, additional_height_top, start_pos_pixmap)
             start_col = 1
         else:
             start_col = 0
@@ -69,32 +79,16 @@ class BeatDrawer:
                 if beat_number < len(filled_beats):
                     beat_view = filled_beats[beat_number]
 
-                    beat_pixmap = self._grab_pixmap(
-                        beat_view, beat_size, beat_size, use_combined_grids
-                    )
-                    # Add border_width to position to account for the border
                     target_x = col * beat_size
                     target_y = row * beat_size + additional_height_top
-                    painter.drawPixmap(target_x, target_y, beat_pixmap)
+                    self.renderer.draw_beat(
+                        painter,
+                        beat_view.beat,
+                        target_x,
+                        target_y,
+                        beat_size,
+                        use_combined_grids,
+                    )
                     beat_number += 1
 
         painter.end()
-
-    def _grab_pixmap(
-        self,
-        view: "LegacyBeatView",
-        width: int,
-        height: int,
-        use_combined_grids: bool = False,
-    ) -> QPixmap:
-        if use_combined_grids:
-            return self.combined_grid_handler.process_beat_for_combined_grids(
-                view, width
-            )
-        else:
-            return view.beat.grabber.grab().scaled(
-                width,
-                height,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
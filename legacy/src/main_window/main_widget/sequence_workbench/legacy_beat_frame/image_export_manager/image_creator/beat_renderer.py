@@ -0,0 +1,143 @@
+import json
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+from PyQt6.QtCore import QRectF, Qt
+from PyQt6.QtGui import QColor, QImage, QPainter
+from PyQt6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+
+if TYPE_CHECKING:
+    from main_window.main_widget.sequence_workbench.legacy_beat_frame.beat import Beat
+    from .combined_grid_handler import CombinedGridHandler
+
+
+class BeatRenderer:
+    """
+    Renders beat scenes off-screen at their final export size.
+
+    Each beat's scene is painted with QGraphicsScene.render straight into a
+    tile of the export beat size, so nothing is rasterized at the 950px
+    scene size and smoothed back down, and the beat views never have to be
+    shown. Tiles are cached by what the beat shows (pictograph data,
+    reversals, prop type and the placement of its visible items) but not its
+    beat number, which is painted over the tile for each beat, so a repeated
+    start position or the repeating beats of a CAP render only once.
+    """
+
+    def __init__(
+        self,
+        combined_grid_handler: Optional["CombinedGridHandler"] = None,
+        max_tiles: int = 16,
+    ):
+        self.combined_grid_handler = combined_grid_handler
+        self.max_tiles = max_tiles
+        self._tiles: "OrderedDict[tuple, QImage]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def draw_beat(
+        self,
+        painter: QPainter,
+        beat: "Beat",
+        x: int,
+        y: int,
+        size: int,
+        combined_grids: bool = False,
+    ) -> None:
+        """Draw beat into painter's device as a size x size square at (x, y)."""
+        key = self._tile_key(beat, size, combined_grids)
+        tile = self._tiles.get(key)
+        if tile is None:
+            self.misses += 1
+            tile = self._render_tile(beat, size, combined_grids)
+            self._tiles[key] = tile
+            if len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+        else:
+            self.hits += 1
+            self._tiles.move_to_end(key)
+
+        painter.drawImage(x, y, tile)
+        number_item = beat.beat_number_item
+        if number_item.isVisible() and number_item.toPlainText():
+            self._paint_item(
+                painter, number_item, QRectF(x, y, size, size), beat.sceneRect()
+            )
+
+    def clear(self) -> None:
+        self._tiles.clear()
+
+    def _render_tile(self, beat: "Beat", size: int, combined_grids: bool) -> QImage:
+        tile = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+        tile.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(tile)
+        painter.setRenderHints(
+            QPainter.RenderHint.Antialiasing
+            | QPainter.RenderHint.SmoothPixmapTransform
+            | QPainter.RenderHint.TextAntialiasing
+        )
+
+        number_item = beat.beat_number_item
+        number_visible = number_item.isVisible()
+        number_item.setVisible(False)
+        try:
+            beat.render(
+                painter,
+                QRectF(0, 0, size, size),
+                beat.sceneRect(),
+                Qt.AspectRatioMode.KeepAspectRatio,
+            )
+        finally:
+            number_item.setVisible(number_visible)
+
+        if combined_grids and self.combined_grid_handler:
+            self.combined_grid_handler.draw_other_grid(painter, beat, size)
+        painter.setPen(QColor(0, 0, 0))
+        painter.drawRect(0, 0, size - 1, size - 1)
+        painter.end()
+        return tile
+
+    @staticmethod
+    def _tile_key(beat: "Beat", size: int, combined_grids: bool) -> tuple:
+        data = {
+            key: value
+            for key, value in beat.state.pictograph_data.items()
+            if key not in ("beat", "duration")
+        }
+        visible_items = sorted(
+            (
+                type(item).__name__,
+                round(item.scenePos().x(), 1),
+                round(item.scenePos().y(), 1),
+                round(item.rotation(), 1),
+            )
+            for item in beat.items()
+            if item is not beat.beat_number_item and item.isVisible()
+        )
+        props = getattr(beat.elements, "props", None) or {}
+        prop_types = sorted(str(prop.state.prop_type) for prop in props.values())
+        return (
+            json.dumps(data, sort_keys=True, default=str),
+            beat.state.blue_reversal,
+            beat.state.red_reversal,
+            tuple(prop_types),
+            tuple(visible_items),
+            size,
+            combined_grids,
+        )
+
+    @staticmethod
+    def _paint_item(
+        painter: QPainter, item: QGraphicsItem, target: QRectF, source: QRectF
+    ) -> None:
+        """Paint a single scene item as it would appear in render(target, source)."""
+        painter.save()
+        painter.translate(target.topLeft())
+        painter.scale(
+            target.width() / source.width(), target.height() / source.height()
+        )
+        painter.translate(-source.topLeft())
+        painter.setTransform(item.sceneTransform(), True)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        item.paint(painter, QStyleOptionGraphicsItem(), None)
+        painter.restore()
@@ -207,6 +207,7 @@ class ImageCreator:
         image_height = int(
             (row_count * self.beat_size * self.beat_scale) + additional_height
         )
-        image = QImage(image_width, image_height, QImage.Format.Format_ARGB32)
+        # RGBA8888 matches PIL's byte order, so PNG export wraps it without a copy
+        image = QImage(image_width, image_height, QImage.Format.Format_RGBA8888)
         image.fill(Qt.GlobalColor.white)
         return image
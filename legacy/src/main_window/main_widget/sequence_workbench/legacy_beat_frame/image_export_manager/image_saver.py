@@ -1,9 +1,12 @@
 import os
-from typing import TYPE_CHECKING
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Optional
+from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtWidgets import QFileDialog
 from PyQt6.QtGui import QImage
 
 from utils.path_helpers import get_my_photos_path
+from utils.png_encoder import get_png_encoder
 
 if TYPE_CHECKING:
     from main_window.main_widget.sequence_workbench.legacy_beat_frame.image_export_manager.image_export_manager import (
@@ -11,10 +14,24 @@ if TYPE_CHECKING:
     )
 
 
-class ImageSaver:
+class ImageSaver(QObject):
+    """
+    Asks where to save an exported sequence image and writes it as a PNG.
+
+    The image is encoded on the shared PNG encoder pool, so the GUI stays
+    responsive while large sequences compress; the indicator message and
+    opening the file follow once the write has finished.
+    """
+
+    # Emitted on the GUI thread: file name, error message or None
+    save_finished = pyqtSignal(str, object)
+
     def __init__(self, export_manager: "ImageExportManager"):
+        super().__init__()
         self.export_manager = export_manager
         self.beat_frame = export_manager.beat_frame
+        self.png_profile = "balanced"
+        self.save_finished.connect(self._on_save_finished)
 
     def save_image(self, sequence_image: QImage):
         self.indicator_label = (
@@ -107,19 +124,45 @@ class ImageSaver:
         if not file_name:
             return None
 
-        # Save the image with maximum quality
-        if sequence_image.save(file_name, "PNG", 100):  # Quality 100 = maximum quality
-            # Store the directory for future use
-            save_directory = os.path.dirname(file_name)
-            print(f"Saving directory: {save_directory}")
-            settings_manager.image_export.set_last_save_directory(save_directory)
-            print(
-                f"After saving, last directory is: {settings_manager.image_export.get_last_save_directory()}"
-            )
+        self.indicator_label.show_message(
+            f"Saving {os.path.basename(file_name)}..."
+        )
+        self._save(sequence_image, file_name)
+
+    def _save(self, sequence_image: QImage, file_name: str) -> Future:
+        """
+        Write the image as a PNG (lossless) with the saver's zlib profile on
+        the encoder pool. The image must not be painted on until it is done.
+        """
+        future = get_png_encoder().submit(
+            sequence_image, file_name, profile=self.png_profile
+        )
+        future.add_done_callback(
+            lambda done: self.save_finished.emit(file_name, self._error(done))
+        )
+        return future
 
-            self.indicator_label.show_message(
-                f"Image saved as {os.path.basename(file_name)}"
-            )
-            os.startfile(file_name)
-        else:
+    @staticmethod
+    def _error(future: Future) -> Optional[str]:
+        error = future.exception()
+        return None if error is None else str(error)
+
+    def _on_save_finished(self, file_name: str, error: Optional[str]):
+        if error is not None:
+            print(f"Failed to save image: {error}")
             self.indicator_label.show_message("Failed to save image.")
+            return
+
+        # Store the directory for future use
+        settings_manager = self.export_manager.settings_manager
+        save_directory = os.path.dirname(file_name)
+        print(f"Saving directory: {save_directory}")
+        settings_manager.image_export.set_last_save_directory(save_directory)
+        print(
+            f"After saving, last directory is: {settings_manager.image_export.get_last_save_directory()}"
+        )
+
+        self.indicator_label.show_message(
+            f"Image saved as {os.path.basename(file_name)}"
+        )
+        os.startfile(file_name)
@@ -1,5 +1,4 @@
-from PyQt6.QtCore import QSettings
-
+from legacy_settings_manager.settings_store import SettingsStore, get_settings_store
 from utils.path_helpers import get_settings_path
 
 
@@ -7,10 +6,7 @@ class SettingsProvider:
     _settings = None
 
     @classmethod
-    def get_settings(cls) -> QSettings:
+    def get_settings(cls) -> SettingsStore:
         if cls._settings is None:
-            cls._settings = QSettings(
-                get_settings_path(),
-                QSettings.Format.IniFormat,
-            )
+            cls._settings = get_settings_store(get_settings_path())
         return cls._settings
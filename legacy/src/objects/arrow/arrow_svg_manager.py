@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING, Union
 from utils.path_helpers import get_data_path, get_image_path
-from PyQt6.QtSvg import QSvgRenderer
 from objects.arrow.arrow import Arrow
+from svg_manager.svg_renderer_cache import get_svg_renderer_cache
 from data.constants import CLOCK, COUNTER, IN, OUT, FLOAT
 
 if TYPE_CHECKING:
@@ -14,11 +14,10 @@ class ArrowSvgManager:
 
     def update_arrow_svg(self, arrow: "Arrow") -> None:
         svg_file = self._get_arrow_svg_file(arrow)
-        svg_data = self.manager.load_svg_file(svg_file)
-        colored_svg_data = self.manager.color_manager.apply_color_transformations(
-            svg_data, arrow.state.color
+        renderer = get_svg_renderer_cache().get_renderer(
+            svg_file, arrow.state.color, self.manager.load_svg_file
         )
-        self._setup_arrow_svg_renderer(arrow, colored_svg_data)
+        arrow.setSharedRenderer(renderer)
 
     def _get_arrow_svg_file(self, arrow: "Arrow") -> str:
         if arrow.motion.state.motion_type == FLOAT:
@@ -49,8 +48,3 @@ class ArrowSvgManager:
         return get_image_path(
             f"arrows/{motion_type}/from_nonradial/{motion_type}_{turns}.svg"
         )
-
-    def _setup_arrow_svg_renderer(self, arrow: "Arrow", svg_data: str) -> None:
-        renderer = QSvgRenderer()
-        renderer.load(svg_data.encode("utf-8"))
-        arrow.setSharedRenderer(renderer)
@@ -1,9 +1,9 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from data.constants import BLUE, PROP_DIR
 from enums.prop_type import PropType
 from objects.prop.prop import Prop
+from svg_manager.svg_renderer_cache import get_svg_renderer_cache
 from utils.path_helpers import get_data_path, get_image_path
-from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtGui import QPixmap
 
 if TYPE_CHECKING:
@@ -20,14 +20,8 @@ class PropSvgManager:
         if prop.prop_type_str == "Chicken":
             self._setup_prop_png_renderer(prop, image_file)
             return
-        svg_data = self.manager.load_svg_file(image_file)
-        if prop.prop_type_str != "Hand":
-            colored_svg_data = self.manager.color_manager.apply_color_transformations(
-                svg_data, prop.state.color
-            )
-        else:
-            colored_svg_data = svg_data
-        self._setup_prop_svg_renderer(prop, colored_svg_data)
+        color = prop.state.color if prop.prop_type_str != "Hand" else None
+        self._setup_prop_svg_renderer(prop, image_file, color)
 
     def _get_prop_image_file(self, prop: "Prop") -> str:
         if prop.prop_type_str == "Hand":
@@ -44,9 +38,12 @@ class PropSvgManager:
         hand_color = "left" if prop.state.color == BLUE else "right"
         return get_image_path(f"hands/{hand_color}_hand.svg")
 
-    def _setup_prop_svg_renderer(self, prop: "Prop", svg_data: str) -> None:
-        prop.renderer = QSvgRenderer()
-        prop.renderer.load(svg_data.encode("utf-8"))
+    def _setup_prop_svg_renderer(
+        self, prop: "Prop", image_file: str, color: Optional[str]
+    ) -> None:
+        prop.renderer = get_svg_renderer_cache().get_renderer(
+            image_file, color, self.manager.load_svg_file
+        )
         prop.setSharedRenderer(prop.renderer)
 
     def _setup_prop_png_renderer(self, prop: "Prop", png_path: str) -> None:
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 import re
 from data.constants import BLUE, HEX_BLUE, HEX_RED, RED
 
@@ -6,38 +6,40 @@ if TYPE_CHECKING:
     from svg_manager.svg_manager import SvgManager
 
 
+COLOR_MAP = {RED: HEX_RED, BLUE: HEX_BLUE}
+CLASS_COLOR_PATTERN = re.compile(
+    r"(\.(st0|cls-1)\s*\{[^}]*?fill:\s*)(#[a-fA-F0-9]{6})([^}]*?\})"
+)
+FILL_PATTERN = re.compile(r'(fill=")(#[a-fA-F0-9]{6})(")')
+
+
 class SvgColorHandler:
     def __init__(self, manager: "SvgManager"):
         self.manager = manager
 
     @staticmethod
-    def apply_color_transformations(svg_data: str, new_color: str) -> str:
+    def get_hex_color(new_color: str) -> Optional[str]:
         """
         If new_color is RED or BLUE, then use COLOR_MAP.
         If new_color is already a hex string (#ED1C24 / #2E3192), use it directly.
         """
-        COLOR_MAP = {RED: HEX_RED, BLUE: HEX_BLUE}
-
         # 1) Detect if we already got a hex color
         if new_color and new_color.startswith("#"):
-            new_hex_color = new_color
-        else:
-            # 2) Maybe "BLUE", "RED", or something else
-            new_hex_color = COLOR_MAP.get(new_color, None)
+            return new_color
+        # 2) Maybe "BLUE", "RED", or something else
+        return COLOR_MAP.get(new_color, None)
 
+    @staticmethod
+    def apply_color_transformations(svg_data: str, new_color: str) -> str:
+        new_hex_color = SvgColorHandler.get_hex_color(new_color)
         if not new_hex_color:
             # If we still don't have a color, nothing to replace.
             return svg_data
 
-        class_color_pattern = re.compile(
-            r"(\.(st0|cls-1)\s*\{[^}]*?fill:\s*)(#[a-fA-F0-9]{6})([^}]*?\})"
-        )
-        fill_pattern = re.compile(r'(fill=")(#[a-fA-F0-9]{6})(")')
-
         def replace_color(match):
-            return match.group(1) + new_hex_color + match.group(4)
+            return match.group(1) + new_hex_color + match.group(len(match.groups()))
 
-        svg_data = class_color_pattern.sub(replace_color, svg_data)
-        svg_data = fill_pattern.sub(replace_color, svg_data)
+        svg_data = CLASS_COLOR_PATTERN.sub(replace_color, svg_data)
+        svg_data = FILL_PATTERN.sub(replace_color, svg_data)
 
         return svg_data
@@ -0,0 +1,84 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from PyQt6.QtSvg import QSvgRenderer
+
+from svg_manager.svg_color_handler import SvgColorHandler
+
+DEFAULT_MAX_RENDERERS = 256
+
+
+class SvgRendererCache:
+    """
+    Bounded LRU cache of colorized QSvgRenderers keyed by (svg path, color hex).
+
+    Every pictograph draws the same few dozen arrow and prop files in one of
+    two colors, so each combination is read, recolored and parsed once and
+    then shared between items with setSharedRenderer. Items hold their own
+    reference to the renderer, so evicting an entry does not affect items
+    that are already drawn. Renderers are Qt objects; use from the GUI thread.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_RENDERERS):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._renderers: OrderedDict[tuple[str, Optional[str]], QSvgRenderer] = (
+            OrderedDict()
+        )
+
+    def get_renderer(
+        self,
+        svg_path: str,
+        color: Optional[str],
+        load_svg_file: Callable[[str], str],
+    ) -> QSvgRenderer:
+        """
+        Return the renderer for svg_path recolored to color.
+
+        color may be RED, BLUE, a hex string or None for an uncolored file.
+        load_svg_file is only called on a miss.
+        """
+        key = (svg_path, SvgColorHandler.get_hex_color(color) if color else None)
+        renderer = self._renderers.get(key)
+        if renderer is not None:
+            self._renderers.move_to_end(key)
+            self.hits += 1
+            return renderer
+
+        self.misses += 1
+        svg_data = load_svg_file(svg_path)
+        if key[1]:
+            svg_data = SvgColorHandler.apply_color_transformations(svg_data, key[1])
+        renderer = QSvgRenderer()
+        renderer.load(svg_data.encode("utf-8"))
+
+        self._renderers[key] = renderer
+        if len(self._renderers) > self.max_size:
+            self._renderers.popitem(last=False)
+        return renderer
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+    def clear(self) -> None:
+        self._renderers.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._renderers)
+
+
+_shared_cache: Optional[SvgRendererCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_svg_renderer_cache() -> SvgRendererCache:
+    """Return the renderer cache shared by every pictograph in the process."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = SvgRendererCache()
+        return _shared_cache
@@ -0,0 +1,25 @@
+import os
+import shutil
+
+
+def _current_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode open() gives a new file; tempfile.mkstemp always uses 0600 instead
+NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def match_file_mode(temp_path: str, path: str) -> None:
+    """
+    Give a temporary file the mode it should have once it replaces path:
+    the mode of the file at path, or that of a newly created file if there
+    is none. os.replace keeps the temporary file's own mode, which is
+    owner-only for files made with tempfile.mkstemp.
+    """
+    try:
+        shutil.copymode(path, temp_path)
+    except FileNotFoundError:
+        os.chmod(temp_path, NEW_FILE_MODE)
@@ -0,0 +1,140 @@
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Union
+
+from PIL import Image, PngImagePlugin
+from PyQt6.QtGui import QImage
+
+from utils.file_modes import match_file_mode
+
+# zlib level per encoding profile: fast for previews and regenerated caches,
+# max for images that are kept
+PNG_PROFILES = {"fast": 1, "balanced": 6, "max": 9}
+
+
+def qimage_to_pil(qimage: QImage) -> Image.Image:
+    """
+    Wrap a QImage's pixels in a PIL image without copying them.
+
+    PIL can only map buffers whose byte order matches its own modes, so
+    RGBA8888 images are wrapped as they are and any other format is first
+    converted to RGBA8888 (one native copy, instead of the NumPy copy,
+    channel swap and fromarray copy this replaces). The returned image
+    reads the QImage's buffer, so it keeps a reference to the QImage and
+    must not be modified in place.
+    """
+    if qimage.format() != QImage.Format.Format_RGBA8888:
+        qimage = qimage.convertToFormat(QImage.Format.Format_RGBA8888)
+
+    pixels = qimage.constBits()
+    pixels.setsize(qimage.sizeInBytes())
+    image = Image.frombuffer(
+        "RGBA",
+        (qimage.width(), qimage.height()),
+        pixels,
+        "raw",
+        "RGBA",
+        qimage.bytesPerLine(),
+        1,
+    )
+    # The buffer belongs to the QImage; keep it alive as long as the image
+    image._qimage = qimage
+    return image
+
+
+def _png_info(metadata: Union[str, dict, None]) -> Optional[PngImagePlugin.PngInfo]:
+    if metadata is None:
+        return None
+    if not isinstance(metadata, str):
+        metadata = json.dumps(metadata)
+    info = PngImagePlugin.PngInfo()
+    info.add_text("metadata", metadata)
+    return info
+
+
+def save_png(
+    image: Union[QImage, Image.Image],
+    path: str,
+    profile: str = "balanced",
+    metadata: Union[str, dict, None] = None,
+) -> None:
+    """
+    Encode image as a PNG with the profile's compression level.
+
+    metadata, if given, is stored in the "metadata" text chunk. The file is
+    written to a temporary name and moved into place, so a failed encode
+    never leaves a truncated PNG behind.
+    """
+    if isinstance(image, QImage):
+        image = qimage_to_pil(image)
+    directory, filename = os.path.split(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{filename}.", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            image.save(
+                file,
+                "PNG",
+                compress_level=PNG_PROFILES[profile],
+                pnginfo=_png_info(metadata),
+            )
+        match_file_mode(temp_path, path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class PngEncoder:
+    """
+    Encodes PNGs on a thread pool.
+
+    PIL releases the GIL while zlib compresses, so several images encode
+    concurrently. Callers hand over the QImage and must not paint on it
+    until the returned future is done. ImageSaver and the sequence card
+    export share one pool through get_png_encoder().
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="png-encoder"
+        )
+
+    def submit(
+        self,
+        image: Union[QImage, Image.Image],
+        path: str,
+        profile: str = "balanced",
+        metadata: Union[str, dict, None] = None,
+    ) -> Future:
+        """Encode image to path in the background."""
+        if profile not in PNG_PROFILES:
+            raise ValueError(f"Unknown PNG profile: {profile}")
+        return self._executor.submit(save_png, image, path, profile, metadata)
+
+    def run(self, function: Callable[..., Any], *args: Any) -> Future:
+        """
+        Run function(*args) on the pool, for encoding work that does more
+        than a single save_png call, such as recording what was written.
+        """
+        return self._executor.submit(function, *args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+_shared_encoder: Optional[PngEncoder] = None
+_shared_encoder_lock = threading.Lock()
+
+
+def get_png_encoder() -> PngEncoder:
+    """Return the process-wide PNG encoder, creating it on first use."""
+    global _shared_encoder
+    with _shared_encoder_lock:
+        if _shared_encoder is None:
+            _shared_encoder = PngEncoder()
+        return _shared_encoder
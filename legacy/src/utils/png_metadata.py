@@ -0,0 +1,135 @@
+import os
+import shutil
+import struct
+import tempfile
+import zlib
+from typing import BinaryIO, Iterator, Optional
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+TEXT_CHUNK_TYPES = (b"tEXt", b"zTXt", b"iTXt")
+IMAGE_DATA_CHUNK_TYPES = (b"IDAT", b"IEND")
+
+_CHUNK_HEADER = struct.Struct(">I4s")
+_CRC = struct.Struct(">I")
+
+
+def read_png_text(path: str, keyword: str = "metadata") -> Optional[str]:
+    """
+    Return the value of a PNG text chunk without decoding the image.
+
+    Only the chunk headers before the first IDAT chunk are visited, which is
+    also where PIL looks when it fills in `Image.info` on open. tEXt, zTXt
+    and iTXt chunks are all understood. Returns None if the chunk is absent.
+    """
+    with open(path, "rb") as file:
+        return _read_text(file, keyword.encode("latin-1"), path)
+
+
+def write_png_text(path: str, text: str, keyword: str = "metadata") -> None:
+    """
+    Replace a PNG text chunk in place without re-encoding the image.
+
+    Every other chunk, IDAT included, is copied byte for byte. The new chunk
+    takes the place of the first chunk with the same keyword, or goes right
+    before the first IDAT if there was none. Text that Latin-1 cannot encode
+    is written as an iTXt chunk, matching PIL. The file is replaced
+    atomically, so readers never see a half-written thumbnail.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError(f"Not a PNG file: {path}")
+
+    keyword_bytes = keyword.encode("latin-1")
+    new_chunk = _text_chunk(keyword_bytes, text)
+    parts = [PNG_SIGNATURE]
+    written = False
+    for chunk_type, start, end in _iter_chunks(data, path):
+        if chunk_type in TEXT_CHUNK_TYPES:
+            chunk_keyword = data[start + 8 : end - 4].partition(b"\0")[0]
+            if chunk_keyword == keyword_bytes:
+                if not written:
+                    parts.append(new_chunk)
+                    written = True
+                continue
+        if chunk_type == b"IDAT" and not written:
+            parts.append(new_chunk)
+            written = True
+        parts.append(data[start:end])
+
+    directory, filename = os.path.split(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{filename}.", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(b"".join(parts))
+        shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _iter_chunks(data: bytes, path: str) -> Iterator[tuple[bytes, int, int]]:
+    """Yield (type, start, end) for each chunk, end including the CRC."""
+    offset = len(PNG_SIGNATURE)
+    while offset < len(data):
+        if offset + _CHUNK_HEADER.size > len(data):
+            raise ValueError(f"Truncated PNG chunk header in {path}")
+        length, chunk_type = _CHUNK_HEADER.unpack_from(data, offset)
+        end = offset + _CHUNK_HEADER.size + length + _CRC.size
+        if end > len(data):
+            raise ValueError(f"Truncated {chunk_type!r} chunk in {path}")
+        yield chunk_type, offset, end
+        offset = end
+
+
+def _text_chunk(keyword: bytes, text: str) -> bytes:
+    try:
+        chunk_type, body = b"tEXt", keyword + b"\0" + text.encode("latin-1")
+    except UnicodeEncodeError:
+        chunk_type = b"iTXt"
+        body = keyword + b"\0\0\0\0\0" + text.encode("utf-8")
+    return (
+        _CHUNK_HEADER.pack(len(body), chunk_type)
+        + body
+        + _CRC.pack(zlib.crc32(chunk_type + body))
+    )
+
+
+def _read_text(file: BinaryIO, keyword: bytes, path: str) -> Optional[str]:
+    if file.read(len(PNG_SIGNATURE)) != PNG_SIGNATURE:
+        raise ValueError(f"Not a PNG file: {path}")
+
+    while True:
+        header = file.read(_CHUNK_HEADER.size)
+        if len(header) < _CHUNK_HEADER.size:
+            return None
+        length, chunk_type = _CHUNK_HEADER.unpack(header)
+        if chunk_type in IMAGE_DATA_CHUNK_TYPES:
+            return None
+
+        if chunk_type in TEXT_CHUNK_TYPES:
+            data = file.read(length)
+            file.seek(4, 1)  # CRC
+            chunk_keyword, _, body = data.partition(b"\0")
+            if chunk_keyword == keyword:
+                return _decode_text_chunk(chunk_type, body)
+        else:
+            file.seek(length + 4, 1)
+
+
+def _decode_text_chunk(chunk_type: bytes, body: bytes) -> str:
+    if chunk_type == b"tEXt":
+        return body.decode("latin-1")
+    if chunk_type == b"zTXt":
+        return zlib.decompress(body[1:]).decode("latin-1")
+
+    # iTXt: compression flag, compression method, language tag and
+    # translated keyword precede the UTF-8 text
+    compressed = body[0] == 1
+    _language, _, rest = body[2:].partition(b"\0")
+    _translated_keyword, _, text = rest.partition(b"\0")
+    if compressed:
+        text = zlib.decompress(text)
+    return text.decode("utf-8")
@@ -0,0 +1,8 @@
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """QApplication shared by every test that needs Qt."""
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,131 @@
+"""
+Beat Rendering Performance Benchmarks
+
+Draws a sample of the bundled data/dictionary sequences the way
+BeatDrawer.draw_beats lays out an export (start position plus numbered
+beats) and compares the original path, which grabs every beat at its 950px
+scene size and smooth-scales the pixmap, against BeatRenderer, which
+renders each scene straight at the export beat size and reuses tiles for
+identical beats. Beats are built from the dictionary metadata under the
+offscreen platform, without a main window.
+"""
+
+import importlib
+import json
+import os
+import sys
+import time
+
+import pytest
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QPainter
+
+from main_window.main_widget.sequence_workbench.legacy_beat_frame.image_export_manager.image_creator.beat_renderer import (
+    BeatRenderer,
+)
+from utils.png_metadata import read_png_text
+
+DICTIONARY_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "dictionary")
+)
+SEQUENCE_COUNT = 12
+BEAT_SIZES = (950, 475)
+
+
+@pytest.fixture(scope="module")
+def sequences(qapp, tmp_path_factory):
+    """Beat scenes for the first dictionary sequences, start position first."""
+    cwd = os.getcwd()
+    # LegacySettingsManager creates settings.ini in the working directory
+    os.chdir(tmp_path_factory.mktemp("settings"))
+    try:
+        from legacy_settings_manager.legacy_settings_manager import (
+            LegacySettingsManager,
+        )
+        from main_window.main_widget.special_placement_loader import (
+            SpecialPlacementLoader,
+        )
+
+        settings_manager = LegacySettingsManager()
+        placement_loader = SpecialPlacementLoader()
+        for name in list(sys.modules):
+            if name.endswith("legacy_settings_manager.global_settings.app_context"):
+                context = importlib.import_module(name).AppContext
+                if not context._initialized:
+                    context.init(settings_manager, None, None, placement_loader)
+
+        from base_widgets.pictograph.elements.views.beat_view import LegacyBeatView
+        from main_window.main_widget.sequence_workbench.legacy_beat_frame.beat import (
+            Beat,
+        )
+
+        def make_beat(beat_data, number):
+            view = LegacyBeatView(None)
+            beat = Beat(None)
+            beat.state.pictograph_data = beat_data
+            beat.managers.updater.update_pictograph(beat_data)
+            view.set_beat(beat, number)
+            return beat
+
+        result = []
+        for word in sorted(os.listdir(DICTIONARY_DIR))[:SEQUENCE_COUNT]:
+            folder = os.path.join(DICTIONARY_DIR, word)
+            thumbnail = sorted(f for f in os.listdir(folder) if f.endswith(".png"))[0]
+            sequence = json.loads(read_png_text(os.path.join(folder, thumbnail)))[
+                "sequence"
+            ]
+            start = make_beat(sequence[1], 0)
+            start.beat_number_item.setVisible(False)
+            beats = [
+                make_beat(beat_data, number)
+                for number, beat_data in enumerate(sequence[2:], start=1)
+                if not beat_data.get("is_placeholder")
+            ]
+            result.append([start] + beats)
+        yield result
+    finally:
+        os.chdir(cwd)
+
+
+def draw_grabbed(painter, beat, x, y, size):
+    """The original BeatDrawer._grab_pixmap and drawPixmap."""
+    pixmap = beat.grabber.grab().scaled(
+        size,
+        size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+    painter.drawPixmap(x, y, pixmap)
+
+
+def export_all(sequences, size, draw):
+    start = time.perf_counter()
+    beat_count = 0
+    for beats in sequences:
+        image = QImage(size * 5, size * 5, QImage.Format.Format_RGBA8888)
+        image.fill(Qt.GlobalColor.white)
+        painter = QPainter(image)
+        for index, beat in enumerate(beats):
+            draw(painter, beat, (index % 5) * size, (index // 5) * size, size)
+            beat_count += 1
+        painter.end()
+    return beat_count / (time.perf_counter() - start)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not os.path.isdir(DICTIONARY_DIR), reason="no bundled dictionary")
+class TestBeatRenderPerformance:
+    def test_draw_beats(self, sequences):
+        beat_count = sum(len(beats) for beats in sequences)
+        print(f"\nDrawing {len(sequences)} sequences, {beat_count} beats")
+        print(f"  {'beat size':<10} {'grab/s':>9} {'renderer/s':>11} {'reused':>7}")
+
+        for size in BEAT_SIZES:
+            grabbed = export_all(sequences, size, draw_grabbed)
+            renderer = BeatRenderer(max_tiles=64)
+            rendered = export_all(sequences, size, renderer.draw_beat)
+            print(
+                f"  {size:<10} {grabbed:>9.1f} {rendered:>11.1f} "
+                f"{renderer.hits:>7}"
+            )
+            assert rendered > grabbed
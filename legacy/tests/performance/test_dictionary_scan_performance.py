@@ -0,0 +1,82 @@
+"""
+Dictionary Scan Performance Benchmarks
+
+Compares reading the metadata of the bundled data/dictionary tree with PIL
+against the chunk-header reader, and serial against process-pool cold scans
+of DictionaryScanner into an empty metadata index.
+"""
+
+import json
+import os
+import time
+
+import pytest
+from PIL import Image
+
+from main_window.main_widget.dictionary_scanner import (
+    DictionaryScanner,
+    read_thumbnail_batch,
+)
+from main_window.main_widget.metadata_index import MetadataIndex
+
+DICTIONARY_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "dictionary")
+)
+
+
+def pil_read(paths):
+    """The original get_metadata_and_thumbnail_dict: open every PNG with PIL."""
+    count = 0
+    for path in paths:
+        with Image.open(path) as img:
+            metadata = img.info.get("metadata")
+        if metadata:
+            json.loads(metadata)
+            count += 1
+    return count
+
+
+def chunk_read(paths):
+    return sum(1 for scanned in read_thumbnail_batch(paths) if scanned[3])
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not os.path.isdir(DICTIONARY_DIR), reason="no bundled dictionary")
+class TestDictionaryScanPerformance:
+    def test_metadata_read(self, tmp_path):
+        index = MetadataIndex(str(tmp_path / "index.db"))
+        try:
+            paths = DictionaryScanner(index, DICTIONARY_DIR).stale_thumbnails()
+        finally:
+            index.close()
+
+        pil_count, pil_time = timed(lambda: pil_read(paths))
+        chunk_count, chunk_time = timed(lambda: chunk_read(paths))
+
+        print(f"\nReading {len(paths)} thumbnails: PIL {pil_time * 1000:.1f} ms, "
+              f"chunk headers {chunk_time * 1000:.1f} ms "
+              f"({pil_time / chunk_time:.1f}x)")
+        assert chunk_count == pil_count
+        assert chunk_time < pil_time
+
+    def test_cold_scan(self, tmp_path):
+        def cold_scan(parallel):
+            index = MetadataIndex(str(tmp_path / f"index_{parallel}.db"))
+            try:
+                return DictionaryScanner(index, DICTIONARY_DIR).run(parallel=parallel)
+            finally:
+                index.close()
+
+        serial_count, serial_time = timed(lambda: cold_scan(False))
+        parallel_count, parallel_time = timed(lambda: cold_scan(True))
+
+        print(f"\n{'cold scan':<10} {'thumbnails':>10} {'time (ms)':>10}   ({os.cpu_count()} CPUs)")
+        print(f"{'serial':<10} {serial_count:>10} {serial_time * 1000:>10.1f}")
+        print(f"{'parallel':<10} {parallel_count:>10} {parallel_time * 1000:>10.1f}")
+        assert serial_count == parallel_count
@@ -0,0 +1,127 @@
+"""
+Letter Determination Performance Benchmarks
+
+Determines the letter of every pictograph in the full dataset (the
+Diamond and Box pictograph CSVs), plus its float, dual float and OPP
+variants, and compares the original example-by-example scans (strategies
+re-created per call) against the hash-indexed LetterDeterminer. This is
+the lookup the graph editor runs on every turns or motion edit.
+"""
+
+import copy
+import statistics
+import time
+
+import pytest
+
+from data.constants import BEAT, BLUE_ATTRS, DIRECTION, FLOAT, MOTION_TYPE, NO_ROT
+from data.constants import OPP, PROP_ROT_DIR, RED_ATTRS, SAME
+from letter_determination.core import LetterDeterminer
+from letter_determination.services.motion_comparator import MotionComparator
+from letter_determination.strategies.dual_float import DualFloatStrategy
+from letter_determination.strategies.non_hybrid_shift import (
+    NonHybridShiftStrategy,
+)
+
+
+class LinearMotionComparator(MotionComparator):
+    """The original scans of every example of every letter."""
+
+    def find_letter(self, pictograph_data):
+        for letter, examples in self.dataset.items():
+            for example in examples:
+                if self.compare(pictograph_data, example):
+                    return letter
+        return None
+
+    def shift_candidates(self, float_attrs, non_float_attrs):
+        return [
+            (letter, example)
+            for letter, examples in self.dataset.items()
+            for example in examples
+        ]
+
+
+class LinearLetterDeterminer(LetterDeterminer):
+    """The original determiner: linear scans, strategies built per call."""
+
+    def __init__(self, pictograph_dataset, json_manager):
+        super().__init__(pictograph_dataset, json_manager)
+        self.comparator = LinearMotionComparator(pictograph_dataset)
+
+    def determine_letter(self, pictograph_data, swap_prop_rot_dir=False):
+        self.strategies = [
+            strategy_class(self.comparator, self.attribute_manager)
+            for strategy_class in (DualFloatStrategy, NonHybridShiftStrategy)
+        ]
+        return super().determine_letter(pictograph_data, swap_prop_rot_dir)
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    pytest.importorskip("pandas")
+    from main_window.main_widget.pictograph_data_loader import PictographDataLoader
+
+    dataset = PictographDataLoader(None).load_pictograph_dataset()
+    if sum(len(examples) for examples in dataset.values()) < 1000:
+        pytest.skip("pictograph CSVs not available")
+    return dataset
+
+
+def edit_queries(dataset):
+    queries = []
+    for examples in dataset.values():
+        for example in examples:
+            base = copy.deepcopy(example)
+            base[BEAT] = 1
+            queries.append(base)
+            for colors in ((BLUE_ATTRS,), (RED_ATTRS,), (BLUE_ATTRS, RED_ATTRS)):
+                for direction in (SAME, OPP):
+                    variant = copy.deepcopy(base)
+                    variant[DIRECTION] = direction
+                    for color in colors:
+                        variant[color][MOTION_TYPE] = FLOAT
+                        variant[color][PROP_ROT_DIR] = NO_ROT
+                    queries.append(variant)
+    return queries
+
+
+def time_lookups(determiner, queries):
+    latencies = []
+    letters = []
+    for query in queries:
+        query = copy.deepcopy(query)
+        start = time.perf_counter()
+        letters.append(determiner.determine_letter(query))
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    return letters, latencies
+
+
+@pytest.mark.slow
+class TestLetterDeterminationPerformance:
+    def test_determine_letter(self, dataset):
+        queries = edit_queries(dataset)
+        example_count = sum(len(examples) for examples in dataset.values())
+
+        start = time.perf_counter()
+        indexed = LetterDeterminer(dataset, None)
+        build_ms = (time.perf_counter() - start) * 1000
+        linear = LinearLetterDeterminer(dataset, None)
+
+        linear_letters, linear_us = time_lookups(linear, queries)
+        indexed_letters, indexed_us = time_lookups(indexed, queries)
+
+        print(
+            f"\n{len(queries)} lookups over {example_count} examples, "
+            f"index built in {build_ms:.1f} ms"
+        )
+        print(f"  {'':<8} {'median us':>10} {'p99 us':>10} {'total s':>9}")
+        for name, latencies in (("linear", linear_us), ("indexed", indexed_us)):
+            p99 = statistics.quantiles(latencies, n=100)[98]
+            print(
+                f"  {name:<8} {statistics.median(latencies):>10.1f} "
+                f"{p99:>10.1f} {sum(latencies) / 1_000_000:>9.2f}"
+            )
+
+        assert indexed_letters == linear_letters
+        assert sum(indexed_us) < sum(linear_us)
@@ -0,0 +1,116 @@
+"""
+Orientation Validation Performance Benchmarks
+
+Replays graph editor turns edits on generated 64-beat sequences and
+compares the full validation pass, which recomputes every beat, against
+propagation from the edited beat, which stops at the first beat whose end
+orientations come out unchanged. Also validates a dictionary-sized batch
+of sequences beat by beat and with the vectorized validate_sequences.
+"""
+
+import copy
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from data.constants import BLUE, FLOAT, MOTION_TYPE, NO_ROT, PROP_ROT_DIR, RED
+from data.constants import CLOCKWISE, TURNS
+from main_window.main_widget.generate_tab.sequence_generation_engine import (
+    SequenceGenerationEngine,
+)
+from main_window.main_widget.json_manager.json_ori_calculator import (
+    JsonOriCalculator,
+)
+from main_window.main_widget.json_manager.json_ori_validation_engine import (
+    JsonOriValidationEngine,
+)
+
+LENGTH = 64
+EDITS = 500
+DICTIONARY_SIZE = 1000
+
+
+@pytest.fixture(scope="module")
+def generator():
+    pytest.importorskip("pandas")
+    from main_window.main_widget.pictograph_data_loader import PictographDataLoader
+
+    dataset = PictographDataLoader(None).load_pictograph_dataset()
+    if sum(len(examples) for examples in dataset.values()) < 1000:
+        pytest.skip("pictograph CSVs not available")
+    random.seed(0)
+    return SequenceGenerationEngine(dataset)
+
+
+def turns_edits(sequence):
+    """(index, color, turns) edits, each applied to the sequence in turn."""
+    random.seed(1)
+    edits = []
+    while len(edits) < EDITS:
+        index = random.randrange(2, len(sequence))
+        color = random.choice((BLUE, RED))
+        if sequence[index][f"{color}_attributes"][MOTION_TYPE] != FLOAT:
+            edits.append((index, color, random.choice([0, 0.5, 1, 1.5, 2, 3])))
+    return edits
+
+
+def edits_per_second(sequence, edits, validate):
+    sequence = copy.deepcopy(sequence)
+    start = time.perf_counter()
+    for index, color, turns in edits:
+        attributes = sequence[index][f"{color}_attributes"]
+        attributes[TURNS] = turns
+        if attributes[PROP_ROT_DIR] == NO_ROT:
+            attributes[PROP_ROT_DIR] = CLOCKWISE
+        validate(sequence, index)
+    return len(edits) / (time.perf_counter() - start), sequence
+
+
+@pytest.mark.slow
+class TestOriValidationPerformance:
+    def test_turns_edits(self, generator):
+        engine = JsonOriValidationEngine(
+            SimpleNamespace(ori_calculator=JsonOriCalculator())
+        )
+        sequence = generator.generate_many(1, LENGTH, level=2)[0]
+        edits = turns_edits(sequence)
+
+        def validate_all(sequence, index):
+            engine.sequence = sequence
+            engine.validate_and_update_json_orientations()
+
+        full, full_result = edits_per_second(sequence, edits, validate_all)
+        incremental, incremental_result = edits_per_second(
+            sequence, edits, engine.propagate_orientations
+        )
+
+        print(f"\n{EDITS} turns edits on a {LENGTH}-beat sequence")
+        print(f"  {'full pass':<12} {full:>9.1f} edits/s")
+        print(f"  {'incremental':<12} {incremental:>9.1f} edits/s")
+        assert incremental_result == full_result
+        assert incremental > full
+
+    def test_dictionary_validation(self, generator):
+        engine = JsonOriValidationEngine(
+            SimpleNamespace(ori_calculator=JsonOriCalculator())
+        )
+        sequences = generator.generate_many(DICTIONARY_SIZE, 16, level=3)
+        one_by_one = copy.deepcopy(sequences)
+        batched = copy.deepcopy(sequences)
+
+        start = time.perf_counter()
+        for sequence in one_by_one:
+            engine.sequence = sequence
+            engine.validate_and_update_json_orientations()
+        one_by_one_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        engine.validate_sequences(batched)
+        batched_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n{DICTIONARY_SIZE} sequences of 16 beats")
+        print(f"  {'one by one':<12} {one_by_one_ms:>9.1f} ms")
+        print(f"  {'vectorized':<12} {batched_ms:>9.1f} ms")
+        assert batched == one_by_one
+        assert batched_ms < one_by_one_ms
@@ -0,0 +1,134 @@
+"""
+PNG Encoding Performance Benchmarks
+
+Encodes a sample of the bundled data/dictionary images (sequence-card
+sized) and reports images per second for:
+
+- QImage to PIL conversion: the original NumPy copy and channel swap
+  against qimage_to_pil, for RGBA8888 images (as ImageCreator now paints
+  them, wrapped without a copy) and ARGB32 images (one native conversion)
+- encoding: QImage.save(..., "PNG", 100) as ImageSaver used to do (Qt maps
+  quality 100 to no compression) and each PNG_PROFILES level, serially and
+  on a PngEncoder pool, with the total size written
+"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+from PIL import Image
+from PyQt6.QtGui import QImage
+
+from utils.png_encoder import PNG_PROFILES, PngEncoder, qimage_to_pil, save_png
+
+DICTIONARY_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "dictionary")
+)
+SAMPLE_SIZE = 24
+
+
+@pytest.fixture(scope="module")
+def images(qapp):
+    paths = []
+    for root, _, files in sorted(os.walk(DICTIONARY_DIR)):
+        paths.extend(os.path.join(root, f) for f in sorted(files) if f.endswith(".png"))
+    return [
+        QImage(path).convertToFormat(QImage.Format.Format_RGBA8888)
+        for path in paths[:SAMPLE_SIZE]
+    ]
+
+
+def numpy_qimage_to_pil(qimage):
+    """The original SequenceCardImageExporter.qimage_to_pil conversion."""
+    qimage = qimage.convertToFormat(QImage.Format.Format_ARGB32)
+    width, height = qimage.width(), qimage.height()
+    ptr = qimage.bits()
+    ptr.setsize(height * width * 4)
+    arr = np.array(ptr, copy=True).reshape((height, width, 4))
+    arr = arr[..., [2, 1, 0, 3]]
+    return Image.fromarray(arr, "RGBA")
+
+
+def images_per_second(images, func):
+    start = time.perf_counter()
+    for index, image in enumerate(images):
+        func(index, image)
+    return len(images) / (time.perf_counter() - start)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not os.path.isdir(DICTIONARY_DIR), reason="no bundled dictionary")
+class TestPngEncodingPerformance:
+    def test_conversion(self, images):
+        numpy_rate = images_per_second(
+            images, lambda i, image: numpy_qimage_to_pil(image).load()
+        )
+        wrapped_rate = images_per_second(
+            images, lambda i, image: qimage_to_pil(image).load()
+        )
+        argb_images = [
+            image.convertToFormat(QImage.Format.Format_ARGB32) for image in images
+        ]
+        converted_rate = images_per_second(
+            argb_images, lambda i, image: qimage_to_pil(image).load()
+        )
+
+        print(f"\nQImage -> PIL, {len(images)} images")
+        print(f"  {'numpy copy':<18} {numpy_rate:>10.1f} images/s")
+        print(f"  {'zero-copy RGBA8888':<18} {wrapped_rate:>10.1f} images/s")
+        print(f"  {'converted ARGB32':<18} {converted_rate:>10.1f} images/s")
+
+        assert wrapped_rate > converted_rate > numpy_rate
+
+    def test_encoding_profiles(self, images, tmp_path):
+        def qt_save(index, image):
+            image.save(str(tmp_path / f"qt_{index}.png"), "PNG", 100)
+
+        rates = {"QImage.save": images_per_second(images, qt_save)}
+        sizes = {"QImage.save": self._total_size(tmp_path, "qt_")}
+
+        for profile in PNG_PROFILES:
+
+            def serial(index, image):
+                save_png(image, str(tmp_path / f"{profile}_{index}.png"), profile)
+
+            rates[profile] = images_per_second(images, serial)
+            sizes[profile] = self._total_size(tmp_path, f"{profile}_")
+
+        encoder = PngEncoder()
+        pooled = {}
+        for profile in PNG_PROFILES:
+            start = time.perf_counter()
+            futures = [
+                encoder.submit(image, str(tmp_path / f"pool_{profile}_{i}.png"), profile)
+                for i, image in enumerate(images)
+            ]
+            for future in futures:
+                future.result()
+            pooled[profile] = len(images) / (time.perf_counter() - start)
+        encoder.shutdown()
+
+        print(
+            f"\nPNG encoding, {len(images)} images, "
+            f"{encoder.max_workers} pool workers ({os.cpu_count()} CPUs)"
+        )
+        print(f"  {'':<12} {'serial/s':>9} {'pool/s':>9} {'MB':>8}")
+        for name, rate in rates.items():
+            pool_rate = f"{pooled[name]:>9.1f}" if name in pooled else f"{'-':>9}"
+            print(
+                f"  {name:<12} {rate:>9.1f} {pool_rate} "
+                f"{sizes[name] / 1_000_000:>8.1f}"
+            )
+
+        assert sizes["fast"] < sizes["QImage.save"] / 10
+        assert rates["fast"] > rates["max"]
+        assert sizes["max"] <= sizes["fast"]
+
+    @staticmethod
+    def _total_size(directory, prefix):
+        return sum(
+            entry.stat().st_size
+            for entry in os.scandir(directory)
+            if entry.name.startswith(prefix)
+        )
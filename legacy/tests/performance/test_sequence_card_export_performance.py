@@ -0,0 +1,115 @@
+"""
+Sequence Card Export Performance Benchmarks
+
+Exports the bundled data/dictionary tree to sequence card PNGs and compares
+the original exporter loop (work list re-listed for every batch of 15,
+serial encoding on the GUI thread, staleness from both PNGs' metadata)
+against SequenceCardExportPipeline (one listing, manifest staleness, worker
+pool encoding). The beat frame needs the full main widget, so each card is
+"rendered" by loading its dictionary thumbnail, which has the size of a
+real card.
+"""
+
+import json
+import os
+import time
+
+import pytest
+from PIL import Image, PngImagePlugin
+from PIL.ImageQt import fromqimage
+from PyQt6.QtGui import QImage
+from PyQt6.QtWidgets import QApplication
+
+from main_window.main_widget.sequence_card_tab.export.sequence_card_export_pipeline import (
+    ExportManifest,
+    SequenceCardExportPipeline,
+    list_export_jobs,
+)
+from utils.png_metadata import read_png_text
+
+DICTIONARY_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "dictionary")
+)
+BATCH_SIZE = 15
+COMPRESS_LEVEL = 1
+
+
+def render(job):
+    metadata = json.loads(read_png_text(job.source_path) or "{}")
+    return QImage(job.source_path), metadata
+
+
+def write(job, qimage, metadata):
+    info = PngImagePlugin.PngInfo()
+    info.add_text("metadata", json.dumps(metadata))
+    fromqimage(qimage).save(
+        job.output_path, "PNG", compress_level=COMPRESS_LEVEL, pnginfo=info
+    )
+
+
+def batched_listing(jobs):
+    """The original _process_sequence_batch: re-list the dictionary per batch."""
+    for _ in range(0, len(jobs), BATCH_SIZE):
+        list_export_jobs(DICTIONARY_DIR, "")
+
+
+def metadata_is_stale(job):
+    """The original _needs_regeneration: parse both PNGs' metadata."""
+    if not os.path.exists(job.output_path):
+        return True
+    source = json.loads(read_png_text(job.source_path) or "{}")
+    output = json.loads(read_png_text(job.output_path) or "{}")
+    return source.get("sequence") != output.get("sequence")
+
+
+def serial_export(jobs):
+    for job in jobs:
+        if metadata_is_stale(job):
+            os.makedirs(os.path.dirname(job.output_path), exist_ok=True)
+            write(job, *render(job))
+            QApplication.processEvents()
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not os.path.isdir(DICTIONARY_DIR), reason="no bundled dictionary")
+class TestSequenceCardExportPerformance:
+    def test_export_dictionary(self, qapp, tmp_path):
+        serial_out = str(tmp_path / "serial")
+        pipeline_out = str(tmp_path / "pipeline")
+        jobs, list_time = timed(lambda: list_export_jobs(DICTIONARY_DIR, serial_out))
+        _, batched_list_time = timed(lambda: batched_listing(jobs))
+
+        _, serial_time = timed(lambda: serial_export(jobs))
+        _, serial_rerun = timed(lambda: serial_export(jobs))
+
+        def pipeline_export():
+            pipeline = SequenceCardExportPipeline(render, write)
+            return pipeline.run(
+                list_export_jobs(DICTIONARY_DIR, pipeline_out),
+                ExportManifest(pipeline_out),
+            )
+
+        stats, pipeline_time = timed(pipeline_export)
+        rerun_stats, pipeline_rerun = timed(pipeline_export)
+
+        print(f"\nExporting {len(jobs)} cards ({os.cpu_count()} CPUs)")
+        print(f"{'':<22} {'original':>10} {'pipeline':>10}")
+        print(
+            f"{'work list (ms)':<22} {batched_list_time * 1000:>10.1f} "
+            f"{list_time * 1000:>10.1f}"
+        )
+        print(f"{'full export (s)':<22} {serial_time:>10.2f} {pipeline_time:>10.2f}")
+        print(
+            f"{'up-to-date rerun (ms)':<22} {serial_rerun * 1000:>10.1f} "
+            f"{pipeline_rerun * 1000:>10.1f}"
+        )
+
+        assert stats["regenerated"] == len(jobs)
+        assert rerun_stats["skipped"] == len(jobs)
+        assert pipeline_rerun < serial_rerun
@@ -0,0 +1,89 @@
+"""
+Sequence Generation Performance Benchmarks
+
+Generates freeform and circular sequences from the full pictograph dataset
+and compares the original per-beat option loading, which scans the dataset
+through the option getter and deep-copies every option, against the
+SequenceGenerationEngine, which indexes the dataset by start position once
+and copies only the picked option. Neither side touches the beat frame, so
+this measures generation alone.
+"""
+
+import random
+import time
+from copy import deepcopy
+from types import SimpleNamespace
+
+import pytest
+
+from main_window.main_widget.construct_tab.option_picker.core.option_getter import (
+    OptionGetter,
+)
+from main_window.main_widget.generate_tab.circular.CAP_type import CAPType
+from main_window.main_widget.generate_tab.sequence_generation_engine import (
+    SequenceGenerationEngine,
+)
+from main_window.main_widget.json_manager.json_ori_calculator import (
+    JsonOriCalculator,
+)
+from main_window.main_widget.json_manager.json_ori_validation_engine import (
+    JsonOriValidationEngine,
+)
+
+SEQUENCE_COUNT = 200
+LENGTH = 16
+
+
+class OptionGetterEngine(SequenceGenerationEngine):
+    """The original option loading: a dataset scan and deep copies per beat."""
+
+    def __init__(self, pictograph_dataset):
+        super().__init__(pictograph_dataset)
+        json_manager = SimpleNamespace(ori_calculator=self.ori_calculator)
+        json_manager.ori_validation_engine = JsonOriValidationEngine(json_manager)
+        self.option_getter = OptionGetter(pictograph_dataset, json_manager)
+
+    def _next_options(self, sequence):
+        return deepcopy(self.option_getter._load_all_next_option_dicts(sequence))
+
+    @staticmethod
+    def _copy_option(option):
+        return option
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    pytest.importorskip("pandas")
+    from main_window.main_widget.pictograph_data_loader import PictographDataLoader
+
+    dataset = PictographDataLoader(None).load_pictograph_dataset()
+    if sum(len(examples) for examples in dataset.values()) < 1000:
+        pytest.skip("pictograph CSVs not available")
+    return dataset
+
+
+def sequences_per_second(engine, **options):
+    random.seed(0)
+    start = time.perf_counter()
+    engine.generate_many(SEQUENCE_COUNT, LENGTH, level=3, **options)
+    return SEQUENCE_COUNT / (time.perf_counter() - start)
+
+
+@pytest.mark.slow
+class TestSequenceGenerationPerformance:
+    def test_generate_many(self, dataset):
+        # The original loader writes orientations into the shared dataset
+        original = OptionGetterEngine(deepcopy(dataset))
+        indexed = SequenceGenerationEngine(dataset, JsonOriCalculator())
+
+        print(f"\n{SEQUENCE_COUNT} sequences of {LENGTH} beats")
+        print(f"  {'mode':<22} {'original/s':>11} {'engine/s':>10}")
+        for name, options in (
+            ("freeform", {}),
+            ("strict rotated", {"CAP_type": CAPType.STRICT_ROTATED}),
+            ("mirrored complementary", {"CAP_type": CAPType.MIRRORED_COMPLEMENTARY}),
+        ):
+            before = sequences_per_second(original, **options)
+            after = sequences_per_second(indexed, **options)
+            print(f"  {name:<22} {before:>11.1f} {after:>10.1f}")
+            assert after > before
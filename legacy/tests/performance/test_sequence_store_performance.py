@@ -0,0 +1,129 @@
+"""
+Current Sequence Store Performance Benchmarks
+
+Replays graph editor turns edits on a generated 64-beat sequence and
+compares the original SequenceDataLoaderSaver, which reads and parses
+current_sequence.json in every getter and rewrites it (indent=4) on every
+save, against the in-memory CurrentSequenceStore, which journals each save
+and writes the file once per burst of edits. Each edit makes the calls a
+turns button click makes: the turns and prefloat getters, a load, the
+save, and the reload the adjustment panel does afterwards.
+"""
+
+import json
+import random
+import time
+
+import pytest
+
+from data.constants import BEAT, BLUE, LETTER, RED, TURNS
+from data.constants import SEQUENCE_START_POSITION
+from main_window.main_widget.generate_tab.sequence_generation_engine import (
+    SequenceGenerationEngine,
+)
+from main_window.main_widget.json_manager.sequence_data_loader_saver import (
+    SequenceDataLoaderSaver,
+)
+from main_window.main_widget.sequence_properties_manager.sequence_properties_manager_factory import (
+    SequencePropertiesManagerFactory,
+)
+from utils.word_simplifier import WordSimplifier
+
+LENGTH = 64
+EDITS = 300
+
+
+class FileSequenceDataLoaderSaver(SequenceDataLoaderSaver):
+    """The original loader: the file is read on every call, written on save."""
+
+    def load_current_sequence(self):
+        with open(self.current_sequence_json, "r", encoding="utf-8") as file:
+            return json.loads(file.read())
+
+    _stored_sequence = load_current_sequence
+
+    def save_current_sequence(self, sequence):
+        sequence[0]["word"] = WordSimplifier.simplify_repeated_word(
+            self.sequence_properties_manager.calculate_word(sequence)
+        )
+        beat_number = 0
+        for beat in sequence:
+            if LETTER in beat or SEQUENCE_START_POSITION in beat:
+                beat_data_with_beat_number = {BEAT: beat_number}
+                beat_data_with_beat_number.update(beat)
+                sequence[sequence.index(beat)] = beat_data_with_beat_number
+                beat_number += 1
+        with open(self.current_sequence_json, "w", encoding="utf-8") as file:
+            json.dump(sequence, file, indent=4, ensure_ascii=False)
+
+
+@pytest.fixture(scope="module")
+def sequence():
+    pytest.importorskip("pandas")
+    from main_window.main_widget.pictograph_data_loader import PictographDataLoader
+
+    dataset = PictographDataLoader(None).load_pictograph_dataset()
+    if sum(len(examples) for examples in dataset.values()) < 1000:
+        pytest.skip("pictograph CSVs not available")
+    random.seed(0)
+    sequence = SequenceGenerationEngine(dataset).generate_many(1, LENGTH, level=2)[0]
+    sequence[0].update(author="benchmark", level=2, prop_type="staff")
+    sequence[0].update(is_circular=False, can_be_CAP=False)
+    return sequence
+
+
+def make_loader_saver(loader_saver_class, path, sequence):
+    loader_saver = loader_saver_class.__new__(loader_saver_class)
+    loader_saver.current_sequence_json = str(path)
+    loader_saver.sequence_properties_manager = (
+        SequencePropertiesManagerFactory.create_legacy()
+    )
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(sequence, file, indent=4)
+    return loader_saver
+
+
+def edits_per_second(loader_saver):
+    random.seed(1)
+    start = time.perf_counter()
+    for _ in range(EDITS):
+        index = random.randrange(2, LENGTH + 2)
+        color = random.choice((BLUE, RED))
+        turns = loader_saver.get_json_turns(index, color)
+        loader_saver.get_json_prefloat_motion_type(index, color)
+        loader_saver.get_json_prefloat_prop_rot_dir(index, color)
+        sequence = loader_saver.load_current_sequence()
+        sequence[index][f"{color}_attributes"][TURNS] = (
+            turns + 1 if isinstance(turns, int) and turns < 3 else 0
+        )
+        loader_saver.save_current_sequence(sequence)
+        loader_saver.load_current_sequence()
+    return EDITS / (time.perf_counter() - start)
+
+
+@pytest.mark.slow
+class TestSequenceStorePerformance:
+    def test_turns_edits(self, sequence, tmp_path):
+        original = make_loader_saver(
+            FileSequenceDataLoaderSaver, tmp_path / "original.json", sequence
+        )
+        stored = make_loader_saver(
+            SequenceDataLoaderSaver, tmp_path / "current_sequence.json", sequence
+        )
+
+        before = edits_per_second(original)
+        after = edits_per_second(stored)
+        start = time.perf_counter()
+        stored.store.flush()
+        flush_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n{EDITS} turns edits on a {LENGTH}-beat sequence")
+        print(f"  {'':<10} {'edits/s':>9}")
+        print(f"  {'file':<10} {before:>9.1f}")
+        print(f"  {'store':<10} {after:>9.1f}  (deferred write {flush_ms:.1f} ms)")
+
+        with open(tmp_path / "original.json", encoding="utf-8") as file:
+            expected = json.load(file)
+        with open(tmp_path / "current_sequence.json", encoding="utf-8") as file:
+            assert json.load(file) == expected
+        assert after > before
@@ -0,0 +1,57 @@
+import json
+import os
+
+import pytest
+from PIL import Image, PngImagePlugin
+
+from main_window.main_widget.dictionary_scanner import DictionaryScanner
+from main_window.main_widget.metadata_index import MetadataIndex
+
+
+def write_thumbnail(path, text):
+    pnginfo = PngImagePlugin.PngInfo()
+    pnginfo.add_text("metadata", text)
+    Image.new("RGB", (4, 4)).save(path, pnginfo=pnginfo)
+
+
+def make_dictionary(root, words=5, variations=3):
+    for w in range(words):
+        word_dir = root / f"W{w}"
+        word_dir.mkdir(parents=True)
+        for v in range(variations):
+            metadata = {"sequence": [{"word": f"W{w}", "author": "Tester", "level": 1}]}
+            write_thumbnail(str(word_dir / f"W{w}_ver{v + 1}.png"), json.dumps(metadata))
+    return str(root)
+
+
+class TestDictionaryScanner:
+    @pytest.fixture
+    def index(self, tmp_path):
+        index = MetadataIndex(str(tmp_path / "index.db"))
+        yield index
+        index.close()
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_scan_indexes_every_thumbnail(self, tmp_path, index, parallel):
+        dictionary = make_dictionary(tmp_path / "dictionary", words=40)
+        scanner = DictionaryScanner(index, dictionary, max_workers=2)
+
+        batches = list(scanner.scan(parallel=parallel))
+
+        assert sum(len(batch) for batch in batches) == 120
+        assert len(batches) > 1
+        assert scanner.stale_thumbnails() == []
+        path = os.path.join(dictionary, "W3", "W3_ver2.png")
+        assert index.record(path).author == "Tester"
+
+    def test_rescan_only_reads_changed_files(self, tmp_path, index):
+        dictionary = make_dictionary(tmp_path / "dictionary")
+        scanner = DictionaryScanner(index, dictionary)
+        assert scanner.run() == 15
+
+        changed = os.path.join(dictionary, "W1", "W1_ver1.png")
+        write_thumbnail(changed, json.dumps({"sequence": [{"author": "Someone"}]}))
+
+        assert scanner.stale_thumbnails() == [changed]
+        assert scanner.run() == 1
+        assert index.record(changed).author == "Someone"
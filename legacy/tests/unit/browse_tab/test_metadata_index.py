@@ -0,0 +1,138 @@
+import json
+import os
+
+import pytest
+from PIL import Image, PngImagePlugin
+
+from main_window.main_widget import metadata_index
+from main_window.main_widget.metadata_index import EMPTY_RECORD, MetadataIndex
+
+
+def write_thumbnail(path, metadata=None, size=(4, 4)):
+    pnginfo = PngImagePlugin.PngInfo()
+    if metadata is not None:
+        pnginfo.add_text("metadata", json.dumps(metadata))
+    Image.new("RGB", size).save(path, pnginfo=pnginfo)
+
+
+def sequence_metadata(author="Tester", level=2, beats=3, **extra):
+    header = {"word": "AB", "author": author, "level": level, "grid_mode": "box"}
+    start = {"beat": 0, "end_pos": "beta5"}
+    return {
+        "sequence": [header, start] + [{"beat": i + 1} for i in range(beats)],
+        "date_added": "2025-01-02T03:04:05",
+        **extra,
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = MetadataIndex(str(tmp_path / "index.db"))
+    yield index
+    index.close()
+
+
+def test_record_fields(tmp_path, index):
+    thumbnail = str(tmp_path / "AB_ver1.png")
+    write_thumbnail(
+        thumbnail, sequence_metadata(is_favorite=True, tags=["flowy", "fast"])
+    )
+
+    record = index.record(thumbnail)
+
+    assert record.author == "Tester"
+    assert record.level == 2
+    assert record.length == 3
+    assert record.start_pos == "beta"
+    assert record.grid_mode == "box"
+    assert record.is_favorite is True
+    assert record.date_added == "2025-01-02T03:04:05"
+    assert record.tags == ("flowy", "fast")
+    assert index.metadata(thumbnail) == sequence_metadata(
+        is_favorite=True, tags=["flowy", "fast"]
+    )
+
+
+def test_thumbnail_without_metadata(tmp_path, index):
+    thumbnail = str(tmp_path / "plain.png")
+    write_thumbnail(thumbnail)
+
+    assert index.record(thumbnail) == EMPTY_RECORD
+    assert index.metadata(thumbnail) is None
+
+
+def test_unchanged_file_is_not_reopened(tmp_path, index, monkeypatch):
+    thumbnail = str(tmp_path / "AB_ver1.png")
+    write_thumbnail(thumbnail, sequence_metadata())
+    index.record(thumbnail)
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("thumbnail was re-read")
+
+    monkeypatch.setattr(metadata_index, "read_png_text", fail_open)
+    assert index.record(thumbnail).author == "Tester"
+
+
+def test_changed_file_is_reindexed(tmp_path, index):
+    thumbnail = str(tmp_path / "AB_ver1.png")
+    write_thumbnail(thumbnail, sequence_metadata(author="Before"))
+    assert index.record(thumbnail).author == "Before"
+
+    write_thumbnail(thumbnail, sequence_metadata(author="After"), size=(8, 8))
+    assert index.record(thumbnail).author == "After"
+
+
+def test_index_persists_between_sessions(tmp_path, monkeypatch):
+    thumbnail = str(tmp_path / "AB_ver1.png")
+    write_thumbnail(thumbnail, sequence_metadata())
+    db_path = str(tmp_path / "index.db")
+    first = MetadataIndex(db_path)
+    first.record(thumbnail)
+    first.close()
+
+    monkeypatch.setattr(metadata_index, "read_png_text", None)
+    second = MetadataIndex(db_path)
+    try:
+        assert second.record(thumbnail).length == 3
+        assert second.metadata(thumbnail)["sequence"][0]["author"] == "Tester"
+    finally:
+        second.close()
+
+
+def test_deleted_file_is_dropped(tmp_path, index):
+    thumbnail = str(tmp_path / "AB_ver1.png")
+    write_thumbnail(thumbnail, sequence_metadata())
+    index.record(thumbnail)
+    os.remove(thumbnail)
+
+    with pytest.raises(FileNotFoundError):
+        index.record(thumbnail)
+    assert index.records([thumbnail]) == {thumbnail: EMPTY_RECORD}
+
+
+def test_store_updates_after_write(tmp_path, index):
+    thumbnail = str(tmp_path / "AB_ver1.png")
+    write_thumbnail(thumbnail, sequence_metadata())
+    index.record(thumbnail)
+
+    metadata = sequence_metadata(is_favorite=True)
+    write_thumbnail(thumbnail, metadata)
+    index.store(thumbnail, metadata)
+
+    assert index.record(thumbnail).is_favorite is True
+
+
+def test_indexed_metadata_does_not_read_unindexed_files(tmp_path, index, monkeypatch):
+    thumbnail = str(tmp_path / "AB_ver1.png")
+    write_thumbnail(thumbnail, sequence_metadata())
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("thumbnail was read")
+
+    monkeypatch.setattr(metadata_index, "read_png_text", fail_open)
+    assert index.indexed_metadata(thumbnail) is None
+
+    monkeypatch.undo()
+    index.record(thumbnail)
+    monkeypatch.setattr(metadata_index, "read_png_text", fail_open)
+    assert index.indexed_metadata(thumbnail) == sequence_metadata()
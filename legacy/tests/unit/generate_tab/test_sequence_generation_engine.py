@@ -0,0 +1,140 @@
+import copy
+import json
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from data.constants import (
+    BEAT,
+    BLUE_ATTRS,
+    END_ORI,
+    END_POS,
+    LETTER,
+    RED_ATTRS,
+    SEQUENCE_START_POSITION,
+    START_ORI,
+    START_POS,
+)
+from enums.letter.letter_type import LetterType
+from main_window.main_widget.generate_tab.base_sequence_builder import (
+    BaseSequenceBuilder,
+)
+from main_window.main_widget.generate_tab.circular.CAP_type import CAPType
+from main_window.main_widget.generate_tab.sequence_generation_engine import (
+    SequenceGenerationEngine,
+)
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    pytest.importorskip("pandas")
+    from main_window.main_widget.pictograph_data_loader import PictographDataLoader
+
+    dataset = PictographDataLoader(None).load_pictograph_dataset()
+    if sum(len(examples) for examples in dataset.values()) < 1000:
+        pytest.skip("pictograph CSVs not available")
+    return dataset
+
+
+@pytest.fixture
+def engine(dataset):
+    random.seed(20)
+    return SequenceGenerationEngine(dataset)
+
+
+def assert_continuous(sequence):
+    """Each beat starts where, and in the orientations, the previous one ended."""
+    for number, (previous, beat) in enumerate(zip(sequence[1:], sequence[2:]), 1):
+        assert beat[BEAT] == number
+        assert beat[START_POS] == previous[END_POS]
+        for color in (BLUE_ATTRS, RED_ATTRS):
+            assert beat[color][START_ORI] == previous[color][END_ORI]
+
+
+def test_freeform_sequences(engine):
+    sequences = engine.generate_many(50, 16, turn_intensity=2, level=3)
+
+    for sequence in sequences:
+        assert SEQUENCE_START_POSITION in sequence[1]
+        assert len(sequence) == 18
+        assert_continuous(sequence)
+        json.dumps(sequence)
+
+
+def test_freeform_limited_to_letters(engine):
+    letters = LetterType.Type1.letters
+
+    sequences = engine.generate_many(20, 16, letters=letters)
+
+    assert {beat[LETTER] for sequence in sequences for beat in sequence[2:]} <= set(
+        letters
+    )
+
+
+@pytest.mark.parametrize("CAP_type", list(CAPType))
+def test_circular_sequences(engine, CAP_type):
+    for slice_size in ("halved", "quartered"):
+        for sequence in engine.generate_many(
+            10, 16, level=2, CAP_type=CAP_type, slice_size=slice_size
+        ):
+            assert len(sequence) == 18
+            assert_continuous(sequence)
+            json.dumps(sequence)
+
+
+@pytest.mark.parametrize(
+    "CAP_type",
+    [
+        CAPType.STRICT_ROTATED,
+        CAPType.STRICT_SWAPPED,
+        CAPType.STRICT_COMPLEMENTARY,
+        CAPType.ROTATED_COMPLEMENTARY,
+    ],
+)
+def test_circular_sequences_return_to_start(engine, CAP_type):
+    for sequence in engine.generate_many(20, 8, CAP_type=CAP_type):
+        assert sequence[-1][END_POS] == sequence[1][END_POS]
+
+
+def test_extends_existing_sequence(engine):
+    sequence = engine.generate_many(1, 4)[0]
+    existing = copy.deepcopy(sequence)
+
+    new_beats = engine.generate_freeform(sequence, 10, 1, 1)
+
+    assert len(new_beats) == 6
+    assert sequence[: len(existing)] == existing
+    assert sequence[len(existing) :] == new_beats
+    assert_continuous(sequence)
+
+
+def test_dataset_is_not_modified(dataset, engine):
+    before = copy.deepcopy(dataset)
+
+    engine.generate_many(20, 16, turn_intensity=3, level=3)
+    for CAP_type in CAPType:
+        engine.generate_many(5, 16, level=3, CAP_type=CAP_type)
+
+    assert dataset == before
+
+
+def test_builder_adds_generated_beats_in_one_pass(engine):
+    added = []
+    beat_factory = SimpleNamespace(
+        create_new_beat_and_add_to_sequence=lambda beat, **flags: added.append(
+            (beat, flags)
+        )
+    )
+    builder = BaseSequenceBuilder.__new__(BaseSequenceBuilder)
+    builder.sequence_workbench = SimpleNamespace(
+        beat_frame=SimpleNamespace(beat_factory=beat_factory)
+    )
+    beats = engine.generate_many(1, 4)[0][2:]
+
+    builder.add_beats_to_sequence(beats)
+
+    assert [beat for beat, _ in added] == beats
+    assert [flags["update_word"] for _, flags in added] == [False] * 3 + [True]
+    assert [flags["select_beat"] for _, flags in added] == [False] * 3 + [True]
+    assert not any(flags["update_image_export_preview"] for _, flags in added)
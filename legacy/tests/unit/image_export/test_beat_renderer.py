@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+
+import pytest
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont, QImage, QPainter
+from PyQt6.QtWidgets import QGraphicsScene
+
+from main_window.main_widget.sequence_workbench.legacy_beat_frame.beat_grabber import (
+    BeatGrabber,
+)
+from main_window.main_widget.sequence_workbench.legacy_beat_frame.image_export_manager.image_creator.beat_renderer import (
+    BeatRenderer,
+)
+
+SIZE = 190  # 950px scenes drawn at a fifth of their size
+
+
+class FakeBeat(QGraphicsScene):
+    """A beat scene with a coloured square where the pictograph would be."""
+
+    def __init__(self, letter: str, number: str = "", blue_reversal=False):
+        super().__init__(0, 0, 950, 950)
+        self.state = SimpleNamespace(
+            pictograph_data={"letter": letter, "beat": number},
+            blue_reversal=blue_reversal,
+            red_reversal=False,
+            grid_mode="diamond",
+        )
+        self.elements = SimpleNamespace(props={})
+        color = QColor("red") if letter == "A" else QColor("blue")
+        self.addRect(300, 300, 400, 400, color, color)
+        self.beat_number_item = self.addText(number, QFont("Georgia", 70))
+        self.beat_number_item.setPos(30, 20)
+
+
+def draw(renderer, beat, size=SIZE):
+    image = QImage(size, size, QImage.Format.Format_RGBA8888)
+    image.fill(Qt.GlobalColor.white)
+    painter = QPainter(image)
+    renderer.draw_beat(painter, beat, 0, 0, size)
+    painter.end()
+    return image
+
+
+def number_area_is_blank(image):
+    return all(
+        image.pixelColor(x, y) == QColor("white")
+        for x in range(10, 50)
+        for y in range(10, 40)
+    )
+
+
+def test_renders_like_scaled_grab(qapp):
+    beat = FakeBeat("A", "1")
+
+    rendered = draw(BeatRenderer(), beat)
+    grabbed = QImage(SIZE, SIZE, QImage.Format.Format_RGBA8888)
+    grabbed.fill(Qt.GlobalColor.white)
+    painter = QPainter(grabbed)
+    painter.drawPixmap(
+        0,
+        0,
+        BeatGrabber(beat)
+        .grab()
+        .scaled(SIZE, SIZE, transformMode=Qt.TransformationMode.SmoothTransformation),
+    )
+    painter.end()
+
+    for x, y in ((SIZE // 2, SIZE // 2), (SIZE - 20, SIZE - 20)):
+        assert rendered.pixelColor(x, y) == grabbed.pixelColor(x, y)
+    assert not number_area_is_blank(rendered)
+
+
+def test_identical_beats_share_a_tile(qapp):
+    renderer = BeatRenderer()
+
+    first = draw(renderer, FakeBeat("A", "1"))
+    second = draw(renderer, FakeBeat("A", "5"))
+
+    assert (renderer.misses, renderer.hits) == (1, 1)
+    assert first != second  # Each beat keeps its own number
+    assert first.copy(0, 60, SIZE, SIZE - 60) == second.copy(0, 60, SIZE, SIZE - 60)
+
+
+def test_number_not_baked_into_tile(qapp):
+    renderer = BeatRenderer()
+    draw(renderer, FakeBeat("A", "1"))
+
+    unnumbered = draw(renderer, FakeBeat("A"))
+
+    assert renderer.hits == 1
+    assert number_area_is_blank(unnumbered)
+
+
+def test_different_content_renders_again(qapp):
+    renderer = BeatRenderer()
+
+    draw(renderer, FakeBeat("A"))
+    draw(renderer, FakeBeat("B"))
+    draw(renderer, FakeBeat("A", blue_reversal=True))
+    draw(renderer, FakeBeat("A"), size=SIZE * 2)
+
+    assert (renderer.misses, renderer.hits) == (4, 0)
+
+
+def test_least_recently_used_tile_evicted(qapp):
+    renderer = BeatRenderer(max_tiles=1)
+
+    draw(renderer, FakeBeat("A"))
+    draw(renderer, FakeBeat("B"))
+    draw(renderer, FakeBeat("A"))
+
+    assert (renderer.misses, renderer.hits) == (3, 0)
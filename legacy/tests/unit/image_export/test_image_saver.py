@@ -0,0 +1,74 @@
+import os
+import threading
+from concurrent.futures import wait
+from types import SimpleNamespace
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtGui import QColor, QImage
+
+from main_window.main_widget.sequence_workbench.legacy_beat_frame.image_export_manager.image_saver import (
+    ImageSaver,
+)
+
+
+class Indicator:
+    def __init__(self):
+        self.messages = []
+
+    def show_message(self, message):
+        self.messages.append(message)
+
+
+def make_saver():
+    last_directory = []
+    image_export = SimpleNamespace(
+        set_last_save_directory=last_directory.append,
+        get_last_save_directory=lambda: last_directory[-1],
+    )
+    export_manager = SimpleNamespace(
+        beat_frame=None,
+        settings_manager=SimpleNamespace(image_export=image_export),
+    )
+    saver = ImageSaver(export_manager)
+    saver.indicator_label = Indicator()
+    saver.finished_threads = []
+    saver.save_finished.connect(
+        lambda *args: saver.finished_threads.append(threading.get_ident())
+    )
+    return saver, last_directory
+
+
+def wait_for_save(saver, future):
+    wait([future], timeout=30)
+    while not saver.finished_threads:
+        QCoreApplication.processEvents()
+    return saver.finished_threads[0]
+
+
+def test_image_saved_off_the_gui_thread(qapp, tmp_path, monkeypatch):
+    opened = []
+    monkeypatch.setattr(os, "startfile", opened.append, raising=False)
+    saver, last_directory = make_saver()
+    image = QImage(16, 8, QImage.Format.Format_RGBA8888)
+    image.fill(QColor("red"))
+    path = str(tmp_path / "word_v1.png")
+
+    future = saver._save(image, path)
+
+    assert wait_for_save(saver, future) == threading.get_ident()
+    assert QImage(path).size() == image.size()
+    assert saver.indicator_label.messages == ["Image saved as word_v1.png"]
+    assert last_directory == [str(tmp_path)]
+    assert opened == [path]
+
+
+def test_failed_save_is_reported(qapp, tmp_path):
+    saver, last_directory = make_saver()
+    image = QImage(16, 8, QImage.Format.Format_RGBA8888)
+
+    future = saver._save(image, str(tmp_path / "missing" / "word_v1.png"))
+    wait_for_save(saver, future)
+
+    assert saver.indicator_label.messages == ["Failed to save image."]
+    assert last_directory == []
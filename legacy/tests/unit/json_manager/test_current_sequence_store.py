@@ -0,0 +1,194 @@
+import json
+import os
+import stat
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from data.constants import BEAT, BLUE_ATTRS, LETTER, RED_ATTRS, TURNS
+from main_window.main_widget.json_manager.current_sequence_store import (
+    CurrentSequenceStore,
+    get_current_sequence_store,
+)
+from main_window.main_widget.json_manager.sequence_data_loader_saver import (
+    SequenceDataLoaderSaver,
+)
+
+
+def make_sequence(length=4):
+    metadata = {
+        "word": "",
+        "author": "tester",
+        "level": 1,
+        "prop_type": "staff",
+        "is_circular": False,
+        "can_be_CAP": False,
+    }
+    start = {
+        "sequence_start_position": "alpha",
+        BLUE_ATTRS: {TURNS: 0},
+        RED_ATTRS: {TURNS: 0},
+    }
+    beats = [
+        {LETTER: "A", BLUE_ATTRS: {TURNS: 0}, RED_ATTRS: {TURNS: 0}}
+        for _ in range(length)
+    ]
+    return [metadata, start, *beats]
+
+
+def read_file(path):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "current_sequence.json")
+
+
+@pytest.fixture
+def loader_saver(path):
+    loader_saver = SequenceDataLoaderSaver.__new__(SequenceDataLoaderSaver)
+    loader_saver.current_sequence_json = path
+    loader_saver.sequence_properties_manager = SimpleNamespace(
+        calculate_word=lambda sequence: "".join(
+            beat[LETTER] for beat in sequence[2:] if LETTER in beat
+        )
+    )
+    yield loader_saver
+    loader_saver.store.flush()
+
+
+def test_reads_file_once(path):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(make_sequence(), file)
+    store = CurrentSequenceStore(path)
+
+    assert store.load() == make_sequence()
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump([], file)
+    assert store.load() == make_sequence()
+
+
+def test_missing_or_invalid_file_has_no_sequence(path):
+    assert CurrentSequenceStore(path).load() is None
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("{not json")
+    assert CurrentSequenceStore(path).load() is None
+
+
+def test_loads_are_independent_copies(path):
+    store = CurrentSequenceStore(path)
+    sequence = make_sequence()
+    store.save(sequence)
+
+    sequence[2][BLUE_ATTRS][TURNS] = 3
+    loaded = store.load()
+    loaded[3][RED_ATTRS][TURNS] = 2
+
+    assert store.load() == make_sequence()
+    store.flush()
+
+
+def test_edits_are_written_together_after_the_delay(path, monkeypatch):
+    store = CurrentSequenceStore(path, write_delay=0.2)
+    writes = []
+    write = store._write
+    monkeypatch.setattr(
+        store, "_write", lambda sequence: write(sequence) or writes.append(1)
+    )
+    sequence = make_sequence()
+
+    for turns in range(10):
+        sequence[2][BLUE_ATTRS][TURNS] = turns
+        store.save(sequence)
+    assert writes == []
+
+    deadline = time.monotonic() + 5
+    while not writes and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert writes == [1]
+    assert read_file(path)[2][BLUE_ATTRS][TURNS] == 9
+
+
+def test_flush_writes_file_and_removes_journal(path, tmp_path):
+    store = CurrentSequenceStore(path, write_delay=60)
+    store.save(make_sequence())
+    assert (tmp_path / "current_sequence.json.journal").exists()
+
+    store.flush()
+
+    assert read_file(path) == make_sequence()
+    assert not (tmp_path / "current_sequence.json.journal").exists()
+    assert [entry.name for entry in tmp_path.iterdir()] == ["current_sequence.json"]
+
+
+def test_flush_keeps_file_mode(path):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(make_sequence(), file)
+    os.chmod(path, 0o644)
+    store = CurrentSequenceStore(path, write_delay=60)
+
+    store.save(make_sequence(2))
+    store.flush()
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+
+def test_unwritten_edits_are_recovered_from_journal(path):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(make_sequence(), file)
+    crashed = CurrentSequenceStore(path, write_delay=60)
+    edited = make_sequence()
+    edited[2][RED_ATTRS][TURNS] = 1
+    crashed.save(make_sequence(2))
+    crashed.save(edited)
+    with open(crashed.journal_path, "a", encoding="utf-8") as journal:
+        journal.write('[{"word": "cut sh')
+
+    restarted = CurrentSequenceStore(path)
+
+    assert restarted.load() == edited
+    assert read_file(path) == edited
+
+
+def test_observers_are_notified_of_saves(path):
+    store = CurrentSequenceStore(path, write_delay=60)
+    notified = []
+    store.register_observer(notified.append)
+
+    store.save(make_sequence())
+    store.unregister_observer(notified.append)
+    store.save(make_sequence(2))
+
+    assert notified == [make_sequence()]
+    store.flush()
+
+
+def test_stores_are_shared_per_path(path, tmp_path):
+    assert get_current_sequence_store(path) is get_current_sequence_store(
+        str(tmp_path / "." / "current_sequence.json")
+    )
+
+
+def test_save_numbers_beats_and_getters_read_memory(loader_saver):
+    sequence = make_sequence()
+    sequence[4][BLUE_ATTRS][TURNS] = 2
+
+    loader_saver.save_current_sequence(sequence)
+
+    assert [beat.get(BEAT) for beat in sequence] == [None, 0, 1, 2, 3, 4]
+    assert list(sequence[2])[0] == BEAT
+    assert sequence[0]["word"] == "A"
+    assert loader_saver.get_json_turns(4, "blue") == 2
+    assert loader_saver.load_current_sequence() == sequence
+
+
+def test_last_beat_data_is_a_copy(loader_saver):
+    loader_saver.save_current_sequence(make_sequence())
+
+    loader_saver.load_last_beat_data()[BLUE_ATTRS][TURNS] = 3
+
+    assert loader_saver.get_json_turns(-1, "blue") == 0
@@ -0,0 +1,178 @@
+import copy
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from data.constants import (
+    ANTI,
+    BLUE,
+    BLUE_ATTRS,
+    CLOCKWISE,
+    COUNTER_CLOCKWISE,
+    END_LOC,
+    END_ORI,
+    IN,
+    MOTION_TYPE,
+    NO_ROT,
+    OUT,
+    PROP_ROT_DIR,
+    RED,
+    RED_ATTRS,
+    START_LOC,
+    START_ORI,
+    TURNS,
+)
+from main_window.main_widget.generate_tab.sequence_generation_engine import (
+    SequenceGenerationEngine,
+)
+from main_window.main_widget.json_manager.json_ori_calculator import (
+    JsonOriCalculator,
+)
+from main_window.main_widget.json_manager.json_ori_validation_engine import (
+    ORIENTATIONS,
+    JsonOriValidationEngine,
+)
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    pytest.importorskip("pandas")
+    from main_window.main_widget.pictograph_data_loader import PictographDataLoader
+
+    dataset = PictographDataLoader(None).load_pictograph_dataset()
+    if sum(len(examples) for examples in dataset.values()) < 1000:
+        pytest.skip("pictograph CSVs not available")
+    return dataset
+
+
+@pytest.fixture(scope="module")
+def sequences(dataset):
+    random.seed(22)
+    generator = SequenceGenerationEngine(dataset)
+    return generator.generate_many(40, 32, turn_intensity=2, level=3)
+
+
+@pytest.fixture
+def engine():
+    return JsonOriValidationEngine(SimpleNamespace(ori_calculator=JsonOriCalculator()))
+
+
+def fully_validated(engine, sequence):
+    engine.sequence = copy.deepcopy(sequence)
+    engine.validate_and_update_json_orientations()
+    return engine.sequence
+
+
+def edit_turns(beat, color):
+    attributes = beat[f"{color}_attributes"]
+    if attributes[MOTION_TYPE] == "float":
+        return
+    attributes[TURNS] = random.choice([0, 0.5, 1, 1.5, 2])
+    if attributes[PROP_ROT_DIR] == NO_ROT:
+        attributes[PROP_ROT_DIR] = CLOCKWISE
+
+
+def test_propagation_matches_full_validation(engine, sequences):
+    random.seed(1)
+    for sequence in sequences:
+        for _ in range(5):
+            index = random.randrange(2, len(sequence))
+            edited = copy.deepcopy(sequence)
+            edit_turns(edited[index], random.choice((BLUE, RED)))
+
+            engine.propagate_orientations(edited, index)
+
+            assert edited == fully_validated(engine, edited)
+
+
+def test_propagation_stops_once_end_orientations_are_unchanged(engine):
+    def beat(turns):
+        motion = {
+            MOTION_TYPE: ANTI,
+            TURNS: turns,
+            PROP_ROT_DIR: CLOCKWISE,
+            START_ORI: IN,
+            END_ORI: OUT if turns % 2 == 0 else IN,
+            START_LOC: "n",
+            END_LOC: "e",
+        }
+        return {BLUE_ATTRS: motion, RED_ATTRS: dict(motion)}
+
+    sequence = [{}, beat(1)] + [beat(0) if i % 2 else beat(1) for i in range(16)]
+    sequence = fully_validated(engine, sequence)
+
+    # 0 to 2 turns: the end orientations stay the same
+    sequence[5][BLUE_ATTRS][TURNS] = 2
+    assert engine.propagate_orientations(sequence, 5) == 2
+
+    sequence[5][BLUE_ATTRS][TURNS] = 1
+    assert engine.propagate_orientations(sequence, 5) == len(sequence) - 5
+    assert sequence == fully_validated(engine, sequence)
+
+
+def test_run_starts_at_edited_beat(engine, sequences):
+    sequence = copy.deepcopy(sequences[0])
+    for beat in (sequence[2], sequence[-1]):
+        beat[BLUE_ATTRS][START_ORI] = None
+    saved = []
+    engine.json_manager.loader_saver = SimpleNamespace(
+        load_current_sequence=lambda: copy.deepcopy(sequence),
+        save_current_sequence=saved.append,
+    )
+
+    engine.run(is_current_sequence=True, start_index=-1)
+
+    assert saved[0][2][BLUE_ATTRS][START_ORI] is None
+    assert saved[0][-1] == sequences[0][-1]
+
+
+def test_transition_tables_match_calculator(engine, dataset):
+    calculator = JsonOriCalculator()
+    checked = 0
+    for examples in dataset.values():
+        for example in examples:
+            for turns in (0, 0.5, 1, 1.5, 2, 2.5, 3, "fl"):
+                for prop_rot_dir in (CLOCKWISE, COUNTER_CLOCKWISE):
+                    attributes = dict(example[BLUE_ATTRS])
+                    attributes[TURNS] = turns
+                    attributes[PROP_ROT_DIR] = prop_rot_dir
+                    row = engine._transition_row(engine._motion_key(attributes))
+                    for start_ori, end_ori in zip(ORIENTATIONS, row):
+                        attributes[START_ORI] = start_ori
+                        expected = calculator.calculate_end_ori(
+                            {BLUE_ATTRS: attributes}, BLUE
+                        )
+                        assert ORIENTATIONS[end_ori] == expected
+                        checked += 1
+    assert checked == 64 * sum(len(examples) for examples in dataset.values())
+
+
+def test_bulk_validation_matches_full_validation(engine, sequences):
+    random.seed(2)
+    scrambled = copy.deepcopy(sequences)
+    for sequence in scrambled:
+        for beat in sequence[2:]:
+            for attributes in (beat[BLUE_ATTRS], beat[RED_ATTRS]):
+                attributes[START_ORI] = random.choice(ORIENTATIONS)
+                attributes[END_ORI] = random.choice(ORIENTATIONS)
+            if random.random() < 0.2:
+                edit_turns(beat, random.choice((BLUE, RED)))
+    # Sequences of different lengths are padded
+    scrambled[0] = scrambled[0][:5]
+
+    expected = [fully_validated(engine, sequence) for sequence in scrambled]
+    engine.validate_sequences(scrambled)
+
+    assert scrambled == expected
+
+
+def test_bulk_validation_raises_like_full_validation(engine, sequences):
+    broken = copy.deepcopy(sequences[:3])
+    broken[1][3][RED_ATTRS][TURNS] = 0.5
+    broken[1][3][RED_ATTRS][PROP_ROT_DIR] = NO_ROT
+
+    with pytest.raises(ValueError):
+        fully_validated(engine, broken[1])
+    with pytest.raises(ValueError):
+        engine.validate_sequences(broken)
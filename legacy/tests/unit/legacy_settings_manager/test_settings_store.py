@@ -0,0 +1,94 @@
+import pytest
+
+from legacy_settings_manager.settings_store import SettingsStore, get_settings_store
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "settings.ini")
+
+
+def read_file(path):
+    # Read as text, as a QSettings would share the store's unsaved values
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+
+def test_values_read_back_like_qsettings(path):
+    store = SettingsStore(path)
+    store.setValue("browse/browse_ratio", 0.5)
+    store.setValue("global/grow_sequence", False)
+
+    assert store.value("browse/browse_ratio", 0.6667, type=float) == 0.5
+    assert store.value("global/grow_sequence", True, type=bool) is False
+    assert store.value("global/missing", "fallback") == "fallback"
+    assert store.contains("global/grow_sequence")
+
+    store.remove("global/grow_sequence")
+    assert not store.contains("global/grow_sequence")
+
+
+def test_changes_are_written_once_after_the_delay(qapp, path, monkeypatch):
+    store = SettingsStore(path, write_delay=0.2)
+    flushes = []
+    flush = store.flush
+    monkeypatch.setattr(store, "flush", lambda: flush() or flushes.append(1))
+
+    for ratio in range(50):
+        store.setValue("browse/browse_ratio", ratio / 100)
+        # QSettings would write the file on the next pass of the event loop
+        qapp.processEvents()
+
+    timer = store._timer
+    assert flushes == []
+    with pytest.raises(FileNotFoundError):
+        read_file(path)
+
+    timer.join()
+    assert len(flushes) == 1
+    assert "browse_ratio=0.49" in read_file(path)
+
+
+def test_sync_writes_now(path):
+    store = SettingsStore(path, write_delay=60)
+    store.setValue("image_export/custom_note", "note")
+
+    store.sync()
+
+    assert "custom_note=note" in read_file(path)
+    assert store._timer is None
+
+
+def test_batch_notifies_once_with_all_changes(path):
+    store = SettingsStore(path, write_delay=60)
+    notifications = []
+    store.register_observer(notifications.append)
+
+    with store.batch():
+        store.setValue("visibility/red_motion", False)
+        with store.batch():
+            store.setValue("visibility/blue_motion", True)
+        assert notifications == []
+        store.setValue("visibility/red_motion", True)
+
+    assert notifications == [
+        {"visibility/red_motion": True, "visibility/blue_motion": True}
+    ]
+    assert store._timer is not None
+    store.flush()
+
+    store.unregister_observer(notifications.append)
+    store.setValue("visibility/red_motion", False)
+    assert len(notifications) == 1
+
+
+def test_flush_without_changes_does_nothing(path):
+    store = SettingsStore(path)
+    store.flush()
+
+    with pytest.raises(FileNotFoundError):
+        read_file(path)
+
+
+def test_store_is_shared_per_path(path):
+    assert get_settings_store(path) is get_settings_store(path)
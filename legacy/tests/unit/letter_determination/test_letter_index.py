@@ -0,0 +1,140 @@
+import copy
+
+import pytest
+
+from data.constants import (
+    ALPHA1,
+    ALPHA3,
+    ANTI,
+    BEAT,
+    BLUE_ATTRS,
+    DIRECTION,
+    END_LOC,
+    END_POS,
+    FLOAT,
+    MOTION_TYPE,
+    NO_ROT,
+    OPP,
+    PRO,
+    PROP_ROT_DIR,
+    RED_ATTRS,
+    SAME,
+    START_LOC,
+    START_POS,
+    STATIC,
+)
+from enums.letter.letter import Letter
+from letter_determination.core import LetterDeterminer
+from letter_determination.services.motion_comparator import MotionComparator
+
+
+class LinearMotionComparator(MotionComparator):
+    """The example-by-example scans the index replaced."""
+
+    def find_letter(self, pictograph_data):
+        for letter, examples in self.dataset.items():
+            for example in examples:
+                if self.compare(pictograph_data, example):
+                    return letter
+        return None
+
+    def shift_candidates(self, float_attrs, non_float_attrs):
+        return [
+            (letter, example)
+            for letter, examples in self.dataset.items()
+            for example in examples
+        ]
+
+
+def linear_determiner(dataset):
+    determiner = LetterDeterminer(dataset, None)
+    determiner.comparator = LinearMotionComparator(dataset)
+    determiner.strategies = determiner._create_strategies()
+    return determiner
+
+
+@pytest.fixture(scope="module")
+def full_dataset():
+    pytest.importorskip("pandas")
+    from main_window.main_widget.pictograph_data_loader import PictographDataLoader
+
+    dataset = PictographDataLoader(None).load_pictograph_dataset()
+    if sum(len(examples) for examples in dataset.values()) < 1000:
+        pytest.skip("pictograph CSVs not available")
+    return dataset
+
+
+def queries(dataset):
+    """Every example, and its float, dual float and OPP variants."""
+    for examples in dataset.values():
+        for example in examples:
+            base = copy.deepcopy(example)
+            base[BEAT] = 1
+            yield base, False
+            yield base, True
+            for colors in ((BLUE_ATTRS,), (RED_ATTRS,), (BLUE_ATTRS, RED_ATTRS)):
+                for direction in (SAME, OPP):
+                    variant = copy.deepcopy(base)
+                    variant[DIRECTION] = direction
+                    for color in colors:
+                        variant[color][MOTION_TYPE] = FLOAT
+                        variant[color][PROP_ROT_DIR] = NO_ROT
+                    yield variant, False
+
+
+def example(letter_start_loc, blue_motion, red_motion=PRO):
+    return {
+        START_POS: ALPHA1,
+        END_POS: ALPHA3,
+        DIRECTION: SAME,
+        BLUE_ATTRS: {
+            MOTION_TYPE: blue_motion,
+            START_LOC: letter_start_loc,
+            END_LOC: "w",
+            PROP_ROT_DIR: "cw",
+        },
+        RED_ATTRS: {
+            MOTION_TYPE: red_motion,
+            START_LOC: "n",
+            END_LOC: "e",
+            PROP_ROT_DIR: "cw",
+        },
+    }
+
+
+def test_matches_linear_search_over_full_dataset(full_dataset):
+    indexed = LetterDeterminer(full_dataset, None)
+    linear = linear_determiner(full_dataset)
+
+    checked = 0
+    for query, swap in queries(full_dataset):
+        expected = linear.determine_letter(copy.deepcopy(query), swap)
+        assert indexed.determine_letter(copy.deepcopy(query), swap) == expected
+        checked += 1
+    assert checked == 8 * sum(len(examples) for examples in full_dataset.values())
+
+
+def test_first_example_in_dataset_order_wins():
+    dataset = {
+        Letter.B: [example("s", ANTI)],
+        Letter.A: [example("n", PRO), example("s", PRO)],
+    }
+    comparator = MotionComparator(dataset)
+
+    # Same positions and motion types as A's first example
+    assert comparator.find_letter(example("e", PRO)) == Letter.A
+    # Equal attributes to B's example, which comes first
+    assert comparator.find_letter(example("s", ANTI)) == Letter.B
+    assert comparator.find_letter(example("s", STATIC)) is None
+
+
+def test_lookups_do_not_scan_dataset(full_dataset, monkeypatch):
+    determiner = LetterDeterminer(full_dataset, None)
+    monkeypatch.setattr(
+        MotionComparator,
+        "compare",
+        lambda *args: pytest.fail("dataset scanned"),
+    )
+
+    for query, swap in queries({Letter.A: full_dataset[Letter.A]}):
+        determiner.determine_letter(query, swap)
@@ -0,0 +1,218 @@
+import json
+import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image, PngImagePlugin
+from PyQt6.QtGui import QColor, QImage
+
+from main_window.main_widget.sequence_card_tab.export.sequence_card_export_pipeline import (
+    ExportManifest,
+    SequenceCardExportPipeline,
+    list_export_jobs,
+)
+from utils.file_modes import NEW_FILE_MODE
+from utils.png_encoder import PngEncoder
+
+
+def write_source(path, sequence, **extra):
+    info = PngImagePlugin.PngInfo()
+    info.add_text("metadata", json.dumps({"sequence": sequence, **extra}))
+    Image.new("RGB", (4, 4)).save(path, "PNG", pnginfo=info)
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    root = tmp_path / "dictionary"
+    for word, count in (("A", 2), ("BC", 3)):
+        (root / word).mkdir(parents=True)
+        for version in range(1, count + 1):
+            write_source(root / word / f"{word}_ver{version}.png", [word, version])
+    (root / "A" / "__thumb.png").write_bytes(b"png")
+    (root / "__pycache__").mkdir()
+    return root
+
+
+class Recorder:
+    def __init__(self, fail=()):
+        self.rendered = []
+        self.writer_threads = set()
+        self.fail = set(fail)
+
+    def render(self, job):
+        self.rendered.append(job.key)
+        image = QImage(8, 8, QImage.Format.Format_ARGB32)
+        image.fill(QColor("red"))
+        with Image.open(job.source_path) as source:
+            return image, json.loads(source.info["metadata"])
+
+    def write(self, job, image, metadata):
+        self.writer_threads.add(threading.get_ident())
+        if job.key in self.fail:
+            raise OSError("disk full")
+        image.save(job.output_path, "PNG")
+
+
+def run_export(dictionary, export_path, recorder, **kwargs):
+    kwargs.setdefault("export_options", {"add_word": True})
+    kwargs.setdefault("max_workers", 2)
+    pipeline = SequenceCardExportPipeline(recorder.render, recorder.write, **kwargs)
+    progress = []
+    pipeline.progress.connect(lambda done, total: progress.append((done, total)))
+    jobs = list_export_jobs(str(dictionary), str(export_path))
+    stats = pipeline.run(jobs, ExportManifest(str(export_path)))
+    return stats, progress
+
+
+def test_jobs_listed_once_per_sequence(dictionary, tmp_path):
+    jobs = list_export_jobs(str(dictionary), str(tmp_path / "out"))
+
+    assert [job.key for job in jobs] == [
+        "A/A_ver1.png",
+        "A/A_ver2.png",
+        "BC/BC_ver1.png",
+        "BC/BC_ver2.png",
+        "BC/BC_ver3.png",
+    ]
+    assert jobs[0].output_path == os.path.join(tmp_path, "out", "A", "A_ver1.png")
+
+
+def test_cards_encoded_off_the_gui_thread(qapp, dictionary, tmp_path):
+    recorder = Recorder()
+    stats, progress = run_export(dictionary, tmp_path / "out", recorder)
+
+    assert stats == {"total": 5, "regenerated": 5, "skipped": 0, "failed": 0}
+    assert progress[-1] == (5, 5)
+    assert threading.get_ident() not in recorder.writer_threads
+    assert QImage(str(tmp_path / "out" / "BC" / "BC_ver3.png")).width() == 8
+
+
+def test_cards_encoded_on_a_shared_pool(qapp, dictionary, tmp_path):
+    encoder = PngEncoder(max_workers=2)
+    recorder = Recorder()
+    stats, _ = run_export(dictionary, tmp_path / "out", recorder, submit=encoder.run)
+    encoder.shutdown()
+
+    assert stats["regenerated"] == 5
+    assert threading.get_ident() not in recorder.writer_threads
+    assert ExportManifest(str(tmp_path / "out")).has_entry(
+        list_export_jobs(str(dictionary), str(tmp_path / "out"))[0]
+    )
+
+
+def test_manifest_skips_unchanged_cards(qapp, dictionary, tmp_path):
+    run_export(dictionary, tmp_path / "out", Recorder())
+    write_source(dictionary / "BC" / "BC_ver2.png", ["BC", 2, "changed"])
+
+    recorder = Recorder()
+    stats, _ = run_export(dictionary, tmp_path / "out", recorder)
+
+    assert recorder.rendered == ["BC/BC_ver2.png"]
+    assert stats["skipped"] == 4 and stats["regenerated"] == 1
+
+
+def test_touched_source_with_same_sequence_is_current(qapp, dictionary, tmp_path):
+    run_export(dictionary, tmp_path / "out", Recorder())
+    source = dictionary / "BC" / "BC_ver2.png"
+    write_source(source, ["BC", 2], tags=["favorite"])
+    os.utime(source, ns=(1, 1))
+
+    recorder = Recorder()
+    stats, _ = run_export(dictionary, tmp_path / "out", recorder)
+
+    assert recorder.rendered == []
+    assert stats["skipped"] == 5
+
+
+def test_option_change_invalidates_affected_cards_only(qapp, dictionary, tmp_path):
+    def card_options(sequence, options):
+        keys = ["add_word"] + (["add_note"] if sequence[0] == "BC" else [])
+        return {key: options.get(key) for key in keys}
+
+    options = {"add_word": True, "add_note": True}
+    run_export(
+        dictionary,
+        tmp_path / "out",
+        Recorder(),
+        export_options=options,
+        card_options=card_options,
+    )
+
+    recorder = Recorder()
+    run_export(
+        dictionary,
+        tmp_path / "out",
+        recorder,
+        export_options={**options, "add_note": False},
+        card_options=card_options,
+    )
+
+    assert recorder.rendered == ["BC/BC_ver1.png", "BC/BC_ver2.png", "BC/BC_ver3.png"]
+
+
+def test_failed_write_is_retried(qapp, dictionary, tmp_path):
+    stats, _ = run_export(
+        dictionary, tmp_path / "out", Recorder(fail={"A/A_ver2.png"})
+    )
+    assert stats["failed"] == 1
+
+    recorder = Recorder()
+    run_export(dictionary, tmp_path / "out", recorder)
+    assert recorder.rendered == ["A/A_ver2.png"]
+
+
+def test_rejected_submit_fails_card_without_hanging(qapp, dictionary, tmp_path):
+    pool = ThreadPoolExecutor(max_workers=1)
+    pool.shutdown()
+
+    stats, progress = run_export(
+        dictionary, tmp_path / "out", Recorder(), submit=pool.submit, max_in_flight=1
+    )
+
+    assert stats == {"total": 5, "regenerated": 0, "skipped": 0, "failed": 5}
+    assert progress[-1] == (5, 5)
+
+
+def test_manifest_has_default_or_existing_mode(qapp, dictionary, tmp_path):
+    out = tmp_path / "out"
+    run_export(dictionary, out, Recorder())
+    manifest_path = out / "export_manifest.json"
+    assert stat.S_IMODE(os.stat(manifest_path).st_mode) == NEW_FILE_MODE
+
+    os.chmod(manifest_path, 0o640)
+    run_export(dictionary, out, Recorder(), export_options={"add_word": False})
+    assert stat.S_IMODE(os.stat(manifest_path).st_mode) == 0o640
+
+
+def test_existing_cards_adopted_without_render(qapp, dictionary, tmp_path):
+    out = tmp_path / "out"
+    (out / "A").mkdir(parents=True)
+    (out / "A" / "A_ver1.png").write_bytes(b"old card")
+
+    recorder = Recorder()
+    stats, _ = run_export(dictionary, out, recorder, is_stale=lambda job: False)
+
+    assert "A/A_ver1.png" not in recorder.rendered
+    assert stats["skipped"] == 1 and stats["regenerated"] == 4
+
+
+def test_in_flight_cards_bounded(qapp, dictionary, tmp_path):
+    recorder = Recorder()
+    in_flight = []
+    peak = []
+    write = recorder.write
+
+    def slow_write(job, image, metadata):
+        in_flight.append(job)
+        peak.append(len(in_flight))
+        threading.Event().wait(0.02)
+        write(job, image, metadata)
+        in_flight.remove(job)
+
+    recorder.write = slow_write
+    stats, _ = run_export(dictionary, tmp_path / "out", recorder, max_in_flight=1)
+
+    assert stats["regenerated"] == 5
+    assert max(peak) == 1
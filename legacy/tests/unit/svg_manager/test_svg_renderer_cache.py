@@ -0,0 +1,58 @@
+import pytest
+
+from data.constants import BLUE, HEX_BLUE, HEX_RED, RED
+from svg_manager.svg_color_handler import SvgColorHandler
+from svg_manager.svg_renderer_cache import SvgRendererCache
+
+SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">'
+    "<style>.st0 { fill: #000000; }</style>"
+    '<rect class="st0" width="10" height="10" fill="#111111"/></svg>'
+)
+
+
+@pytest.fixture
+def loads():
+    return []
+
+
+@pytest.fixture
+def load_svg_file(loads):
+    def load(svg_path):
+        loads.append(svg_path)
+        return SVG
+
+    return load
+
+
+def test_renderer_shared_per_path_and_color(qapp, loads, load_svg_file):
+    cache = SvgRendererCache()
+
+    blue = cache.get_renderer("arrow.svg", BLUE, load_svg_file)
+    assert blue.isValid()
+    assert cache.get_renderer("arrow.svg", HEX_BLUE, load_svg_file) is blue
+    assert cache.get_renderer("arrow.svg", RED, load_svg_file) is not blue
+    assert cache.get_renderer("hand.svg", None, load_svg_file).isValid()
+
+    assert loads == ["arrow.svg", "arrow.svg", "hand.svg"]
+    assert cache.stats() == {"hits": 1, "misses": 3, "size": 3}
+
+
+def test_least_recently_used_evicted(qapp, loads, load_svg_file):
+    cache = SvgRendererCache(max_size=2)
+    blue = cache.get_renderer("arrow.svg", BLUE, load_svg_file)
+    cache.get_renderer("arrow.svg", RED, load_svg_file)
+    cache.get_renderer("arrow.svg", BLUE, load_svg_file)
+    cache.get_renderer("prop.svg", RED, load_svg_file)
+
+    assert len(cache) == 2
+    assert cache.get_renderer("arrow.svg", BLUE, load_svg_file) is blue
+    assert len(loads) == 3
+
+
+def test_color_transformations():
+    colored = SvgColorHandler.apply_color_transformations(SVG, RED)
+
+    assert colored.count(HEX_RED) == 2
+    assert "#000000" not in colored and "#111111" not in colored
+    assert SvgColorHandler.apply_color_transformations(SVG, "green") == SVG
@@ -0,0 +1,91 @@
+import gc
+import os
+import stat
+
+import pytest
+from PIL import Image
+from PyQt6.QtGui import QColor, QImage
+
+from utils.file_modes import NEW_FILE_MODE
+from utils.png_encoder import PNG_PROFILES, PngEncoder, qimage_to_pil, save_png
+from utils.png_metadata import read_png_text
+
+
+def make_qimage(fmt=QImage.Format.Format_RGBA8888, color=QColor(10, 20, 30, 40)):
+    image = QImage(7, 5, fmt)
+    image.fill(color)
+    image.setPixelColor(6, 4, QColor(200, 100, 50, 255))
+    return image
+
+
+@pytest.mark.parametrize(
+    "fmt, expected",
+    [
+        (QImage.Format.Format_RGBA8888, (10, 20, 30, 40)),
+        (QImage.Format.Format_ARGB32, (10, 20, 30, 40)),
+        (QImage.Format.Format_ARGB32_Premultiplied, (10, 20, 30, 255)),
+        (QImage.Format.Format_RGB32, (10, 20, 30, 255)),
+        (QImage.Format.Format_RGB888, (10, 20, 30, 255)),
+    ],
+)
+def test_pixels_match_qimage(qapp, fmt, expected):
+    color = QColor(10, 20, 30, expected[3])
+    image = qimage_to_pil(make_qimage(fmt, color))
+
+    assert image.size == (7, 5)
+    assert image.getpixel((0, 0)) == expected
+    assert image.getpixel((6, 4))[:3] == (200, 100, 50)
+
+
+def test_rgba8888_pixels_not_copied(qapp):
+    qimage = make_qimage()
+    image = qimage_to_pil(qimage)
+    qimage.setPixelColor(0, 0, QColor(1, 2, 3, 4))
+
+    assert image.getpixel((0, 0)) == (1, 2, 3, 4)
+
+
+def test_image_keeps_qimage_alive(qapp):
+    image = qimage_to_pil(make_qimage())
+    gc.collect()
+
+    assert image.getpixel((6, 4)) == (200, 100, 50, 255)
+
+
+def test_profiles_round_trip_with_metadata(qapp, tmp_path):
+    qimage = make_qimage()
+    for profile in PNG_PROFILES:
+        path = str(tmp_path / f"{profile}.png")
+        save_png(qimage, path, profile=profile, metadata={"sequence": [profile]})
+
+        with Image.open(path) as saved:
+            assert saved.getpixel((6, 4)) == (200, 100, 50, 255)
+        assert profile in read_png_text(path)
+
+
+def test_saved_file_has_default_or_existing_mode(qapp, tmp_path):
+    path = str(tmp_path / "image.png")
+    save_png(make_qimage(), path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == NEW_FILE_MODE
+
+    os.chmod(path, 0o640)
+    save_png(make_qimage(), path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+
+def test_encoder_writes_concurrently(qapp, tmp_path):
+    encoder = PngEncoder(max_workers=2)
+    futures = [
+        encoder.submit(make_qimage(), str(tmp_path / f"{i}.png"), profile="fast")
+        for i in range(6)
+    ]
+    for future in futures:
+        future.result(timeout=30)
+    encoder.shutdown()
+
+    assert sorted(os.listdir(tmp_path)) == sorted(f"{i}.png" for i in range(6))
+
+
+def test_unknown_profile_rejected(qapp, tmp_path):
+    with pytest.raises(ValueError):
+        PngEncoder(max_workers=1).submit(make_qimage(), str(tmp_path / "x.png"), "tiny")
@@ -0,0 +1,110 @@
+import json
+import os
+
+import pytest
+from PIL import Image, PngImagePlugin
+
+from utils.png_metadata import PNG_SIGNATURE, read_png_text, write_png_text
+
+
+def write_thumbnail(path, text=None, zip_text=False, itxt=False, size=(16, 16)):
+    pnginfo = PngImagePlugin.PngInfo()
+    if text is not None:
+        if itxt:
+            pnginfo.add_itxt("metadata", text, zip=zip_text)
+        else:
+            pnginfo.add_text("metadata", text, zip=zip_text)
+    pnginfo.add_text("other", "kept")
+    image = Image.new("RGB", size)
+    image.putpixel((3, 5), (200, 10, 30))
+    image.save(path, pnginfo=pnginfo)
+
+
+def chunks(path):
+    with open(path, "rb") as file:
+        data = file.read()
+    offset = len(PNG_SIGNATURE)
+    result = []
+    while offset < len(data):
+        length = int.from_bytes(data[offset : offset + 4], "big")
+        result.append((data[offset + 4 : offset + 8], data[offset : offset + 12 + length]))
+        offset += 12 + length
+    return result
+
+
+class TestReadPngText:
+    @pytest.mark.parametrize(
+        "zip_text, itxt",
+        [(False, False), (True, False), (False, True), (True, True)],
+    )
+    def test_matches_pil(self, tmp_path, zip_text, itxt):
+        path = str(tmp_path / "thumb.png")
+        text = json.dumps({"sequence": [{"word": "Θα"}]}, ensure_ascii=not itxt)
+        write_thumbnail(path, text, zip_text=zip_text, itxt=itxt)
+
+        with Image.open(path) as img:
+            expected = img.info["metadata"]
+        assert read_png_text(path) == expected
+
+    def test_missing_chunk(self, tmp_path):
+        path = str(tmp_path / "thumb.png")
+        write_thumbnail(path)
+        assert read_png_text(path) is None
+
+    def test_rejects_non_png(self, tmp_path):
+        path = tmp_path / "thumb.png"
+        path.write_bytes(b"not a png")
+        with pytest.raises(ValueError):
+            read_png_text(str(path))
+
+
+class TestWritePngText:
+    def test_replaces_only_the_text_chunk(self, tmp_path):
+        path = str(tmp_path / "thumb.png")
+        write_thumbnail(path, json.dumps({"is_favorite": False}))
+        before = chunks(path)
+
+        write_png_text(path, json.dumps({"is_favorite": True}))
+        after = chunks(path)
+
+        assert read_png_text(path) == '{"is_favorite": true}'
+        assert [t for t, _ in after] == [t for t, _ in before]
+        unchanged = [c for t, c in before if t != b"tEXt"]
+        assert [c for t, c in after if t != b"tEXt"] == unchanged
+        assert read_png_text(path, "other") == "kept"
+
+    def test_pixels_survive_and_pil_reads_new_text(self, tmp_path):
+        path = str(tmp_path / "thumb.png")
+        write_thumbnail(path, "old", zip_text=True)
+
+        write_png_text(path, "new")
+
+        with Image.open(path) as img:
+            assert img.info["metadata"] == "new"
+            assert img.getpixel((3, 5)) == (200, 10, 30)
+
+    def test_adds_chunk_before_image_data(self, tmp_path):
+        path = str(tmp_path / "thumb.png")
+        write_thumbnail(path)
+
+        write_png_text(path, "added")
+
+        types = [t for t, _ in chunks(path)]
+        assert types.index(b"tEXt") < types.index(b"IDAT")
+        assert read_png_text(path) == "added"
+
+    def test_non_latin_text_is_written_as_itxt(self, tmp_path):
+        path = str(tmp_path / "thumb.png")
+        write_thumbnail(path, "old")
+
+        write_png_text(path, "Θα")
+
+        assert b"iTXt" in [t for t, _ in chunks(path)]
+        with Image.open(path) as img:
+            assert img.info["metadata"] == "Θα"
+
+    def test_leaves_no_temp_files(self, tmp_path):
+        path = str(tmp_path / "thumb.png")
+        write_thumbnail(path, "old")
+        write_png_text(path, "new")
+        assert os.listdir(tmp_path) == ["thumb.png"]
@@ -98,6 +98,7 @@ class KineticConstructorModern(QMainWindow):
         # Register focused domain services
         self._register_motion_services()
         self._register_layout_services()
+        self._register_positioning_services()
         self._register_pictograph_services()
 
         # Configure workbench services
@@ -180,6 +181,14 @@ class KineticConstructorModern(QMainWindow):
         # ComponentLayoutService) have been consolidated for better maintainability
         pass
 
+    def _register_positioning_services(self):
+        """Register the read-only positioning services shared by every pictograph scene."""
+        from application.services.positioning.shared_positioning import (
+            register_positioning_services,
+        )
+
+        register_positioning_services(self.container)
+
     def _register_pictograph_services(self):  # 🔥 CHANGED: Pure DI registration
         """Register the focused pictograph services using pure dependency injection."""
         from application.services.data.pictograph_data_service import (
@@ -16,14 +16,12 @@ PROVIDES:
 - CSV data loading and pictograph creation
 """
 
-from typing import List, Dict, Any, Optional, Tuple, Union, TypedDict
+from typing import List, Dict, Any, Mapping, Optional, Tuple, Union, TypedDict
 from abc import ABC, abstractmethod
 from enum import Enum
 import uuid
 from pathlib import Path
 
-import pandas as pd
-
 from domain.models.core_models import (
     BeatData,
     MotionData,
@@ -42,6 +40,9 @@ from domain.models.pictograph_models import (
     ArrowData,
     PropData,
 )
+from application.services.data.pictograph_dataset_engine import (
+    PictographDatasetEngine,
+)
 
 
 class PictographSearchQuery(TypedDict, total=False):
@@ -108,14 +109,8 @@ class PictographManagementService(IPictographManagementService):
         self._pictograph_cache: Dict[str, PictographData] = {}
         self._dataset_index: Dict[str, List[str]] = {}
 
-        # CSV data loading
-        self._csv_data = None
-        # Path from modern/src/application/services/core/ to project root data/
-        self._data_path = (
-            Path(__file__).parent.parent.parent.parent.parent.parent
-            / "data"
-            / "DiamondPictographDataframe.csv"
-        )
+        # Shared columnar view of the Diamond/Box CSV datasets
+        self._dataset_engine = PictographDatasetEngine()
 
         # Context configuration
         self._context_configs = self._load_context_configs()
@@ -258,11 +253,19 @@ class PictographManagementService(IPictographManagementService):
         """Load pictograph data from a CSV file and add to dataset."""
         pictographs = []
 
-        # Read CSV file
+        # Dataset CSVs are already loaded by the shared engine
         try:
-            df = pd.read_csv(file_path)
+            grid_mode = self._dataset_engine.source_grid_mode(file_path)
+            if grid_mode is not None:
+                rows = self._dataset_engine.records(
+                    self._dataset_engine.query(grid_mode=grid_mode)
+                )
+            else:
+                import pandas as pd
+
+                rows = pd.read_csv(file_path).to_dict("records")
 
-            for _, row in df.iterrows():
+            for row in rows:
                 # Convert each row to pictograph
                 pictograph = self._convert_row_to_pictograph(row)
                 if pictograph:
@@ -274,35 +277,27 @@ class PictographManagementService(IPictographManagementService):
 
         return pictographs
 
-    def _load_csv_data(self) -> pd.DataFrame:
-        """Load CSV data if not already loaded."""
-        if self._csv_data is None:
-            self._csv_data = pd.read_csv(self._data_path)
-        return self._csv_data
-
     def get_specific_pictograph(
-        self, letter: str, index: int = 0
+        self, letter: str, index: int = 0, grid_mode: str = "diamond"
     ) -> Optional[BeatData]:
-        """Get a specific pictograph by letter and index from CSV data."""
-        df = self._load_csv_data()
-
-        # Filter by letter
-        letter_data = df[df["letter"] == letter]
+        """Get a specific pictograph by letter and index from the dataset."""
+        rows = self._dataset_engine.query(letter=letter, grid_mode=grid_mode)
 
-        if letter_data.empty or index >= len(letter_data):
+        if index >= len(rows):
             return None
 
-        row = letter_data.iloc[index]
+        row = self._dataset_engine.records([rows[index]])[0]
         return self._create_beat_data_from_csv_row(row)
 
-    def get_pictographs_by_letter(self, letter: str) -> List[BeatData]:
+    def get_pictographs_by_letter(
+        self, letter: str, grid_mode: str = "diamond"
+    ) -> List[BeatData]:
         """Get all pictographs for a specific letter."""
-        df = self._load_csv_data()
-        letter_data = df[df["letter"] == letter]
+        rows = self._dataset_engine.query(letter=letter, grid_mode=grid_mode)
 
         return [
             self._create_beat_data_from_csv_row(row)
-            for _, row in letter_data.iterrows()
+            for row in self._dataset_engine.records(rows)
         ]
 
     def get_start_position_pictograph(
@@ -332,8 +327,8 @@ class PictographManagementService(IPictographManagementService):
             print(f"⚠️ No pictographs found for letter: {letter}")
             return None
 
-    def _create_beat_data_from_csv_row(self, row) -> BeatData:
-        """Convert a CSV row to BeatData object."""
+    def _create_beat_data_from_csv_row(self, row: Mapping[str, Any]) -> BeatData:
+        """Convert a dataset row record to BeatData object."""
         # Map CSV values to enums
         motion_type_map = {
             "pro": MotionType.PRO,
@@ -368,7 +363,7 @@ class PictographManagementService(IPictographManagementService):
                 ),
                 start_loc=location_map[row["blue_start_loc"]],
                 end_loc=location_map[row["blue_end_loc"]],
-            )
+            ).interned()
 
         red_motion = None
         if row["red_motion_type"] in motion_type_map:
@@ -379,7 +374,7 @@ class PictographManagementService(IPictographManagementService):
                 ),
                 start_loc=location_map[row["red_start_loc"]],
                 end_loc=location_map[row["red_end_loc"]],
-            )
+            ).interned()
 
         # Create initial beat data
         beat_data = BeatData(
@@ -650,7 +645,9 @@ class PictographManagementService(IPictographManagementService):
             "blank": "○",
         }
 
-    def _convert_row_to_pictograph(self, row: pd.Series) -> Optional[PictographData]:
+    def _convert_row_to_pictograph(
+        self, row: Mapping[str, Any]
+    ) -> Optional[PictographData]:
         """Convert a CSV row to PictographData."""
         try:
             # Extract arrow data
@@ -27,6 +27,7 @@ from domain.models.core_models import (
     Location,
     RotationDirection,
 )
+from domain.models.beat_vector import BeatVector
 from domain.models.pictograph_models import PictographData
 
 # Event-driven architecture imports
@@ -306,14 +307,10 @@ class SequenceManagementService(ISequenceManagementService):
                 f"Invalid position {position} for sequence of length {len(sequence.beats)}"
             )
 
-        new_beats = sequence.beats.copy()
-        new_beats.insert(position, beat)
-
-        # Update beat numbers
-        for i, beat in enumerate(new_beats):
-            new_beats[i] = beat.update(beat_number=i + 1)
-
-        updated_sequence = sequence.update(beats=new_beats)
+        # Later beats are renumbered implicitly
+        updated_sequence = sequence.insert_beat(position + 1, beat)
+        new_beats = updated_sequence.beats
+        beat = new_beats[position]
 
         # Publish beat added event
         if self.event_bus:
@@ -346,14 +343,11 @@ class SequenceManagementService(ISequenceManagementService):
                 f"Invalid position {position} for sequence of length {len(sequence.beats)}"
             )
 
-        new_beats = sequence.beats.copy()
-        removed_beat = new_beats.pop(position)
+        removed_beat = sequence.beats[position]
 
-        # Update beat numbers
-        for i, beat in enumerate(new_beats):
-            new_beats[i] = beat.update(beat_number=i + 1)
-
-        updated_sequence = sequence.update(beats=new_beats)
+        # Later beats are renumbered implicitly
+        updated_sequence = sequence.remove_beat(position + 1)
+        new_beats = updated_sequence.beats
 
         # Publish beat removed event
         if self.event_bus:
@@ -637,10 +631,7 @@ class SequenceManagementService(ISequenceManagementService):
 
     def _apply_reverse_sequence(self, sequence: SequenceData) -> SequenceData:
         """Reverse the order of beats in sequence."""
-        new_beats = list(reversed(sequence.beats))
-        for i, beat in enumerate(new_beats):
-            new_beats[i] = beat.update(beat_number=i + 1)
-        return sequence.update(beats=new_beats)
+        return sequence.update(beats=BeatVector(reversed(sequence.beats)))
 
     def _load_transformation_matrices(self) -> Dict[str, Any]:
         """Load transformation matrices for workbench operations."""
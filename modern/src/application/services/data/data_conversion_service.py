@@ -257,7 +257,7 @@ class DataConversionService:
                 end_loc=end_loc,
                 start_ori=start_ori,
                 end_ori=end_ori,
-            )
+            ).interned()
 
         except Exception as e:
             logger.error(
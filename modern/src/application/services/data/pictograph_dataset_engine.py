@@ -0,0 +1,219 @@
+"""
+Pictograph Dataset Engine - Columnar Pictograph Dataset
+
+Loads the Diamond and Box pictograph datasets once per process and keeps them as
+columns of small integer codes. The columns come from the pre-built dataset
+snapshot, so a warm start maps them from disk without parsing CSV or importing
+pandas. Motion type, rotation direction and location columns use fixed code
+tables derived from the domain enums; letter, position, timing and direction
+columns are factorized into per-column vocabularies.
+
+Queries are vectorized boolean masks over the code columns, so filtering by
+letter, start/end position, grid mode or motion-type pair never touches a
+Python row object. Services that need row dictionaries get read-only records
+that are decoded once and shared.
+"""
+
+import threading
+from enum import Enum
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from infrastructure.data_path_handler import DataPathHandler
+from infrastructure.dataset_snapshot import (
+    COLUMNS,
+    ENUM_COLUMNS,
+    GRID_MODES,
+    DatasetSnapshotStore,
+)
+
+MISSING_CODE = -1
+
+
+class PictographDatasetEngine:
+    """
+    Process-wide columnar view of the Diamond and Box pictograph datasets.
+
+    Usage:
+        engine = PictographDatasetEngine()
+        rows = engine.query(grid_mode="diamond", start_pos="alpha1")
+        records = engine.records(rows)
+    """
+
+    _instance: Optional["PictographDatasetEngine"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._load()
+                    cls._instance = instance
+        return cls._instance
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the shared instance so the next construction reloads the data."""
+        with cls._lock:
+            cls._instance = None
+
+    # Loading
+
+    def _load(self) -> None:
+        """Load the encoded columns from the dataset snapshot."""
+        self._data_handler = DataPathHandler()
+        self._columns: Dict[str, np.ndarray] = {}
+        self._vocabularies: Dict[str, Tuple[str, ...]] = {}
+        self._code_lookup: Dict[str, Dict[str, int]] = {}
+        self._records: Optional[Tuple[Mapping[str, Any], ...]] = None
+
+        try:
+            snapshot = DatasetSnapshotStore.shared().load_or_build()
+            self._set_columns(dict(snapshot.columns), dict(snapshot.vocabularies))
+        except Exception as e:
+            print(f"❌ Error loading pictograph dataset engine: {e}")
+            self._set_columns(
+                {column: np.empty(0, dtype=np.int16) for column in COLUMNS},
+                {column: ENUM_COLUMNS.get(column, ()) for column in COLUMNS},
+            )
+
+    def _set_columns(
+        self,
+        columns: Dict[str, np.ndarray],
+        vocabularies: Dict[str, Tuple[str, ...]],
+    ) -> None:
+        """Install encoded columns, freezing the arrays against mutation."""
+        for array in columns.values():
+            array.flags.writeable = False
+
+        self._columns = columns
+        self._vocabularies = vocabularies
+        self._code_lookup = {
+            column: {value: code for code, value in enumerate(vocabulary)}
+            for column, vocabulary in vocabularies.items()
+        }
+        self._records = None
+
+    # Introspection
+
+    @property
+    def size(self) -> int:
+        """Number of pictographs across both grid modes."""
+        return len(self._columns.get("letter", ()))
+
+    def column(self, name: str) -> np.ndarray:
+        """Get the read-only integer code array for a column."""
+        return self._columns[name]
+
+    def vocabulary(self, name: str) -> Tuple[str, ...]:
+        """Get the code-to-string table for a column."""
+        return self._vocabularies[name]
+
+    def encode(self, column: str, value: Any) -> int:
+        """Get the integer code of a value, or MISSING_CODE if it never occurs."""
+        if isinstance(value, Enum):
+            value = value.value
+        return self._code_lookup[column].get(str(value), MISSING_CODE)
+
+    def source_grid_mode(self, file_path: Path) -> Optional[str]:
+        """Return the grid mode whose CSV lives at file_path, if any."""
+        resolved = Path(file_path).resolve()
+        if resolved == self._data_handler.diamond_csv_path.resolve():
+            return "diamond"
+        if resolved == self._data_handler.box_csv_path.resolve():
+            return "box"
+        return None
+
+    # Queries
+
+    def mask(self, **criteria: Any) -> np.ndarray:
+        """
+        Build a boolean row mask from column=value criteria.
+
+        None values are ignored; a sequence value matches any of its items.
+        Enum members are matched by value.
+        """
+        mask = np.ones(self.size, dtype=bool)
+        for column, value in criteria.items():
+            if value is None:
+                continue
+            codes = self._columns[column]
+            if isinstance(value, (list, tuple, set, frozenset)):
+                wanted = [self.encode(column, item) for item in value]
+                wanted = [code for code in wanted if code != MISSING_CODE]
+                mask &= np.isin(codes, wanted)
+            else:
+                code = self.encode(column, value)
+                if code == MISSING_CODE:
+                    mask[:] = False
+                else:
+                    mask &= codes == code
+        return mask
+
+    def query(self, **criteria: Any) -> np.ndarray:
+        """Get the row indices matching column=value criteria, in dataset order."""
+        return np.flatnonzero(self.mask(**criteria))
+
+    def query_motion_types(
+        self,
+        blue_motion_type: Any,
+        red_motion_type: Any,
+        grid_mode: Optional[str] = None,
+    ) -> np.ndarray:
+        """Get the row indices for a (blue, red) motion-type pair."""
+        return self.query(
+            grid_mode=grid_mode,
+            blue_motion_type=blue_motion_type,
+            red_motion_type=red_motion_type,
+        )
+
+    def unique(self, column: str, **criteria: Any) -> List[str]:
+        """Get the distinct values of a column among the matching rows."""
+        codes = np.unique(self._columns[column][self.mask(**criteria)])
+        vocabulary = self._vocabularies[column]
+        return [vocabulary[code] for code in codes if code != MISSING_CODE]
+
+    # Records
+
+    def records(
+        self, indices: Optional[Iterable[int]] = None
+    ) -> List[Mapping[str, Any]]:
+        """
+        Get read-only row records keyed by CSV column name.
+
+        Records are decoded once for the whole dataset and shared between
+        callers.
+        """
+        all_records = self._decoded_records()
+        if indices is None:
+            return list(all_records)
+        return [all_records[i] for i in indices]
+
+    def first_record(self, **criteria: Any) -> Optional[Mapping[str, Any]]:
+        """Get the first record matching the criteria, or None."""
+        indices = self.query(**criteria)
+        if len(indices) == 0:
+            return None
+        return self._decoded_records()[indices[0]]
+
+    def _decoded_records(self) -> Sequence[Mapping[str, Any]]:
+        if self._records is None:
+            decoded = [self._decode_column(column) for column in COLUMNS]
+            self._records = tuple(
+                MappingProxyType(dict(zip(COLUMNS, values)))
+                for values in zip(*decoded)
+            )
+        return self._records
+
+    def _decode_column(self, column: str) -> List[Optional[str]]:
+        """Vectorized code-to-string lookup for a whole column."""
+        table = np.asarray(self._vocabularies[column] + (None,), dtype=object)
+        # MISSING_CODE (-1) indexes the trailing None entry
+        return table[self._columns[column]].tolist()
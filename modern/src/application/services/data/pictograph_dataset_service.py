@@ -5,10 +5,7 @@ This service provides access to the actual pictograph dataset,
 enabling pixel-perfect accuracy for start position selection and motion combinations.
 """
 
-import os
-import pandas as pd
-from typing import Dict, Any, Optional, List
-from pathlib import Path
+from typing import Dict, Any, Mapping, Optional, List
 
 from domain.models.core_models import (
     BeatData,
@@ -18,8 +15,8 @@ from domain.models.core_models import (
     Location,
     GlyphData,
 )
-from infrastructure.data_path_handler import DataPathHandler
 from .glyph_data_service import GlyphDataService
+from .pictograph_dataset_engine import PictographDatasetEngine
 
 
 class PictographDatasetService:
@@ -34,39 +31,8 @@ class PictographDatasetService:
     """
 
     def __init__(self):
-        self._data_handler = DataPathHandler()
+        self._dataset_engine = PictographDatasetEngine()
         self.glyph_service = GlyphDataService()
-        self._diamond_dataset: Optional[pd.DataFrame] = None
-        self._box_dataset: Optional[pd.DataFrame] = None
-        self._combined_dataset: Optional[pd.DataFrame] = None
-        self._load_datasets()
-
-    def _load_datasets(self) -> None:
-        """Load the diamond and box pictograph datasets."""
-        try:
-            self._diamond_dataset = self._data_handler.load_diamond_dataset()
-            self._box_dataset = self._data_handler.load_box_dataset()
-
-            if self._diamond_dataset is not None and self._box_dataset is not None:
-                self._combined_dataset = pd.concat(
-                    [self._diamond_dataset, self._box_dataset], ignore_index=True
-                )
-            elif self._diamond_dataset is not None:
-                self._combined_dataset = self._diamond_dataset
-            elif self._box_dataset is not None:
-                self._combined_dataset = self._box_dataset
-
-            status = self._data_handler.validate_data_files()
-            if not status["diamond_exists"]:
-                print(f"❌ Diamond dataset not found: {status['diamond_path']}")
-            if not status["box_exists"]:
-                print(f"❌ Box dataset not found: {status['box_path']}")
-
-        except Exception as e:
-            print(f"❌ Error loading datasets: {e}")
-            self._diamond_dataset = pd.DataFrame()
-            self._box_dataset = pd.DataFrame()
-            self._combined_dataset = pd.DataFrame()
 
     def get_start_position_pictograph(
         self, position_key: str, grid_mode: str = "diamond"
@@ -82,12 +48,7 @@ class PictographDatasetService:
             BeatData object with real dataset information, or None if not found
         """
         try:
-            # Choose the appropriate dataset
-            dataset = (
-                self._diamond_dataset if grid_mode == "diamond" else self._box_dataset
-            )
-
-            if dataset is None or dataset.empty:
+            if self._dataset_engine.size == 0:
                 print(f"❌ No {grid_mode} dataset available")
                 return None
 
@@ -95,19 +56,16 @@ class PictographDatasetService:
             start_pos, end_pos = position_key.split("_")
 
             # Find matching entry where start_pos == end_pos (start position entries)
-            matching_entries = dataset[
-                (dataset["start_pos"] == start_pos) & (dataset["end_pos"] == end_pos)
-            ]
+            entry = self._dataset_engine.first_record(
+                grid_mode=grid_mode, start_pos=start_pos, end_pos=end_pos
+            )
 
-            if matching_entries.empty:
+            if entry is None:
                 print(
                     f"❌ No start position found for {position_key} in {grid_mode} dataset"
                 )
                 return None
 
-            # Take the first matching entry
-            entry = matching_entries.iloc[0]
-
             # Convert to BeatData
             beat_data = self._dataset_entry_to_beat_data(entry)
 
@@ -141,36 +99,35 @@ class PictographDatasetService:
             BeatData object if found, None otherwise
         """
         try:
-            dataset = (
-                self._diamond_dataset if grid_mode == "diamond" else self._box_dataset
+            entry = self._dataset_engine.first_record(
+                grid_mode=grid_mode,
+                letter=letter,
+                start_pos=start_pos,
+                end_pos=end_pos,
             )
 
-            if dataset is None or dataset.empty:
+            if entry is None:
                 return None
 
-            matching_entries = dataset[
-                (dataset["letter"] == letter)
-                & (dataset["start_pos"] == start_pos)
-                & (dataset["end_pos"] == end_pos)
-            ]
-
-            if matching_entries.empty:
-                return None
-
-            # Take the first matching entry
-            entry = matching_entries.iloc[0]
             return self._dataset_entry_to_beat_data(entry)
 
         except Exception as e:
             print(f"❌ Error finding pictograph: {e}")
             return None
 
-    def _dataset_entry_to_beat_data(self, entry: pd.Series) -> BeatData:
+    def get_first_pictograph(self, grid_mode: str = "diamond") -> Optional[BeatData]:
+        """Get the first pictograph of a grid mode's dataset, or None if empty."""
+        entry = self._dataset_engine.first_record(grid_mode=grid_mode)
+        if entry is None:
+            return None
+        return self._dataset_entry_to_beat_data(entry)
+
+    def _dataset_entry_to_beat_data(self, entry: Mapping[str, Any]) -> BeatData:
         """
         Convert a dataset entry to BeatData format.
 
         Args:
-            entry: Pandas Series representing a dataset row
+            entry: Row record from the pictograph dataset engine
 
         Returns:
             BeatData object with proper motion data and glyph information
@@ -200,7 +157,7 @@ class PictographDatasetService:
             end_ori=(
                 "out" if blue_motion_type in [MotionType.PRO, MotionType.ANTI] else "in"
             ),
-        )
+        ).interned()
 
         red_motion = MotionData(
             motion_type=red_motion_type,
@@ -212,7 +169,7 @@ class PictographDatasetService:
             end_ori=(
                 "out" if red_motion_type in [MotionType.PRO, MotionType.ANTI] else "in"
             ),
-        )
+        ).interned()
 
         # Create beat data
         beat_data = BeatData(
@@ -268,17 +225,12 @@ class PictographDatasetService:
 
     def get_dataset_info(self) -> Dict[str, Any]:
         """Get information about the loaded datasets."""
+        diamond_entries = len(self._dataset_engine.query(grid_mode="diamond"))
+        box_entries = len(self._dataset_engine.query(grid_mode="box"))
         return {
-            "diamond_loaded": self._diamond_dataset is not None
-            and not self._diamond_dataset.empty,
-            "box_loaded": self._box_dataset is not None and not self._box_dataset.empty,
-            "diamond_entries": (
-                len(self._diamond_dataset) if self._diamond_dataset is not None else 0
-            ),
-            "box_entries": (
-                len(self._box_dataset) if self._box_dataset is not None else 0
-            ),
-            "total_entries": (
-                len(self._combined_dataset) if self._combined_dataset is not None else 0
-            ),
+            "diamond_loaded": diamond_entries > 0,
+            "box_loaded": box_entries > 0,
+            "diamond_entries": diamond_entries,
+            "box_entries": box_entries,
+            "total_entries": self._dataset_engine.size,
         }
@@ -1,24 +1,97 @@
 from typing import Dict, Any, Optional, Tuple, List, Union, TYPE_CHECKING
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
+import json
 import math
 import logging
+import threading
 import uuid
 from datetime import datetime
+from pathlib import Path
 
 from PyQt6.QtCore import QSize
 from core.decorators import handle_service_errors
 from core.monitoring import monitor_performance
 from domain.models.core_models import SequenceData
 from core.interfaces.core_services import ILayoutService
+from infrastructure.data_path_handler import DataPathHandler
+
+logger = logging.getLogger(__name__)
+
+# (rows, columns) for each beat count, from data/default_layouts.json with
+# data/beat_layout_overrides.json applied on top, as the legacy app does.
+# Loaded on first use and kept for the life of the process.
+_layout_table: Optional[Dict[int, Tuple[int, int]]] = None
+_layout_table_lock = threading.Lock()
+
+
+def _read_layouts(path: Path) -> Dict[int, Tuple[int, int]]:
+    """Read a beat count -> [rows, columns] JSON file; empty if unusable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            raw_layouts = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        logger.warning(f"Ignoring invalid beat layouts in {path}: {e}")
+        return {}
+
+    layouts = {}
+    for beat_count, layout in raw_layouts.items():
+        try:
+            rows, columns = layout
+            layouts[int(beat_count)] = (int(rows), int(columns))
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring invalid layout for {beat_count} beats in {path}")
+    return layouts
+
+
+def get_layout_table() -> Dict[int, Tuple[int, int]]:
+    """The default beat frame layouts with the user's overrides applied."""
+    global _layout_table
+    if _layout_table is None:
+        with _layout_table_lock:
+            if _layout_table is None:
+                data_dir = DataPathHandler().data_dir
+                layouts = _read_layouts(data_dir / "default_layouts.json")
+                layouts.update(_read_layouts(data_dir / "beat_layout_overrides.json"))
+                _layout_table = layouts
+    return _layout_table
+
+
+def reload_layout_table() -> None:
+    """Forget the loaded layouts, e.g. after the overrides file has changed."""
+    global _layout_table
+    with _layout_table_lock:
+        _layout_table = None
+    layout_for_beat_count.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def layout_for_beat_count(beat_count: int) -> Tuple[int, int]:
+    """(rows, columns) of the beat frame for a sequence of beat_count beats."""
+    layout = get_layout_table().get(beat_count)
+    if layout is not None:
+        return layout
+
+    # For beat counts beyond the table, keep 4 columns and add rows
+    if beat_count > 64:
+        columns = 4
+        return math.ceil(beat_count / columns), columns
+
+    # Fallback (should rarely be used with the layout table)
+    return 1, beat_count
 
 
 class BeatLayoutCalculator:
     """
     Handles comprehensive beat layout calculations with detailed default layouts.
 
-    This class preserves the original carefully designed beat layout logic
-    with comprehensive default layouts for beat counts 0-64 and beyond.
+    Beat frame layouts come from the layout table (data/default_layouts.json
+    and the user's beat_layout_overrides.json, covering beat counts 0-64) and
+    the 4-column pattern beyond it. Each beat count's layout is worked out
+    once per process, since it doesn't depend on the container size.
     Responsible for determining optimal rows/columns for beat sequences.
     """
 
@@ -33,92 +106,8 @@ class BeatLayoutCalculator:
         self, sequence: SequenceData, container_size: Tuple[int, int]
     ) -> Dict[str, Any]:
         """Calculate layout for beat frames using your original carefully designed algorithm."""
-        beat_count = len(sequence.beats)
-
-        # Your original complete default layouts (rows, columns) for all beat counts
-        # This preserves your careful layout design decisions
-        default_layouts = {
-            "0": [1, 0],
-            "1": [1, 1],
-            "2": [1, 2],
-            "3": [1, 3],
-            "4": [1, 4],
-            "5": [2, 4],
-            "6": [2, 4],
-            "7": [2, 4],
-            "8": [2, 4],
-            "9": [3, 4],
-            "10": [3, 4],
-            "11": [3, 4],
-            "12": [4, 3],
-            "13": [4, 4],
-            "14": [4, 4],
-            "15": [4, 4],
-            "16": [4, 4],
-            "17": [4, 5],
-            "18": [4, 5],
-            "19": [4, 5],
-            "20": [4, 5],
-            "21": [6, 4],
-            "22": [6, 4],
-            "23": [6, 4],
-            "24": [6, 4],
-            "25": [7, 4],
-            "26": [7, 4],
-            "27": [7, 4],
-            "28": [7, 4],
-            "29": [8, 4],
-            "30": [8, 4],
-            "31": [8, 4],
-            "32": [8, 4],
-            "33": [9, 4],
-            "34": [9, 4],
-            "35": [9, 4],
-            "36": [9, 4],
-            "37": [10, 4],
-            "38": [10, 4],
-            "39": [10, 4],
-            "40": [10, 4],
-            "41": [11, 4],
-            "42": [11, 4],
-            "43": [11, 4],
-            "44": [11, 4],
-            "45": [11, 4],
-            "46": [12, 4],
-            "47": [12, 4],
-            "48": [12, 4],
-            "49": [13, 4],
-            "50": [13, 4],
-            "51": [13, 4],
-            "52": [13, 4],
-            "53": [14, 4],
-            "54": [14, 4],
-            "55": [14, 4],
-            "56": [14, 4],
-            "57": [15, 4],
-            "58": [15, 4],
-            "59": [15, 4],
-            "60": [15, 4],
-            "61": [16, 4],
-            "62": [16, 4],
-            "63": [16, 4],
-            "64": [16, 4],
-        }
-
-        # Use your original layout logic
-        beat_count_str = str(beat_count)
-        if beat_count_str in default_layouts:
-            rows, columns = default_layouts[beat_count_str]
-            return {"rows": rows, "columns": columns}
-
-        # For beat counts beyond 64, use your pattern (maintain 4 columns, increase rows)
-        if beat_count > 64:
-            columns = 4
-            rows = math.ceil(beat_count / columns)
-            return {"rows": rows, "columns": columns}
-
-        # Fallback (should rarely be used with your comprehensive layout table)
-        return {"rows": 1, "columns": beat_count}
+        rows, columns = layout_for_beat_count(len(sequence.beats))
+        return {"rows": rows, "columns": columns}
 
     @handle_service_errors("get_optimal_grid_layout")
     @monitor_performance("grid_layout_optimization")
@@ -3,10 +3,16 @@ Enhanced Beat Resizer Service
 
 Implements sophisticated beat sizing logic with precise
 dimension calculations and intelligent responsive behavior.
+
+Resizes happen constantly while the window is dragged, so the widgets the
+sizing depends on (the beat frame's ancestors, the button panel and the
+graph editor) are looked up once and kept until the widget tree around the
+beat frame changes, and each resize applies its geometry in one batch.
 """
 
-from typing import Tuple, Optional, TYPE_CHECKING, Union
-from PyQt6.QtCore import Qt
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple, Optional, TYPE_CHECKING, Union
+from PyQt6.QtCore import QEvent, QObject, QSize, Qt
 from PyQt6.QtWidgets import QScrollArea, QWidget
 
 if TYPE_CHECKING:
@@ -21,12 +27,20 @@ if TYPE_CHECKING:
 BeatFrameType = Union["SequenceBeatFrame", "BeatFrame"]
 
 
+# Events that change which widgets surround the beat frame
+STRUCTURAL_EVENTS = (
+    QEvent.Type.ParentChange,
+    QEvent.Type.ChildAdded,
+    QEvent.Type.ChildRemoved,
+)
+
+
 def ensure_positive_size(size: int, min_value: int = 1) -> int:
     """Ensure a size value is positive to avoid Qt warnings"""
     return max(size, min_value)
 
 
-class BeatResizerService:
+class BeatResizerService(QObject):
     """
     Enhanced beat frame resizer with validated sizing algorithms.
 
@@ -34,12 +48,23 @@ class BeatResizerService:
     - Available container space    - Number of columns in current layout
     - Fixed height ratio for optimal display
     - Dynamic scroll bar management
+
+    Widget references are cached per beat frame. The service watches the
+    beat frame and its ancestors, and forgets the references when one of
+    them is reparented or gains or loses a child widget.
     """
 
     def __init__(self):
+        super().__init__()
         self._last_calculated_size = None
         self._size_cache = {}
 
+        # Widget references, valid until the next structural change
+        self._cached_frame: Optional[QWidget] = None
+        self._ancestors: List[QWidget] = []
+        self._named_children: Dict[str, Optional[QWidget]] = {}
+        self._named_children_root: Optional[QWidget] = None
+
     def resize_beat_frame(
         self, beat_frame: BeatFrameType, num_rows: int, num_columns: int
     ) -> int:
@@ -56,10 +81,26 @@ class BeatResizerService:
         """
         width, height = self.calculate_dimensions(beat_frame)
         beat_size = self.calculate_beat_size(width, height, num_columns)
-        self.resize_beats(beat_frame, beat_size)
-        self.configure_scroll_behavior(beat_frame, num_rows)
+        with self.batch_geometry(beat_frame):
+            self.resize_beats(beat_frame, beat_size)
+            self.configure_scroll_behavior(beat_frame, num_rows)
         return beat_size
 
+    @contextmanager
+    def batch_geometry(self, beat_frame: BeatFrameType) -> Iterator[None]:
+        """
+        Hold back repaints of the beat frame while its geometry changes, so
+        it is laid out and painted once when the outermost batch ends.
+        """
+        if not beat_frame.updatesEnabled():
+            yield
+            return
+        beat_frame.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            beat_frame.setUpdatesEnabled(True)
+
     def calculate_dimensions(self, beat_frame: BeatFrameType) -> Tuple[int, int]:
         """
         Calculate available container dimensions using validated logic.
@@ -141,16 +182,21 @@ class BeatResizerService:
         # Resize all beat views
         beat_views = getattr(beat_frame, "_beat_views", [])
         for beat_view in beat_views:
-            beat_view.setFixedSize(safe_size, safe_size)
-            if hasattr(beat_view, "setMinimumSize"):
-                beat_view.setMinimumSize(min_size, min_size)
+            self._apply_beat_size(beat_view, safe_size, min_size)
 
         # Also resize start position view (consistent behavior)
         start_position_view = getattr(beat_frame, "_start_position_view", None)
         if start_position_view:
-            start_position_view.setFixedSize(safe_size, safe_size)
-            if hasattr(start_position_view, "setMinimumSize"):
-                start_position_view.setMinimumSize(min_size, min_size)
+            self._apply_beat_size(start_position_view, safe_size, min_size)
+
+    def _apply_beat_size(self, view: QWidget, size: int, min_size: int):
+        """Size a view, skipping views that already have these constraints."""
+        if view.maximumSize() == QSize(size, size) and view.minimumSize() == QSize(
+            min_size, min_size
+        ):
+            return
+        view.setFixedSize(size, size)
+        view.setMinimumSize(min_size, min_size)
 
     def configure_scroll_behavior(self, beat_frame: BeatFrameType, num_rows: int):
         """
@@ -163,35 +209,67 @@ class BeatResizerService:
         scroll_area = self._find_scroll_area_parent(beat_frame)
         if scroll_area:
             if num_rows > 4:
-                scroll_area.setVerticalScrollBarPolicy(
-                    Qt.ScrollBarPolicy.ScrollBarAlwaysOn
-                )
+                policy = Qt.ScrollBarPolicy.ScrollBarAlwaysOn
             else:
-                scroll_area.setVerticalScrollBarPolicy(
-                    Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-                )
+                policy = Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+            if scroll_area.verticalScrollBarPolicy() != policy:
+                scroll_area.setVerticalScrollBarPolicy(policy)
 
     def _find_main_widget(self, widget: QWidget) -> Optional[QWidget]:
         """Find the main widget by traversing up the parent hierarchy"""
-        parent = widget.parent()
-        while parent:
+        for parent in self._get_ancestors(widget):
             # Look for a widget that looks like a main widget
-            if (
-                isinstance(parent, QWidget) and parent.width() > 1000
-            ):  # Reasonable main window size
+            if parent.width() > 1000:  # Reasonable main window size
                 return parent
-            parent = parent.parent()
         return None
 
     def _find_scroll_area_parent(self, widget: QWidget) -> Optional[QScrollArea]:
         """Find QScrollArea parent widget"""
-        parent = widget.parent()
-        while parent:
+        for parent in self._get_ancestors(widget):
             if isinstance(parent, QScrollArea):
                 return parent
-            parent = parent.parent()
         return None
 
+    def _get_ancestors(self, widget: QWidget) -> List[QWidget]:
+        """The widget's ancestors, nearest first, cached until they change"""
+        if widget is not self._cached_frame:
+            self.invalidate_widget_cache()
+            ancestors = []
+            parent = widget.parent()
+            while parent:
+                if isinstance(parent, QWidget):
+                    ancestors.append(parent)
+                parent = parent.parent()
+
+            for watched in [widget, *ancestors]:
+                watched.installEventFilter(self)
+            self._cached_frame = widget
+            self._ancestors = ancestors
+        return self._ancestors
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() in STRUCTURAL_EVENTS:
+            is_child_event = event.type() != QEvent.Type.ParentChange
+            # The beat frame adds and removes its own beat views freely
+            if not is_child_event or (
+                watched is not self._cached_frame and event.child().isWidgetType()
+            ):
+                self.invalidate_widget_cache()
+        return False
+
+    def invalidate_widget_cache(self):
+        """Forget the cached widget references and stop watching the tree"""
+        if self._cached_frame is not None:
+            for watched in [self._cached_frame, *self._ancestors]:
+                try:
+                    watched.removeEventFilter(self)
+                except RuntimeError:
+                    pass  # Already deleted
+        self._cached_frame = None
+        self._ancestors = []
+        self._clear_named_children()
+        self._named_children_root = None
+
     def _get_button_panel_width(self, main_widget: QWidget) -> int:
         """Get button panel width or reasonable estimate"""
         # Try to find button panel, otherwise use reasonable default
@@ -209,13 +287,31 @@ class BeatResizerService:
         return int(main_widget.height() * 0.3)  # Reasonable default (30% of height)
 
     def _find_child_by_name(self, widget: QWidget, name: str) -> Optional[QWidget]:
-        """Find child widget by object name"""
-        for child in widget.findChildren(QWidget):
-            if child.objectName() == name:
-                return child
-        return None
+        """Find child widget by object name, cached until the tree changes"""
+        if widget is not self._named_children_root:
+            self._clear_named_children()
+            self._named_children_root = widget
+        if name not in self._named_children:
+            child = widget.findChild(QWidget, name)
+            if child is not None:
+                child.destroyed.connect(self._on_named_child_destroyed)
+            self._named_children[name] = child
+        return self._named_children[name]
+
+    def _on_named_child_destroyed(self, *args):
+        self._named_children.clear()
+
+    def _clear_named_children(self):
+        for child in self._named_children.values():
+            if child is not None:
+                try:
+                    child.destroyed.disconnect(self._on_named_child_destroyed)
+                except (RuntimeError, TypeError):
+                    pass  # Already deleted
+        self._named_children.clear()
 
     def clear_cache(self):
-        """Clear size calculation cache"""
+        """Clear size calculation cache and cached widget references"""
         self._size_cache.clear()
         self._last_calculated_size = None
+        self.invalidate_widget_cache()
@@ -90,11 +90,11 @@ from domain.models.pictograph_models import (
 from .placement_key_service import PlacementKeyService
 from domain.models.letter_type_classifier import LetterTypeClassifier
 from .dash_location_service import DashLocationService
+from .special_placement_service import SpecialPlacementService
 
 # Event-driven architecture imports
 if TYPE_CHECKING:
     from core.events import IEventBus
-    from .special_placement_service import SpecialPlacementService
 
 try:
     from core.events import (
@@ -170,10 +170,9 @@ class ArrowManagementService(IArrowManagementService):
         self.placement_key_service = (
             PlacementKeyService()
         )  # Initialize dash location service
-        self.dash_location_service = (
-            DashLocationService()
-        )  # Cache special placement service to avoid reloading JSON files on every call
-        self._special_placement_service: Optional["SpecialPlacementService"] = None
+        self.dash_location_service = DashLocationService()
+        # Created eagerly so concurrent positioning calls never race to build it
+        self._special_placement_service = SpecialPlacementService()
 
         # CRITICAL FIX: Use correct coordinates from circle_coords.json
         # Hand point coordinates (for STATIC/DASH arrows) - inner grid positions where props are placed
@@ -588,15 +587,7 @@ class ArrowManagementService(IArrowManagementService):
         self, arrow_data: ArrowData, pictograph_data: PictographData
     ) -> Union[Any, None]:
         """Get special adjustment for specific letters and configurations."""
-        # CRITICAL FIX: Use cached service instance to avoid reloading JSON files on every call
-
         try:
-            # Use cached service instance to avoid expensive JSON reloading
-            if self._special_placement_service is None:
-                from .special_placement_service import SpecialPlacementService
-
-                self._special_placement_service = SpecialPlacementService()
-
             result = self._special_placement_service.get_special_adjustment(
                 arrow_data, pictograph_data
             )
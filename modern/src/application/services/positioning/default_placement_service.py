@@ -7,6 +7,7 @@ arrow positioning with comprehensive adjustment data.
 
 import json
 import codecs
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -32,17 +33,18 @@ except ImportError:
     QT_AVAILABLE = False
 
 from domain.models.core_models import MotionData, MotionType
+from infrastructure.dataset_snapshot import DatasetSnapshotStore
 
 
 class DefaultPlacementService:
     """Service that loads default placement data and provides adjustments."""
 
+    # Placement tables are read-only, so every instance shares one copy
+    _shared_defaults: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+    _shared_lock = threading.Lock()
+
     def __init__(self):
         self.root_path = Path(__file__).parent.parent.parent.parent.parent.parent
-        self.all_defaults: Dict[str, Dict[str, Dict[str, Any]]] = {
-            "diamond": {},
-            "box": {},
-        }
 
         self.placements_files = {
             "diamond": {
@@ -61,18 +63,39 @@ class DefaultPlacementService:
             },
         }
 
-        self._load_all_default_placements()
+        self.all_defaults = self._shared_default_placements()
+
+    def _shared_default_placements(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get the process-wide placement tables, loading them on first use."""
+        if DefaultPlacementService._shared_defaults is None:
+            with DefaultPlacementService._shared_lock:
+                if DefaultPlacementService._shared_defaults is None:
+                    DefaultPlacementService._shared_defaults = (
+                        self._load_all_default_placements()
+                    )
+        return DefaultPlacementService._shared_defaults
+
+    def _load_all_default_placements(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Load all default placement JSON files, preferring the dataset snapshot."""
+        all_defaults: Dict[str, Dict[str, Dict[str, Any]]] = {
+            "diamond": {},
+            "box": {},
+        }
+        try:
+            snapshot = DatasetSnapshotStore.shared().load_or_build()
+        except Exception as e:
+            print(f"⚠️ Dataset snapshot unavailable, reading placement files: {e}")
+            snapshot = None
 
-    def _load_all_default_placements(self) -> None:
-        """Load all default placement JSON files using direct path resolution."""
         for grid_mode, motion_files in self.placements_files.items():
             for motion_type, filename in motion_files.items():
-                filepath = (
-                    self.root_path / "data" / "arrow_placement" / grid_mode / filename
-                )
-                self.all_defaults[grid_mode][motion_type] = self._load_json(
-                    str(filepath)
-                )
+                relative_path = f"arrow_placement/{grid_mode}/{filename}"
+                data = snapshot.json_blob(relative_path) if snapshot else None
+                if data is None:
+                    filepath = self.root_path / "data" / relative_path
+                    data = self._load_json(str(filepath))
+                all_defaults[grid_mode][motion_type] = data
+        return all_defaults
 
     def _load_json(self, path: str) -> Dict[str, Any]:
         """Load JSON file with error handling."""
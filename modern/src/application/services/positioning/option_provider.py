@@ -0,0 +1,147 @@
+"""
+Option Provider - Long-Lived Next-Option Lookups
+
+Serves the option picker's "what can follow this position" queries from one
+PositionMatchingService for the lifetime of the application, instead of
+building a new service (and re-indexing the whole dataset) per refresh.
+
+Options are cached per (grid_mode, end_pos). After options are shown, the
+end positions they lead to are prefetched on a background thread, so the
+refresh after the next click is a cache hit.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from domain.models.core_models import BeatData
+
+from .position_matching_service import PositionMatchingService
+
+
+class IOptionProvider(ABC):
+    """Interface for next-option lookups by end position."""
+
+    @abstractmethod
+    def warm_up(self) -> Future:
+        """Build the option index in the background."""
+        pass
+
+    @abstractmethod
+    def get_options(
+        self, end_pos: str, grid_mode: Optional[str] = None
+    ) -> List[BeatData]:
+        """Get the options that can follow a beat ending at end_pos."""
+        pass
+
+    @abstractmethod
+    def prefetch(self, end_positions: Iterable[str]) -> Future:
+        """Warm the cache for end_positions in the background."""
+        pass
+
+    @abstractmethod
+    def prefetch_following(self, options: Iterable[BeatData]) -> Future:
+        """Warm the cache for the end positions reachable from options."""
+        pass
+
+    @abstractmethod
+    def get_available_start_positions(self) -> List[str]:
+        """Get all start positions present in the dataset."""
+        pass
+
+
+class OptionProvider(IOptionProvider):
+    """
+    Cached, prefetching front end to PositionMatchingService.
+
+    The position service is created on first use (or by warm_up() on the
+    prefetch thread) and kept for the provider's lifetime. Cached option
+    tuples are shared, so every lookup returns a fresh list of the same
+    immutable BeatData instances.
+    """
+
+    def __init__(self, position_service: Optional[PositionMatchingService] = None):
+        self._position_service = position_service
+        self._service_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._cache: Dict[Tuple[Optional[str], str], Tuple[BeatData, ...]] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="option-prefetch"
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def position_service(self) -> PositionMatchingService:
+        """The long-lived position matching service, created on first use."""
+        if self._position_service is None:
+            with self._service_lock:
+                if self._position_service is None:
+                    self._position_service = PositionMatchingService()
+        return self._position_service
+
+    def warm_up(self) -> Future:
+        """Create the position service on the prefetch thread."""
+        return self._executor.submit(lambda: self.position_service)
+
+    def get_options(
+        self, end_pos: str, grid_mode: Optional[str] = None
+    ) -> List[BeatData]:
+        """Get the options that can follow a beat ending at end_pos."""
+        key = (grid_mode, end_pos)
+        with self._cache_lock:
+            options = self._cache.get(key)
+            if options is not None:
+                self.hits += 1
+                return list(options)
+            self.misses += 1
+
+        return list(self._load(key))
+
+    def prefetch(self, end_positions: Iterable[str]) -> Future:
+        """Warm the cache for end_positions in the background."""
+        keys: List[Tuple[Optional[str], str]] = [
+            (None, end_pos) for end_pos in dict.fromkeys(end_positions)
+        ]
+        return self._executor.submit(self._load_missing, keys)
+
+    def prefetch_following(self, options: Iterable[BeatData]) -> Future:
+        """Warm the cache for the end positions reachable from options."""
+        return self.prefetch(
+            option.metadata["end_pos"]
+            for option in options
+            if option.metadata and option.metadata.get("end_pos")
+        )
+
+    def get_available_start_positions(self) -> List[str]:
+        """Get all start positions present in the dataset."""
+        return self.position_service.get_available_start_positions()
+
+    def stats(self) -> Dict[str, int]:
+        """Cache hit/miss counters and the number of cached end positions."""
+        with self._cache_lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._cache)}
+
+    def clear(self) -> None:
+        """Drop the cached options; the position service is kept."""
+        with self._cache_lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def shutdown(self) -> None:
+        """Stop the prefetch thread, dropping pending prefetches."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _load_missing(self, keys: List[Tuple[Optional[str], str]]) -> None:
+        for key in keys:
+            with self._cache_lock:
+                if key in self._cache:
+                    continue
+            self._load(key)
+
+    def _load(self, key: Tuple[Optional[str], str]) -> Tuple[BeatData, ...]:
+        grid_mode, end_pos = key
+        options = tuple(self.position_service.get_next_options(end_pos, grid_mode))
+        with self._cache_lock:
+            return self._cache.setdefault(key, options)
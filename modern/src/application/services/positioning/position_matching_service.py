@@ -3,11 +3,16 @@ Position Matching Service - Data-Driven Motion Generation
 
 This service implements a data-driven position matching algorithm for motion generation.
 The algorithm is simple: find all pictographs where start_pos matches the target position.
+
+The matches are precomputed once at load into an immutable index keyed by
+(grid_mode, start_pos), so an option refresh is a dict lookup instead of a
+scan over the whole dataset.
 """
 
-import pandas as pd
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from ..core.pictograph_management_service import PictographManagementService
+from ..data.pictograph_dataset_engine import GRID_MODES, PictographDatasetEngine
 
 from domain.models.core_models import (
     BeatData,
@@ -26,30 +31,42 @@ class PositionMatchingService:
     `if item.get("start_pos") == target_position: next_opts.append(item)`
 
     No complex validation or rule-based generation - just simple dataset lookups.
+    The lookups are served from a start-position index built once at load.
     """
 
+    GRID_MODES = GRID_MODES
+
     def __init__(self):
         """Initialize position matching service with Modern's native dataset."""
         self.pictograph_management_service = PictographManagementService()
+        self.dataset_engine = PictographDatasetEngine()
 
         self.pictograph_dataset: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._options_index: Mapping[Tuple[str, str], Tuple[BeatData, ...]] = (
+            MappingProxyType({})
+        )
+        self._position_grid_modes: Mapping[str, str] = MappingProxyType({})
         self._load_dataset()
 
     def _load_dataset(self):
-        """Load dataset using Modern's native pictograph management service."""
+        """Load dataset from the shared columnar pictograph dataset engine."""
         try:
-            # Get the raw CSV dataset from Modern's service
-            raw_dataset = self.pictograph_management_service._load_csv_data()
+            self.pictograph_dataset = {}
+            for grid_mode in self.GRID_MODES:
+                records = self.dataset_engine.records(
+                    self.dataset_engine.query(grid_mode=grid_mode)
+                )
 
-            if raw_dataset is None or raw_dataset.empty:
-                print("❌ Dataset is empty")
-                self.pictograph_dataset = {}
-                return
+                if not records:
+                    print(f"❌ {grid_mode.title()} dataset is empty")
+                    continue
 
-            # Convert to grouped dictionary format: {letter: [pictograph_data_list]}
-            self.pictograph_dataset = self._convert_dataframe_to_grouped_dict(
-                raw_dataset
-            )
+                # Convert to grouped dictionary format: {letter: [pictograph_data_list]}
+                grouped = self._convert_records_to_grouped_dict(records)
+                for letter, group in grouped.items():
+                    self.pictograph_dataset.setdefault(letter, []).extend(group)
+
+            self._build_options_index()
 
             # Log statistics
             total_pictographs = sum(
@@ -58,32 +75,68 @@ class PositionMatchingService:
             print(f"📊 Position matching service initialized:")
             print(f"   - {total_pictographs} pictographs")
             print(f"   - {len(self.pictograph_dataset)} letters")
+            print(f"   - {len(self._options_index)} indexed start positions")
 
         except Exception as e:
             print(f"❌ Failed to load dataset: {e}")
             self.pictograph_dataset = {}
+            self._options_index = MappingProxyType({})
+            self._position_grid_modes = MappingProxyType({})
+
+    def _build_options_index(self) -> None:
+        """
+        Precompute the next-option BeatData for every (grid_mode, start_pos).
 
-    def _convert_dataframe_to_grouped_dict(
-        self, df: pd.DataFrame
+        Each dataset item is converted to BeatData (with glyph data) exactly once.
+        BeatData is immutable, so the same instances are safely handed out on
+        every lookup.
+        """
+        index: Dict[Tuple[str, str], List[BeatData]] = {}
+        position_grid_modes: Dict[str, str] = {}
+
+        for group in self.pictograph_dataset.values():
+            for item in group:
+                start_pos = item["start_pos"]
+                grid_mode = item.get("grid_mode", "diamond")
+                try:
+                    beat_data = self._convert_dict_to_beat_data(item)
+                except Exception as e:
+                    print(f"❌ Failed to index {item.get('letter')} ({start_pos}): {e}")
+                    continue
+
+                index.setdefault((grid_mode, start_pos), []).append(beat_data)
+                position_grid_modes.setdefault(start_pos, grid_mode)
+
+        self._options_index = MappingProxyType(
+            {key: tuple(options) for key, options in index.items()}
+        )
+        self._position_grid_modes = MappingProxyType(position_grid_modes)
+
+    def _convert_records_to_grouped_dict(
+        self, records: List[Mapping[str, Any]]
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Convert pandas DataFrame to grouped dictionary format for position matching.
+        Convert dataset engine records to grouped dictionary format for position matching.
 
         Args:
-            df: Pandas DataFrame with pictograph data
+            records: Read-only row records from the pictograph dataset engine
 
         Returns:
             Dictionary in format: {letter: [pictograph_data_list]}
         """
         grouped_dict = {}
 
-        for _, row in df.iterrows():
+        for row in records:
+            if row.get("start_pos") is None:
+                # Never reachable from a start position lookup
+                continue
             letter = str(row.get("letter", "Unknown"))
 
             # Convert row to pictograph data format
             pictograph_data = {
                 "letter": letter,
-                "start_pos": str(row.get("start_pos", "unknown")),
+                "grid_mode": row.get("grid_mode", "diamond"),
+                "start_pos": str(row["start_pos"]),
                 "end_pos": str(row.get("end_pos", "unknown")),
                 "blue_attributes": {
                     "motion_type": str(row.get("blue_motion_type", "static")),
@@ -110,76 +163,32 @@ class PositionMatchingService:
 
         return grouped_dict
 
-    def get_next_options(self, last_beat_end_pos: str) -> List[BeatData]:
+    def get_next_options(
+        self, last_beat_end_pos: str, grid_mode: Optional[str] = None
+    ) -> List[BeatData]:
         """
         Validated algorithm: find all pictographs where start_pos matches.
 
-        This is the complete algorithm from the option_getter.py lines 120-131:
+        This is the algorithm from the option_getter.py lines 120-131:
         ```python
         for group in self.pictograph_dataset.values():
             for item in group:
                 if item.get("start_pos") == start:
                     next_opts.append(item)
         ```
+        served from the precomputed (grid_mode, start_pos) index.
 
         Args:
             last_beat_end_pos: The end position of the last beat
+            grid_mode: "diamond" or "box"; inferred from the position if omitted
 
         Returns:
             List of BeatData objects that can follow the given position
         """
-        print(f"\n🔍 POSITION MATCHING ANALYSIS")
-        print(f"🎯 Searching for options with start_pos = '{last_beat_end_pos}'")
-
-        if not self.pictograph_dataset:
-            print("❌ No dataset loaded")
-            return []
+        if grid_mode is None:
+            grid_mode = self._position_grid_modes.get(last_beat_end_pos, "diamond")
 
-        next_opts = []
-        dataset_groups_checked = 0
-        total_items_checked = 0
-        matches_found = 0
-
-        # Validated algorithm implementation
-        for group_key, group in self.pictograph_dataset.items():
-            dataset_groups_checked += 1
-            for item in group:
-                total_items_checked += 1
-                if item.get("start_pos") == last_beat_end_pos:  # ← THE ENTIRE ALGORITHM
-                    letter = item.get("letter", "Unknown")
-                    end_pos = item.get("end_pos", "N/A")
-                    matches_found += 1
-
-                    # Convert dictionary to BeatData object
-                    try:
-                        # Convert dictionary to BeatData using native Modern methods
-                        beat_data = self._convert_dict_to_beat_data(item)
-                        next_opts.append(beat_data)  # ← ADD TO VALID OPTIONS
-                        print(
-                            f"   ✅ Match {matches_found}: {letter} ({last_beat_end_pos} → {end_pos})"
-                        )
-                    except Exception as e:
-                        print(f"   ❌ Failed to convert match {matches_found}: {e}")
-                        continue
-
-        # Log analysis results
-        print(f"\n📊 POSITION MATCHING RESULTS:")
-        print(f"   - Dataset groups checked: {dataset_groups_checked}")
-        print(f"   - Total items checked: {total_items_checked}")
-        print(f"   - Matches found: {matches_found}")
-        print(
-            f"   - Success rate: {(matches_found/total_items_checked*100):.1f}%"
-            if total_items_checked > 0
-            else "   - Success rate: 0%"
-        )
-
-        if matches_found > 0:
-            letters = [opt.letter or "?" for opt in next_opts]
-            print(f"   - Letters found: {', '.join(letters)}")
-
-        print("=" * 60)
-
-        return next_opts
+        return list(self._options_index.get((grid_mode, last_beat_end_pos), ()))
 
     def _convert_dict_to_beat_data(self, item: Dict[str, Any]) -> BeatData:
         """Convert dictionary item to BeatData using actual motion data from the dictionary."""
@@ -210,7 +219,7 @@ class PositionMatchingService:
             turns=float(blue_attrs.get("turns", 0.0)),
             start_ori=blue_attrs.get("start_ori", "in"),
             end_ori=blue_attrs.get("end_ori", "in"),
-        )
+        ).interned()
 
         # Convert red motion
         red_motion = MotionData(
@@ -223,7 +232,7 @@ class PositionMatchingService:
             turns=float(red_attrs.get("turns", 0.0)),
             start_ori=red_attrs.get("start_ori", "in"),
             end_ori=red_attrs.get("end_ori", "in"),
-        )
+        ).interned()
 
         # Create initial BeatData object with position info in metadata
         beat_data = BeatData(
@@ -255,12 +264,7 @@ class PositionMatchingService:
 
     def _generate_glyph_data(self, beat_data: "BeatData") -> Optional["GlyphData"]:
         """Generate glyph data for beat data using the consolidated pictograph management service."""
-        from application.services.core.pictograph_management_service import (
-            PictographManagementService,
-        )
-
-        pictograph_service = PictographManagementService()
-        return pictograph_service._generate_glyph_data(beat_data)
+        return self.pictograph_management_service._generate_glyph_data(beat_data)
 
     def _parse_motion_type(self, motion_type_str: str) -> "MotionType":
         """Parse motion type string to MotionType enum."""
@@ -318,17 +322,7 @@ class PositionMatchingService:
         Returns:
             List of unique start position strings
         """
-        if not self.pictograph_dataset:
-            return []
-
-        start_positions = set()
-        for group in self.pictograph_dataset.values():
-            for item in group:
-                start_pos = item.get("start_pos")
-                if start_pos:
-                    start_positions.add(start_pos)
-
-        return sorted(list(start_positions))
+        return sorted(self._position_grid_modes.keys())
 
     def get_position_statistics(self, position: str) -> Dict[str, Any]:
         """
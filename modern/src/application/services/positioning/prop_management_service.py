@@ -15,6 +15,7 @@ from typing import Tuple, Dict, Any, Optional, List, TYPE_CHECKING
 from abc import ABC, abstractmethod
 from PyQt6.QtCore import QPointF
 import json
+import threading
 from pathlib import Path
 from enum import Enum
 import uuid
@@ -99,6 +100,10 @@ class PropManagementService(IPropManagementService):
     - Prop overlap detection and resolution
     """
 
+    # Special placements are read-only, so every instance shares one copy
+    _shared_special_placements: Optional[Dict[str, Any]] = None
+    _shared_lock = threading.Lock()
+
     def __init__(self, event_bus: Optional["IEventBus"] = None):
         # Event system integration
         self.event_bus = event_bus or (
@@ -124,8 +129,7 @@ class PropManagementService(IPropManagementService):
         self.UPRIGHT = "upright"
         self.DOWNLEFT = "downleft"
         self.DOWNRIGHT = "downright"  # Load special placements for beta prop swaps
-        self._special_placements: Optional[Dict[str, Any]] = None
-        self._load_special_placements()
+        self._special_placements = self._shared_placements()
 
     def _init_prop_offset_map(self) -> None:
         """Initialize prop offset mapping based on modern PropType enum."""
@@ -519,25 +523,34 @@ class PropManagementService(IPropManagementService):
 
         return beat_data
 
-    def _load_special_placements(self) -> None:
+    def _shared_placements(self) -> Dict[str, Any]:
+        """Get the process-wide special placements, loading them on first use."""
+        if PropManagementService._shared_special_placements is None:
+            with PropManagementService._shared_lock:
+                if PropManagementService._shared_special_placements is None:
+                    PropManagementService._shared_special_placements = (
+                        self._load_special_placements()
+                    )
+        return PropManagementService._shared_special_placements
+
+    def _load_special_placements(self) -> Dict[str, Any]:
         """Load special placement data from JSON configuration files."""
         try:
             # Look for special placements file in data directory
             placements_file = Path("data/special_placements.json")
             if placements_file.exists():
                 with open(placements_file, "r") as f:
-                    self._special_placements = json.load(f)
-            else:
-                # Try alternative path as fallback
-                alt_placements_file = Path("v1/src/resources/special_placements.json")
-                if alt_placements_file.exists():
-                    with open(alt_placements_file, "r") as f:
-                        self._special_placements = json.load(f)
-                else:
-                    self._special_placements = {}
+                    return json.load(f)
+
+            # Try alternative path as fallback
+            alt_placements_file = Path("v1/src/resources/special_placements.json")
+            if alt_placements_file.exists():
+                with open(alt_placements_file, "r") as f:
+                    return json.load(f)
+            return {}
         except Exception as e:
             print(f"Warning: Could not load special placements: {e}")
-            self._special_placements = {}
+            return {}
 
     def classify_props_by_size(self, beat_data: BeatData) -> Dict[str, list]:
         """
@@ -0,0 +1,75 @@
+"""
+Process-wide positioning services.
+
+Arrow and prop positioning only read placement tables after construction,
+so one instance of each service can serve every pictograph scene. The same
+holds for the option provider and the position index behind it. The
+instances live in the DI container; if the application has not registered
+them (tests, standalone widgets) they are created and registered on first
+use.
+"""
+
+import threading
+from typing import Callable, Type, TypeVar
+
+from core.dependency_injection.di_container import DIContainer, get_container
+
+from .arrow_management_service import (
+    ArrowManagementService,
+    IArrowManagementService,
+)
+from .option_provider import IOptionProvider, OptionProvider
+from .prop_management_service import (
+    IPropManagementService,
+    PropManagementService,
+)
+
+T = TypeVar("T")
+
+_registration_lock = threading.Lock()
+
+
+def register_positioning_services(container: DIContainer) -> None:
+    """Register the shared arrow, prop and option positioning services."""
+    with _registration_lock:
+        _register_if_missing(container, IArrowManagementService, ArrowManagementService)
+        _register_if_missing(container, IPropManagementService, PropManagementService)
+        _register_if_missing(container, IOptionProvider, OptionProvider)
+
+
+def get_arrow_management_service() -> IArrowManagementService:
+    """Get the shared arrow positioning service."""
+    return _resolve_shared(IArrowManagementService, ArrowManagementService)
+
+
+def get_prop_management_service() -> IPropManagementService:
+    """Get the shared prop positioning service."""
+    return _resolve_shared(IPropManagementService, PropManagementService)
+
+
+def get_option_provider() -> IOptionProvider:
+    """Get the shared next-option provider."""
+    return _resolve_shared(IOptionProvider, OptionProvider)
+
+
+def _resolve_shared(interface: Type[T], create: Callable[[], T]) -> T:
+    container = get_container()
+    with _registration_lock:
+        _register_if_missing(container, interface, create)
+        return container.resolve(interface)
+
+
+def _register_if_missing(
+    container: DIContainer, interface: Type[T], create: Callable[[], T]
+) -> None:
+    # Registered as instances: the services take an optional event bus that
+    # constructor injection cannot resolve from its forward reference
+    if not any(
+        interface in registry
+        for registry in (
+            container._singletons,
+            container._services,
+            container._factories,
+        )
+    ):
+        container.register_instance(interface, create())
@@ -19,12 +19,14 @@ PROVIDES:
 
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 from PyQt6.QtCore import QPointF
 
 from domain.models.core_models import MotionData, MotionType, Location
 from domain.models.pictograph_models import ArrowData, PictographData
+from infrastructure.dataset_snapshot import DatasetSnapshotStore
 
 
 class SpecialPlacementService:
@@ -38,9 +40,22 @@ class SpecialPlacementService:
     4. Applying motion-type-specific placement rules
     """
 
+    # Placement tables are read-only, so every instance shares one copy
+    _shared_placements: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+    _shared_lock = threading.Lock()
+
     def __init__(self):
-        self.special_placements: Dict[str, Dict[str, Dict[str, Any]]] = {}
-        self._load_special_placements()
+        self.special_placements = self._shared_special_placements()
+
+    def _shared_special_placements(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get the process-wide special placement tables, loading them on first use."""
+        if SpecialPlacementService._shared_placements is None:
+            with SpecialPlacementService._shared_lock:
+                if SpecialPlacementService._shared_placements is None:
+                    SpecialPlacementService._shared_placements = (
+                        self._load_special_placements()
+                    )
+        return SpecialPlacementService._shared_placements
 
     def get_special_adjustment(
         self, arrow_data: ArrowData, pictograph_data: PictographData
@@ -106,9 +121,12 @@ class SpecialPlacementService:
 
         return None
 
-    def _load_special_placements(self) -> None:
-        """Load special placement data from JSON configuration files."""
+    def _load_special_placements(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Load special placement data from the dataset snapshot's JSON files."""
+        special_placements: Dict[str, Dict[str, Dict[str, Any]]] = {}
         try:
+            snapshot = DatasetSnapshotStore.shared().load_or_build()
+
             # Define the supported modes and subfolders matching the data structure
             supported_modes = ["diamond", "box"]
             subfolders = [
@@ -119,33 +137,30 @@ class SpecialPlacementService:
             ]
 
             for mode in supported_modes:
-                self.special_placements[mode] = {}
+                special_placements[mode] = {}
 
                 for subfolder in subfolders:
-                    self.special_placements[mode][subfolder] = {}
-
-                    # Build path to special placement directory
-                    directory = (
-                        Path("data") / "arrow_placement" / mode / "special" / subfolder
-                    )
+                    special_placements[mode][subfolder] = {}
 
-                    if not directory.exists():
-                        continue
+                    # Placement files stored under this special placement directory
+                    prefix = f"arrow_placement/{mode}/special/{subfolder}/"
 
-                    # Load all placement JSON files in this directory
-                    for file_path in directory.glob("*_placements.json"):
+                    for name in snapshot.blob_names(prefix):
+                        if not name.endswith("_placements.json"):
+                            continue
                         try:
-                            with open(file_path, "r", encoding="utf-8") as f:
-                                data = json.load(f)
-                                self.special_placements[mode][subfolder].update(data)
+                            data = snapshot.json_blob(name)
+                            if data is not None:
+                                special_placements[mode][subfolder].update(data)
                         except Exception as e:
                             print(
-                                f"⚠️ Failed to load special placement file {file_path}: {e}"
+                                f"⚠️ Failed to load special placement file {name}: {e}"
                             )
 
         except Exception as e:
             print(f"⚠️ Failed to load special placements: {e}")
-            self.special_placements = {}
+            return {}
+        return special_placements
 
     def _generate_orientation_key(
         self, motion: MotionData, pictograph_data: PictographData
@@ -13,14 +13,16 @@ This service provides a clean, unified interface for all UI state operations
 while maintaining the proven algorithms from the individual services.
 """
 
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Iterator
 from enum import Enum
 from dataclasses import dataclass, field
+from contextlib import contextmanager
 import json
 from pathlib import Path
 
 from core.events.event_bus import get_event_bus, UIEvent, EventPriority
 from core.interfaces.core_services import IUIStateManagementService
+from infrastructure.settings_store import get_settings_store
 
 
 class UIComponent(Enum):
@@ -83,6 +85,11 @@ class UIStateManagementService(IUIStateManagementService):
     - Graph editor state management
     - Option picker state management
     - Event-driven state synchronization
+
+    State is kept in memory and persisted through a SettingsStore, which
+    writes the settings file in the background shortly after a change.
+    Changes made inside batch() are written once and published as a single
+    settings event.
     """
 
     def __init__(self):
@@ -93,6 +100,7 @@ class UIStateManagementService(IUIStateManagementService):
         # Navigate from: src/application/services/ui/ -> modern/
         modern_dir = Path(__file__).parent.parent.parent.parent.parent
         self._settings_file = modern_dir / "user_settings.json"
+        self._store = get_settings_store(self._settings_file)
 
         # Event bus for state synchronization
         self._event_bus = get_event_bus()
@@ -103,6 +111,10 @@ class UIStateManagementService(IUIStateManagementService):
         # Hotkey bindings
         self._hotkey_bindings: Dict[str, Callable] = {}
 
+        # Setting changes held back until the outermost batch() ends
+        self._batch_depth = 0
+        self._batched_setting_changes: Dict[str, Any] = {}
+
         # Load saved state
         self._load_state()
 
@@ -120,14 +132,28 @@ class UIStateManagementService(IUIStateManagementService):
         self._ui_state.user_settings[key] = value
         self._save_state()
 
-        # Publish setting change event
-        event = UIEvent(
-            component="settings",
-            action="updated",
-            state_data={"key": key, "value": value},
-            source="ui_state_management_service",
-        )
-        self._event_bus.publish(event)
+        if self._batch_depth:
+            self._batched_setting_changes[key] = value
+        else:
+            self._publish_setting_changes({key: value})
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group setting changes, such as those made while a splitter or slider
+        is dragged, into one write and one settings event, both made when
+        the outermost batch ends.
+        """
+        self._batch_depth += 1
+        try:
+            with self._store.batch():
+                yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batched_setting_changes:
+                changes = self._batched_setting_changes
+                self._batched_setting_changes = {}
+                self._publish_setting_changes(changes)
 
     def get_tab_state(self, tab_name: str) -> Dict[str, Any]:
         """Get state for a specific tab."""
@@ -204,8 +230,9 @@ class UIStateManagementService(IUIStateManagementService):
         self._save_state()
 
     def save_state(self) -> None:
-        """Save state to persistent storage."""
+        """Save state to persistent storage now."""
         self._save_state()
+        self._store.flush()
 
     def load_state(self) -> None:
         """Load state from persistent storage."""
@@ -359,13 +386,25 @@ class UIStateManagementService(IUIStateManagementService):
 
     # Private methods
 
+    def _publish_setting_changes(self, changes: Dict[str, Any]) -> None:
+        """Publish one settings event for changes, keyed by setting."""
+        state_data: Dict[str, Any] = {"changes": changes}
+        if len(changes) == 1:
+            key, value = next(iter(changes.items()))
+            state_data.update(key=key, value=value)
+        event = UIEvent(
+            component="settings",
+            action="updated",
+            state_data=state_data,
+            source="ui_state_management_service",
+        )
+        self._event_bus.publish(event)
+
     def _load_state(self) -> None:
-        """Load state from file."""
-        if self._settings_file.exists():
+        """Load state from the settings store."""
+        data = self._store.load()
+        if data:
             try:
-                with open(self._settings_file, "r") as f:
-                    data = json.load(f)
-
                 # Update UI state from loaded data
                 if "user_settings" in data:
                     self._ui_state.user_settings.update(data["user_settings"])
@@ -390,7 +429,7 @@ class UIStateManagementService(IUIStateManagementService):
                 print(f"Error loading UI state: {e}")
 
     def _save_state(self) -> None:
-        """Save state to file."""
+        """Hand state to the settings store, which writes it to file shortly."""
         try:
             data = {
                 "user_settings": self._ui_state.user_settings,
@@ -403,8 +442,7 @@ class UIStateManagementService(IUIStateManagementService):
                 "component_visibility": self._ui_state.component_visibility,
             }
 
-            with open(self._settings_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self._store.update(data)
 
         except Exception as e:
             print(f"Error saving UI state: {e}")
@@ -62,16 +62,9 @@ class AddBeatCommand(ICommand[Any]):  # Use Any for generic parameter
         if not self.can_execute():
             raise ValueError("Cannot add beat - invalid position")
 
-        # Create new sequence with beat added
-        new_beats = list(self.sequence.beats)
+        # Create new sequence with beat added (later beats renumber implicitly)
         new_beat = self.beat.update(beat_number=self.position + 1)
-        new_beats.insert(self.position, new_beat)
-
-        # Renumber subsequent beats
-        for i in range(self.position + 1, len(new_beats)):
-            new_beats[i] = new_beats[i].update(beat_number=i + 1)
-
-        self._result_sequence = self.sequence.update(beats=new_beats)
+        self._result_sequence = self.sequence.insert_beat(self.position + 1, new_beat)
 
         # Publish event for other services to respond
         self.event_bus.publish(
@@ -94,14 +87,8 @@ class AddBeatCommand(ICommand[Any]):  # Use Any for generic parameter
             raise ValueError("Cannot undo - no result sequence available")
 
         # Remove the beat that was added
-        new_beats = list(self._result_sequence.beats)
-        removed_beat = new_beats.pop(self.position)
-
-        # Renumber subsequent beats
-        for i in range(self.position, len(new_beats)):
-            new_beats[i] = new_beats[i].update(beat_number=i + 1)
-
-        original_sequence = self.sequence.update(beats=new_beats)
+        removed_beat = self._result_sequence.beats[self.position]
+        original_sequence = self._result_sequence.remove_beat(self.position + 1)
 
         # Publish event
         self.event_bus.publish(
@@ -157,15 +144,8 @@ class RemoveBeatCommand(ICommand[Any]):  # ICommand[SequenceData]
         # Store removed beat for undo
         self._removed_beat = self.sequence.beats[self.position]
 
-        # Create new sequence with beat removed
-        new_beats = list(self.sequence.beats)
-        new_beats.pop(self.position)
-
-        # Renumber subsequent beats
-        for i in range(self.position, len(new_beats)):
-            new_beats[i] = new_beats[i].update(beat_number=i + 1)
-
-        result_sequence = self.sequence.update(beats=new_beats)
+        # Create new sequence with beat removed (later beats renumber implicitly)
+        result_sequence = self.sequence.remove_beat(self.position + 1)
 
         # Publish event
         self.event_bus.publish(
@@ -187,16 +167,10 @@ class RemoveBeatCommand(ICommand[Any]):  # ICommand[SequenceData]
         if not self.can_undo():
             raise ValueError("Cannot undo - no removed beat stored")
 
-        # Re-insert the removed beat
-        new_beats = list(self.sequence.beats)
-        restored_beat = self._removed_beat.update(beat_number=self.position + 1)
-        new_beats.insert(self.position, restored_beat)
-
-        # Renumber subsequent beats
-        for i in range(self.position + 1, len(new_beats)):
-            new_beats[i] = new_beats[i].update(beat_number=i + 1)
-
-        original_sequence = self.sequence.update(beats=new_beats)
+        # The pre-removal sequence still holds the beat; it shares all of its
+        # structure with the edited one, so restoring it is free
+        restored_beat = self._removed_beat
+        original_sequence = self.sequence
 
         # Publish event
         self.event_bus.publish(
@@ -254,11 +228,7 @@ class UpdateBeatCommand(ICommand[Any]):  # ICommand[SequenceData]
             )
 
         # Find the beat to update
-        beat_to_update = None
-        for beat in self.sequence.beats:
-            if beat.beat_number == self.beat_number:
-                beat_to_update = beat
-                break
+        beat_to_update = self.sequence.get_beat(self.beat_number)
 
         if not beat_to_update:
             raise ValueError(f"Beat {self.beat_number} not found")
@@ -266,19 +236,9 @@ class UpdateBeatCommand(ICommand[Any]):  # ICommand[SequenceData]
         # Store old value for undo
         self._old_value = getattr(beat_to_update, self.field_name)
 
-        # Update the beat
-        update_dict = {self.field_name: self.new_value}
-        updated_beat = beat_to_update.update(**update_dict)
-
         # Create new sequence with updated beat
-        new_beats = []
-        for beat in self.sequence.beats:
-            if beat.beat_number == self.beat_number:
-                new_beats.append(updated_beat)
-            else:
-                new_beats.append(beat)
-
-        result_sequence = self.sequence.update(beats=new_beats)
+        update_dict = {self.field_name: self.new_value}
+        result_sequence = self.sequence.update_beat(self.beat_number, **update_dict)
 
         # Publish event
         self.event_bus.publish(
@@ -301,29 +261,12 @@ class UpdateBeatCommand(ICommand[Any]):  # ICommand[SequenceData]
         if not self.can_undo():
             raise ValueError("Cannot undo - no old value stored")
 
-        # Find the beat to restore
-        beat_to_restore = None
-        for beat in self.sequence.beats:
-            if beat.beat_number == self.beat_number:
-                beat_to_restore = beat
-                break
-
-        if not beat_to_restore:
+        if self.sequence.get_beat(self.beat_number) is None:
             raise ValueError(f"Beat {self.beat_number} not found")
 
-        # Restore old value
-        update_dict = {self.field_name: self._old_value}
-        restored_beat = beat_to_restore.update(**update_dict)
-
         # Create sequence with restored beat
-        new_beats = []
-        for beat in self.sequence.beats:
-            if beat.beat_number == self.beat_number:
-                new_beats.append(restored_beat)
-            else:
-                new_beats.append(beat)
-
-        original_sequence = self.sequence.update(beats=new_beats)
+        update_dict = {self.field_name: self._old_value}
+        original_sequence = self.sequence.update_beat(self.beat_number, **update_dict)
 
         # Publish event
         self.event_bus.publish(
@@ -343,7 +286,7 @@ class UpdateBeatCommand(ICommand[Any]):  # ICommand[SequenceData]
 
     def can_execute(self) -> bool:
         """Check if beat can be updated."""
-        return any(beat.beat_number == self.beat_number for beat in self.sequence.beats)
+        return self.sequence.get_beat(self.beat_number) is not None
 
     def can_undo(self) -> bool:
         """Check if command can be undone."""
@@ -7,9 +7,11 @@ Provides a type-safe, high-performance event system for Modern architecture:
 - Event filtering and priority handling
 - Comprehensive logging and debugging
 - Memory-efficient subscription management
+- Copy-on-write subscriber snapshots for lock-free dispatch
+- Optional coalescing of high-frequency events
 """
 
-from typing import Dict, List, Callable, Any, TypeVar, Generic, Optional, Union
+from typing import Dict, List, Callable, Any, TypeVar, Generic, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -24,6 +26,8 @@ import threading
 # Type definitions
 T = TypeVar("T")
 EventHandler = Union[Callable[[T], None], Callable[[T], asyncio.Future]]
+CoalesceKey = Callable[["BaseEvent"], Any]
+FlushScheduler = Callable[[Callable[[], Any]], None]
 
 
 class EventPriority(Enum):
@@ -165,81 +169,173 @@ class TypeSafeEventBus(IEventBus):
     - Weak reference management
     - Event filtering
     - Comprehensive logging
+    - Optional coalescing of high-frequency event types
+
+    Subscriptions are stored as immutable tuples, pre-sorted by priority and
+    replaced wholesale on subscribe/unsubscribe. Publishing reads the current
+    snapshot without taking the lock, and handlers never run under it, so a
+    slow handler cannot block publishers on other threads.
     """
 
-    def __init__(self, max_workers: int = 4):
-        self._subscriptions: Dict[str, List[EventSubscription]] = {}
+    def __init__(
+        self,
+        max_workers: int = 4,
+        flush_scheduler: Optional[FlushScheduler] = None,
+    ):
+        # Copy-on-write: both mappings are replaced, never mutated in place
+        self._subscriptions: Dict[str, Tuple[EventSubscription, ...]] = {}
+        self._coalesced_types: Dict[str, Optional[CoalesceKey]] = {}
         self._subscription_lookup: Dict[str, EventSubscription] = {}
         self._lock = threading.RLock()
+        self._stats_lock = threading.Lock()
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
         self._logger = logging.getLogger(__name__)
         self._event_stats: Dict[str, int] = {}
 
+        # Coalescing state, guarded by _lock
+        self._pending_events: Dict[Tuple[str, Any], BaseEvent] = {}
+        self._flush_scheduler = flush_scheduler
+        self._flush_scheduled = False
+
     def publish(self, event: BaseEvent) -> None:
-        """Publish an event to all subscribers synchronously."""
-        with self._lock:
-            subscriptions = self._subscriptions.get(event.event_type, [])
+        """
+        Publish an event to all subscribers synchronously.
+
+        Events of a coalesced type are held back until the next flush; only
+        the latest event per coalescing key is delivered.
+        """
+        event_type = event.event_type
+        if event_type in self._coalesced_types:
+            self._defer(event_type, event)
+            return
+        self._dispatch(event_type, event)
 
-            # Sort by priority
-            subscriptions.sort(key=lambda s: s.priority.value)
+    def _dispatch(self, event_type: str, event: BaseEvent) -> None:
+        """Deliver an event to the current subscriber snapshot."""
+        subscriptions = self._subscriptions.get(event_type, ())
+        self._record_event(event_type)
 
-            # Track event statistics
-            self._event_stats[event.event_type] = (
-                self._event_stats.get(event.event_type, 0) + 1
-            )
-
-            self._logger.debug(
-                f"Publishing event {event.event_type} to {len(subscriptions)} subscribers"
-            )
+        self._logger.debug(
+            "Publishing event %s to %d subscribers", event_type, len(subscriptions)
+        )
 
-            for subscription in subscriptions:
-                try:
-                    self._handle_subscription(subscription, event)
-                except Exception as e:
-                    self._logger.error(f"Error handling event {event.event_type}: {e}")
+        for subscription in subscriptions:
+            try:
+                self._handle_subscription(subscription, event)
+            except Exception as e:
+                self._logger.error(f"Error handling event {event_type}: {e}")
 
     async def publish_async(self, event: BaseEvent) -> None:
         """Publish an event to all subscribers asynchronously."""
+        event_type = event.event_type
+        subscriptions = self._subscriptions.get(event_type, ())
+        self._record_event(event_type)
+
+        self._logger.debug(
+            "Publishing async event %s to %d subscribers",
+            event_type,
+            len(subscriptions),
+        )
+
+        # Handle async subscriptions
+        async_tasks = []
+        for subscription in subscriptions:
+            try:
+                if subscription.is_async:
+                    task = self._handle_subscription_async(subscription, event)
+                    async_tasks.append(task)
+                else:
+                    # Run sync handlers in executor
+                    loop = asyncio.get_event_loop()
+                    task = loop.run_in_executor(
+                        self._executor,
+                        self._handle_subscription,
+                        subscription,
+                        event,
+                    )
+                    async_tasks.append(task)
+            except Exception as e:
+                self._logger.error(f"Error handling async event {event_type}: {e}")
+
+        # Wait for all handlers to complete
+        if async_tasks:
+            await asyncio.gather(*async_tasks, return_exceptions=True)
+
+    def _record_event(self, event_type: str) -> None:
+        """Track event statistics."""
+        with self._stats_lock:
+            self._event_stats[event_type] = self._event_stats.get(event_type, 0) + 1
+
+    # Coalescing
+
+    def enable_coalescing(
+        self, event_type: str, key: Optional[CoalesceKey] = None
+    ) -> None:
+        """
+        Coalesce published events of a type until the next flush.
+
+        Args:
+            event_type: Event type to coalesce, e.g. "arrow.positioned"
+            key: Maps an event to its coalescing key; events with equal keys
+                replace each other. Defaults to one pending event per type.
+        """
         with self._lock:
-            subscriptions = self._subscriptions.get(event.event_type, [])
+            self._coalesced_types = {**self._coalesced_types, event_type: key}
 
-            # Sort by priority
-            subscriptions.sort(key=lambda s: s.priority.value)
+    def disable_coalescing(self, event_type: str) -> None:
+        """Stop coalescing an event type, delivering anything still pending."""
+        with self._lock:
+            coalesced = dict(self._coalesced_types)
+            coalesced.pop(event_type, None)
+            self._coalesced_types = coalesced
+        self.flush_coalesced()
+
+    def set_flush_scheduler(self, flush_scheduler: Optional[FlushScheduler]) -> None:
+        """
+        Set the callable that schedules flush_coalesced after a burst starts.
+
+        A Qt front end can pass ``lambda flush: QTimer.singleShot(0, flush)`` so
+        coalesced events are delivered once per event-loop iteration. Without
+        a scheduler, pending events wait for an explicit flush_coalesced().
+        """
+        with self._lock:
+            self._flush_scheduler = flush_scheduler
 
-            # Track event statistics
-            self._event_stats[event.event_type] = (
-                self._event_stats.get(event.event_type, 0) + 1
-            )
+    def flush_coalesced(self) -> int:
+        """Deliver pending coalesced events in arrival order; return the count."""
+        with self._lock:
+            pending = self._pending_events
+            self._pending_events = {}
+            self._flush_scheduled = False
 
-            self._logger.debug(
-                f"Publishing async event {event.event_type} to {len(subscriptions)} subscribers"
-            )
+        for (event_type, _), event in pending.items():
+            self._dispatch(event_type, event)
+        return len(pending)
 
-            # Handle async subscriptions
-            async_tasks = []
-            for subscription in subscriptions:
-                try:
-                    if subscription.is_async:
-                        task = self._handle_subscription_async(subscription, event)
-                        async_tasks.append(task)
-                    else:
-                        # Run sync handlers in executor
-                        loop = asyncio.get_event_loop()
-                        task = loop.run_in_executor(
-                            self._executor,
-                            self._handle_subscription,
-                            subscription,
-                            event,
-                        )
-                        async_tasks.append(task)
-                except Exception as e:
-                    self._logger.error(
-                        f"Error handling async event {event.event_type}: {e}"
-                    )
+    def _defer(self, event_type: str, event: BaseEvent) -> None:
+        key = self._coalesced_types.get(event_type)
+        pending_key = (event_type, key(event) if key else None)
 
-            # Wait for all handlers to complete
-            if async_tasks:
-                await asyncio.gather(*async_tasks, return_exceptions=True)
+        with self._lock:
+            # Drop the superseded event so the key moves to the back of the queue
+            self._pending_events.pop(pending_key, None)
+            self._pending_events[pending_key] = event
+            scheduler = None
+            if not self._flush_scheduled and self._flush_scheduler:
+                self._flush_scheduled = True
+                scheduler = self._flush_scheduler
+
+        if scheduler:
+            scheduler(self.flush_coalesced)
+
+    # Subscriptions
+
+    @staticmethod
+    def _by_priority(
+        subscriptions: Tuple[EventSubscription, ...],
+    ) -> Tuple[EventSubscription, ...]:
+        # Stable sort keeps subscription order within a priority level
+        return tuple(sorted(subscriptions, key=lambda s: s.priority.value))
 
     def subscribe(
         self,
@@ -264,10 +360,11 @@ class TypeSafeEventBus(IEventBus):
         )
 
         with self._lock:
-            if event_type not in self._subscriptions:
-                self._subscriptions[event_type] = []
-
-            self._subscriptions[event_type].append(subscription)
+            current = self._subscriptions.get(event_type, ())
+            self._subscriptions = {
+                **self._subscriptions,
+                event_type: self._by_priority(current + (subscription,)),
+            }
             self._subscription_lookup[subscription_id] = subscription
 
         self._logger.debug(f"Subscribed to {event_type} with priority {priority.name}")
@@ -282,17 +379,19 @@ class TypeSafeEventBus(IEventBus):
             subscription = self._subscription_lookup[subscription_id]
             event_type = subscription.event_type
 
-            # Remove from subscriptions list
-            if event_type in self._subscriptions:
-                self._subscriptions[event_type] = [
-                    s
-                    for s in self._subscriptions[event_type]
-                    if s.subscription_id != subscription_id
-                ]
-
-                # Clean up empty event type lists
-                if not self._subscriptions[event_type]:
-                    del self._subscriptions[event_type]
+            # Publish a new snapshot without the subscription
+            subscriptions = dict(self._subscriptions)
+            remaining = tuple(
+                s
+                for s in subscriptions.get(event_type, ())
+                if s.subscription_id != subscription_id
+            )
+            if remaining:
+                subscriptions[event_type] = remaining
+            else:
+                # Clean up empty event types
+                subscriptions.pop(event_type, None)
+            self._subscriptions = subscriptions
 
             # Remove from lookup
             del self._subscription_lookup[subscription_id]
@@ -302,7 +401,7 @@ class TypeSafeEventBus(IEventBus):
 
     def get_event_stats(self) -> Dict[str, int]:
         """Get event publishing statistics."""
-        with self._lock:
+        with self._stats_lock:
             return self._event_stats.copy()
 
     def get_subscription_count(self, event_type: Optional[str] = None) -> int:
@@ -318,21 +417,17 @@ class TypeSafeEventBus(IEventBus):
         removed_count = 0
 
         with self._lock:
-            for event_type in list(self._subscriptions.keys()):
-                original_count = len(self._subscriptions[event_type])
-
+            subscriptions = {}
+            for event_type, current in self._subscriptions.items():
                 # Filter out dead weak references
-                self._subscriptions[event_type] = [
-                    s
-                    for s in self._subscriptions[event_type]
-                    if not self._is_dead_reference(s)
-                ]
+                alive = tuple(s for s in current if not self._is_dead_reference(s))
+                removed_count += len(current) - len(alive)
 
-                removed_count += original_count - len(self._subscriptions[event_type])
+                # Clean up empty event types
+                if alive:
+                    subscriptions[event_type] = alive
 
-                # Clean up empty lists
-                if not self._subscriptions[event_type]:
-                    del self._subscriptions[event_type]
+            self._subscriptions = subscriptions
 
             # Update lookup table
             self._subscription_lookup = {
@@ -350,19 +445,15 @@ class TypeSafeEventBus(IEventBus):
         self, subscription: EventSubscription, event: BaseEvent
     ) -> None:
         """Handle a single subscription synchronously."""
-        # Check if reference is dead
-        if self._is_dead_reference(subscription):
+        # Get actual handler (resolve weak reference; None if it is dead)
+        handler = self._resolve_handler(subscription)
+        if handler is None:
             return
 
         # Apply filter if present
         if subscription.filter_func and not subscription.filter_func(event):
             return
 
-        # Get actual handler (resolve weak reference if needed)
-        handler = self._resolve_handler(subscription)
-        if handler is None:
-            return
-
         # Call handler
         if subscription.is_async:
             # For async handlers in sync context, schedule them
@@ -417,8 +508,9 @@ class TypeSafeEventBus(IEventBus):
     def shutdown(self) -> None:
         """Shutdown the event bus and cleanup resources."""
         with self._lock:
-            self._subscriptions.clear()
+            self._subscriptions = {}
             self._subscription_lookup.clear()
+            self._pending_events = {}
             self._executor.shutdown(wait=True)
 
         self._logger.info("Event bus shutdown complete")
@@ -8,21 +8,72 @@ the TKA Desktop application.
 COMPONENTS:
 - PerformanceMonitor: Core monitoring class for metric collection
 - monitor_performance: Decorator for automatic performance tracking
+- SamplingPolicy: Which decorated calls are measured, and how memory is read
 - PerformanceReport: Reporting and analysis utilities
+
+Decorated calls are sampled according to the monitor's SamplingPolicy. Calls
+that are not sampled go straight to the wrapped function. Sampled calls are
+appended to a per-thread buffer without locking, and the buffers are folded
+into the shared statistics periodically and whenever statistics are read.
 """
 
+import itertools
+import os
 import time
+import tracemalloc
 import psutil
 import logging
 import threading
-from typing import Dict, Any, Optional, List, Callable
-from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Any, Optional, List, Callable, Tuple
+from dataclasses import dataclass, field, replace
 from functools import wraps
 from collections import deque
 
 logger = logging.getLogger(__name__)
 
 
+class SamplingMode(Enum):
+    """Which decorated calls are measured."""
+
+    OFF = "off"  # No call is measured
+    ALL = "all"  # Every call is measured
+    EVERY_NTH = "every_nth"  # One call in every_n per decorated function
+    INTERVAL = "interval"  # At most one call per interval_s per function
+
+
+class MemoryMode(Enum):
+    """How the memory delta of a sampled call is measured."""
+
+    NONE = "none"  # Not measured (reported as 0)
+    RSS = "rss"  # Process resident set size before and after
+    TRACEMALLOC = "tracemalloc"  # Python allocations still alive after the call
+
+
+@dataclass
+class SamplingPolicy:
+    """Sampling and aggregation settings for monitor_performance."""
+
+    mode: SamplingMode = SamplingMode.ALL
+    every_n: int = 100
+    interval_s: float = 1.0
+    memory_mode: MemoryMode = MemoryMode.RSS
+
+    # Per-thread buffers are flushed when full or older than flush_interval_s
+    buffer_size: int = 256
+    flush_interval_s: float = 1.0
+
+
+# (function name, positional count, keyword count, decorator context)
+CallInfo = Tuple[str, int, int, Optional[Dict[str, Any]]]
+
+# Enum member lookups are slow enough to matter on the unsampled path
+_MODE_OFF = SamplingMode.OFF
+_MODE_ALL = SamplingMode.ALL
+_MODE_EVERY_NTH = SamplingMode.EVERY_NTH
+_MODE_INTERVAL = SamplingMode.INTERVAL
+
+
 @dataclass
 class PerformanceMetric:
     """Individual performance metric data."""
@@ -82,9 +133,13 @@ class PerformanceMonitor:
         self.max_metrics = max_metrics
         self.metrics: deque = deque(maxlen=max_metrics)
         self.operation_stats: Dict[str, OperationStats] = {}
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
         self._enabled = True
 
+        self.sampling = SamplingPolicy()
+        self._local = threading.local()
+        self._buffers: List[_ThreadBuffer] = []
+
         # Performance thresholds (adjusted for memory delta measurements)
         self.warning_thresholds = {
             "duration_ms": 1000.0,  # 1 second
@@ -124,17 +179,116 @@ class PerformanceMonitor:
         )
 
         with self._lock:
-            self.metrics.append(metric)
-
-            # Update operation statistics
-            if operation not in self.operation_stats:
-                self.operation_stats[operation] = OperationStats(operation=operation)
-
-            self.operation_stats[operation].update(metric)
+            self._store_metric(metric)
 
         # Check thresholds and log warnings/errors
         self._check_thresholds(metric)
 
+    def configure_sampling(self, **settings: Any) -> SamplingPolicy:
+        """
+        Update the sampling policy.
+
+        Args:
+            **settings: SamplingPolicy fields, e.g. mode=SamplingMode.EVERY_NTH,
+                every_n=50, memory_mode=MemoryMode.TRACEMALLOC
+
+        Returns:
+            The new sampling policy
+        """
+        self.flush()
+        policy = replace(self.sampling, **settings)
+        if policy.every_n < 1:
+            raise ValueError("every_n must be at least 1")
+        self.sampling = policy
+        return policy
+
+    def record_sample(
+        self,
+        operation: str,
+        duration_ms: float,
+        memory_mb: float,
+        call_info: CallInfo,
+    ):
+        """
+        Buffer a sampled call on the current thread without locking.
+
+        The buffer is folded into the statistics once it holds
+        sampling.buffer_size samples or sampling.flush_interval_s has passed.
+        """
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._register_buffer()
+
+        now = time.time()
+        buffer.samples.append((operation, duration_ms, memory_mb, now, call_info))
+
+        policy = self.sampling
+        if (
+            len(buffer.samples) >= policy.buffer_size
+            or now - buffer.last_flush >= policy.flush_interval_s
+        ):
+            buffer.last_flush = now
+            self.flush()
+
+    def flush(self):
+        """Fold every thread's buffered samples into the statistics."""
+        flushed: List[PerformanceMetric] = []
+        with self._lock:
+            for buffer in self._buffers:
+                samples = buffer.samples
+                while samples:
+                    operation, duration_ms, memory_mb, timestamp, call_info = (
+                        samples.popleft()
+                    )
+                    metric = PerformanceMetric(
+                        operation=operation,
+                        duration_ms=duration_ms,
+                        memory_mb=memory_mb,
+                        timestamp=timestamp,
+                        context=self._build_context(call_info),
+                    )
+                    self._store_metric(metric)
+                    flushed.append(metric)
+
+            # Forget buffers of threads that have exited
+            self._buffers = [
+                b for b in self._buffers if b.samples or b.thread.is_alive()
+            ]
+
+        for metric in flushed:
+            self._check_thresholds(metric)
+
+    def _register_buffer(self) -> "_ThreadBuffer":
+        buffer = _ThreadBuffer()
+        self._local.buffer = buffer
+        with self._lock:
+            self._buffers.append(buffer)
+        return buffer
+
+    @staticmethod
+    def _build_context(call_info: CallInfo) -> Dict[str, Any]:
+        function_name, args_count, kwargs_count, context = call_info
+        runtime_context = {
+            "function": function_name,
+            "args_count": args_count,
+            "kwargs_count": kwargs_count,
+        }
+        if context:
+            runtime_context.update(context)
+        return runtime_context
+
+    def _store_metric(self, metric: PerformanceMetric):
+        """Add a metric to the history and statistics (caller holds the lock)."""
+        self.metrics.append(metric)
+
+        # Update operation statistics
+        if metric.operation not in self.operation_stats:
+            self.operation_stats[metric.operation] = OperationStats(
+                operation=metric.operation
+            )
+
+        self.operation_stats[metric.operation].update(metric)
+
     def _check_thresholds(self, metric: PerformanceMetric):
         """Check if metric exceeds warning or error thresholds."""
         # Check duration thresholds
@@ -163,22 +317,26 @@ class PerformanceMonitor:
 
     def get_operation_stats(self, operation: str) -> Optional[OperationStats]:
         """Get statistics for a specific operation."""
+        self.flush()
         with self._lock:
             return self.operation_stats.get(operation)
 
     def get_all_stats(self) -> Dict[str, OperationStats]:
         """Get statistics for all operations."""
+        self.flush()
         with self._lock:
             return dict(self.operation_stats)
 
     def get_slowest_operations(self, limit: int = 10) -> List[OperationStats]:
         """Get the slowest operations by average duration."""
+        self.flush()
         with self._lock:
             stats = list(self.operation_stats.values())
             return sorted(stats, key=lambda s: s.avg_duration_ms, reverse=True)[:limit]
 
     def get_memory_intensive_operations(self, limit: int = 10) -> List[OperationStats]:
         """Get the most memory-intensive operations."""
+        self.flush()
         with self._lock:
             stats = list(self.operation_stats.values())
             return sorted(stats, key=lambda s: s.avg_memory_mb, reverse=True)[:limit]
@@ -186,6 +344,8 @@ class PerformanceMonitor:
     def clear_metrics(self):
         """Clear all collected metrics and statistics."""
         with self._lock:
+            for buffer in self._buffers:
+                buffer.samples.clear()
             self.metrics.clear()
             self.operation_stats.clear()
 
@@ -195,6 +355,7 @@ class PerformanceMonitor:
 
     def generate_report(self) -> Dict[str, Any]:
         """Generate a comprehensive performance report."""
+        self.flush()
         with self._lock:
             total_operations = sum(
                 stats.count for stats in self.operation_stats.values()
@@ -206,6 +367,8 @@ class PerformanceMonitor:
                     "unique_operations": len(self.operation_stats),
                     "total_metrics": len(self.metrics),
                     "monitoring_enabled": self._enabled,
+                    "sampling_mode": self.sampling.mode.value,
+                    "memory_mode": self.sampling.memory_mode.value,
                 },
                 "slowest_operations": [
                     {
@@ -232,6 +395,89 @@ class PerformanceMonitor:
             }
 
 
+class _ThreadBuffer:
+    """Samples recorded by one thread and not yet folded into statistics."""
+
+    __slots__ = ("samples", "last_flush", "thread")
+
+    def __init__(self):
+        # deque append/popleft are atomic, so the owning thread appends
+        # without a lock while flush() drains from any thread
+        self.samples: deque = deque()
+        self.last_flush = time.time()
+        self.thread = threading.current_thread()
+
+
+class _CallSampler:
+    """Per-function sampling state for monitor_performance."""
+
+    __slots__ = ("_calls", "_next_sample_at")
+
+    def __init__(self):
+        self._calls = itertools.count()
+        self._next_sample_at = 0.0
+
+    def should_sample(self, policy: SamplingPolicy) -> bool:
+        mode = policy.mode
+        if mode is _MODE_ALL:
+            return True
+        if mode is _MODE_EVERY_NTH:
+            return next(self._calls) % policy.every_n == 0
+        if mode is _MODE_INTERVAL:
+            now = time.monotonic()
+            if now < self._next_sample_at:
+                return False
+            self._next_sample_at = now + policy.interval_s
+            return True
+        return False
+
+
+# Memory probes for sampled calls
+
+_process: Optional[psutil.Process] = None
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_owned = False  # Whether tracing was started here
+
+
+def _rss_mb() -> float:
+    """Resident set size of this process, reusing one Process handle."""
+    global _process
+    if _process is None or _process.pid != os.getpid():
+        _process = psutil.Process()
+    return _process.memory_info().rss / 1024 / 1024
+
+
+def _memory_start(memory_mode: MemoryMode) -> float:
+    if memory_mode is MemoryMode.RSS:
+        return _rss_mb()
+    if memory_mode is MemoryMode.TRACEMALLOC:
+        global _tracemalloc_users, _tracemalloc_owned
+        with _tracemalloc_lock:
+            # Trace only while at least one sampled call is running
+            if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _tracemalloc_owned = True
+            _tracemalloc_users += 1
+        return tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    return 0.0
+
+
+def _memory_delta(memory_mode: MemoryMode, start_memory: float) -> float:
+    if memory_mode is MemoryMode.RSS:
+        return abs(_rss_mb() - start_memory)
+    if memory_mode is MemoryMode.TRACEMALLOC:
+        global _tracemalloc_users, _tracemalloc_owned
+        end_memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+        with _tracemalloc_lock:
+            _tracemalloc_users -= 1
+            if _tracemalloc_users == 0 and _tracemalloc_owned:
+                tracemalloc.stop()
+                _tracemalloc_owned = False
+        return abs(end_memory - start_memory)
+    return 0.0
+
+
 # Global performance monitor instance
 performance_monitor = PerformanceMonitor()
 
@@ -242,6 +488,9 @@ def monitor_performance(
     """
     Decorator to monitor operation performance.
 
+    Only calls selected by performance_monitor.sampling are measured; the
+    rest call straight through to the wrapped function.
+
     Args:
         operation_name: Custom operation name (defaults to class.method)
         context: Additional context to include with metrics
@@ -256,8 +505,19 @@ def monitor_performance(
     """
 
     def decorator(func: Callable) -> Callable:
+        sampler = _CallSampler()
+
         @wraps(func)
         def wrapper(*args, **kwargs):
+            monitor = performance_monitor
+            policy = monitor.sampling
+            if (
+                policy.mode is _MODE_OFF
+                or not monitor._enabled
+                or not sampler.should_sample(policy)
+            ):
+                return func(*args, **kwargs)
+
             # Determine operation name
             if operation_name:
                 op_name = operation_name
@@ -267,37 +527,22 @@ def monitor_performance(
                 op_name = func.__name__
 
             # Start monitoring
+            memory_mode = policy.memory_mode
+            start_memory = _memory_start(memory_mode)
             start_time = time.perf_counter()
-            start_memory = psutil.Process().memory_info().rss / 1024 / 1024
 
             try:
-                result = func(*args, **kwargs)
-                return result
+                return func(*args, **kwargs)
             finally:
                 # Record metrics
-                end_time = time.perf_counter()
-                end_memory = psutil.Process().memory_info().rss / 1024 / 1024
-
-                duration_ms = (end_time - start_time) * 1000
-                memory_mb = abs(
-                    end_memory - start_memory
-                )  # Memory delta used by operation
-
-                # Merge provided context with runtime context
-                runtime_context = {
-                    "function": func.__name__,
-                    "args_count": len(args),
-                    "kwargs_count": len(kwargs) if kwargs else 0,
-                }
-
-                if context:
-                    runtime_context.update(context)
-
-                performance_monitor.record_metric(
-                    operation=op_name,
-                    duration_ms=duration_ms,
-                    memory_mb=memory_mb,
-                    context=runtime_context,
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                memory_mb = _memory_delta(memory_mode, start_memory)
+
+                monitor.record_sample(
+                    op_name,
+                    duration_ms,
+                    memory_mb,
+                    (func.__name__, len(args), len(kwargs), context),
                 )
 
         return wrapper
@@ -333,6 +578,17 @@ def set_performance_thresholds(
         performance_monitor.error_thresholds["memory_mb"] = error_memory_mb
 
 
+def configure_sampling(**settings: Any) -> SamplingPolicy:
+    """
+    Configure which decorated calls are measured.
+
+    Example:
+        configure_sampling(mode=SamplingMode.EVERY_NTH, every_n=100)
+        configure_sampling(mode=SamplingMode.OFF)
+    """
+    return performance_monitor.configure_sampling(**settings)
+
+
 def get_performance_report() -> Dict[str, Any]:
     """Get a comprehensive performance report."""
     return performance_monitor.generate_report()
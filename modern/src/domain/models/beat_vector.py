@@ -0,0 +1,275 @@
+"""
+Beat Vector - Persistent Beats Container
+
+Immutable, structurally shared storage for the beats of a SequenceData.
+
+Beats are kept in chunks of at most CHUNK_SIZE under a shallow balanced tree.
+Inserting, removing or replacing a beat copies only the affected chunk and
+the branch nodes above it (O(log n)); every other chunk is shared with the
+previous version, so undo snapshots of a sequence cost one path, not one list.
+
+Beat numbering is implicit: a beat's number is its position plus one, applied
+when the beat is read. Renumbering after an insert or removal is free.
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import accumulate
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Union,
+    overload,
+)
+
+if TYPE_CHECKING:
+    from .core_models import BeatData
+
+CHUNK_SIZE = 32
+MIN_CHUNK_SIZE = CHUNK_SIZE // 4
+
+
+class _Branch:
+    """Interior tree node: child nodes plus their cumulative end offsets."""
+
+    __slots__ = ("children", "offsets", "size")
+
+    def __init__(self, children: Tuple[Any, ...]):
+        self.children = children
+        self.offsets = tuple(accumulate(_node_size(child) for child in children))
+        self.size = self.offsets[-1] if self.offsets else 0
+
+    def locate(self, index: int, inserting: bool = False) -> Tuple[int, int]:
+        """Get (child slot, index within child) for a vector index."""
+        slot = bisect_right(self.offsets, index)
+        if inserting and slot == len(self.children):
+            slot -= 1  # Appending goes to the end of the last child
+        start = self.offsets[slot - 1] if slot else 0
+        return slot, index - start
+
+
+# A node is either a leaf tuple of beats or a _Branch
+Node = Union[Tuple["BeatData", ...], _Branch]
+
+
+def _node_size(node: Node) -> int:
+    return node.size if isinstance(node, _Branch) else len(node)
+
+
+def _entries(node: Node) -> Tuple[Any, ...]:
+    return node.children if isinstance(node, _Branch) else node
+
+
+def _like(node: Node, entries: Tuple[Any, ...]) -> Node:
+    return _Branch(entries) if isinstance(node, _Branch) else entries
+
+
+def _split(node: Node, entries: Tuple[Any, ...]) -> Tuple[Node, ...]:
+    """Wrap entries in one node of node's kind, or two if they overflow."""
+    if len(entries) <= CHUNK_SIZE:
+        return (_like(node, entries),)
+    half = len(entries) // 2
+    return (_like(node, entries[:half]), _like(node, entries[half:]))
+
+
+def _build(beats: Tuple["BeatData", ...]) -> Node:
+    """Bulk-load a balanced tree bottom-up."""
+    level: List[Node] = [
+        beats[i : i + CHUNK_SIZE] for i in range(0, len(beats), CHUNK_SIZE)
+    ]
+    if not level:
+        return ()
+    while len(level) > 1:
+        level = [
+            _Branch(tuple(level[i : i + CHUNK_SIZE]))
+            for i in range(0, len(level), CHUNK_SIZE)
+        ]
+    return level[0]
+
+
+def _get(node: Node, index: int) -> "BeatData":
+    while isinstance(node, _Branch):
+        slot, index = node.locate(index)
+        node = node.children[slot]
+    return node[index]
+
+
+def _set(node: Node, index: int, beat: "BeatData") -> Node:
+    if not isinstance(node, _Branch):
+        return node[:index] + (beat,) + node[index + 1 :]
+    slot, local = node.locate(index)
+    children = node.children
+    return _Branch(
+        children[:slot] + (_set(children[slot], local, beat),) + children[slot + 1 :]
+    )
+
+
+def _insert(node: Node, index: int, beat: "BeatData") -> Tuple[Node, ...]:
+    if not isinstance(node, _Branch):
+        return _split(node, node[:index] + (beat,) + node[index:])
+    slot, local = node.locate(index, inserting=True)
+    children = node.children
+    parts = _insert(children[slot], local, beat)
+    return _split(node, children[:slot] + parts + children[slot + 1 :])
+
+
+def _delete(node: Node, index: int) -> Node:
+    if not isinstance(node, _Branch):
+        return node[:index] + node[index + 1 :]
+    slot, local = node.locate(index)
+    children = node.children
+    child = _delete(children[slot], local)
+
+    if len(_entries(child)) >= MIN_CHUNK_SIZE or len(children) == 1:
+        return _Branch(children[:slot] + (child,) + children[slot + 1 :])
+
+    # Underfull child: merge with a neighbour, re-splitting if that overflows
+    if slot > 0:
+        left, right, first = children[slot - 1], child, slot - 1
+    else:
+        left, right, first = child, children[slot + 1], slot
+    merged = _split(left, _entries(left) + _entries(right))
+    return _Branch(children[:first] + merged + children[first + 2 :])
+
+
+def _iter_beats(node: Node) -> Iterator["BeatData"]:
+    if isinstance(node, _Branch):
+        for child in node.children:
+            yield from _iter_beats(child)
+    else:
+        yield from node
+
+
+class BeatVector(Sequence):
+    """
+    Immutable sequence of beats with O(log n) structural-sharing edits.
+
+    Reads behave like a list of BeatData whose beat_number matches their
+    position. Edits return a new vector:
+
+        beats = BeatVector([beat])
+        beats = beats.inserted(0, other_beat)  # beat is now beat 2
+    """
+
+    __slots__ = ("_root", "_renumbered")
+
+    def __init__(self, beats: Iterable["BeatData"] = ()):
+        if isinstance(beats, BeatVector):
+            root = beats._root
+        else:
+            root = _build(tuple(beats))
+        self._root: Node = root
+        self._renumbered: Dict[int, "BeatData"] = {}
+
+    @classmethod
+    def _from_root(cls, root: Node) -> "BeatVector":
+        vector = cls.__new__(cls)
+        vector._root = root
+        vector._renumbered = {}
+        return vector
+
+    # Reading
+
+    def __len__(self) -> int:
+        return _node_size(self._root)
+
+    @overload
+    def __getitem__(self, index: int) -> "BeatData": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List["BeatData"]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = self._normalize(index)
+        return self._numbered(index, _get(self._root, index))
+
+    def __iter__(self) -> Iterator["BeatData"]:
+        for index, beat in enumerate(_iter_beats(self._root)):
+            yield self._numbered(index, beat)
+
+    def _numbered(self, index: int, beat: "BeatData") -> "BeatData":
+        """Give a stored beat the number of its current position."""
+        if beat.beat_number == index + 1:
+            return beat
+        renumbered = self._renumbered.get(index)
+        if renumbered is None:
+            renumbered = beat.update(beat_number=index + 1)
+            self._renumbered[index] = renumbered
+        return renumbered
+
+    def _normalize(self, index: int) -> int:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("beat index out of range")
+        return index
+
+    # Persistent edits
+
+    def appended(self, beat: "BeatData") -> "BeatVector":
+        """Get a new vector with beat added at the end."""
+        return self.inserted(len(self), beat)
+
+    def inserted(self, index: int, beat: "BeatData") -> "BeatVector":
+        """Get a new vector with beat inserted before position index."""
+        if not 0 <= index <= len(self):
+            raise IndexError("beat index out of range")
+        beat = self._stored(index, beat)
+        parts = _insert(self._root, index, beat)
+        return self._from_root(parts[0] if len(parts) == 1 else _Branch(parts))
+
+    def removed(self, index: int) -> "BeatVector":
+        """Get a new vector without the beat at position index."""
+        root = _delete(self._root, self._normalize(index))
+        while isinstance(root, _Branch) and len(root.children) == 1:
+            root = root.children[0]
+        return self._from_root(root)
+
+    def replaced(self, index: int, beat: "BeatData") -> "BeatVector":
+        """Get a new vector with the beat at position index swapped for beat."""
+        index = self._normalize(index)
+        return self._from_root(_set(self._root, index, self._stored(index, beat)))
+
+    @staticmethod
+    def _stored(index: int, beat: "BeatData") -> "BeatData":
+        # Numbering new beats up front keeps them identical across versions
+        if beat.beat_number == index + 1:
+            return beat
+        return beat.update(beat_number=index + 1)
+
+    # List compatibility
+
+    def copy(self) -> List["BeatData"]:
+        """Get the beats as a new mutable list."""
+        return list(self)
+
+    def __add__(self, other: Iterable["BeatData"]) -> List["BeatData"]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: Iterable["BeatData"]) -> List["BeatData"]:
+        return list(other) + list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BeatVector) and other._root is self._root:
+            return True
+        if not isinstance(other, (BeatVector, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            mine == theirs for mine, theirs in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"BeatVector({list(self)!r})"
+
+    def __reduce__(self):
+        return (BeatVector, (list(self),))
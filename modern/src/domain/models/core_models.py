@@ -17,9 +17,12 @@ ELIMINATES:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from enum import Enum
 import uuid
+import weakref
+
+from .beat_vector import BeatVector
 
 
 class MotionType(Enum):
@@ -119,13 +122,16 @@ class GridPosition(Enum):
     GAMMA16 = "gamma16"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class MotionData:
     """
     REPLACES: Complex motion attribute dictionaries
 
     Immutable motion data for props and arrows.
     Matches legacy data structure exactly.
+
+    Instances are slotted and can be interned by value, so every beat that
+    uses the same motion shares a single flyweight instance.
     """
 
     motion_type: MotionType
@@ -150,6 +156,25 @@ class MotionData:
             "end_ori": self.end_ori,
         }
 
+    def interned(self) -> "MotionData":
+        """Get the shared instance equal to this motion."""
+        key = self._intern_key()
+        shared = _INTERNED_MOTIONS.get(key)
+        if shared is None:
+            shared = _INTERNED_MOTIONS.setdefault(key, self)
+        return shared
+
+    def _intern_key(self) -> Tuple[Any, ...]:
+        return (
+            self.motion_type,
+            self.prop_rot_dir,
+            self.start_loc,
+            self.end_loc,
+            self.turns,
+            self.start_ori,
+            self.end_ori,
+        )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MotionData":
         """Create from dictionary."""
@@ -161,7 +186,13 @@ class MotionData:
             turns=data.get("turns", 0.0),
             start_ori=data.get("start_ori", "in"),
             end_ori=data.get("end_ori", "in"),
-        )
+        ).interned()
+
+
+# Interned motions, keyed by field values; entries vanish with their last user
+_INTERNED_MOTIONS: "weakref.WeakValueDictionary[Tuple[Any, ...], MotionData]" = (
+    weakref.WeakValueDictionary()
+)
 
 
 class VTGMode(Enum):
@@ -275,17 +306,20 @@ class GlyphData:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BeatData:
     """
     REPLACES: Beat class with UI coupling
 
     Pure business data for a single beat in a sequence.
     No UI dependencies, completely immutable.
+
+    The id is generated on first access, so beats that are never identified
+    (option sheets, previews) skip the uuid work entirely.
     """
 
-    # Core identity
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # Core identity (generated lazily when omitted)
+    id: Optional[str] = None
     beat_number: int = 1
 
     # Business data
@@ -313,6 +347,27 @@ class BeatData:
             raise ValueError("Duration must be positive")
         if self.beat_number < 1:
             raise ValueError("Beat number must be positive")
+        if self.id is None:
+            # Leave the slot empty; __getattr__ fills it on first access
+            object.__delattr__(self, "id")
+
+    def __getattr__(self, name: str) -> str:
+        if name != "id":
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        beat_id = str(uuid.uuid4())
+        object.__setattr__(self, "id", beat_id)
+        return beat_id
+
+    @property
+    def has_id(self) -> bool:
+        """Whether the id has been assigned or generated yet."""
+        try:
+            object.__getattribute__(self, "id")
+        except AttributeError:
+            return False
+        return True
 
     def update(self, **kwargs) -> "BeatData":
         """Create a new BeatData with updated fields."""
@@ -362,7 +417,7 @@ class BeatData:
             glyph_data = GlyphData.from_dict(data["glyph_data"])
 
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
+            id=data.get("id"),
             beat_number=data.get("beat_number", 1),
             letter=data.get("letter"),
             duration=data.get("duration", 1.0),
@@ -388,6 +443,9 @@ class SequenceData:
 
     Pure business data for a complete kinetic sequence.
     No UI dependencies, completely immutable.
+
+    Beats are held in a BeatVector, so beat edits share unchanged structure
+    with the previous version and beat numbers follow from position.
     """
 
     # Core identity
@@ -396,7 +454,7 @@ class SequenceData:
     word: str = ""  # Generated word from sequence
 
     # Business data
-    beats: List[BeatData] = field(default_factory=list)
+    beats: Sequence[BeatData] = field(default_factory=BeatVector)
     start_position: Optional[str] = None  # Simplified for now
 
     # Metadata
@@ -404,6 +462,10 @@ class SequenceData:
 
     def __post_init__(self):
         """Validate sequence data."""
+        if isinstance(self.beats, BeatVector):
+            # Numbering is implicit in the vector
+            return
+
         # Validate beat numbers are sequential
         for i, beat in enumerate(self.beats):
             expected_beat_number = i + 1
@@ -411,6 +473,7 @@ class SequenceData:
                 raise ValueError(
                     f"Beat {i} has number {beat.beat_number}, expected {expected_beat_number}"
                 )
+        object.__setattr__(self, "beats", BeatVector(self.beats))
 
     @property
     def length(self) -> int:
@@ -436,45 +499,41 @@ class SequenceData:
 
     def get_beat(self, beat_number: int) -> Optional[BeatData]:
         """Get a beat by its number."""
-        for beat in self.beats:
-            if beat.beat_number == beat_number:
-                return beat
+        if 1 <= beat_number <= len(self.beats):
+            return self.beats[beat_number - 1]
         return None
 
     def add_beat(self, beat_data: BeatData) -> "SequenceData":
         """Create a new sequence with an additional beat."""
-        new_beat = beat_data.update(beat_number=len(self.beats) + 1)
-        new_beats = list(self.beats) + [new_beat]
+        from dataclasses import replace
+
+        return replace(self, beats=self.beats.appended(beat_data))
 
+    def insert_beat(self, beat_number: int, beat_data: BeatData) -> "SequenceData":
+        """Create a new sequence with a beat inserted as the given beat number."""
         from dataclasses import replace
 
-        return replace(self, beats=new_beats)
+        return replace(self, beats=self.beats.inserted(beat_number - 1, beat_data))
 
     def remove_beat(self, beat_number: int) -> "SequenceData":
         """Create a new sequence with a beat removed."""
-        new_beats = []
-        for beat in self.beats:
-            if beat.beat_number != beat_number:
-                # Renumber remaining beats
-                new_beat_number = len(new_beats) + 1
-                new_beats.append(beat.update(beat_number=new_beat_number))
-
         from dataclasses import replace
 
-        return replace(self, beats=new_beats)
+        if not 1 <= beat_number <= len(self.beats):
+            return replace(self)
+        # Remaining beats are renumbered implicitly
+        return replace(self, beats=self.beats.removed(beat_number - 1))
 
     def update_beat(self, beat_number: int, **kwargs) -> "SequenceData":
         """Create a new sequence with an updated beat."""
-        new_beats = []
-        for beat in self.beats:
-            if beat.beat_number == beat_number:
-                new_beats.append(beat.update(**kwargs))
-            else:
-                new_beats.append(beat)
-
         from dataclasses import replace
 
-        return replace(self, beats=new_beats)
+        beat = self.get_beat(beat_number)
+        if beat is None:
+            return replace(self)
+        return replace(
+            self, beats=self.beats.replaced(beat_number - 1, beat.update(**kwargs))
+        )
 
     def update(self, **kwargs) -> "SequenceData":
         """Create a new sequence with updated fields."""
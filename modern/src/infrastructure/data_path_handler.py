@@ -1,7 +1,9 @@
 import os
 from pathlib import Path
-from typing import Optional
-import pandas as pd
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class DataPathHandler:
@@ -41,20 +43,31 @@ class DataPathHandler:
         """Get the box pictograph CSV file path."""
         return self.data_dir / "BoxPictographDataframe.csv"
 
-    def load_diamond_dataset(self) -> Optional[pd.DataFrame]:
+    @property
+    def arrow_placement_dir(self) -> Path:
+        """Get the arrow placement JSON directory path."""
+        return self.data_dir / "arrow_placement"
+
+    def load_diamond_dataset(self) -> Optional["pd.DataFrame"]:
         """Load diamond pictograph dataset."""
+        import pandas as pd
+
         if self.diamond_csv_path.exists():
             return pd.read_csv(self.diamond_csv_path)
         return None
 
-    def load_box_dataset(self) -> Optional[pd.DataFrame]:
+    def load_box_dataset(self) -> Optional["pd.DataFrame"]:
         """Load box pictograph dataset."""
+        import pandas as pd
+
         if self.box_csv_path.exists():
             return pd.read_csv(self.box_csv_path)
         return None
 
-    def load_combined_dataset(self) -> pd.DataFrame:
+    def load_combined_dataset(self) -> "pd.DataFrame":
         """Load and combine both diamond and box datasets."""
+        import pandas as pd
+
         diamond_df = self.load_diamond_dataset()
         box_df = self.load_box_dataset()
 
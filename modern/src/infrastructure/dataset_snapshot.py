@@ -0,0 +1,409 @@
+"""
+Dataset Snapshot - Pre-built Binary Pictograph Dataset
+
+Compiles DiamondPictographDataframe.csv, BoxPictographDataframe.csv and the
+arrow_placement JSON trees into a single versioned binary file under
+infrastructure/cache/generated_data. The snapshot is keyed by a hash of every
+source file and is rebuilt automatically when any of them changes.
+
+Loading a snapshot memory-maps the file: code columns are zero-copy NumPy
+views and each placement JSON document is parsed only when first requested.
+pandas is only imported when a snapshot has to be (re)built.
+
+File layout:
+    8 bytes   magic (b"TKASNAP\\0")
+    4 bytes   format version (little-endian uint32)
+    4 bytes   header length (little-endian uint32)
+    n bytes   UTF-8 JSON header (columns, vocabularies, blobs, source hashes)
+    padding   to DATA_ALIGNMENT
+    data      column arrays and raw blob bytes, each DATA_ALIGNMENT aligned
+
+Build step:
+    python -m infrastructure.dataset_snapshot [--force]
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from domain.models.core_models import Location, MotionType, RotationDirection
+from infrastructure.data_path_handler import DataPathHandler
+
+SNAPSHOT_MAGIC = b"TKASNAP\0"
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_SUFFIX = ".tkasnap"
+DATA_ALIGNMENT = 64
+
+_PREAMBLE = struct.Struct("<8sII")
+
+GRID_MODES: Tuple[str, ...] = ("diamond", "box")
+
+MOTION_TYPE_CODES: Tuple[str, ...] = tuple(m.value for m in MotionType)
+ROTATION_CODES: Tuple[str, ...] = tuple(r.value for r in RotationDirection)
+LOCATION_CODES: Tuple[str, ...] = tuple(loc.value for loc in Location)
+
+# Columns encoded against a fixed, enum-derived code table
+ENUM_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "grid_mode": GRID_MODES,
+    "blue_motion_type": MOTION_TYPE_CODES,
+    "blue_prop_rot_dir": ROTATION_CODES,
+    "blue_start_loc": LOCATION_CODES,
+    "blue_end_loc": LOCATION_CODES,
+    "red_motion_type": MOTION_TYPE_CODES,
+    "red_prop_rot_dir": ROTATION_CODES,
+    "red_start_loc": LOCATION_CODES,
+    "red_end_loc": LOCATION_CODES,
+}
+
+# Columns encoded against a vocabulary discovered from the data
+VOCABULARY_COLUMNS: Tuple[str, ...] = (
+    "letter",
+    "start_pos",
+    "end_pos",
+    "timing",
+    "direction",
+)
+
+# Record column order, matching the CSV header plus the grid mode
+COLUMNS: Tuple[str, ...] = (
+    "letter",
+    "start_pos",
+    "end_pos",
+    "timing",
+    "direction",
+    "blue_motion_type",
+    "blue_prop_rot_dir",
+    "blue_start_loc",
+    "blue_end_loc",
+    "red_motion_type",
+    "red_prop_rot_dir",
+    "red_start_loc",
+    "red_end_loc",
+    "grid_mode",
+)
+
+
+def encode_pictograph_frame(
+    df,
+) -> Tuple[Dict[str, np.ndarray], Dict[str, Tuple[str, ...]]]:
+    """Vectorized encoding of a pictograph DataFrame into integer code columns."""
+    import pandas as pd
+
+    columns: Dict[str, np.ndarray] = {}
+    vocabularies: Dict[str, Tuple[str, ...]] = {}
+
+    for column, categories in ENUM_COLUMNS.items():
+        values = df[column].astype(str).str.lower()
+        codes = pd.Categorical(values, categories=list(categories)).codes
+        columns[column] = np.ascontiguousarray(codes, dtype=np.int8)
+        vocabularies[column] = categories
+
+    for column in VOCABULARY_COLUMNS:
+        codes, uniques = pd.factorize(df[column].astype(str))
+        columns[column] = np.ascontiguousarray(codes, dtype=np.int16)
+        vocabularies[column] = tuple(str(value) for value in uniques)
+
+    return columns, vocabularies
+
+
+class DatasetSnapshot:
+    """Read-only view over a snapshot buffer (memory map or bytes)."""
+
+    def __init__(self, buffer, path: Optional[Path] = None):
+        magic, version, header_length = _PREAMBLE.unpack_from(buffer, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a dataset snapshot")
+        if version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format version {version}")
+
+        header_start = _PREAMBLE.size
+        header = json.loads(
+            bytes(buffer[header_start : header_start + header_length]).decode("utf-8")
+        )
+
+        self.path = path
+        self._buffer = buffer
+        self._data_offset = _align(header_start + header_length)
+        self._blobs: Dict[str, Tuple[int, int]] = {
+            name: (spec["offset"], spec["length"])
+            for name, spec in header["blobs"].items()
+        }
+        self._json_cache: Dict[str, Any] = {}
+
+        self.source_hashes: Dict[str, str] = header["source_hashes"]
+        self.vocabularies: Dict[str, Tuple[str, ...]] = {
+            name: tuple(values) for name, values in header["vocabularies"].items()
+        }
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.frombuffer(
+                buffer,
+                dtype=np.dtype(spec["dtype"]),
+                count=spec["length"],
+                offset=self._data_offset + spec["offset"],
+            )
+            for name, spec in header["columns"].items()
+        }
+
+    @classmethod
+    def open(cls, path: Path) -> "DatasetSnapshot":
+        """Memory-map a snapshot file."""
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, path)
+
+    def blob_names(self, prefix: str = "") -> List[str]:
+        """List stored source files, optionally under a path prefix."""
+        return sorted(name for name in self._blobs if name.startswith(prefix))
+
+    def blob(self, name: str) -> Optional[bytes]:
+        """Get the raw bytes of a stored source file."""
+        if name not in self._blobs:
+            return None
+        offset, length = self._blobs[name]
+        start = self._data_offset + offset
+        return bytes(self._buffer[start : start + length])
+
+    def json_blob(self, name: str) -> Optional[Any]:
+        """Get a stored JSON source file, parsed on first access."""
+        if name not in self._json_cache:
+            raw = self.blob(name)
+            if raw is None:
+                return None
+            self._json_cache[name] = json.loads(raw.decode("utf-8"))
+        return self._json_cache[name]
+
+
+class DatasetSnapshotStore:
+    """
+    Builds, validates and loads dataset snapshots keyed by source-file hashes.
+
+    Usage:
+        snapshot = DatasetSnapshotStore.shared().load_or_build()
+        snapshot.columns["letter"], snapshot.json_blob("arrow_placement/...")
+    """
+
+    _shared: Optional["DatasetSnapshotStore"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        data_handler: Optional[DataPathHandler] = None,
+        cache_dir: Optional[Path] = None,
+    ):
+        self._data_handler = data_handler or DataPathHandler()
+        self.cache_dir = cache_dir or Path(__file__).parent / "cache" / "generated_data"
+        self._snapshot: Optional[DatasetSnapshot] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "DatasetSnapshotStore":
+        """Get the process-wide store for the default data directory."""
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+
+    # Sources
+
+    def source_files(self) -> Dict[str, Path]:
+        """Map snapshot blob names (relative to data/) to source paths."""
+        handler = self._data_handler
+        data_dir = handler.data_dir
+        sources = {
+            handler.diamond_csv_path.name: handler.diamond_csv_path,
+            handler.box_csv_path.name: handler.box_csv_path,
+        }
+        placement_dir = handler.arrow_placement_dir
+        if placement_dir.exists():
+            for path in sorted(placement_dir.rglob("*.json")):
+                sources[path.relative_to(data_dir).as_posix()] = path
+        return sources
+
+    def source_hashes(self) -> Dict[str, str]:
+        """Hash every existing source file."""
+        return {
+            name: hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+            for name, path in self.source_files().items()
+            if path.exists()
+        }
+
+    def snapshot_path(self, source_hashes: Mapping[str, str]) -> Path:
+        """Get the snapshot file path for a set of source hashes."""
+        key = hashlib.blake2b(digest_size=8)
+        for name in sorted(source_hashes):
+            key.update(f"{name}={source_hashes[name]}\n".encode("utf-8"))
+        return self.cache_dir / (
+            f"pictograph_dataset_v{SNAPSHOT_FORMAT_VERSION}_{key.hexdigest()}"
+            f"{SNAPSHOT_SUFFIX}"
+        )
+
+    # Loading
+
+    def load_or_build(self, force_rebuild: bool = False) -> DatasetSnapshot:
+        """Load the snapshot matching the current sources, building it if needed."""
+        with self._lock:
+            if self._snapshot is not None and not force_rebuild:
+                return self._snapshot
+
+            source_hashes = self.source_hashes()
+            path = self.snapshot_path(source_hashes)
+
+            snapshot = None if force_rebuild else self._try_open(path, source_hashes)
+            if snapshot is None:
+                snapshot = self._build(path, source_hashes)
+
+            self._snapshot = snapshot
+            return snapshot
+
+    def _try_open(
+        self, path: Path, source_hashes: Mapping[str, str]
+    ) -> Optional[DatasetSnapshot]:
+        if not path.exists():
+            return None
+        try:
+            snapshot = DatasetSnapshot.open(path)
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable dataset snapshot {path.name}: {e}")
+            return None
+        if snapshot.source_hashes != dict(source_hashes):
+            return None
+        return snapshot
+
+    # Building
+
+    def _build(
+        self, path: Path, source_hashes: Mapping[str, str]
+    ) -> DatasetSnapshot:
+        """Compile the sources and write them to path, falling back to memory."""
+        payload = self._compile(source_hashes)
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                dir=self.cache_dir, suffix=SNAPSHOT_SUFFIX + ".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.chmod(temp_name, 0o644)
+            os.replace(temp_name, path)
+            self._remove_stale_snapshots(keep=path)
+            return DatasetSnapshot.open(path)
+        except OSError as e:
+            print(f"⚠️ Could not write dataset snapshot, using in-memory copy: {e}")
+            return DatasetSnapshot(payload)
+
+    def _compile(self, source_hashes: Mapping[str, str]) -> bytes:
+        """Encode CSV columns and collect placement files into snapshot bytes."""
+        import pandas as pd
+
+        frames = []
+        loaders = {
+            "diamond": self._data_handler.load_diamond_dataset,
+            "box": self._data_handler.load_box_dataset,
+        }
+        for grid_mode in GRID_MODES:
+            df = loaders[grid_mode]()
+            if df is not None:
+                frames.append(df.assign(grid_mode=grid_mode))
+
+        if frames:
+            df = pd.concat(frames, ignore_index=True)
+        else:
+            df = pd.DataFrame(columns=list(COLUMNS))
+        columns, vocabularies = encode_pictograph_frame(df)
+
+        blobs = {
+            name: path.read_bytes()
+            for name, path in self.source_files().items()
+            if name.endswith(".json") and path.exists()
+        }
+
+        return _serialize(columns, vocabularies, blobs, source_hashes)
+
+    def _remove_stale_snapshots(self, keep: Path) -> None:
+        for path in self.cache_dir.glob(f"pictograph_dataset_v*{SNAPSHOT_SUFFIX}"):
+            if path != keep:
+                try:
+                    path.unlink()
+                except OSError:
+                    # Still memory-mapped by another process on some platforms
+                    pass
+
+
+def _align(offset: int) -> int:
+    return (offset + DATA_ALIGNMENT - 1) // DATA_ALIGNMENT * DATA_ALIGNMENT
+
+
+def _serialize(
+    columns: Mapping[str, np.ndarray],
+    vocabularies: Mapping[str, Tuple[str, ...]],
+    blobs: Mapping[str, bytes],
+    source_hashes: Mapping[str, str],
+) -> bytes:
+    """Lay out columns and blobs in an aligned data section behind a JSON header."""
+    chunks: List[bytes] = []
+    offset = 0
+
+    def append(data: bytes) -> Dict[str, int]:
+        nonlocal offset
+        padding = _align(offset) - offset
+        if padding:
+            chunks.append(b"\0" * padding)
+            offset += padding
+        spec = {"offset": offset, "length": len(data)}
+        chunks.append(data)
+        offset += len(data)
+        return spec
+
+    column_specs = {}
+    for name, array in columns.items():
+        array = np.ascontiguousarray(array)
+        spec = append(array.astype(array.dtype.newbyteorder("<")).tobytes())
+        column_specs[name] = {
+            "dtype": array.dtype.newbyteorder("<").str,
+            "offset": spec["offset"],
+            "length": len(array),
+        }
+
+    blob_specs = {name: append(data) for name, data in blobs.items()}
+
+    header = json.dumps(
+        {
+            "columns": column_specs,
+            "vocabularies": {
+                name: list(values) for name, values in vocabularies.items()
+            },
+            "blobs": blob_specs,
+            "source_hashes": dict(source_hashes),
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    preamble = _PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(header))
+    head = preamble + header
+    head += b"\0" * (_align(len(head)) - len(head))
+    return head + b"".join(chunks)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Build the pictograph dataset snapshot"
+    )
+    parser.add_argument("--force", action="store_true", help="rebuild even if current")
+    args = parser.parse_args()
+
+    snapshot = DatasetSnapshotStore().load_or_build(force_rebuild=args.force)
+    print(f"✅ Dataset snapshot ready: {snapshot.path}")
+    print(f"   - {len(snapshot.columns['letter'])} pictographs")
+    print(f"   - {len(snapshot.blob_names('arrow_placement/'))} placement files")
@@ -0,0 +1,34 @@
+"""
+File Modes - Permissions for files written through a temporary file
+
+tempfile.mkstemp always creates files as 0600, and os.replace keeps the
+temporary file's mode, so files saved atomically would otherwise become
+owner-only.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Union
+
+
+def _current_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode open() gives a new file
+NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def match_file_mode(temp_path: Union[str, Path], path: Union[str, Path]) -> None:
+    """
+    Give a temporary file the mode it should have once it replaces path:
+    the mode of the file at path, or that of a newly created file if there
+    is none.
+    """
+    try:
+        shutil.copymode(path, temp_path)
+    except FileNotFoundError:
+        os.chmod(temp_path, NEW_FILE_MODE)
@@ -0,0 +1,195 @@
+"""
+Settings Store - In-memory JSON settings with write-behind persistence
+
+Holds a JSON settings document in memory and writes it to disk on a timer
+thread, so a burst of changes, such as those from dragging a splitter or a
+slider, costs a single write instead of one full rewrite per change.
+"""
+
+import atexit
+import copy
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from infrastructure.file_modes import match_file_mode
+
+# Seconds between the first unsaved change and the write to disk. Changes
+# made in the meantime are written together.
+WRITE_DELAY = 0.5
+
+ChangeObserver = Callable[[Dict[str, Any]], None]
+
+
+class SettingsStore:
+    """
+    A JSON object of settings, read once and written to disk behind the UI.
+
+    Setting a key to a value it doesn't already have marks the store dirty
+    and schedules a write WRITE_DELAY seconds later on a timer thread. The
+    document is written to a temporary file that then replaces the settings
+    file, so a crash mid-write never leaves it truncated. Changes made
+    inside batch() are reported to observers once, when the batch ends.
+
+    Values are copied when they are set, so callers can keep changing their
+    own objects while a write is in progress.
+    """
+
+    def __init__(self, path: Union[str, Path], write_delay: float = WRITE_DELAY):
+        self.path = Path(path)
+        self.write_delay = write_delay
+        self._document: Dict[str, Any] = {}
+        self._loaded = False
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._batch_depth = 0
+        self._batch_changes: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._observers: List[ChangeObserver] = []
+        atexit.register(self.flush)
+
+    def load(self) -> Dict[str, Any]:
+        """A copy of the stored document; empty if the file is missing or invalid."""
+        with self._lock:
+            self._ensure_loaded()
+            return copy.deepcopy(self._document)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """A copy of the value stored under key."""
+        with self._lock:
+            self._ensure_loaded()
+            return copy.deepcopy(self._document.get(key, default))
+
+    def set(self, key: str, value: Any) -> bool:
+        """Store value under key; returns whether it changed anything."""
+        with self._lock:
+            self._ensure_loaded()
+            if key in self._document and self._document[key] == value:
+                return False
+            value = copy.deepcopy(value)
+            self._document[key] = value
+            self._dirty = True
+            if self._batch_depth:
+                self._batch_changes[key] = value
+                return True
+            self._schedule_flush()
+        self._notify_observers({key: value})
+        return True
+
+    def update(self, values: Dict[str, Any]) -> bool:
+        """Store several values as one change; returns whether any changed."""
+        with self.batch():
+            changed = [self.set(key, value) for key, value in values.items()]
+        return any(changed)
+
+    @contextmanager
+    def batch(self) -> Iterator["SettingsStore"]:
+        """
+        Group changes into one write and one observer notification, made
+        when the outermost batch ends.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                changes: Dict[str, Any] = {}
+                if self._batch_depth == 0:
+                    changes, self._batch_changes = self._batch_changes, {}
+                    if changes:
+                        self._schedule_flush()
+            if changes:
+                self._notify_observers(changes)
+
+    def flush(self) -> None:
+        """Write any unsaved changes to the file now."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return
+                # Values are replaced, never changed in place, once stored
+                document = dict(self._document)
+                self._dirty = False
+            try:
+                self._write(document)
+            except OSError:
+                with self._lock:
+                    self._dirty = True
+                raise
+
+    def register_observer(self, callback: ChangeObserver) -> None:
+        """
+        Call callback with the changed keys and their new values after
+        every change, or once per batch. The values are the store's own
+        and must not be modified.
+        """
+        if callback not in self._observers:
+            self._observers.append(callback)
+
+    def unregister_observer(self, callback: ChangeObserver) -> None:
+        """Remove an observer."""
+        if callback in self._observers:
+            self._observers.remove(callback)
+
+    def _notify_observers(self, changes: Dict[str, Any]) -> None:
+        for callback in list(self._observers):
+            callback(changes)
+
+    def _schedule_flush(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self.write_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self._document = self._read_file()
+            self._loaded = True
+
+    def _read_file(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+            return {}
+        return document if isinstance(document, dict) else {}
+
+    def _write(self, document: Dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            prefix=f".{self.path.name}.", dir=self.path.parent
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(document, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            match_file_mode(temp_path, self.path)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+_stores: Dict[str, SettingsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_settings_store(path: Union[str, Path]) -> SettingsStore:
+    """Get the process-wide store for the settings file at path."""
+    key = os.path.normcase(os.path.abspath(path))
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = SettingsStore(path)
+        return _stores[key]
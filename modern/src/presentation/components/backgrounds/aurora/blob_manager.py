@@ -1,7 +1,8 @@
-import random
 from PyQt6.QtGui import QPainter, QColor, QPainterPath
 from PyQt6.QtCore import Qt
 
+from ..particle_system import FRAME_INTERVAL, ParticleSystem
+
 
 class BlobManager:
     def __init__(self, num_blobs=3):
@@ -9,47 +10,43 @@ class BlobManager:
 
     def create_blobs(self, num_blobs):
         """Create initial blobs with random positions and properties."""
-        return [
-            {
-                "x": random.uniform(0.1, 0.9),
-                "y": random.uniform(0.1, 0.9),
-                "size": random.uniform(100, 200),
-                "opacity": random.uniform(0.2, 0.5),
-                "dx": random.uniform(-0.0005, 0.0005),
-                "dy": random.uniform(-0.0005, 0.0005),
-                "dsize": random.uniform(-0.1, 0.1),
-                "dopacity": random.uniform(-0.001, 0.001),
-            }
-            for _ in range(num_blobs)
-        ]
-
-    def animate(self):
+        blobs = ParticleSystem(num_blobs)
+        blobs.add_attribute("x", blobs.uniform(0.1, 0.9))
+        blobs.add_attribute("y", blobs.uniform(0.1, 0.9))
+        blobs.add_attribute("size", blobs.uniform(100, 200))
+        blobs.add_attribute("opacity", blobs.uniform(0.2, 0.5))
+        # Rates were tuned per frame
+        drift = 0.0005 / FRAME_INTERVAL
+        blobs.add_attribute("vx", blobs.uniform(-drift, drift))
+        blobs.add_attribute("vy", blobs.uniform(-drift, drift))
+        blobs.add_attribute("dsize", blobs.uniform(-0.1, 0.1))
+        blobs.add_attribute("dopacity", blobs.uniform(-0.001, 0.001))
+        return blobs
+
+    def animate(self, dt: float = FRAME_INTERVAL):
         """Animate blobs by updating their position, size, and opacity."""
-        for blob in self.blobs:
-            blob["x"] += blob["dx"]
-            blob["y"] += blob["dy"]
-            blob["size"] += blob["dsize"]
-            blob["opacity"] += blob["dopacity"]
-
-            # Keep within bounds and reverse direction if necessary
-            if blob["x"] < 0 or blob["x"] > 1:
-                blob["dx"] *= -1
-            if blob["y"] < 0 or blob["y"] > 1:
-                blob["dy"] *= -1
-            if blob["size"] < 50 or blob["size"] > 250:
-                blob["dsize"] *= -1
-            if blob["opacity"] < 0.1 or blob["opacity"] > 0.5:
-                blob["dopacity"] *= -1
+        blobs = self.blobs
+        frames = dt / FRAME_INTERVAL
+        blobs.step(dt)
+        blobs.size += blobs.dsize * frames
+        blobs.opacity += blobs.dopacity * frames
+
+        # Keep within bounds and reverse direction if necessary
+        ParticleSystem.reverse_outside(blobs.x, blobs.vx, 0, 1)
+        ParticleSystem.reverse_outside(blobs.y, blobs.vy, 0, 1)
+        ParticleSystem.reverse_outside(blobs.size, blobs.dsize, 50, 250)
+        ParticleSystem.reverse_outside(blobs.opacity, blobs.dopacity, 0.1, 0.5)
 
     def draw(self, widget, painter: QPainter):
         """Draw blobs on the widget using the painter."""
-        for blob in self.blobs:
+        blobs = self.blobs
+        for blob_x, blob_y, blob_size, opacity in zip(
+            (blobs.x * widget.width()).tolist(),
+            (blobs.y * widget.height()).tolist(),
+            blobs.size.tolist(),
+            blobs.opacity.tolist(),
+        ):
             blob_path = QPainterPath()
-            blob_x = blob["x"] * widget.width()
-            blob_y = blob["y"] * widget.height()
-            blob_size = blob["size"]
-            opacity = blob["opacity"]
-
             blob_path.addEllipse(blob_x, blob_y, blob_size, blob_size)
 
             painter.setOpacity(opacity)
@@ -1,7 +1,8 @@
-import random
 from PyQt6.QtGui import QPainter, QColor
 from PyQt6.QtCore import Qt
 
+from ..particle_system import FRAME_INTERVAL, ParticleSystem
+
 
 class SparkleManager:
     def __init__(self, num_sparkles=50):
@@ -9,32 +10,32 @@ class SparkleManager:
 
     def create_sparkles(self, num_sparkles):
         """Create initial sparkles with random positions and properties."""
-        return [
-            {
-                "x": random.uniform(0, 1),
-                "y": random.uniform(0, 1),
-                "size": random.uniform(2, 4),
-                "opacity": random.uniform(0.5, 1.0),
-                "pulse_speed": random.uniform(0.005, 0.015),
-            }
-            for _ in range(num_sparkles)
-        ]
+        sparkles = ParticleSystem(num_sparkles)
+        sparkles.add_attribute("x", sparkles.uniform(0, 1))
+        sparkles.add_attribute("y", sparkles.uniform(0, 1))
+        sparkles.add_attribute("size", sparkles.uniform(2, 4))
+        sparkles.add_attribute("opacity", sparkles.uniform(0.5, 1.0))
+        sparkles.add_attribute("pulse_speed", sparkles.uniform(0.005, 0.015))
+        return sparkles
 
-    def animate(self):
+    def animate(self, dt: float = FRAME_INTERVAL):
         """Animate sparkles by updating their opacity."""
-        for sparkle in self.sparkles:
-            sparkle["opacity"] += sparkle["pulse_speed"]
-            if sparkle["opacity"] > 1.0 or sparkle["opacity"] < 0.5:
-                sparkle["pulse_speed"] *= -1  # Reverse the pulse direction
+        sparkles = self.sparkles
+        sparkles.opacity += sparkles.pulse_speed * (dt / FRAME_INTERVAL)
+        # Reverse the pulse direction
+        ParticleSystem.reverse_outside(
+            sparkles.opacity, sparkles.pulse_speed, 0.5, 1.0
+        )
 
     def draw(self, widget, painter: QPainter):
         """Draw sparkles on the widget using the painter."""
-        for sparkle in self.sparkles:
-            x = int(sparkle["x"] * widget.width())
-            y = int(sparkle["y"] * widget.height())
-            size = int(sparkle["size"])
-            opacity = sparkle["opacity"]
-
+        sparkles = self.sparkles
+        for x, y, size, opacity in zip(
+            (sparkles.x * widget.width()).astype(int).tolist(),
+            (sparkles.y * widget.height()).astype(int).tolist(),
+            sparkles.size.astype(int).tolist(),
+            sparkles.opacity.tolist(),
+        ):
             painter.setOpacity(opacity)
             painter.setBrush(QColor(255, 255, 255, int(opacity * 255)))
             painter.setPen(Qt.PenStyle.NoPen)
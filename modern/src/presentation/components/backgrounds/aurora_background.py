@@ -5,9 +5,12 @@ import math
 from .aurora.blob_manager import BlobManager
 from .aurora.sparkle_manager import SparkleManager
 from .base_background import BaseBackground
+from .particle_system import FRAME_INTERVAL
 
 
 class AuroraBackground(BaseBackground):
+    sparkle_count = 50
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent or QWidget())
         self.gradient_shift = 0
@@ -15,17 +18,18 @@ class AuroraBackground(BaseBackground):
         self.wave_phase = 0  # Phase of sine wave for wavy gradient effect
 
         # Initialize the SparkleManager and BlobManager
-        self.sparkle_manager = SparkleManager()
+        self.sparkle_manager = SparkleManager(self.sparkle_count)
         self.blob_manager = BlobManager()
 
-    def animate_background(self) -> None:
-        self.gradient_shift += 0.01
-        self.color_shift = (self.color_shift + 2) % 360
-        self.wave_phase += 0.02  # Gradually move the wave phase
+    def animate_background(self, dt: float = FRAME_INTERVAL) -> None:
+        frames = dt / FRAME_INTERVAL
+        self.gradient_shift += 0.01 * frames
+        self.color_shift = (self.color_shift + 2 * frames) % 360
+        self.wave_phase += 0.02 * frames  # Gradually move the wave phase
 
         # Animate sparkles and blobs
-        self.sparkle_manager.animate()
-        self.blob_manager.animate()
+        self.sparkle_manager.animate(dt)
+        self.blob_manager.animate(dt)
 
         self.update_required.emit()
 
@@ -5,6 +5,7 @@ from PyQt6.QtGui import QLinearGradient, QColor, QPainter
 from PyQt6.QtWidgets import QWidget
 
 from .base_background import BaseBackground
+from .particle_system import FRAME_INTERVAL
 
 
 class AuroraBorealisBackground(BaseBackground):
@@ -30,12 +31,12 @@ class AuroraBorealisBackground(BaseBackground):
             (150, 255, 200, 20),  # Light green
         ]
 
-    def animate_background(self):
+    def animate_background(self, dt: float = FRAME_INTERVAL):
         """Update light wave positions for smooth animation."""
         # Advance each wave at slightly different speeds for natural variation
         for i in range(len(self.light_waves)):
             wave_speed = 0.008 + (i * 0.002)  # Varying speeds
-            self.light_waves[i] += wave_speed
+            self.light_waves[i] += wave_speed * (dt / FRAME_INTERVAL)
 
             # Keep waves within reasonable bounds to prevent overflow
             if self.light_waves[i] > 4 * math.pi:
@@ -1,6 +1,7 @@
+import time
 from typing import Optional
-from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QPainter, QPixmap
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtGui import QCursor, QPainter, QPixmap, QWindow
 from PyQt6.QtCore import Qt, QTimer
 
 from src.presentation.components.backgrounds.starfield_background import (
@@ -15,6 +16,11 @@ from src.presentation.components.backgrounds.snowfall_background import (
 )
 from src.presentation.components.backgrounds.bubbles_background import BubblesBackground
 from src.presentation.components.backgrounds.base_background import BaseBackground
+from src.presentation.components.backgrounds.frame_pacer import FramePacer
+
+# Longest step a frame may advance the animation by, so that it doesn't jump
+# after the window was hidden or the app was busy
+MAX_FRAME_STEP = 0.25
 
 
 class MainBackgroundWidget(QWidget):
@@ -28,12 +34,16 @@ class MainBackgroundWidget(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
         self.setGeometry(main_widget.rect())
 
-        # Animation timer for calling animate_background()
+        # Animation timer for calling animate_background(), paced adaptively
+        self.frame_pacer = FramePacer()
         self.animation_timer = QTimer(self)
         self.animation_timer.timeout.connect(self._animate_background)
-        self.animation_timer.start(50)  # 20 FPS animation
+        self.animation_timer.start(FramePacer.ACTIVE_INTERVAL_MS)
 
         self._painting_active = False
+        self._last_frame_time = time.perf_counter()
+        self._frame_cost = 0.0
+        self._cursor_pos = QCursor.pos()
 
         self.apply_background()
 
@@ -56,8 +66,38 @@ class MainBackgroundWidget(QWidget):
 
     def _animate_background(self):
         """Called by animation timer to update background animation."""
-        if self.background:
-            self.background.animate_background()
+        now = time.perf_counter()
+        dt = min(now - self._last_frame_time, MAX_FRAME_STEP)
+        self._last_frame_time = now
+
+        cursor_pos = QCursor.pos()
+        if cursor_pos != self._cursor_pos:
+            self._cursor_pos = cursor_pos
+            self.frame_pacer.notify_input()
+
+        visible = self._is_on_screen()
+        if visible and self.background:
+            # The previous frame's cost, its paint having happened since
+            self.frame_pacer.record_frame(self._frame_cost)
+            start = time.perf_counter()
+            self.background.animate_background(dt)
+            self._frame_cost = time.perf_counter() - start
+
+        focused = (
+            QApplication.applicationState() == Qt.ApplicationState.ApplicationActive
+        )
+        interval = self.frame_pacer.interval_ms(visible, focused)
+        if self.animation_timer and interval != self.animation_timer.interval():
+            self.animation_timer.setInterval(interval)
+
+    def _is_on_screen(self) -> bool:
+        """Whether any of the background can currently be seen."""
+        if not self.isVisible():
+            return False
+        window = self.window().windowHandle()
+        return window is None or (
+            window.isExposed() and window.visibility() != QWindow.Visibility.Minimized
+        )
 
     def _get_background(self, bg_type: str) -> Optional[BaseBackground]:
         background_map = {
@@ -75,6 +115,7 @@ class MainBackgroundWidget(QWidget):
         if self._painting_active:
             return
         self._painting_active = True
+        start = time.perf_counter()
 
         try:
             painter = QPainter(self)
@@ -89,6 +130,7 @@ class MainBackgroundWidget(QWidget):
 
         finally:
             self._painting_active = False
+            self._frame_cost += time.perf_counter() - start
 
     def resizeEvent(self, event):
         """Handle widget resize."""
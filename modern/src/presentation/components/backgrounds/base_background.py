@@ -2,6 +2,8 @@ from PyQt6.QtCore import QObject, pyqtSignal
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 
+from .particle_system import FRAME_INTERVAL
+
 if TYPE_CHECKING:
     from PyQt6.QtGui import QPainter
     from PyQt6.QtWidgets import QWidget
@@ -16,8 +18,11 @@ class BaseBackground(QObject):
         self.color_shift = 0
 
     @abstractmethod
-    def animate_background(self):
-        """Override this method to implement background animation logic"""
+    def animate_background(self, dt: float = FRAME_INTERVAL):
+        """
+        Override this method to implement background animation logic,
+        advancing the animation by dt seconds
+        """
         self.update_required.emit()
 
     @abstractmethod
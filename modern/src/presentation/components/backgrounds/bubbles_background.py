@@ -13,9 +13,11 @@ from PyQt6.QtCore import Qt, QPointF
 
 from .base_background import BaseBackground
 from .asset_utils import get_image_path
+from .particle_system import FRAME_INTERVAL, ParticleSystem
 
 
 class BubblesBackground(BaseBackground):
+    bubble_count = 100
     # Class variable to hold cached images
     _cached_fish_images = None
 
@@ -47,17 +49,17 @@ class BubblesBackground(BaseBackground):
 
     def _initialize_bubbles(self):
         # Create bubbles floating upward with additional reflection properties
-        self.bubbles = [
-            {
-                "x": random.uniform(0, 1),
-                "y": random.uniform(0, 1),
-                "size": random.uniform(5, 15),
-                "speed": random.uniform(0.0005, 0.002),
-                "opacity": random.uniform(0.4, 0.8),
-                "highlight_factor": random.uniform(0.7, 1.0),  # Highlight brightness
-            }
-            for _ in range(100)
-        ]
+        bubbles = self.bubbles = ParticleSystem(self.bubble_count)
+        bubbles.add_attribute("x", bubbles.uniform(0, 1))
+        bubbles.add_attribute("y", bubbles.uniform(0, 1))
+        bubbles.add_attribute("size", bubbles.uniform(5, 15))
+        # Rise speeds were tuned per frame
+        bubbles.add_attribute(
+            "vy", bubbles.uniform(-0.002 / FRAME_INTERVAL, -0.0005 / FRAME_INTERVAL)
+        )
+        bubbles.add_attribute("opacity", bubbles.uniform(0.4, 0.8))
+        # Highlight brightness
+        bubbles.add_attribute("highlight_factor", bubbles.uniform(0.7, 1.0))
 
     def _initialize_fish(self):
         # Initialize fish that occasionally swim across the screen
@@ -65,15 +67,17 @@ class BubblesBackground(BaseBackground):
         self.fish_timer = 0  # Time between fish appearances
         self.spawn_fish_interval = random.randint(50, 100)  # More frequent fish spawn
 
-    def animate_background(self):
+    def animate_background(self, dt: float = FRAME_INTERVAL):
         # Move the bubbles upwards
-        for bubble in self.bubbles:
-            bubble["y"] -= bubble["speed"]
-            if bubble["y"] < 0:
-                bubble["y"] = 1  # Reset bubble position to the bottom
-                bubble["x"] = random.uniform(0, 1)
-                bubble["size"] = random.uniform(5, 15)
-                bubble["highlight_factor"] = random.uniform(0.7, 1.0)  # Reset highlight
+        bubbles = self.bubbles
+        bubbles.step(dt)
+        bubbles.respawn(
+            bubbles.y < 0,
+            y=1,  # Reset bubble position to the bottom
+            x=bubbles.uniform(0, 1),
+            size=bubbles.uniform(5, 15),
+            highlight_factor=bubbles.uniform(0.7, 1.0),  # Reset highlight
+        )
 
         # Handle fish movement
         self.animate_fish()
@@ -141,14 +145,17 @@ class BubblesBackground(BaseBackground):
         painter.fillRect(widget.rect(), gradient)
 
         # Draw bubbles
-        for bubble in self.bubbles:
-            x = int(bubble["x"] * widget.width())
-            y = int(bubble["y"] * widget.height())
-            size = int(bubble["size"])
-
+        bubbles = self.bubbles
+        for x, y, size, opacity, highlight_factor in zip(
+            (bubbles.x * widget.width()).astype(int).tolist(),
+            (bubbles.y * widget.height()).astype(int).tolist(),
+            bubbles.size.astype(int).tolist(),
+            bubbles.opacity.tolist(),
+            bubbles.highlight_factor.tolist(),
+        ):
             # Set bubble opacity and fill
-            painter.setOpacity(bubble["opacity"])
-            painter.setBrush(QColor(255, 255, 255, int(bubble["opacity"] * 255)))
+            painter.setOpacity(opacity)
+            painter.setBrush(QColor(255, 255, 255, int(opacity * 255)))
             painter.setPen(Qt.PenStyle.NoPen)
 
             # Draw the main bubble
@@ -159,7 +166,7 @@ class BubblesBackground(BaseBackground):
                 painter,
                 QPointF(x + size / 4, y + size / 4),
                 size,
-                bubble["highlight_factor"],
+                highlight_factor,
             )
 
         # Draw fish if any are swimming
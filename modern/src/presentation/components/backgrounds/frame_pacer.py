@@ -0,0 +1,90 @@
+"""
+Adaptive frame pacing for the animated backgrounds.
+
+The backgrounds animate behind everything else for as long as the app is
+open, so they slow down whenever nobody is looking at them closely.
+"""
+
+import time
+from typing import Callable, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def on_battery() -> bool:
+    """Whether the machine is running on battery; False when unknown."""
+    if psutil is None:
+        return False
+    try:
+        battery = psutil.sensors_battery()
+    except (AttributeError, NotImplementedError, OSError, RuntimeError):
+        return False
+    return battery is not None and not battery.power_plugged
+
+
+class FramePacer:
+    """
+    Chooses how often a background animates.
+
+    Frames run every ACTIVE_INTERVAL_MS while the user is active. The pace
+    drops to IDLE_INTERVAL_MS after IDLE_AFTER seconds without input or
+    while another application has focus, and to BATTERY_INTERVAL_MS on
+    battery. While the window is hidden, minimized or occluded nothing is
+    animated, and it is only checked again every HIDDEN_INTERVAL_MS. On top
+    of that, the interval is stretched so that animating and painting a
+    frame stay within CPU_BUDGET of a core.
+    """
+
+    ACTIVE_INTERVAL_MS = 50
+    BATTERY_INTERVAL_MS = 100
+    IDLE_INTERVAL_MS = 200
+    HIDDEN_INTERVAL_MS = 1000
+    IDLE_AFTER = 30.0
+    CPU_BUDGET = 0.1
+    BATTERY_CHECK_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        battery_probe: Callable[[], bool] = on_battery,
+    ):
+        self.clock = clock
+        self.battery_probe = battery_probe
+        self.frame_cost = 0.0
+        self._last_input = clock()
+        self._on_battery = False
+        self._battery_checked: Optional[float] = None
+
+    def notify_input(self) -> None:
+        """Record user input, which resets the idle countdown."""
+        self._last_input = self.clock()
+
+    def record_frame(self, cost: float) -> None:
+        """Record the seconds one frame took to animate and paint."""
+        # Smoothed, so a single slow frame doesn't halve the frame rate
+        self.frame_cost += (cost - self.frame_cost) * 0.2
+
+    def on_battery(self) -> bool:
+        now = self.clock()
+        if (
+            self._battery_checked is None
+            or now - self._battery_checked >= self.BATTERY_CHECK_INTERVAL
+        ):
+            self._on_battery = self.battery_probe()
+            self._battery_checked = now
+        return self._on_battery
+
+    def interval_ms(self, visible: bool, focused: bool = True) -> int:
+        """The interval until the next frame, in milliseconds."""
+        if not visible:
+            return self.HIDDEN_INTERVAL_MS
+        if not focused or self.clock() - self._last_input >= self.IDLE_AFTER:
+            interval = self.IDLE_INTERVAL_MS
+        elif self.on_battery():
+            interval = self.BATTERY_INTERVAL_MS
+        else:
+            interval = self.ACTIVE_INTERVAL_MS
+        return max(interval, round(self.frame_cost / self.CPU_BUDGET * 1000))
@@ -0,0 +1,61 @@
+from ..particle_system import ParticleSystem
+
+# Fall speeds were tuned in pixels per step, stepped about 60 times a second
+STEPS_PER_SECOND = 60
+
+
+class SnowflakeField:
+    """Snowflakes falling down the widget, respawning above it once they land."""
+
+    def __init__(self, snowflake_count, width, height, image_count):
+        self.snowflake_count = snowflake_count
+        self.width = width
+        self.height = height
+        self.image_count = image_count
+        self.particles = ParticleSystem(snowflake_count)
+        self._initialize_snowflakes()
+
+    def _initialize_snowflakes(self):
+        """Initialize snowflake positions and properties."""
+        particles = self.particles
+        particles.add_attribute("x", particles.integers(0, self.width))
+        particles.add_attribute("y", particles.integers(-self.height, 0))
+        particles.add_attribute("size", particles.integers(2, 6))
+        particles.add_attribute("vy", self._fall_speeds())
+        particles.add_attribute(
+            "image_index", particles.integers(0, self.image_count - 1)
+        )
+
+    def _fall_speeds(self):
+        return self.particles.uniform(
+            0.5 * STEPS_PER_SECOND, 2.0 * STEPS_PER_SECOND
+        )
+
+    def update(self, dt: float) -> None:
+        """Move the snowflakes on by dt seconds and respawn the fallen ones."""
+        particles = self.particles
+        particles.step(dt)
+        particles.respawn(
+            particles.y > self.height,
+            y=particles.integers(-20, 0),
+            x=particles.integers(0, self.width),
+            size=particles.integers(2, 6),
+            vy=self._fall_speeds(),
+            image_index=particles.integers(0, self.image_count - 1),
+        )
+
+    def snowflakes(self):
+        """(x, y, size, image_index) of each snowflake, as Python numbers."""
+        particles = self.particles
+        return zip(
+            particles.x.astype(int).tolist(),
+            particles.y.astype(int).tolist(),
+            particles.size.astype(int).tolist(),
+            particles.image_index.tolist(),
+        )
+
+    def update_bounds(self, width, height):
+        """Update the bounds for snowflake generation."""
+        self.width = width
+        self.height = height
+        self._initialize_snowflakes()
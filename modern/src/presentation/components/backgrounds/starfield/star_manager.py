@@ -1,9 +1,12 @@
-import random
 import math
+
+import numpy as np
 from PyQt6.QtGui import QColor, QPainter, QPainterPath
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt
 
+from ..particle_system import FRAME_INTERVAL, ParticleSystem
+
 # A+ Enhancement: Import Qt resource pooling - Temporarily disabled
 # try:
 #     from core.qt_integration import qt_resources, pooled_pen, pooled_brush
@@ -15,6 +18,14 @@ from PyQt6.QtCore import Qt
 QT_RESOURCES_AVAILABLE = False
 
 
+STAR_COLORS = [
+    QColor(255, 255, 255),  # White stars
+    QColor(255, 255, 0),  # Yellow stars
+    QColor(255, 200, 200),  # Reddish stars
+    QColor(200, 200, 255),  # Bluish stars
+]
+
+
 class StarManager:
     """
     Manages stars with different shapes and twinkling behavior.
@@ -23,125 +34,106 @@ class StarManager:
     and spiky stars with realistic twinkling effects.
     """
 
-    def __init__(self):
+    def __init__(self, star_count: int = 150):
         # Create diverse star population
-        self.stars = [
-            {
-                "x": random.random(),
-                "y": random.random(),
-                "size": random.random() * 2 + 1,
-                "color": random.choice(
-                    [
-                        QColor(255, 255, 255),  # White stars
-                        QColor(255, 255, 0),  # Yellow stars
-                        QColor(255, 200, 200),  # Reddish stars
-                        QColor(200, 200, 255),  # Bluish stars
-                    ]
-                ),
-                "spikiness": random.choice(
-                    [0, 1, 2]
-                ),  # 0: round, 1: star shape, 2: spiky
-                "twinkle_speed": random.uniform(0.5, 2.0),
-                "twinkle_phase": random.uniform(0, 2 * math.pi),
-            }
-            for _ in range(150)  # More stars for richer sky
-        ]
+        self.stars = ParticleSystem(star_count)
+        self.stars.add_attribute("x", self.stars.uniform(0, 1))
+        self.stars.add_attribute("y", self.stars.uniform(0, 1))
+        self.stars.add_attribute("size", self.stars.uniform(1, 3))
+        self.stars.add_attribute(
+            "color_index", self.stars.integers(0, len(STAR_COLORS) - 1)
+        )
+        # 0: round, 1: star shape, 2: spiky
+        self.stars.add_attribute("spikiness", self.stars.integers(0, 2))
+        self.stars.add_attribute("twinkle_speed", self.stars.uniform(0.5, 2.0))
+        self.stars.add_attribute("twinkle_phase", self.stars.uniform(0, 2 * math.pi))
 
         # Initialize twinkle states
-        self.twinkle_state = [random.uniform(0.8, 1.0) for _ in range(len(self.stars))]
-
-    def animate_stars(self):
-        """Update star twinkling animation."""
-        for i, star in enumerate(self.stars):
-            # Smooth twinkling using sine waves
-            star["twinkle_phase"] += star["twinkle_speed"] * 0.1
-            twinkle_intensity = (math.sin(star["twinkle_phase"]) + 1) / 2
-            self.twinkle_state[i] = 0.6 + (twinkle_intensity * 0.4)  # Range: 0.6 to 1.0
+        self.stars.add_attribute("twinkle", self.stars.uniform(0.8, 1.0))
+        # Star outlines around (0, 0), keyed by (spikiness, size)
+        self._star_paths: dict[tuple[int, int], QPainterPath] = {}
+
+    def animate_stars(self, dt: float = FRAME_INTERVAL):
+        """Update star twinkling animation by dt seconds."""
+        stars = self.stars
+        # Smooth twinkling using sine waves
+        stars.twinkle_phase += stars.twinkle_speed * (0.1 * dt / FRAME_INTERVAL)
+        twinkle_intensity = (np.sin(stars.twinkle_phase) + 1) / 2
+        stars.twinkle[:] = 0.6 + twinkle_intensity * 0.4  # Range: 0.6 to 1.0
 
     def draw_stars(self, painter: QPainter, widget: QWidget):
         """Draw all stars with their current twinkle states."""
-        for i, star in enumerate(self.stars):
-            x = int(star["x"] * widget.width())
-            y = int(star["y"] * widget.height())
-
-            # Apply twinkling to size and opacity
-            twinkle = self.twinkle_state[i]
-            size = int(star["size"] * (1 + twinkle * 0.5))
-
+        stars = self.stars
+        # Apply twinkling to size and opacity
+        xs = (stars.x * widget.width()).astype(int).tolist()
+        ys = (stars.y * widget.height()).astype(int).tolist()
+        sizes = (stars.size * (1 + stars.twinkle * 0.5)).astype(int)
+
+        for x, y, size, twinkle, color_index, spikiness in zip(
+            xs,
+            ys,
+            sizes.tolist(),
+            stars.twinkle.tolist(),
+            stars.color_index.tolist(),
+            stars.spikiness.tolist(),
+        ):
             # Set color with twinkling opacity
-            color = QColor(star["color"])
+            color = QColor(STAR_COLORS[color_index])
             color.setAlphaF(twinkle)
 
-            # A+ Enhancement: Use resource pooling - Temporarily disabled
-            # if QT_RESOURCES_AVAILABLE:
-            #     with pooled_brush(color) as brush:
-            #         painter.setBrush(brush)
-            #         painter.setPen(Qt.PenStyle.NoPen)
-            # else:
             painter.setBrush(color)
             painter.setPen(Qt.PenStyle.NoPen)
 
             # Draw star based on its type
-            if star["spikiness"] == 0:  # Round stars
+            if spikiness == 0:  # Round stars
                 painter.drawEllipse(x - size // 2, y - size // 2, size, size)
-            elif star["spikiness"] == 1:  # Star-shaped stars
+            elif spikiness == 1:  # Star-shaped stars
                 self._draw_star_shape(painter, x, y, size, color)
             else:  # Spiky stars
                 self._draw_spiky_star(painter, x, y, size, color)
 
+    def _star_path(self, spikiness: int, size: int) -> QPainterPath:
+        path = self._star_paths.get((spikiness, size))
+        if path is None:
+            path = QPainterPath()
+            radius = size / 2
+            if spikiness == 1:
+                angle_step = math.pi / 3  # 6 points
+
+                # Create star rays
+                for i in range(6):
+                    angle = i * angle_step
+                    path.moveTo(0, 0)
+                    path.lineTo(radius * math.cos(angle), radius * math.sin(angle))
+            else:
+                small_radius = radius * 0.6
+                angle_step = math.pi / 6  # 12 points
+
+                # Create alternating long and short points
+                for i in range(12):
+                    angle = i * angle_step
+                    r = radius if i % 2 == 0 else small_radius
+                    x1 = r * math.cos(angle)
+                    y1 = r * math.sin(angle)
+                    if i == 0:
+                        path.moveTo(x1, y1)
+                    else:
+                        path.lineTo(x1, y1)
+                path.closeSubpath()
+            self._star_paths[(spikiness, size)] = path
+        return path
+
     def _draw_star_shape(
         self, painter: QPainter, x: int, y: int, size: int, color: QColor
     ):
         """Draw a classic 6-pointed star shape."""
-        path = QPainterPath()
-        radius = size / 2
-        angle_step = math.pi / 3  # 6 points
-
-        # Create star rays
-        for i in range(6):
-            angle = i * angle_step
-            x1 = x + radius * math.cos(angle)
-            y1 = y + radius * math.sin(angle)
-            path.moveTo(x, y)
-            path.lineTo(x1, y1)
-
-        # A+ Enhancement: Use resource pooling - Temporarily disabled
-        # if QT_RESOURCES_AVAILABLE:
-        #     with pooled_pen(color, 1) as pen:
-        #         painter.setPen(pen)
-        #         painter.drawPath(path)
-        # else:
         painter.setPen(color)
-        painter.drawPath(path)
+        painter.drawPath(self._star_path(1, size).translated(x, y))
 
     def _draw_spiky_star(
         self, painter: QPainter, x: int, y: int, size: int, color: QColor
     ):
         """Draw a spiky multi-pointed star."""
-        path = QPainterPath()
-        radius = size / 2
-        small_radius = radius * 0.6
-        angle_step = math.pi / 6  # 12 points
-
-        # Create alternating long and short points
-        for i in range(12):
-            angle = i * angle_step
-            r = radius if i % 2 == 0 else small_radius
-            x1 = x + r * math.cos(angle)
-            y1 = y + r * math.sin(angle)
-            if i == 0:
-                path.moveTo(x1, y1)
-            else:
-                path.lineTo(x1, y1)
-        path.closeSubpath()
-
-        # A+ Enhancement: Use resource pooling - Temporarily disabled
-        # if QT_RESOURCES_AVAILABLE:
-        #     with pooled_brush(color) as brush:
-        #         painter.setBrush(brush)
-        #         painter.setPen(Qt.PenStyle.NoPen)
-        #         painter.drawPath(path)
-        # else:
         painter.setBrush(color)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPath(path)
+        painter.drawPath(self._star_path(2, size).translated(x, y))
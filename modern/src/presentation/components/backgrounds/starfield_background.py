@@ -1,4 +1,5 @@
 from .base_background import BaseBackground
+from .particle_system import FRAME_INTERVAL
 from PyQt6.QtGui import QColor, QPainter
 from PyQt6.QtWidgets import QWidget
 
@@ -19,19 +20,21 @@ class StarfieldBackground(BaseBackground):
     with all the sophisticated space scene elements.
     """
 
+    star_count = 150
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         # Initialize all starfield components
-        self.star_manager = StarManager()
+        self.star_manager = StarManager(self.star_count)
         self.comet_manager = CometManager()
         self.moon_manager = MoonManager()
         self.ufo_manager = UFOManager()
 
-    def animate_background(self):
+    def animate_background(self, dt: float = FRAME_INTERVAL):
         """Animate all starfield components."""
         # Animate stars and UFO
-        self.star_manager.animate_stars()
+        self.star_manager.animate_stars(dt)
         self.ufo_manager.animate_ufo()
 
         # Handle comet activation and movement
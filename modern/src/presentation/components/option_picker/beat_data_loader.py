@@ -2,12 +2,11 @@ from typing import List, Optional, Dict, Any, Callable, TYPE_CHECKING
 from PyQt6.QtCore import QObject
 
 from application.services.data.data_conversion_service import DataConversionService
+from application.services.positioning.option_provider import IOptionProvider
+from application.services.positioning.shared_positioning import get_option_provider
 from domain.models.core_models import BeatData
 
 if TYPE_CHECKING:
-    from application.services.positioning.position_matching_service import (
-        PositionMatchingService,
-    )
     from domain.models.core_models import SequenceData
 
 
@@ -52,24 +51,23 @@ class BeatDataLoader(QObject):
         ("ne", "nw"): "gamma16",
     }
 
-    def __init__(self):
+    def __init__(self, option_provider: Optional[IOptionProvider] = None):
         super().__init__()
         self._beat_options: List[BeatData] = (
             []
         )  # Create reverse mapping from positions_map for location tuples to positions
         self._location_to_position_map = self._create_location_to_position_mapping()
 
-        # Initialize services for dynamic refresh
+        # Initialize services for dynamic refresh. The option provider is
+        # shared and long-lived; its option index is built in the background
+        # so the first refresh does not pay for it.
         try:
-            from application.services.positioning.position_matching_service import (
-                PositionMatchingService,
-            )
-
-            self.position_service = PositionMatchingService()
+            self.option_provider = option_provider or get_option_provider()
+            self.option_provider.warm_up()
             self.conversion_service = DataConversionService()
         except Exception as e:
             # Failed to initialize services for BeatDataLoader
-            self.position_service = None
+            self.option_provider = None
             self.conversion_service = None
 
     def _create_location_to_position_mapping(self) -> Dict[tuple, str]:
@@ -95,12 +93,10 @@ class BeatDataLoader(QObject):
                 )
 
         try:
-            from application.services.positioning.position_matching_service import (
-                PositionMatchingService,
-            )
-
-            position_service = PositionMatchingService()
-            conversion_service = DataConversionService()
+            option_provider = self.option_provider
+            conversion_service = self.conversion_service
+            if not option_provider or not conversion_service:
+                return self._load_sample_beat_options()
 
             if not sequence_data or len(sequence_data) < 2:
                 print(
@@ -115,17 +111,17 @@ class BeatDataLoader(QObject):
             last_beat = sequence_data[-1]
             print(f"   📍 Last beat data: {last_beat}")
 
-            last_end_pos = self._extract_end_position(last_beat, position_service)
+            last_end_pos = self._extract_end_position(last_beat, option_provider)
             print(f"   🎯 Extracted end position: {last_end_pos}")
 
             if not last_end_pos:
                 print("   ❌ No end position found, falling back to sample options")
                 return self._load_sample_beat_options()
 
-            print(f"   🔍 Calling position_service.get_next_options({last_end_pos})")
-            next_options = position_service.get_next_options(last_end_pos)
+            print(f"   🔍 Calling option_provider.get_options({last_end_pos})")
+            next_options = option_provider.get_options(last_end_pos)
             print(
-                f"   📊 Position service returned {len(next_options) if next_options else 0} options"
+                f"   📊 Option provider returned {len(next_options) if next_options else 0} options"
             )
 
             if not next_options:
@@ -161,6 +157,7 @@ class BeatDataLoader(QObject):
                     continue
 
             self._beat_options = beat_options
+            option_provider.prefetch_following(beat_options)
             return beat_options
 
         except Exception as e:
@@ -171,7 +168,7 @@ class BeatDataLoader(QObject):
             return self._load_sample_beat_options()
 
     def _extract_end_position(
-        self, last_beat: Dict[str, Any], position_service: "PositionMatchingService"
+        self, last_beat: Dict[str, Any], option_provider: IOptionProvider
     ) -> Optional[str]:
         """Extract end position from last beat data using Legacy-compatible logic"""
         if "end_pos" in last_beat:
@@ -188,12 +185,12 @@ class BeatDataLoader(QObject):
             if end_pos:
                 return end_pos  # Fallback to position service
         try:
-            available_positions = position_service.get_available_start_positions()
+            available_positions = option_provider.get_available_start_positions()
             if available_positions:
                 fallback_pos = available_positions[0]
                 return fallback_pos
             else:
-                alpha1_options = position_service.get_alpha1_options()
+                alpha1_options = option_provider.get_options("alpha1")
                 fallback_pos = "alpha1" if alpha1_options else None
                 return fallback_pos
         except Exception as e:
@@ -263,23 +260,24 @@ class BeatDataLoader(QObject):
 
         try:
             # Check if services are available
-            if not self.position_service or not self.conversion_service:
+            if not self.option_provider or not self.conversion_service:
                 return self._load_sample_beat_options()
 
             # Extract end position from last beat
-            end_position = self._extract_end_position(last_beat, self.position_service)
+            end_position = self._extract_end_position(last_beat, self.option_provider)
 
             if not end_position:
                 return self._load_sample_beat_options()
 
-            # Get next options from position service
-            next_options = self.position_service.get_next_options(end_position)
+            # Get next options from the option provider
+            next_options = self.option_provider.get_options(end_position)
 
             if not next_options:
                 return self._load_sample_beat_options()
 
             # Optimized: Batch convert to BeatData format
             beat_options = self._batch_convert_options(next_options)
+            self.option_provider.prefetch_following(beat_options)
             return beat_options
 
         except Exception as e:
@@ -348,14 +346,17 @@ class BeatDataLoader(QObject):
             if not end_position:
                 return self._load_sample_beat_options()
 
-            # Get next options using position service
-            if not self.position_service:
+            # Get next options from the option provider
+            if not self.option_provider:
                 return self._load_sample_beat_options()
 
-            next_options = self.position_service.get_next_options(end_position)
+            next_options = self.option_provider.get_options(end_position)
             if not next_options:
                 return self._load_sample_beat_options()
 
+            # Warm the positions the user can reach with the next click
+            self.option_provider.prefetch_following(next_options)
+
             # Options are already BeatData objects from position service
             total_time = (time.perf_counter() - start_time) * 1000
             print(f"⚡ PURE Modern BEAT LOADER: {total_time:.1f}ms")
@@ -44,6 +44,8 @@ class ClickablePictographFrame(QFrame):
             self.pictograph_component.setSizePolicy(
                 QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
             )
+            # Options are redrawn on every beat; paint them from cached tiles
+            self.pictograph_component.enable_tile_cache()
 
             self._configure_option_picker_context(beat_data)
 
@@ -119,14 +119,7 @@ class PictographPoolManager(QObject):
         self, dataset_service: "PictographDatasetService"
     ) -> Optional[BeatData]:
         """Get fallback beat data from dataset"""
-        if (
-            hasattr(dataset_service, "_diamond_dataset")
-            and dataset_service._diamond_dataset is not None
-        ):
-            if not dataset_service._diamond_dataset.empty:
-                first_entry = dataset_service._diamond_dataset.iloc[0]
-                return dataset_service._dataset_entry_to_beat_data(first_entry)
-        return None
+        return dataset_service.get_first_pictograph("diamond")
 
     def _create_minimal_beat_data(self) -> BeatData:
         """Create minimal valid beat data as final fallback"""
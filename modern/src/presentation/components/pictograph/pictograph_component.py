@@ -5,12 +5,20 @@ Direct pictograph view for Kinetic Constructor - matches legacy container hierar
 from typing import Optional, Any
 from PyQt6.QtWidgets import QGraphicsView
 from PyQt6.QtCore import pyqtSignal, Qt, QTimer, QSize, QEvent
-from PyQt6.QtGui import QPainter, QKeyEvent, QResizeEvent, QEnterEvent
+from PyQt6.QtGui import (
+    QPainter,
+    QKeyEvent,
+    QResizeEvent,
+    QEnterEvent,
+    QImage,
+    QPixmap,
+)
 
 from application.services.ui.context_aware_scaling_service import ScalingContext
 from domain.models.core_models import BeatData
 
 from .pictograph_scene import PictographScene
+from .pictograph_tile_cache import PictographTileCache, render_tile, tile_key
 from .border_manager import BorderedPictographMixin
 
 
@@ -29,7 +37,15 @@ class PictographComponent(QGraphicsView, BorderedPictographMixin):
         BorderedPictographMixin.__init__(self)
 
         self.current_beat: Optional[BeatData] = None
-        self.scene: Optional[PictographScene] = None  # Dimension debugging
+        self.scene: Optional[PictographScene] = None
+
+        # Tile mode: paint a cached raster and only build the scene when needed
+        self._tile_cache: Optional[PictographTileCache] = None
+        self._tile: Optional[QPixmap] = None
+        self._scene_stale = False
+        self._live = False
+
+        # Dimension debugging
         self.debug_enabled = False
         self.debug_timer = QTimer()
         self.debug_timer.timeout.connect(self._print_debug_dimensions)
@@ -60,9 +76,21 @@ class PictographComponent(QGraphicsView, BorderedPictographMixin):
         except RuntimeError as e:
             print(f"❌ Failed to setup PictographComponent UI: {e}")
 
+    def enable_tile_cache(self, cache: Optional[PictographTileCache] = None) -> None:
+        """
+        Paint from cached pictograph tiles instead of the live scene.
+
+        The scene is only rendered on a tile miss and while the mouse is over
+        the view, so hover effects still see live items.
+        """
+        self._tile_cache = cache or PictographTileCache.shared()
+
     def update_from_beat(self, beat_data: BeatData) -> None:
         self.current_beat = beat_data
-        if self.scene:
+        if self._tile_cache and not self._live:
+            self._scene_stale = True
+            self._refresh_tile()
+        elif self.scene:
             self.scene.update_beat(beat_data)
             self._fit_view()
 
@@ -77,9 +105,40 @@ class PictographComponent(QGraphicsView, BorderedPictographMixin):
 
     def clear_pictograph(self) -> None:
         self.current_beat = None
+        self._tile = None
+        self._scene_stale = False
         if self.scene:
             self.scene.clear()
 
+    def _refresh_tile(self) -> None:
+        """Look up the tile for the current beat at the current viewport size."""
+        self._tile = None
+        scene = self.scene
+        # Hidden views have no final size yet; showEvent refreshes them
+        if self.current_beat and scene and self.isVisible():
+            ratio = self.devicePixelRatioF()
+            size = self.viewport().size()
+            pixel_size = QSize(
+                round(size.width() * ratio), round(size.height() * ratio)
+            )
+            if not pixel_size.isEmpty():
+                self._tile = self._tile_cache.get_tile(
+                    tile_key(self.current_beat, pixel_size),
+                    lambda: self._render_tile(scene, pixel_size),
+                )
+                self._tile.setDevicePixelRatio(ratio)
+        self.viewport().update()
+
+    def _render_tile(self, scene: PictographScene, size: QSize) -> QImage:
+        self._ensure_scene_current()
+        return render_tile(scene, size)
+
+    def _ensure_scene_current(self) -> None:
+        if self._scene_stale and self.scene and self.current_beat:
+            self.scene.update_beat(self.current_beat)
+            self._scene_stale = False
+            self._fit_view()
+
     def cleanup(self) -> None:
         try:
             if self.scene:
@@ -102,14 +161,25 @@ class PictographComponent(QGraphicsView, BorderedPictographMixin):
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
         self._fit_view()
+        if self._tile_cache and not self._live:
+            self._refresh_tile()
 
     def showEvent(self, event: Any) -> None:
         super().showEvent(event)
         self._fit_view()
+        if self._tile_cache and not self._live:
+            self._refresh_tile()
 
     def paintEvent(self, event: Any) -> None:
         """Handle paint events and draw borders if enabled."""
-        super().paintEvent(event)
+        if self._tile is not None and not self._live:
+            painter = QPainter(self.viewport())
+            try:
+                painter.drawPixmap(0, 0, self._tile)
+            finally:
+                painter.end()
+        else:
+            super().paintEvent(event)
 
         # Draw borders using the border manager
         painter = QPainter(self.viewport())
@@ -133,6 +203,11 @@ class PictographComponent(QGraphicsView, BorderedPictographMixin):
     def enterEvent(self, event: QEnterEvent) -> None:
         """Handle mouse enter events for hover effects."""
         super().enterEvent(event)
+        if self._tile_cache:
+            # Hover works on live scene items
+            self._ensure_scene_current()
+            self._live = True
+            self.viewport().update()
         # Default hover behavior - can be overridden by context configurator
         if hasattr(self, "_hover_enter_func"):
             self._hover_enter_func()
@@ -140,6 +215,9 @@ class PictographComponent(QGraphicsView, BorderedPictographMixin):
     def leaveEvent(self, event: QEvent) -> None:
         """Handle mouse leave events for hover effects."""
         super().leaveEvent(event)
+        if self._tile_cache:
+            self._live = False
+            self._refresh_tile()
         # Default hover behavior - can be overridden by context configurator
         if hasattr(self, "_hover_leave_func"):
             self._hover_leave_func()
@@ -10,6 +10,16 @@ from PyQt6.QtGui import QBrush, QColor
 
 from domain.models.core_models import BeatData, LetterType
 from domain.models.letter_type_classifier import LetterTypeClassifier
+from application.services.positioning.arrow_management_service import (
+    IArrowManagementService,
+)
+from application.services.positioning.prop_management_service import (
+    IPropManagementService,
+)
+from application.services.positioning.shared_positioning import (
+    get_arrow_management_service,
+    get_prop_management_service,
+)
 
 from presentation.components.pictograph.renderers.grid_renderer import GridRenderer
 from presentation.components.pictograph.renderers.prop_renderer import PropRenderer
@@ -32,7 +42,12 @@ from presentation.components.pictograph.renderers.position_glyph_renderer import
 class PictographScene(QGraphicsScene):
     """Graphics scene for rendering pictographs using modular renderers."""
 
-    def __init__(self, parent=None):
+    def __init__(
+        self,
+        parent=None,
+        arrow_service: Optional[IArrowManagementService] = None,
+        prop_service: Optional[IPropManagementService] = None,
+    ):
         super().__init__(parent)
         self.beat_data: Optional[BeatData] = None
 
@@ -43,10 +58,14 @@ class PictographScene(QGraphicsScene):
         self.setSceneRect(0, 0, self.SCENE_SIZE, self.SCENE_SIZE)
         self.setBackgroundBrush(QBrush(QColor(255, 255, 255)))
 
+        # Positioning services are read-only and shared by every scene
+        self.arrow_service = arrow_service or get_arrow_management_service()
+        self.prop_service = prop_service or get_prop_management_service()
+
         # Initialize renderers
         self.grid_renderer = GridRenderer(self)
-        self.prop_renderer = PropRenderer(self)
-        self.arrow_renderer = ArrowRenderer(self)
+        self.prop_renderer = PropRenderer(self, self.prop_service)
+        self.arrow_renderer = ArrowRenderer(self, self.arrow_service)
         self.letter_renderer = LetterRenderer(self)  # Initialize glyph renderers
         self.elemental_glyph_renderer = ElementalGlyphRenderer(self)
         self.vtg_glyph_renderer = VTGGlyphRenderer(self)
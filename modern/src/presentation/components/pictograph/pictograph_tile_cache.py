@@ -0,0 +1,249 @@
+"""
+Rasterized pictograph tile cache.
+
+Option pickers redraw dozens of pictographs whose content has usually been
+drawn before, at the same size. Each rendered pictograph is kept as a tile
+keyed by a hash of everything the scene draws from (letter, both motions,
+glyph data and its visibility flags) plus the target pixel size. Tiles are
+held in memory up to a byte budget, least recently used first out, and are
+written to disk as PNG files so the next session starts warm.
+
+The key also covers a fingerprint of the assets the scene is drawn with (the
+SVG images and the dataset and arrow placement files), so tiles on disk stop
+matching when an asset changes and are pruned like any other unused tile.
+
+Tiles are QPixmaps and the cache must only be used from the GUI thread.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QRectF, QSize, Qt
+from PyQt6.QtGui import QImage, QPainter, QPixmap
+from PyQt6.QtWidgets import QGraphicsScene
+
+from domain.models.core_models import BeatData
+from infrastructure.dataset_snapshot import DatasetSnapshotStore
+from presentation.components.pictograph.asset_utils import get_image_path
+
+# Bump when rendering changes so tiles from older sessions are not reused
+TILE_FORMAT_VERSION = 1
+TILE_SUFFIX = ".png"
+
+DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+_asset_fingerprint: Optional[str] = None
+
+
+def asset_fingerprint() -> str:
+    """Hash of every SVG image and dataset source file, computed once per process."""
+    global _asset_fingerprint
+    if _asset_fingerprint is None:
+        digest = hashlib.blake2b(digest_size=16)
+        source_hashes = DatasetSnapshotStore.shared().source_hashes()
+        for name in sorted(source_hashes):
+            digest.update(f"{name}={source_hashes[name]}\n".encode("utf-8"))
+        images_dir = Path(get_image_path(""))
+        for path in sorted(images_dir.rglob("*.svg")):
+            content_hash = hashlib.blake2b(path.read_bytes(), digest_size=16)
+            name = path.relative_to(images_dir).as_posix()
+            digest.update(f"{name}={content_hash.hexdigest()}\n".encode("utf-8"))
+        _asset_fingerprint = digest.hexdigest()
+    return _asset_fingerprint
+
+
+def tile_key(beat_data: BeatData, size: QSize) -> str:
+    """Stable content hash of what a pictograph scene draws at the given size."""
+    content = {
+        "version": TILE_FORMAT_VERSION,
+        "assets": asset_fingerprint(),
+        "letter": beat_data.letter,
+        "is_blank": beat_data.is_blank,
+        "blue": beat_data.blue_motion.to_dict() if beat_data.blue_motion else None,
+        "red": beat_data.red_motion.to_dict() if beat_data.red_motion else None,
+        "glyphs": beat_data.glyph_data.to_dict() if beat_data.glyph_data else None,
+        "size": [size.width(), size.height()],
+    }
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def render_tile(scene: QGraphicsScene, size: QSize) -> QImage:
+    """Rasterize the scene's items the way PictographComponent fits them."""
+    image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.white)
+    painter = QPainter(image)
+    try:
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        scene.render(
+            painter,
+            QRectF(0, 0, size.width(), size.height()),
+            scene.itemsBoundingRect(),
+            Qt.AspectRatioMode.KeepAspectRatio,
+        )
+    finally:
+        painter.end()
+    return image
+
+
+class PictographTileCache:
+    """Memory-bounded LRU of pictograph tiles backed by a PNG directory."""
+
+    _shared: Optional["PictographTileCache"] = None
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ):
+        self.cache_dir = cache_dir or (
+            Path(__file__).parents[3] / "infrastructure" / "cache" / "pictograph_tiles"
+        )
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._tiles: "OrderedDict[str, QPixmap]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: Optional[int] = None
+
+    @classmethod
+    def shared(cls) -> "PictographTileCache":
+        """Get the process-wide tile cache."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def get_tile(self, key: str, render: Callable[[], QImage]) -> QPixmap:
+        """
+        Get the tile for a key, rendering it only if neither memory nor disk has it.
+
+        render is called on a miss and must return the tile image; it is then
+        kept in memory and written to disk.
+        """
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            self.hits += 1
+            return tile
+
+        image = self._read_disk(key)
+        if image is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            image = render()
+            self._write_disk(key, image)
+
+        tile = QPixmap.fromImage(image)
+        self._remember(key, tile)
+        return tile
+
+    def stats(self) -> dict[str, int]:
+        """Get hit/miss counters and current memory use."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "tiles": len(self._tiles),
+            "memory_bytes": self._memory_bytes,
+        }
+
+    def clear_memory(self) -> None:
+        """Drop every in-memory tile; tiles on disk are kept."""
+        self._tiles.clear()
+        self._memory_bytes = 0
+
+    def clear(self) -> None:
+        """Drop every tile from memory and disk."""
+        self.clear_memory()
+        for path in self._disk_tiles():
+            path.unlink(missing_ok=True)
+        self._disk_bytes = 0
+
+    # Memory
+
+    def _remember(self, key: str, tile: QPixmap) -> None:
+        self._tiles[key] = tile
+        self._memory_bytes += self._tile_bytes(tile)
+        while self._memory_bytes > self.max_memory_bytes and len(self._tiles) > 1:
+            _, evicted = self._tiles.popitem(last=False)
+            self._memory_bytes -= self._tile_bytes(evicted)
+
+    @staticmethod
+    def _tile_bytes(tile: QPixmap) -> int:
+        return tile.width() * tile.height() * max(1, tile.depth() // 8)
+
+    # Disk
+
+    def _tile_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{TILE_SUFFIX}"
+
+    def _disk_tiles(self) -> list[Path]:
+        if not self.cache_dir.exists():
+            return []
+        return list(self.cache_dir.glob(f"*{TILE_SUFFIX}"))
+
+    def _read_disk(self, key: str) -> Optional[QImage]:
+        path = self._tile_path(key)
+        if not path.exists():
+            return None
+        image = QImage(str(path))
+        if image.isNull():
+            path.unlink(missing_ok=True)
+            return None
+        # Refresh the modification time so disk eviction is least recently used
+        os.utime(path)
+        return image
+
+    def _write_disk(self, key: str, image: QImage) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.cache_dir, suffix=TILE_SUFFIX + ".tmp"
+            )
+            os.close(fd)
+            if not image.save(temp_path, "PNG"):
+                os.remove(temp_path)
+                return
+            written = os.path.getsize(temp_path)
+            os.replace(temp_path, self._tile_path(key))
+        except OSError as e:
+            print(f"⚠️ Could not write pictograph tile: {e}")
+            return
+
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(path.stat().st_size for path in self._disk_tiles())
+        else:
+            self._disk_bytes += written
+        if self._disk_bytes > self.max_disk_bytes:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """Delete the least recently used tiles until the disk budget is met."""
+        tiles = []
+        for path in self._disk_tiles():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            tiles.append((stat.st_mtime_ns, stat.st_size, path))
+        tiles.sort()
+
+        total = sum(size for _, size, _ in tiles)
+        target = self.max_disk_bytes * 3 // 4
+        for _, size, path in tiles:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._disk_bytes = total
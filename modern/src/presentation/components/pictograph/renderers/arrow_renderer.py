@@ -5,16 +5,21 @@ Handles rendering of arrow elements with positioning, rotation, and mirroring.
 """
 
 import os
-import re
 from typing import Optional, TYPE_CHECKING
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import (
+    SvgRendererCache,
+    get_color_hex,
+)
 from domain.models.core_models import MotionData, Location, MotionType
 from domain.models.pictograph_models import ArrowData, PictographData
 from application.services.positioning.arrow_management_service import (
-    ArrowManagementService,
+    IArrowManagementService,
+)
+from application.services.positioning.shared_positioning import (
+    get_arrow_management_service,
 )
 
 if TYPE_CHECKING:
@@ -24,13 +29,18 @@ if TYPE_CHECKING:
 class ArrowRenderer:
     """Handles arrow rendering for pictographs."""
 
-    def __init__(self, scene: "PictographScene"):
+    def __init__(
+        self,
+        scene: "PictographScene",
+        arrow_service: Optional[IArrowManagementService] = None,
+    ):
         self.scene = scene
         self.CENTER_X = 475
         self.CENTER_Y = 475
         self.HAND_RADIUS = 143.1
 
-        self.arrow_service = ArrowManagementService()
+        self.arrow_service = arrow_service or get_arrow_management_service()
+        self.renderer_cache = SvgRendererCache.shared()
 
         self.location_coordinates = {
             Location.NORTH.value: (0, -self.HAND_RADIUS),
@@ -71,11 +81,9 @@ class ArrowRenderer:
         if os.path.exists(arrow_svg_path):
             arrow_item = QGraphicsSvgItem()
 
-            # Apply color transformation to SVG data
-            svg_data = self._load_svg_file(arrow_svg_path)
-            colored_svg_data = self._apply_color_transformation(svg_data, color)
-
-            renderer = QSvgRenderer(bytearray(colored_svg_data, encoding="utf-8"))
+            renderer = self.renderer_cache.get_renderer(
+                arrow_svg_path, get_color_hex(color)
+            )
             if renderer.isValid():
                 arrow_item.setSharedRenderer(renderer)
 
@@ -163,55 +171,3 @@ class ArrowRenderer:
     def _get_location_position(self, location: Location) -> tuple[float, float]:
         """Get the coordinate position for a location."""
         return self.location_coordinates.get(location.value, (0, 0))
-
-    def _load_svg_file(self, file_path: str) -> str:
-        """Load SVG file content as string."""
-        try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
-
-                # Extract dimensions from SVG content for debugging
-                width_match = re.search(r'width="([^"]*)"', content)
-                height_match = re.search(r'height="([^"]*)"', content)
-                viewbox_match = re.search(r'viewBox="([^"]*)"', content)
-
-                # Store for potential debugging use
-                _ = width_match.group(1) if width_match else "not found"
-                _ = height_match.group(1) if height_match else "not found"
-                _ = viewbox_match.group(1) if viewbox_match else "not found"
-
-                return content
-        except Exception:
-            return ""
-
-    def _apply_color_transformation(self, svg_data: str, color: str) -> str:
-        """Apply color transformation to SVG data based on arrow color."""
-        if not svg_data:
-            return svg_data
-
-        # Color mapping based on reference implementation
-        COLOR_MAP = {
-            "blue": "#2E3192",  # Reference blue color
-            "red": "#ED1C24",  # Reference red color
-        }
-
-        target_color = COLOR_MAP.get(color.lower(), "#2E3192")  # Default to blue
-
-        # Pattern to match CSS fill properties in SVG
-        # This matches both fill attributes and CSS style properties
-        patterns = [
-            # CSS fill property: fill="#color"
-            re.compile(r'(fill=")([^"]*)(")'),
-            # CSS style attribute: fill: #color;
-            re.compile(r"(fill:\s*)([^;]*)(;)"),
-            # Class definition: .st0 { fill: #color; }
-            re.compile(r"(\.(st0|cls-1)\s*\{[^}]*?fill:\s*)([^;}]*)([^}]*?\})"),
-        ]
-
-        # Apply color transformation using all patterns
-        for pattern in patterns:
-            svg_data = pattern.sub(
-                lambda m: m.group(1) + target_color + m.group(len(m.groups())), svg_data
-            )
-
-        return svg_data
@@ -6,9 +6,9 @@ Handles rendering of grid elements using SVG assets.
 
 import os
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import SvgRendererCache
 
 
 class GridRenderer:
@@ -23,7 +23,7 @@ class GridRenderer:
 
         if os.path.exists(grid_svg_path):
             grid_item = QGraphicsSvgItem()
-            renderer = QSvgRenderer(grid_svg_path)
+            renderer = SvgRendererCache.shared().get_renderer(grid_svg_path)
 
             if renderer.isValid():
                 grid_item.setSharedRenderer(renderer)
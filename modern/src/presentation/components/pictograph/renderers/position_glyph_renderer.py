@@ -9,9 +9,9 @@ import os
 from typing import Optional
 from PyQt6.QtWidgets import QGraphicsItemGroup
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import SvgRendererCache
 
 
 class PositionGlyphRenderer:
@@ -95,7 +95,7 @@ class PositionGlyphRenderer:
             return None
 
         symbol_item = QGraphicsSvgItem()
-        renderer = QSvgRenderer(svg_path)
+        renderer = SvgRendererCache.shared().get_renderer(svg_path)
 
         if renderer.isValid():
             symbol_item.setSharedRenderer(renderer)
@@ -116,7 +116,7 @@ class PositionGlyphRenderer:
             return None
 
         arrow_item = QGraphicsSvgItem()
-        renderer = QSvgRenderer(svg_path)
+        renderer = SvgRendererCache.shared().get_renderer(svg_path)
 
         if renderer.isValid():
             arrow_item.setSharedRenderer(renderer)
@@ -9,10 +9,10 @@ import os
 from typing import Optional
 from PyQt6.QtWidgets import QGraphicsItemGroup
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from domain.models.core_models import LetterType
 from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import SvgRendererCache
 
 
 class TKAGlyphRenderer:
@@ -81,7 +81,7 @@ class TKAGlyphRenderer:
         if not os.path.exists(svg_path):
             return None
 
-        renderer = QSvgRenderer(svg_path)
+        renderer = SvgRendererCache.shared().get_renderer(svg_path)
 
         if renderer.isValid():
             letter_item = QGraphicsSvgItem()
@@ -97,7 +97,7 @@ class TKAGlyphRenderer:
             return None
 
         dash_item = QGraphicsSvgItem()
-        renderer = QSvgRenderer(svg_path)
+        renderer = SvgRendererCache.shared().get_renderer(svg_path)
 
         if renderer.isValid():
             dash_item.setSharedRenderer(renderer)
@@ -8,10 +8,10 @@ classification of pictographs (SS, SO, TS, TO, QS, QO).
 import os
 from typing import Optional
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from domain.models.core_models import VTGMode
 from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import SvgRendererCache
 
 
 class VTGGlyphRenderer:
@@ -48,7 +48,7 @@ class VTGGlyphRenderer:
 
         # Create and configure the SVG item
         glyph_item = QGraphicsSvgItem()
-        renderer = QSvgRenderer(svg_path)
+        renderer = SvgRendererCache.shared().get_renderer(svg_path)
 
         if renderer.isValid():
             glyph_item.setSharedRenderer(renderer)
@@ -0,0 +1,120 @@
+"""
+Shared SVG renderer cache for pictograph components.
+
+Parsing an SVG into a QSvgRenderer is the most expensive step of drawing a
+pictograph element, and every pictograph draws the same few dozen assets in
+one of two colors. Renderers are built once per (asset path, color hex) and
+handed to items through setSharedRenderer. Items keep a reference to their
+renderer, so evicting an entry never affects what is already on screen.
+
+Renderers are Qt objects and the cache must only be used from the GUI thread.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Optional
+
+from PyQt6.QtSvg import QSvgRenderer
+
+# Color mapping based on reference implementation
+COLOR_MAP = {
+    "blue": "#2E3192",  # Reference blue color
+    "red": "#ED1C24",  # Reference red color
+}
+
+# Patterns that match fill attributes, CSS fill properties and the fill in
+# .st0 / .cls-1 class definitions
+_FILL_PATTERNS = [
+    re.compile(r'(fill=")([^"]*)(")'),
+    re.compile(r"(fill:\s*)([^;]*)(;)"),
+    re.compile(r"(\.(st0|cls-1)\s*\{[^}]*?fill:\s*)([^;}]*)([^}]*?\})"),
+]
+
+DEFAULT_MAX_RENDERERS = 256
+
+
+def get_color_hex(color: str) -> str:
+    """Get the fill color for a motion color name, defaulting to blue."""
+    return COLOR_MAP.get(color.lower(), COLOR_MAP["blue"])
+
+
+def apply_color_transformation(svg_data: str, color_hex: str) -> str:
+    """Replace every fill color in the SVG data with the given hex color."""
+    if not svg_data:
+        return svg_data
+
+    for pattern in _FILL_PATTERNS:
+        svg_data = pattern.sub(
+            lambda m: m.group(1) + color_hex + m.group(len(m.groups())), svg_data
+        )
+    return svg_data
+
+
+class SvgRendererCache:
+    """Bounded LRU cache of QSvgRenderers keyed by (svg path, color hex)."""
+
+    _shared: Optional["SvgRendererCache"] = None
+
+    def __init__(self, max_size: int = DEFAULT_MAX_RENDERERS):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._renderers: "OrderedDict[tuple[str, Optional[str]], QSvgRenderer]" = (
+            OrderedDict()
+        )
+
+    @classmethod
+    def shared(cls) -> "SvgRendererCache":
+        """Get the process-wide cache used by all pictograph scenes."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def get_renderer(
+        self, svg_path: str, color_hex: Optional[str] = None
+    ) -> QSvgRenderer:
+        """
+        Get a renderer for the SVG file, recolored when a color is given.
+
+        Missing or unreadable files produce an invalid renderer, which is
+        cached like any other so the file is not retried on every draw.
+        """
+        key = (svg_path, color_hex)
+        renderer = self._renderers.get(key)
+        if renderer is not None:
+            self._renderers.move_to_end(key)
+            self.hits += 1
+            return renderer
+
+        self.misses += 1
+        if color_hex is None:
+            renderer = QSvgRenderer(svg_path)
+        else:
+            svg_data = apply_color_transformation(self._load_svg(svg_path), color_hex)
+            renderer = QSvgRenderer(bytearray(svg_data, encoding="utf-8"))
+
+        self._renderers[key] = renderer
+        if len(self._renderers) > self.max_size:
+            self._renderers.popitem(last=False)
+        return renderer
+
+    def stats(self) -> dict[str, int]:
+        """Get hit/miss counters and the current number of cached renderers."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+    def clear(self) -> None:
+        """Drop every cached renderer and reset the counters."""
+        self._renderers.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._renderers)
+
+    def _load_svg(self, svg_path: str) -> str:
+        try:
+            with open(svg_path, "r", encoding="utf-8") as file:
+                return file.read()
+        except Exception as e:
+            print(f"Error loading SVG file {svg_path}: {e}")
+            return ""
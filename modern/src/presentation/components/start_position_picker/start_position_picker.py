@@ -47,6 +47,7 @@ class StartPositionOption(QWidget):
         # Create pictograph preview
         self.pictograph_component = PictographComponent()
         self.pictograph_component.setFixedSize(200, 200)
+        self.pictograph_component.enable_tile_cache()
 
         self.pictograph_component.setStyleSheet(
             """
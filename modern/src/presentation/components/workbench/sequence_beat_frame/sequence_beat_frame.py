@@ -262,31 +262,35 @@ class SequenceBeatFrame(QScrollArea):
 
     def _apply_layout(self, rows: int, columns: int):
         """Apply the specified grid layout like legacy"""
-        # Clear existing layout (except start position)
-        for i in range(len(self._beat_views)):
-            self._grid_layout.removeWidget(self._beat_views[i])
-            self._beat_views[i].hide()
-
-        # Update layout info (no label in legacy)
-        self._current_layout = {"rows": rows, "columns": columns}
-
-        # Add beats to new layout
-        beat_count = self._current_sequence.length if self._current_sequence else 0
+        # Apply the whole layout change as one geometry update
+        with self._resizer_service.batch_geometry(self):
+            # Clear existing layout (except start position)
+            for i in range(len(self._beat_views)):
+                self._grid_layout.removeWidget(self._beat_views[i])
+                self._beat_views[i].hide()
+
+            # Update layout info (no label in legacy)
+            self._current_layout = {"rows": rows, "columns": columns}
+
+            # Add beats to new layout
+            beat_count = (
+                self._current_sequence.length if self._current_sequence else 0
+            )
 
-        # Only add beat views if there are beats and columns > 0
-        if beat_count > 0 and columns > 0:
-            for i in range(min(beat_count, len(self._beat_views))):
-                row = i // columns
-                col = (i % columns) + 1  # +1 to account for start position
+            # Only add beat views if there are beats and columns > 0
+            if beat_count > 0 and columns > 0:
+                for i in range(min(beat_count, len(self._beat_views))):
+                    row = i // columns
+                    col = (i % columns) + 1  # +1 to account for start position
 
-                beat_view = self._beat_views[i]
-                self._grid_layout.addWidget(beat_view, row, col, 1, 1)
-                beat_view.show()
+                    beat_view = self._beat_views[i]
+                    self._grid_layout.addWidget(beat_view, row, col, 1, 1)
+                    beat_view.show()
 
-        # CRITICAL: Apply Legacy's beat sizing after layout change
-        # Ensure we have at least 1 column for resizing calculations
-        resize_columns = max(columns, 1)
-        self._resizer_service.resize_beat_frame(self, rows, resize_columns)
+            # CRITICAL: Apply Legacy's beat sizing after layout change
+            # Ensure we have at least 1 column for resizing calculations
+            resize_columns = max(columns, 1)
+            self._resizer_service.resize_beat_frame(self, rows, resize_columns)
 
         # Emit layout changed signal
         self.layout_changed.emit(rows, columns)
@@ -368,13 +372,14 @@ class SequenceBeatFrame(QScrollArea):
             )
 
             if layout_changed:
+                # Resizes the beats as part of the new layout
                 self._apply_layout(new_layout["rows"], new_layout["columns"])
-
-            # CRITICAL: Always resize beats using Legacy's exact sizing logic
-            # This was missing in Modern - causing beats to be 1/8 or 1/9 instead of 1/6!
-            self._resizer_service.resize_beat_frame(
-                self, new_layout["rows"], new_layout["columns"]
-            )
+            else:
+                # CRITICAL: Always resize beats using Legacy's exact sizing logic
+                # This was missing in Modern - causing beats to be 1/8 or 1/9 instead of 1/6!
+                self._resizer_service.resize_beat_frame(
+                    self, new_layout["rows"], new_layout["columns"]
+                )
 
     # Event handlers for domain events
     def _on_sequence_created(self, event: SequenceCreatedEvent):
@@ -65,10 +65,9 @@ class SequenceManager(QObject):
             )
 
             # Add beat to sequence
-            updated_beats = current_sequence.beats + [new_beat]
-            updated_sequence = current_sequence.update(beats=updated_beats)
+            updated_sequence = current_sequence.add_beat(new_beat)
 
-            print(f"📊 Sequence updated: {len(updated_beats)} beats")
+            print(f"📊 Sequence updated: {updated_sequence.length} beats")
 
             # Update workbench (this will trigger the workbench signal, which will flow back to us)
             if self.workbench_setter:
@@ -0,0 +1,196 @@
+"""
+Background Particle Benchmarks
+
+Runs the snowfall, starfield, aurora and bubbles backgrounds with 150, 1,000
+and 10,000 particles and reports the CPU time per frame for the particle
+update alone and for a whole frame (update plus painting an 800x600 image).
+The update is compared against the per-particle dict loops the backgrounds
+used before.
+"""
+
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtWidgets import QWidget
+
+from presentation.components.backgrounds.aurora_background import AuroraBackground
+from presentation.components.backgrounds.bubbles_background import (
+    BubblesBackground,
+)
+from presentation.components.backgrounds.particle_system import FRAME_INTERVAL
+from presentation.components.backgrounds.snowfall_background import (
+    SnowfallBackground,
+)
+from presentation.components.backgrounds.starfield_background import (
+    StarfieldBackground,
+)
+
+COUNTS = [150, 1000, 10000]
+WIDTH, HEIGHT = 800, 600
+
+
+def dict_snowflakes(count):
+    return [
+        {
+            "x": random.randint(0, WIDTH),
+            "y": random.randint(-HEIGHT, 0),
+            "size": random.randint(2, 6),
+            "speed": random.uniform(0.5, 2.0),
+            "image_index": random.randint(0, 19),
+        }
+        for _ in range(count)
+    ]
+
+
+def update_dict_snowflakes(snowflakes):
+    for snowflake in snowflakes:
+        snowflake["y"] += snowflake["speed"]
+        if snowflake["y"] > HEIGHT:
+            snowflake["y"] = random.randint(-20, 0)
+            snowflake["x"] = random.randint(0, WIDTH)
+            snowflake["size"] = random.randint(2, 6)
+            snowflake["speed"] = random.uniform(0.5, 2.0)
+            snowflake["image_index"] = random.randint(0, 19)
+
+
+def dict_stars(count):
+    return [
+        {
+            "twinkle_speed": random.uniform(0.5, 2.0),
+            "twinkle_phase": random.uniform(0, 2 * math.pi),
+        }
+        for _ in range(count)
+    ], [1.0] * count
+
+
+def update_dict_stars(state):
+    stars, twinkle_state = state
+    for i, star in enumerate(stars):
+        star["twinkle_phase"] += star["twinkle_speed"] * 0.1
+        twinkle_intensity = (math.sin(star["twinkle_phase"]) + 1) / 2
+        twinkle_state[i] = 0.6 + (twinkle_intensity * 0.4)
+
+
+def dict_sparkles(count):
+    return [
+        {
+            "opacity": random.uniform(0.5, 1.0),
+            "pulse_speed": random.uniform(0.005, 0.015),
+        }
+        for _ in range(count)
+    ]
+
+
+def update_dict_sparkles(sparkles):
+    for sparkle in sparkles:
+        sparkle["opacity"] += sparkle["pulse_speed"]
+        if sparkle["opacity"] > 1.0 or sparkle["opacity"] < 0.5:
+            sparkle["pulse_speed"] *= -1
+
+
+def dict_bubbles(count):
+    return [
+        {
+            "x": random.uniform(0, 1),
+            "y": random.uniform(0, 1),
+            "size": random.uniform(5, 15),
+            "speed": random.uniform(0.0005, 0.002),
+            "highlight_factor": random.uniform(0.7, 1.0),
+        }
+        for _ in range(count)
+    ]
+
+
+def update_dict_bubbles(bubbles):
+    for bubble in bubbles:
+        bubble["y"] -= bubble["speed"]
+        if bubble["y"] < 0:
+            bubble["y"] = 1
+            bubble["x"] = random.uniform(0, 1)
+            bubble["size"] = random.uniform(5, 15)
+            bubble["highlight_factor"] = random.uniform(0.7, 1.0)
+
+
+# Background, its particle count attribute, the particle update on its own,
+# and the dict-based version of that update
+BACKGROUNDS = {
+    "Snowfall": (
+        SnowfallBackground,
+        "snowflake_count",
+        lambda background: background.snowflakes.update(FRAME_INTERVAL),
+        (dict_snowflakes, update_dict_snowflakes),
+    ),
+    "Starfield": (
+        StarfieldBackground,
+        "star_count",
+        lambda background: background.star_manager.animate_stars(FRAME_INTERVAL),
+        (dict_stars, update_dict_stars),
+    ),
+    "Aurora": (
+        AuroraBackground,
+        "sparkle_count",
+        lambda background: background.sparkle_manager.animate(FRAME_INTERVAL),
+        (dict_sparkles, update_dict_sparkles),
+    ),
+    "Bubbles": (
+        BubblesBackground,
+        "bubble_count",
+        lambda background: background.animate_background(FRAME_INTERVAL),
+        (dict_bubbles, update_dict_bubbles),
+    ),
+}
+
+
+def cpu_ms_per_call(function, calls):
+    start = time.process_time()
+    for _ in range(calls):
+        function()
+    return (time.process_time() - start) * 1000 / calls
+
+
+@pytest.mark.slow
+class TestBackgroundParticlePerformance:
+    @pytest.mark.parametrize("name", list(BACKGROUNDS))
+    def test_cpu_per_frame(self, qapp, name):
+        background_class, count_attribute, update, baseline = BACKGROUNDS[name]
+        create_dicts, update_dicts = baseline
+        widget = QWidget()
+        widget.resize(WIDTH, HEIGHT)
+        image = QImage(WIDTH, HEIGHT, QImage.Format.Format_ARGB32_Premultiplied)
+
+        def frame():
+            background.animate_background(FRAME_INTERVAL)
+            painter = QPainter(image)
+            background.paint_background(widget, painter)
+            painter.end()
+
+        print(f"\n{name}: CPU ms per frame")
+        print(
+            f"  {'particles':>9} {'dict update':>12} {'array update':>13}"
+            f" {'whole frame':>12}"
+        )
+        for count in COUNTS:
+            background = type(
+                background_class.__name__,
+                (background_class,),
+                {count_attribute: count},
+            )(widget)
+            calls = max(20, 20000 // count)
+            array_ms = cpu_ms_per_call(lambda: update(background), calls)
+            frame_ms = cpu_ms_per_call(frame, max(5, 2000 // count))
+            particles = create_dicts(count)
+            dict_ms = cpu_ms_per_call(lambda: update_dicts(particles), calls)
+
+            print(f"  {count:>9} {dict_ms:>12.3f} {array_ms:>13.3f} {frame_ms:>12.2f}")
+            if count == COUNTS[-1]:
+                assert array_ms < dict_ms
@@ -0,0 +1,174 @@
+"""
+Beat Memory Benchmarks
+
+Reports bytes per beat for a 64-beat sequence and for a full option sheet
+(every option for every start position in both grids), comparing the compact
+model (slotted BeatData, lazy ids, interned MotionData flyweights) against a
+replica of the original dict-backed dataclasses with eager uuid ids.
+"""
+
+import gc
+import sys
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+# Add src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from domain.models.core_models import BeatData, MotionData
+from application.services.positioning.position_matching_service import (
+    PositionMatchingService,
+)
+
+SEQUENCE_LENGTH = 64
+
+
+@dataclass(frozen=True)
+class LegacyMotionData:
+    """The original non-slotted, non-interned MotionData layout."""
+
+    motion_type: Any
+    prop_rot_dir: Any
+    start_loc: Any
+    end_loc: Any
+    turns: float = 0.0
+    start_ori: str = "in"
+    end_ori: str = "in"
+
+
+@dataclass(frozen=True)
+class LegacyBeatData:
+    """The original BeatData layout with an eager uuid4 id."""
+
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    beat_number: int = 1
+    letter: Optional[str] = None
+    duration: float = 1.0
+    blue_motion: Optional[LegacyMotionData] = None
+    red_motion: Optional[LegacyMotionData] = None
+    glyph_data: Any = None
+    blue_reversal: bool = False
+    red_reversal: bool = False
+    is_blank: bool = False
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def copy_motion(motion: MotionData, compact: bool):
+    """Rebuild a motion from its fields, as a converter reading a row would."""
+    if compact:
+        return MotionData(
+            motion.motion_type,
+            motion.prop_rot_dir,
+            motion.start_loc,
+            motion.end_loc,
+            motion.turns,
+            motion.start_ori,
+            motion.end_ori,
+        ).interned()
+    return LegacyMotionData(
+        motion.motion_type,
+        motion.prop_rot_dir,
+        motion.start_loc,
+        motion.end_loc,
+        motion.turns,
+        motion.start_ori,
+        motion.end_ori,
+    )
+
+
+def copy_beat(beat: BeatData, beat_number: int, compact: bool):
+    """Rebuild a beat from a dataset option in the given representation."""
+    beat_type = BeatData if compact else LegacyBeatData
+    return beat_type(
+        beat_number=beat_number,
+        letter=beat.letter,
+        blue_motion=copy_motion(beat.blue_motion, compact),
+        red_motion=copy_motion(beat.red_motion, compact),
+        glyph_data=beat.glyph_data,
+        metadata=dict(beat.metadata),
+    )
+
+
+def measure_bytes(build):
+    """Return (result, bytes still allocated by build())."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = build()
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return result, allocated
+
+
+@pytest.fixture(scope="module")
+def service():
+    return PositionMatchingService()
+
+
+def walk_sequence(service, length):
+    """Follow the first option from alpha1 for the given number of beats."""
+    beats = []
+    position = "alpha1"
+    for _ in range(length):
+        option = service.get_next_options(position)[0]
+        beats.append(option)
+        position = option.metadata["end_pos"]
+    return beats
+
+
+def full_option_sheet(service):
+    return [
+        option
+        for position in service.get_available_start_positions()
+        for option in service.get_next_options(position)
+    ]
+
+
+@pytest.mark.slow
+class TestBeatMemoryPerformance:
+    """Bytes per beat for the compact and original beat representations."""
+
+    def _report(self, label, source_beats):
+        print(f"\n{label}: {len(source_beats)} beats")
+        results = {}
+        for compact in (False, True):
+
+            def build():
+                return [
+                    copy_beat(beat, number, compact)
+                    for number, beat in enumerate(source_beats, start=1)
+                ]
+
+            _, allocated = measure_bytes(build)
+            results[compact] = allocated / len(source_beats)
+            name = "compact" if compact else "original"
+            print(f"  {name:<9} {results[compact]:>9.1f} bytes/beat")
+
+        print(f"  saving    {1 - results[True] / results[False]:>9.1%}")
+        return results
+
+    def test_sequence_bytes_per_beat(self, service):
+        source = walk_sequence(service, SEQUENCE_LENGTH)
+        results = self._report(f"{SEQUENCE_LENGTH}-beat sequence", source)
+        assert results[True] < results[False]
+
+    def test_option_sheet_bytes_per_beat(self, service):
+        source = full_option_sheet(service)
+        results = self._report("Full option sheet", source)
+        assert results[True] < results[False]
+
+    def test_option_sheet_shares_motion_flyweights(self, service):
+        sheet = full_option_sheet(service)
+        motions = {id(m) for beat in sheet for m in (beat.blue_motion, beat.red_motion)}
+        print(f"\n{2 * len(sheet)} motion references, {len(motions)} distinct objects")
+        assert len(motions) < len(sheet)
@@ -0,0 +1,67 @@
+"""
+Dataset Snapshot Startup Benchmarks
+
+Measures cold-process dataset startup with and without a pre-built snapshot.
+Each scenario runs in a fresh interpreter so module import cost (pandas in
+particular) is part of the measurement.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+modern_src_path = Path(__file__).parent.parent.parent / "src"
+
+STARTUP_SCRIPT = """
+import json, sys, time
+from pathlib import Path
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+from infrastructure.dataset_snapshot import DatasetSnapshotStore
+store = DatasetSnapshotStore(cache_dir=Path({cache_dir!r}))
+snapshot = store.load_or_build(force_rebuild={force!r})
+placements = [snapshot.json_blob(n) for n in snapshot.blob_names("arrow_placement/")]
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "rows": len(snapshot.columns["letter"]),
+    "placements": len(placements),
+    "pandas_imported": "pandas" in sys.modules,
+}}))
+"""
+
+
+def run_startup(cache_dir: Path, force: bool) -> dict:
+    script = STARTUP_SCRIPT.format(
+        src=str(modern_src_path), cache_dir=str(cache_dir), force=force
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.slow
+class TestDatasetSnapshotStartup:
+    """Cold-start cost of the CSV/JSON parse path versus the snapshot path."""
+
+    def test_snapshot_startup(self, tmp_path):
+        runs = 3
+        csv_runs = [run_startup(tmp_path, force=True) for _ in range(runs)]
+        snapshot_runs = [run_startup(tmp_path, force=False) for _ in range(runs)]
+
+        csv_best = min(run["seconds"] for run in csv_runs)
+        snapshot_best = min(run["seconds"] for run in snapshot_runs)
+
+        print(f"\nCSV + JSON parse startup: {csv_best * 1000:8.1f} ms")
+        print(f"Snapshot startup:         {snapshot_best * 1000:8.1f} ms")
+        print(f"Speedup:                  {csv_best / snapshot_best:8.1f}x")
+
+        assert all(run["pandas_imported"] for run in csv_runs)
+        assert not any(run["pandas_imported"] for run in snapshot_runs)
+        assert snapshot_runs[0]["rows"] == csv_runs[0]["rows"]
+        assert snapshot_runs[0]["placements"] == csv_runs[0]["placements"]
+        assert snapshot_best < csv_best
@@ -0,0 +1,124 @@
+"""
+Event Bus Performance Benchmarks
+
+Measures TypeSafeEventBus.publish throughput (publishes per second) with 1, 10
+and 100 subscribers, against the original dispatch that re-sorted the
+subscription list and held the bus lock around every handler, and the
+throughput of a coalesced drag burst.
+"""
+
+import gc
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from core.events.event_bus import ArrowEvent, EventPriority, TypeSafeEventBus
+
+SUBSCRIBER_COUNTS = (1, 10, 100)
+PRIORITIES = tuple(EventPriority)
+
+
+class SortingEventBus(TypeSafeEventBus):
+    """The original publish: sort on every call and dispatch under the lock."""
+
+    def publish(self, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.event_type, ()))
+            subscriptions.sort(key=lambda s: s.priority.value)
+
+            self._event_stats[event.event_type] = (
+                self._event_stats.get(event.event_type, 0) + 1
+            )
+
+            self._logger.debug(
+                f"Publishing event {event.event_type} to {len(subscriptions)} subscribers"
+            )
+
+            for subscription in subscriptions:
+                try:
+                    if self._is_dead_reference(subscription):
+                        continue
+                    self._handle_subscription(subscription, event)
+                except Exception as e:
+                    self._logger.error(f"Error handling event {event.event_type}: {e}")
+
+
+def make_bus(bus_type, subscribers):
+    bus = bus_type()
+    for i in range(subscribers):
+        bus.subscribe(
+            "arrow.positioned",
+            lambda event: None,
+            priority=PRIORITIES[i % len(PRIORITIES)],
+        )
+    return bus
+
+
+def publishes_per_second(bus, event, publishes):
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(publishes):
+        bus.publish(event)
+    return publishes / (time.perf_counter() - start)
+
+
+@pytest.mark.slow
+class TestEventBusPerformance:
+    """Publish throughput of the snapshot bus against the sorting bus."""
+
+    def test_publish_throughput(self):
+        event = ArrowEvent(arrow_color="blue", operation="positioned")
+
+        print(
+            f"\n{'subscribers':>11} {'sorting (pub/s)':>16} {'snapshot (pub/s)':>17} {'speedup':>8}"
+        )
+        for subscribers in SUBSCRIBER_COUNTS:
+            publishes = max(500, 50000 // subscribers)
+            old_bus = make_bus(SortingEventBus, subscribers)
+            new_bus = make_bus(TypeSafeEventBus, subscribers)
+            try:
+                old_rate = publishes_per_second(old_bus, event, publishes)
+                new_rate = publishes_per_second(new_bus, event, publishes)
+            finally:
+                old_bus.shutdown()
+                new_bus.shutdown()
+
+            print(
+                f"{subscribers:>11} {old_rate:>16,.0f} {new_rate:>17,.0f} "
+                f"{new_rate / old_rate:>7.1f}x"
+            )
+            assert new_rate > old_rate * 0.9
+
+    def test_coalesced_drag_burst(self):
+        """A 60-frame drag producing 50 position updates per frame."""
+        bus = make_bus(TypeSafeEventBus, 10)
+        bus.enable_coalescing("arrow.positioned", key=lambda e: e.arrow_color)
+        delivered = []
+        bus.subscribe("arrow.positioned", lambda e: delivered.append(e))
+        try:
+            start = time.perf_counter()
+            for frame in range(60):
+                for step in range(50):
+                    bus.publish(
+                        ArrowEvent(
+                            arrow_color="blue",
+                            operation="positioned",
+                            position_data={"x": frame * 50 + step},
+                        )
+                    )
+                bus.flush_coalesced()
+            elapsed = time.perf_counter() - start
+        finally:
+            bus.shutdown()
+
+        print(
+            f"\nCoalesced drag: 3000 publishes -> {len(delivered)} deliveries "
+            f"in {elapsed * 1000:.1f} ms"
+        )
+        assert len(delivered) == 60
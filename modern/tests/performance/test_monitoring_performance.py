@@ -0,0 +1,122 @@
+"""
+Monitoring Overhead Benchmarks
+
+Measures the per-call overhead that monitor_performance adds to a trivial
+function under each sampling configuration, against the original decorator
+that read RSS through a new psutil.Process twice per call and recorded every
+call under the monitor lock.
+"""
+
+import gc
+import sys
+import time
+from functools import wraps
+from pathlib import Path
+
+import psutil
+import pytest
+
+# Add src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from core.monitoring import (
+    MemoryMode,
+    SamplingMode,
+    configure_sampling,
+    monitor_performance,
+    performance_monitor,
+)
+
+CALLS = 20000
+
+
+def original_monitor_performance(operation_name):
+    """The original decorator, recording synchronously on every call."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+            start_memory = psutil.Process().memory_info().rss / 1024 / 1024
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end_time = time.perf_counter()
+                end_memory = psutil.Process().memory_info().rss / 1024 / 1024
+                performance_monitor.record_metric(
+                    operation=operation_name,
+                    duration_ms=(end_time - start_time) * 1000,
+                    memory_mb=abs(end_memory - start_memory),
+                    context={
+                        "function": func.__name__,
+                        "args_count": len(args),
+                        "kwargs_count": len(kwargs) if kwargs else 0,
+                    },
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def hot_path(value):
+    return value + 1
+
+
+def ns_per_call(func, calls=CALLS):
+    gc.collect()
+    start = time.perf_counter()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+@pytest.mark.slow
+class TestMonitoringOverhead:
+    """Per-call cost of monitor_performance under each sampling policy."""
+
+    def test_sampling_overhead(self):
+        original_policy = performance_monitor.sampling
+        configurations = [
+            ("off", dict(mode=SamplingMode.OFF)),
+            (
+                "every 100th, no memory",
+                dict(
+                    mode=SamplingMode.EVERY_NTH,
+                    every_n=100,
+                    memory_mode=MemoryMode.NONE,
+                ),
+            ),
+            (
+                "every 100th, tracemalloc",
+                dict(
+                    mode=SamplingMode.EVERY_NTH,
+                    every_n=100,
+                    memory_mode=MemoryMode.TRACEMALLOC,
+                ),
+            ),
+            ("all, no memory", dict(mode=SamplingMode.ALL, memory_mode=MemoryMode.NONE)),
+            ("all, rss", dict(mode=SamplingMode.ALL, memory_mode=MemoryMode.RSS)),
+        ]
+
+        try:
+            baseline = ns_per_call(hot_path)
+            original = ns_per_call(
+                original_monitor_performance("bench_original")(hot_path), calls=2000
+            )
+            print(f"\n{'configuration':<26} {'overhead (ns/call)':>19}")
+            print(f"{'original decorator':<26} {original - baseline:>19,.0f}")
+
+            results = {}
+            for label, settings in configurations:
+                configure_sampling(**settings)
+                decorated = monitor_performance("bench_sampled")(hot_path)
+                results[label] = ns_per_call(decorated) - baseline
+                print(f"{label:<26} {results[label]:>19,.0f}")
+        finally:
+            performance_monitor.sampling = original_policy
+            performance_monitor.clear_metrics()
+
+        assert results["off"] < (original - baseline) / 20
+        assert results["all, rss"] < original - baseline
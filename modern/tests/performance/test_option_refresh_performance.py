@@ -0,0 +1,82 @@
+"""
+Option Refresh Benchmarks
+
+Replays a run of option clicks (each click appends the chosen option to the
+sequence and refreshes the option list) and reports the click to refreshed
+options latency for a position service rebuilt on every refresh, as
+BeatDataLoader.load_motion_combinations used to do, and for the shared
+option provider with background prefetch.
+"""
+
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from application.services.positioning.option_provider import OptionProvider
+from application.services.positioning.position_matching_service import (
+    PositionMatchingService,
+)
+from domain.models.core_models import SequenceData
+from presentation.components.option_picker.beat_data_loader import BeatDataLoader
+
+CLICKS = 16
+
+
+def click_through(refresh, first_options):
+    """Click CLICKS options in turn; return the per-click latencies in ms."""
+    sequence = SequenceData.empty()
+    options = first_options
+    latencies = []
+    for click in range(CLICKS):
+        choice = options[(click * 7) % len(options)]
+        start = time.perf_counter()
+        sequence = sequence.add_beat(choice)
+        options = refresh(sequence)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+@pytest.mark.slow
+class TestOptionRefreshPerformance:
+    """Click to refreshed options latency, rebuilt service vs shared provider."""
+
+    def test_click_to_options_refreshed(self):
+        first_options = PositionMatchingService().get_next_options("alpha1")
+
+        def rebuilt_refresh(sequence):
+            loader = BeatDataLoader(OptionProvider(PositionMatchingService()))
+            return loader.refresh_options_from_modern_sequence(sequence)
+
+        provider = OptionProvider()
+        loader = BeatDataLoader(provider)
+
+        def shared_refresh(sequence):
+            options = loader.refresh_options_from_modern_sequence(sequence)
+            # The user takes far longer than one prefetch to pick the next option
+            provider.prefetch([]).result()
+            return options
+
+        rebuilt = click_through(rebuilt_refresh, first_options)
+        shared = click_through(shared_refresh, first_options)
+        stats = provider.stats()
+        provider.shutdown()
+
+        print(f"\n{CLICKS} clicks, click -> options refreshed")
+        for name, latencies in (("rebuilt", rebuilt), ("shared", shared)):
+            print(
+                f"  {name:<8} median {statistics.median(latencies):>8.2f} ms "
+                f"max {max(latencies):>8.2f} ms"
+            )
+        print(
+            f"  provider: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['size']} positions cached"
+        )
+
+        assert statistics.median(shared) < statistics.median(rebuilt)
@@ -0,0 +1,103 @@
+"""
+Pictograph Tile Cache Benchmarks
+
+Refreshes an option picker's worth of pictograph views (every option from
+alpha1 at 160 px) and reports the time per refresh for the live scene path
+the views used before, for tiles already in memory, and for a new session
+that loads its tiles from disk.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+
+from application.services.positioning.position_matching_service import (
+    PositionMatchingService,
+)
+from presentation.components.pictograph.pictograph_component import (
+    PictographComponent,
+)
+from presentation.components.pictograph.pictograph_tile_cache import (
+    PictographTileCache,
+)
+
+VIEW_SIZE = 160
+REFRESHES = 3
+
+
+@pytest.fixture(scope="module")
+def option_sheet():
+    return PositionMatchingService().get_next_options("alpha1")
+
+
+def create_views(count, cache=None):
+    views = []
+    for _ in range(count):
+        view = PictographComponent()
+        if cache is not None:
+            view.enable_tile_cache(cache)
+        view.resize(VIEW_SIZE, VIEW_SIZE)
+        # Away from the cursor, so no view switches to live hover rendering
+        view.move(VIEW_SIZE, VIEW_SIZE)
+        view.show()
+        views.append(view)
+    return views
+
+
+def refresh(views, options, app):
+    start = time.perf_counter()
+    for _ in range(REFRESHES):
+        for view, option in zip(views, options):
+            view.update_from_beat(option)
+            view.viewport().repaint()
+        app.processEvents()
+    return (time.perf_counter() - start) / REFRESHES
+
+
+@pytest.mark.slow
+class TestPictographTileCachePerformance:
+    """Option sheet refresh time for live scenes and cached tiles."""
+
+    def test_option_sheet_refresh(self, qapp, option_sheet, tmp_path):
+        count = len(option_sheet)
+        print(f"\nOption sheet: {count} pictographs at {VIEW_SIZE}px")
+
+        live_views = create_views(count)
+        live = refresh(live_views, option_sheet, qapp)
+
+        cache = PictographTileCache(cache_dir=tmp_path)
+        tiled_views = create_views(count, cache)
+        start = time.perf_counter()
+        for view, option in zip(tiled_views, option_sheet):
+            view.update_from_beat(option)
+        cold = time.perf_counter() - start
+        warm = refresh(tiled_views, option_sheet, qapp)
+        stats = cache.stats()
+
+        next_session = PictographTileCache(cache_dir=tmp_path)
+        disk_views = create_views(count, next_session)
+        start = time.perf_counter()
+        for view, option in zip(disk_views, option_sheet):
+            view.update_from_beat(option)
+        from_disk = time.perf_counter() - start
+
+        print(f"  live scene       {live * 1000:>8.1f} ms/refresh")
+        print(f"  first render     {cold * 1000:>8.1f} ms (tiles rendered and saved)")
+        print(f"  memory tiles     {warm * 1000:>8.1f} ms/refresh")
+        print(f"  next session     {from_disk * 1000:>8.1f} ms (tiles read from disk)")
+        print(
+            f"  {stats['tiles']} tiles, {stats['memory_bytes'] / 1024:.0f} KiB, "
+            f"{next_session.stats()['disk_hits']} disk hits"
+        )
+
+        for view in live_views + tiled_views + disk_views:
+            view.cleanup()
+        assert warm < live
+        assert from_disk < cold
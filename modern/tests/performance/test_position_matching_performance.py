@@ -0,0 +1,82 @@
+"""
+Position Matching Performance Benchmarks
+
+Compares per-call latency of PositionMatchingService.get_next_options against
+the original linear scan (every item in every letter group, converted to
+BeatData with glyph data on each call) for all 16 gamma and 8 alpha/beta
+start positions.
+"""
+
+import gc
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from application.services.positioning.position_matching_service import (
+    PositionMatchingService,
+)
+
+POSITIONS = (
+    [f"alpha{i}" for i in range(1, 9)]
+    + [f"beta{i}" for i in range(1, 9)]
+    + [f"gamma{i}" for i in range(1, 17)]
+)
+
+
+def linear_scan_next_options(service, start_pos):
+    """The pre-index algorithm: scan the whole dataset and convert each match."""
+    next_opts = []
+    for group in service.pictograph_dataset.values():
+        for item in group:
+            if item.get("start_pos") == start_pos:
+                next_opts.append(service._convert_dict_to_beat_data(item))
+    return next_opts
+
+
+def time_per_call(func, position, iterations):
+    """Return the mean latency of func(position) in microseconds."""
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(position)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+@pytest.mark.slow
+class TestPositionMatchingPerformance:
+    """Per-call latency of get_next_options before and after indexing."""
+
+    def test_indexed_lookup_latency(self):
+        service = PositionMatchingService()
+
+        print(f"\n{'position':<10} {'scan (us)':>12} {'index (us)':>12} {'speedup':>9}")
+        total_scan = total_index = 0.0
+        for position in POSITIONS:
+            scan_us = time_per_call(
+                lambda p: linear_scan_next_options(service, p), position, 3
+            )
+            index_us = time_per_call(service.get_next_options, position, 2000)
+            total_scan += scan_us
+            total_index += index_us
+            print(
+                f"{position:<10} {scan_us:>12.1f} {index_us:>12.2f} "
+                f"{scan_us / index_us:>8.0f}x"
+            )
+
+            assert len(service.get_next_options(position)) == len(
+                linear_scan_next_options(service, position)
+            )
+
+        print(
+            f"{'mean':<10} {total_scan / len(POSITIONS):>12.1f} "
+            f"{total_index / len(POSITIONS):>12.2f}"
+        )
+
+        # A lookup is one dict access plus a tuple copy
+        assert total_index / len(POSITIONS) < 100, "Indexed lookup too slow"
@@ -0,0 +1,136 @@
+"""
+Positioning Service Startup and Memory Benchmarks
+
+Builds the pictograph scenes of a full option picker plus a beat frame and
+reports placement table loads, construction time and the bytes kept alive by
+the positioning stack. The per-scene path replicates the original behaviour,
+where every scene constructed its own ArrowManagementService and
+PropManagementService, each loading its own placement tables. The shared path
+resolves one DI-managed instance of each for every scene.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+
+from core.dependency_injection import di_container
+from core.dependency_injection.di_container import DIContainer
+from application.services.positioning.arrow_management_service import (
+    ArrowManagementService,
+)
+from application.services.positioning.default_placement_service import (
+    DefaultPlacementService,
+)
+from application.services.positioning.prop_management_service import (
+    PropManagementService,
+)
+from application.services.positioning.special_placement_service import (
+    SpecialPlacementService,
+)
+from presentation.components.pictograph.pictograph_scene import PictographScene
+
+# Option picker pool plus a 16-beat frame with its start position
+SCENE_COUNT = 36 + 17
+
+LOADERS = [
+    (DefaultPlacementService, "_load_all_default_placements"),
+    (SpecialPlacementService, "_load_special_placements"),
+    (PropManagementService, "_load_special_placements"),
+]
+SHARED_TABLES = [
+    (DefaultPlacementService, "_shared_defaults"),
+    (SpecialPlacementService, "_shared_placements"),
+    (PropManagementService, "_shared_special_placements"),
+]
+
+
+@pytest.fixture
+def load_counter(monkeypatch):
+    """Count placement table loads across all positioning services."""
+    loads = []
+    for owner, name in LOADERS:
+        original = getattr(owner, name)
+
+        def counting_load(self, _original=original):
+            loads.append(1)
+            return _original(self)
+
+        monkeypatch.setattr(owner, name, counting_load)
+    for owner, name in SHARED_TABLES:
+        monkeypatch.setattr(owner, name, None)
+    monkeypatch.setattr(di_container, "_container", DIContainer())
+    return loads
+
+
+def per_scene_services():
+    """Original behaviour: a scene-private service stack with its own tables."""
+    for owner, name in SHARED_TABLES:
+        setattr(owner, name, None)
+    return {
+        "arrow_service": ArrowManagementService(),
+        "prop_service": PropManagementService(),
+    }
+
+
+def build_scenes(shared):
+    scenes = []
+    for _ in range(SCENE_COUNT):
+        services = {} if shared else per_scene_services()
+        scenes.append(PictographScene(**services))
+    return scenes
+
+
+def measure(build):
+    """Return (result, seconds, bytes still allocated by build())."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        start = time.perf_counter()
+        result = build()
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return result, elapsed, allocated
+
+
+@pytest.mark.slow
+class TestPositioningServicesPerformance:
+    """Placement loads and resident bytes for per-scene and shared services."""
+
+    def test_scene_startup(self, qapp, load_counter):
+        # Warm the dataset snapshot so both paths start from parsed JSON
+        DefaultPlacementService()
+
+        results = {}
+        for shared in (False, True):
+            for owner, name in SHARED_TABLES:
+                setattr(owner, name, None)
+            load_counter.clear()
+            scenes, elapsed, allocated = measure(lambda: build_scenes(shared))
+            results[shared] = (len(load_counter), elapsed, allocated)
+            arrow_services = {id(scene.arrow_service) for scene in scenes}
+            del scenes
+
+            name = "shared" if shared else "per-scene"
+            print(
+                f"\n  {name:<9} {len(load_counter):>4} table loads "
+                f"{len(arrow_services):>4} arrow services "
+                f"{elapsed * 1000:>8.1f} ms {allocated / 1024:>9.1f} KiB"
+            )
+
+        print(f"  {SCENE_COUNT} scenes")
+        assert results[True][0] < results[False][0]
+        assert results[True][2] < results[False][2]
@@ -0,0 +1,126 @@
+"""
+Sequence Edit Performance Benchmarks
+
+Compares beat edits on SequenceData's persistent BeatVector against the
+original list-copy-and-renumber algorithm, for edit latency and for the
+memory held by a 100-step undo history.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from domain.models.core_models import BeatData, SequenceData
+
+LENGTHS = (64, 1024, 8192)
+HISTORY_STEPS = 100
+
+
+def make_sequence(length):
+    return SequenceData(
+        beats=[BeatData(letter="A", beat_number=i + 1) for i in range(length)]
+    )
+
+
+def list_remove(beats, index):
+    """The original remove: copy the list and renumber every later beat."""
+    new_beats = list(beats)
+    new_beats.pop(index)
+    for i in range(index, len(new_beats)):
+        new_beats[i] = new_beats[i].update(beat_number=i + 1)
+    return new_beats
+
+
+def list_update(beats, index, **kwargs):
+    """The original update: rebuild the list with one beat replaced."""
+    return [
+        beat.update(**kwargs) if i == index else beat for i, beat in enumerate(beats)
+    ]
+
+
+def time_per_call(func, iterations):
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def retained_bytes(build):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        history = build()
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del history
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+@pytest.mark.slow
+class TestSequenceEditPerformance:
+    """Edit latency and undo-history memory for list and vector beats."""
+
+    def test_edit_latency(self):
+        print(
+            f"\n{'beats':>6} {'edit':<7} {'list (us)':>11} {'vector (us)':>12} {'speedup':>8}"
+        )
+        for length in LENGTHS:
+            sequence = make_sequence(length)
+            beats = list(sequence.beats)
+            iterations = max(5, 20000 // length)
+
+            cases = {
+                "remove": (
+                    lambda: list_remove(beats, 0),
+                    lambda: sequence.remove_beat(1),
+                ),
+                "update": (
+                    lambda: list_update(beats, length // 2, letter="B"),
+                    lambda: sequence.update_beat(length // 2 + 1, letter="B"),
+                ),
+            }
+            for name, (old, new) in cases.items():
+                old_us = time_per_call(old, iterations)
+                new_us = time_per_call(new, iterations)
+                print(
+                    f"{length:>6} {name:<7} {old_us:>11.1f} {new_us:>12.1f} "
+                    f"{old_us / new_us:>7.1f}x"
+                )
+                if length >= 1024:
+                    assert new_us < old_us
+
+    def test_undo_history_memory(self):
+        length = 1024
+        sequence = make_sequence(length)
+
+        def list_history():
+            history = [list(sequence.beats)]
+            for step in range(HISTORY_STEPS):
+                history.append(list_update(history[-1], step, letter="B"))
+            return history
+
+        def vector_history():
+            history = [sequence]
+            for step in range(HISTORY_STEPS):
+                history.append(history[-1].update_beat(step + 1, letter="B"))
+            return history
+
+        old_bytes = retained_bytes(list_history)
+        new_bytes = retained_bytes(vector_history)
+        print(
+            f"\n{HISTORY_STEPS}-step undo history of a {length}-beat sequence: "
+            f"list {old_bytes / 1024:.0f} KiB, vector {new_bytes / 1024:.0f} KiB"
+        )
+        assert new_bytes < old_bytes
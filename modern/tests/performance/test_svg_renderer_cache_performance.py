@@ -0,0 +1,72 @@
+"""
+SVG Renderer Cache Benchmarks
+
+Redraws a full option sheet (every option from alpha1) into a pool of
+pictograph scenes and reports the redraw time, renderer hits and misses.
+The uncached run uses a zero-capacity cache, which reproduces the original
+read, recolor and parse of every SVG on every draw.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+
+from application.services.positioning.position_matching_service import (
+    PositionMatchingService,
+)
+from presentation.components.pictograph.pictograph_scene import PictographScene
+from presentation.components.pictograph.svg_renderer_cache import SvgRendererCache
+
+REDRAWS = 3
+
+
+@pytest.fixture(scope="module")
+def option_sheet():
+    return PositionMatchingService().get_next_options("alpha1")
+
+
+def redraw_sheet(scenes, options):
+    start = time.perf_counter()
+    for _ in range(REDRAWS):
+        for scene, option in zip(scenes, options):
+            scene.update_beat(option)
+    return (time.perf_counter() - start) / REDRAWS
+
+
+@pytest.mark.slow
+class TestSvgRendererCachePerformance:
+    """Option sheet redraw time with and without the renderer cache."""
+
+    def test_option_sheet_redraw(self, qapp, option_sheet, monkeypatch):
+        scenes = [PictographScene() for _ in option_sheet]
+        print(f"\nOption sheet: {len(option_sheet)} pictographs, {REDRAWS} redraws")
+
+        results = {}
+        for cached in (False, True):
+            cache = SvgRendererCache(max_size=256 if cached else 0)
+            monkeypatch.setattr(SvgRendererCache, "_shared", cache)
+            for scene in scenes:
+                scene.arrow_renderer.renderer_cache = cache
+                scene.prop_renderer.renderer_cache = cache
+            # First draw fills the cache; measure the steady-state redraws
+            redraw_sheet(scenes, option_sheet)
+            cache.hits = cache.misses = 0
+
+            results[cached] = redraw_sheet(scenes, option_sheet)
+            stats = cache.stats()
+            name = "cached" if cached else "uncached"
+            print(
+                f"  {name:<9} {results[cached] * 1000:>8.1f} ms/sheet "
+                f"{stats['hits']:>6} hits {stats['misses']:>6} misses "
+                f"{stats['size']:>4} renderers"
+            )
+
+        print(f"  speedup   {results[False] / results[True]:>8.1f}x")
+        assert results[True] < results[False]
@@ -0,0 +1,177 @@
+"""
+Unit tests for the beat frame layout engine
+
+Tests that beat frame layouts come from the layout table files with the
+overrides applied, and that the resizer caches its widget lookups until the
+widget tree changes.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtWidgets import QScrollArea, QWidget
+
+from application.services.layout import beat_layout_calculator
+from application.services.layout.beat_layout_calculator import (
+    BeatLayoutCalculator,
+    layout_for_beat_count,
+    reload_layout_table,
+)
+from application.services.layout.beat_resizer_service import BeatResizerService
+from domain.models.core_models import BeatData, SequenceData
+from infrastructure.data_path_handler import DataPathHandler
+
+
+@pytest.fixture
+def layout_files(tmp_path, monkeypatch):
+    (tmp_path / "default_layouts.json").write_text(
+        json.dumps({"0": [1, 0], "4": [1, 4], "12": [4, 3]})
+    )
+    (tmp_path / "beat_layout_overrides.json").write_text(json.dumps({"12": [3, 4]}))
+    monkeypatch.setattr(DataPathHandler(), "_data_dir", tmp_path)
+    reload_layout_table()
+    yield tmp_path
+    monkeypatch.undo()
+    reload_layout_table()
+
+
+def make_sequence(beat_count):
+    return SequenceData(
+        beats=[BeatData(beat_number=i + 1, letter="A") for i in range(beat_count)]
+    )
+
+
+class TestBeatLayoutTable:
+    """Test suite for the layout table."""
+
+    def test_repo_layouts_are_loaded(self):
+        reload_layout_table()
+
+        assert layout_for_beat_count(0) == (1, 0)
+        assert layout_for_beat_count(64) == (16, 4)
+
+    def test_overrides_apply_over_defaults(self, layout_files):
+        calculator = BeatLayoutCalculator()
+
+        layout = calculator.calculate_beat_frame_layout(make_sequence(12), (800, 600))
+
+        assert layout == {"rows": 3, "columns": 4}
+        assert layout_for_beat_count(4) == (1, 4)
+
+    def test_counts_beyond_the_table(self, layout_files):
+        assert layout_for_beat_count(70) == (18, 4)
+        assert layout_for_beat_count(5) == (1, 5)
+
+    def test_table_is_read_once(self, layout_files, monkeypatch):
+        reads = []
+        read_layouts = beat_layout_calculator._read_layouts
+        monkeypatch.setattr(
+            beat_layout_calculator,
+            "_read_layouts",
+            lambda path: reads.append(path) or read_layouts(path),
+        )
+        calculator = BeatLayoutCalculator()
+
+        for width in range(600, 1200, 50):
+            for beat_count in (4, 12, 70):
+                calculator.calculate_beat_frame_layout(
+                    make_sequence(beat_count), (width, 600)
+                )
+
+        assert len(reads) == 2
+
+    def test_invalid_overrides_are_ignored(self, layout_files):
+        (layout_files / "beat_layout_overrides.json").write_text("{not json")
+        reload_layout_table()
+
+        assert layout_for_beat_count(12) == (4, 3)
+
+
+class TestBeatResizerWidgetCache:
+    """Test suite for the resizer's cached widget references."""
+
+    def make_tree(self):
+        main_widget = QWidget()
+        main_widget.resize(1600, 900)
+        scroll_area = QScrollArea(main_widget)
+        beat_frame = QWidget(scroll_area)
+        return main_widget, scroll_area, beat_frame
+
+    def test_references_are_looked_up_once(self, qapp):
+        main_widget, scroll_area, beat_frame = self.make_tree()
+        graph_editor = QWidget(main_widget)
+        graph_editor.setObjectName("graph_editor")
+        graph_editor.resize(100, 250)
+        resizer = BeatResizerService()
+        lookups = []
+        find_child = main_widget.findChild
+        main_widget.findChild = lambda *args: lookups.append(args) or find_child(*args)
+
+        first = resizer.calculate_dimensions(beat_frame)
+        for _ in range(10):
+            assert resizer.calculate_dimensions(beat_frame) == first
+
+        assert first[1] == 900 - 200
+        assert len(lookups) == 2
+        assert resizer._find_scroll_area_parent(beat_frame) is scroll_area
+        assert resizer._named_children == {
+            "button_panel": None,
+            "graph_editor": graph_editor,
+        }
+
+    def test_structural_change_invalidates_references(self, qapp):
+        main_widget, scroll_area, beat_frame = self.make_tree()
+        resizer = BeatResizerService()
+        resizer.calculate_dimensions(beat_frame)
+        assert resizer._named_children["graph_editor"] is None
+
+        graph_editor = QWidget(main_widget)
+        graph_editor.setObjectName("graph_editor")
+        graph_editor.resize(100, 250)
+        QCoreApplication.sendPostedEvents()
+
+        assert resizer._named_children == {}
+        assert resizer.calculate_dimensions(beat_frame)[1] == 900 - 200
+
+    def test_reparenting_invalidates_references(self, qapp):
+        main_widget, scroll_area, beat_frame = self.make_tree()
+        resizer = BeatResizerService()
+        assert resizer._find_scroll_area_parent(beat_frame) is scroll_area
+
+        beat_frame.setParent(main_widget)
+
+        assert resizer._find_scroll_area_parent(beat_frame) is None
+
+    def test_beats_already_sized_are_skipped(self, qapp):
+        main_widget, scroll_area, beat_frame = self.make_tree()
+        beat_frame._beat_views = [QWidget(beat_frame) for _ in range(4)]
+        resizer = BeatResizerService()
+        resizer.resize_beats(beat_frame, 120)
+        sized = []
+        for view in beat_frame._beat_views:
+            view.setFixedSize = lambda *args, view=view: sized.append(view)
+
+        resizer.resize_beats(beat_frame, 120)
+        assert sized == []
+
+        resizer.resize_beats(beat_frame, 100)
+        assert sized == beat_frame._beat_views
+
+    def test_geometry_is_applied_in_one_batch(self, qapp):
+        main_widget, scroll_area, beat_frame = self.make_tree()
+        resizer = BeatResizerService()
+
+        with resizer.batch_geometry(beat_frame):
+            with resizer.batch_geometry(beat_frame):
+                assert not beat_frame.updatesEnabled()
+            assert not beat_frame.updatesEnabled()
+
+        assert beat_frame.updatesEnabled()
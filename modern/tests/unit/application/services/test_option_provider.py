@@ -0,0 +1,123 @@
+"""
+Unit tests for OptionProvider
+
+Tests that next options come from one long-lived position service, that
+they are cached per end position, that prefetching warms the positions the
+shown options lead to, and that BeatDataLoader refreshes through the
+shared provider.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from core.dependency_injection import di_container
+from core.dependency_injection.di_container import DIContainer
+from application.services.positioning.option_provider import (
+    IOptionProvider,
+    OptionProvider,
+)
+from application.services.positioning.position_matching_service import (
+    PositionMatchingService,
+)
+from application.services.positioning.shared_positioning import get_option_provider
+from domain.models.core_models import SequenceData
+
+
+@pytest.fixture(scope="module")
+def position_service():
+    return PositionMatchingService()
+
+
+@pytest.fixture
+def provider(position_service):
+    provider = OptionProvider(position_service)
+    yield provider
+    provider.shutdown()
+
+
+class TestOptionProvider:
+    """Test suite for cached next-option lookups."""
+
+    def test_options_match_position_service(self, provider, position_service):
+        assert provider.get_options("alpha1") == position_service.get_next_options(
+            "alpha1"
+        )
+        assert provider.get_options("gamma11") == position_service.get_next_options(
+            "gamma11"
+        )
+
+    def test_options_cached_per_end_position(self, provider):
+        first = provider.get_options("beta5")
+        second = provider.get_options("beta5")
+
+        assert second == first and second is not first
+        assert provider.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_prefetch_following_warms_reachable_positions(self, provider):
+        options = provider.get_options("alpha1")
+        reachable = {option.metadata["end_pos"] for option in options}
+
+        provider.prefetch_following(options).result(timeout=30)
+        for end_pos in reachable:
+            provider.get_options(end_pos)
+
+        assert provider.stats()["hits"] == len(reachable)
+
+    def test_service_created_once_in_background(self, monkeypatch):
+        created = []
+        original_init = PositionMatchingService.__init__
+
+        def counting_init(self):
+            created.append(1)
+            original_init(self)
+
+        monkeypatch.setattr(PositionMatchingService, "__init__", counting_init)
+        provider = OptionProvider()
+        provider.warm_up().result(timeout=60)
+        provider.get_options("alpha1")
+        provider.get_options("alpha3")
+        provider.shutdown()
+
+        assert len(created) == 1
+
+    def test_shared_provider_registered(self, monkeypatch):
+        container = DIContainer()
+        monkeypatch.setattr(di_container, "_container", container)
+
+        provider = get_option_provider()
+
+        assert get_option_provider() is provider
+        assert container.resolve(IOptionProvider) is provider
+
+
+class TestBeatDataLoaderRefresh:
+    """Test suite for BeatDataLoader refreshing through the provider."""
+
+    def test_refresh_does_not_rebuild_position_service(
+        self, provider, monkeypatch
+    ):
+        from presentation.components.option_picker.beat_data_loader import (
+            BeatDataLoader,
+        )
+
+        loader = BeatDataLoader(provider)
+        monkeypatch.setattr(
+            PositionMatchingService,
+            "__init__",
+            lambda self: pytest.fail("position service rebuilt"),
+        )
+        start = provider.get_options("alpha1")[0]
+        sequence = SequenceData.empty().add_beat(start)
+
+        options = loader.refresh_options_from_modern_sequence(sequence)
+        legacy_options = loader.load_motion_combinations(
+            [{"metadata": "sequence_info"}, {"end_pos": "alpha1"}]
+        )
+
+        assert options == provider.get_options(start.metadata["end_pos"])
+        assert legacy_options == provider.get_options("alpha1")
@@ -0,0 +1,92 @@
+"""
+Unit tests for PictographDatasetEngine
+
+Tests that vectorized code-column queries agree with plain pandas filtering of
+the Diamond/Box CSVs.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from domain.models.core_models import MotionType
+from infrastructure.data_path_handler import DataPathHandler
+from application.services.data.pictograph_dataset_engine import (
+    MISSING_CODE,
+    PictographDatasetEngine,
+)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return PictographDatasetEngine()
+
+
+@pytest.fixture(scope="module")
+def combined_df():
+    handler = DataPathHandler()
+    return pd.concat(
+        [
+            handler.load_diamond_dataset().assign(grid_mode="diamond"),
+            handler.load_box_dataset().assign(grid_mode="box"),
+        ],
+        ignore_index=True,
+    )
+
+
+class TestPictographDatasetEngine:
+    """Test suite for PictographDatasetEngine."""
+
+    def test_engine_is_shared(self, engine):
+        assert PictographDatasetEngine() is engine
+
+    def test_loads_both_grid_modes(self, engine, combined_df):
+        assert engine.size == len(combined_df)
+        assert len(engine.query(grid_mode="diamond")) > 0
+        assert len(engine.query(grid_mode="box")) > 0
+
+    def test_enum_columns_fully_encoded(self, engine):
+        for column in ("blue_motion_type", "red_prop_rot_dir", "blue_start_loc"):
+            assert (engine.column(column) != MISSING_CODE).all()
+
+    def test_columns_are_read_only(self, engine):
+        with pytest.raises(ValueError):
+            engine.column("letter")[0] = 0
+
+    @pytest.mark.parametrize(
+        "criteria",
+        [
+            {"letter": "A"},
+            {"start_pos": "alpha1", "grid_mode": "diamond"},
+            {"end_pos": "gamma12", "grid_mode": "box"},
+            {"letter": "Φ-", "start_pos": "beta5"},
+            {"blue_motion_type": "pro", "red_motion_type": "anti"},
+        ],
+    )
+    def test_query_matches_pandas_filter(self, engine, combined_df, criteria):
+        expected = combined_df
+        for column, value in criteria.items():
+            expected = expected[expected[column] == value]
+
+        assert engine.query(**criteria).tolist() == expected.index.tolist()
+
+    def test_motion_type_pair_accepts_enums(self, engine):
+        by_enum = engine.query_motion_types(MotionType.DASH, MotionType.STATIC)
+        by_value = engine.query(blue_motion_type="dash", red_motion_type="static")
+        assert by_enum.tolist() == by_value.tolist()
+        assert len(by_enum) > 0
+
+    def test_unknown_value_matches_nothing(self, engine):
+        assert len(engine.query(letter="not_a_letter")) == 0
+
+    def test_records_match_csv_rows(self, engine, combined_df):
+        rows = engine.query(letter="C", grid_mode="box")
+        records = engine.records(rows)
+        expected = combined_df.loc[rows].to_dict("records")
+        assert [dict(record) for record in records] == expected
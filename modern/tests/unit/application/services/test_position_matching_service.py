@@ -0,0 +1,83 @@
+"""
+Unit tests for PositionMatchingService
+
+Tests that the precomputed (grid_mode, start_pos) index returns exactly what the
+original linear dataset scan returned.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from application.services.positioning.position_matching_service import (
+    PositionMatchingService,
+)
+
+
+@pytest.fixture(scope="module")
+def service():
+    return PositionMatchingService()
+
+
+def _linear_scan(service, start_pos, grid_mode):
+    """Reference implementation: the original scan over every letter group."""
+    return [
+        item
+        for group in service.pictograph_dataset.values()
+        for item in group
+        if item.get("start_pos") == start_pos and item.get("grid_mode") == grid_mode
+    ]
+
+
+class TestPositionMatchingIndex:
+    """Test suite for the start-position index."""
+
+    def test_all_positions_indexed(self, service):
+        positions = service.get_available_start_positions()
+        assert len([p for p in positions if p.startswith("alpha")]) == 8
+        assert len([p for p in positions if p.startswith("beta")]) == 8
+        assert len([p for p in positions if p.startswith("gamma")]) == 16
+
+    def test_index_matches_linear_scan(self, service):
+        for start_pos in service.get_available_start_positions():
+            for grid_mode in service.GRID_MODES:
+                expected = _linear_scan(service, start_pos, grid_mode)
+                options = service.get_next_options(start_pos, grid_mode)
+
+                assert [o.letter for o in options] == [i["letter"] for i in expected]
+                assert [o.metadata["end_pos"] for o in options] == [
+                    i["end_pos"] for i in expected
+                ]
+                assert all(o.glyph_data is not None for o in options)
+
+    def test_grid_mode_inferred_from_position(self, service):
+        assert service.get_next_options("alpha1") == service.get_next_options(
+            "alpha1", "diamond"
+        )
+        assert service.get_next_options("alpha2") == service.get_next_options(
+            "alpha2", "box"
+        )
+        assert len(service.get_next_options("alpha2")) > 0
+
+    def test_lookup_returns_fresh_list(self, service):
+        options = service.get_next_options("alpha1")
+        options.clear()
+        assert len(service.get_next_options("alpha1")) > 0
+
+    def test_unknown_position_returns_empty(self, service):
+        assert service.get_next_options("not_a_position") == []
+
+    def test_rows_without_start_position_are_skipped(self, service):
+        records = [
+            {"letter": "A", "grid_mode": "diamond", "start_pos": None},
+            {"letter": "A", "grid_mode": "diamond", "start_pos": "alpha1"},
+        ]
+
+        grouped = service._convert_records_to_grouped_dict(records)
+
+        assert [item["start_pos"] for item in grouped["A"]] == ["alpha1"]
+        assert "None" not in service.get_available_start_positions()
@@ -0,0 +1,113 @@
+"""
+Unit tests for the shared positioning services
+
+Tests that every pictograph scene positions arrows and props with the same
+DI-managed services, and that placement tables are loaded once per process.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+
+from core.dependency_injection import di_container
+from core.dependency_injection.di_container import DIContainer
+from application.services.positioning.arrow_management_service import (
+    ArrowManagementService,
+    IArrowManagementService,
+)
+from application.services.positioning.default_placement_service import (
+    DefaultPlacementService,
+)
+from application.services.positioning.prop_management_service import (
+    IPropManagementService,
+    PropManagementService,
+)
+from application.services.positioning.shared_positioning import (
+    get_arrow_management_service,
+    get_prop_management_service,
+    register_positioning_services,
+)
+from application.services.positioning.special_placement_service import (
+    SpecialPlacementService,
+)
+
+
+@pytest.fixture
+def container(monkeypatch):
+    """A fresh global container, restored after the test."""
+    container = DIContainer()
+    monkeypatch.setattr(di_container, "_container", container)
+    return container
+
+
+class TestSharedPositioningServices:
+    """Test suite for the DI-managed positioning services."""
+
+    def test_services_resolved_once(self, container):
+        arrow_service = get_arrow_management_service()
+        prop_service = get_prop_management_service()
+
+        assert get_arrow_management_service() is arrow_service
+        assert get_prop_management_service() is prop_service
+        assert container.resolve(IArrowManagementService) is arrow_service
+        assert container.resolve(IPropManagementService) is prop_service
+
+    def test_registered_services_are_used(self, container):
+        arrow_service = ArrowManagementService()
+        container.register_instance(IArrowManagementService, arrow_service)
+        register_positioning_services(container)
+
+        assert get_arrow_management_service() is arrow_service
+        assert isinstance(get_prop_management_service(), PropManagementService)
+
+    def test_scenes_share_services(self, qapp, container):
+        from presentation.components.pictograph.pictograph_scene import (
+            PictographScene,
+        )
+
+        first, second = PictographScene(), PictographScene()
+
+        assert first.arrow_renderer.arrow_service is second.arrow_renderer.arrow_service
+        assert (
+            first.prop_renderer.prop_management_service
+            is second.prop_renderer.prop_management_service
+        )
+        assert first.arrow_service is container.resolve(IArrowManagementService)
+
+
+class TestSharedPlacementTables:
+    """Test suite for the process-wide placement tables."""
+
+    def test_instances_share_tables(self):
+        assert (
+            DefaultPlacementService().all_defaults
+            is DefaultPlacementService().all_defaults
+        )
+        assert (
+            SpecialPlacementService().special_placements
+            is SpecialPlacementService().special_placements
+        )
+
+    def test_tables_loaded_once(self, monkeypatch):
+        loads = []
+        load = DefaultPlacementService._load_all_default_placements
+
+        def counting_load(self):
+            loads.append(1)
+            return load(self)
+
+        monkeypatch.setattr(DefaultPlacementService, "_shared_defaults", None)
+        monkeypatch.setattr(
+            DefaultPlacementService, "_load_all_default_placements", counting_load
+        )
+
+        for _ in range(5):
+            ArrowManagementService()
+
+        assert len(loads) == 1
+        assert DefaultPlacementService().all_defaults["diamond"]["pro"]
@@ -0,0 +1,116 @@
+"""
+Unit tests for UIStateManagementService persistence
+
+Tests that state is persisted through the settings store in the background
+and that batch() coalesces setting changes into one write and one event.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from application.services.ui import ui_state_management_service
+from application.services.ui.ui_state_management_service import (
+    UIStateManagementService,
+)
+from core.events.event_bus import get_event_bus
+from infrastructure.settings_store import SettingsStore
+
+
+@pytest.fixture
+def settings_file(tmp_path):
+    return tmp_path / "user_settings.json"
+
+
+@pytest.fixture
+def store(settings_file, monkeypatch):
+    store = SettingsStore(settings_file, write_delay=60)
+    monkeypatch.setattr(
+        ui_state_management_service, "get_settings_store", lambda path: store
+    )
+    return store
+
+
+@pytest.fixture
+def setting_events():
+    events = []
+    event_bus = get_event_bus()
+    subscription_id = event_bus.subscribe(
+        "ui.settings.updated", lambda event: events.append(event)
+    )
+    yield events
+    event_bus.unsubscribe(subscription_id)
+
+
+def read_file(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TestUIStatePersistence:
+    """Test suite for write-behind settings persistence."""
+
+    def test_set_setting_writes_in_background(self, store, settings_file):
+        service = UIStateManagementService()
+
+        service.set_setting("theme", "light")
+
+        assert not settings_file.exists()
+        assert store._timer is not None
+        store.flush()
+        assert read_file(settings_file)["user_settings"] == {"theme": "light"}
+
+    def test_save_state_writes_now(self, store, settings_file):
+        service = UIStateManagementService()
+        service.set_graph_editor_height(420)
+
+        service.save_state()
+
+        assert read_file(settings_file)["graph_editor_height"] == 420
+
+    def test_state_is_loaded_from_store(self, store, settings_file):
+        settings_file.write_text(
+            json.dumps({"user_settings": {"theme": "light"}, "active_tab": "learn"})
+        )
+
+        service = UIStateManagementService()
+
+        assert service.get_setting("theme") == "light"
+        assert service.get_active_tab() == "learn"
+
+    def test_single_setting_event(self, store, setting_events):
+        service = UIStateManagementService()
+
+        service.set_setting("sound_volume", 0.5)
+
+        assert [event.state_data for event in setting_events] == [
+            {"changes": {"sound_volume": 0.5}, "key": "sound_volume", "value": 0.5}
+        ]
+
+    def test_batch_publishes_one_event_and_one_change(self, store, setting_events):
+        service = UIStateManagementService()
+        store_changes = []
+        store.register_observer(store_changes.append)
+
+        with service.batch():
+            for volume in range(10):
+                service.set_setting("sound_volume", volume / 10)
+            with service.batch():
+                service.set_setting("animation_speed", 2.0)
+            assert setting_events == []
+            assert store_changes == []
+
+        assert [event.state_data for event in setting_events] == [
+            {"changes": {"sound_volume": 0.9, "animation_speed": 2.0}}
+        ]
+        assert len(store_changes) == 1
+        assert store.get("user_settings") == {
+            "sound_volume": 0.9,
+            "animation_speed": 2.0,
+        }
@@ -0,0 +1,150 @@
+"""
+Unit tests for TypeSafeEventBus dispatch
+
+Tests priority ordering of the pre-sorted subscriber snapshots, that handlers
+run outside the bus lock, and event coalescing.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from core.events.event_bus import (
+    ArrowEvent,
+    EventPriority,
+    TypeSafeEventBus,
+    UIEvent,
+)
+
+
+@pytest.fixture
+def event_bus():
+    bus = TypeSafeEventBus()
+    yield bus
+    bus.shutdown()
+
+
+def arrow_event(color="blue", x=0):
+    return ArrowEvent(
+        arrow_color=color, operation="positioned", position_data={"x": x}
+    )
+
+
+class TestSnapshotDispatch:
+    def test_handlers_run_in_priority_then_subscription_order(self, event_bus):
+        calls = []
+        event_bus.subscribe(
+            "arrow.positioned", lambda e: calls.append("low"), EventPriority.LOW
+        )
+        event_bus.subscribe("arrow.positioned", lambda e: calls.append("normal-1"))
+        event_bus.subscribe(
+            "arrow.positioned", lambda e: calls.append("high"), EventPriority.HIGH
+        )
+        event_bus.subscribe("arrow.positioned", lambda e: calls.append("normal-2"))
+
+        event_bus.publish(arrow_event())
+
+        assert calls == ["high", "normal-1", "normal-2", "low"]
+
+    def test_unsubscribe_during_dispatch_keeps_current_snapshot(self, event_bus):
+        calls = []
+        second_id = None
+
+        def first(event):
+            calls.append("first")
+            event_bus.unsubscribe(second_id)
+
+        event_bus.subscribe("arrow.positioned", first)
+        second_id = event_bus.subscribe(
+            "arrow.positioned", lambda e: calls.append("second")
+        )
+
+        event_bus.publish(arrow_event())
+        event_bus.publish(arrow_event())
+
+        assert calls == ["first", "second", "first"]
+
+    def test_slow_handler_does_not_block_other_publishers(self, event_bus):
+        entered = threading.Event()
+        release = threading.Event()
+        delivered = []
+
+        def slow_handler(event):
+            entered.set()
+            release.wait(timeout=5)
+
+        event_bus.subscribe("arrow.positioned", slow_handler)
+        event_bus.subscribe("ui.panel.updated", lambda e: delivered.append(e))
+
+        worker = threading.Thread(target=event_bus.publish, args=(arrow_event(),))
+        worker.start()
+        try:
+            assert entered.wait(timeout=5)
+
+            publisher = threading.Thread(
+                target=event_bus.publish,
+                args=(UIEvent(component="panel", action="updated"),),
+            )
+            publisher.start()
+            publisher.join(timeout=2)
+
+            assert not publisher.is_alive()
+            assert len(delivered) == 1
+        finally:
+            release.set()
+            worker.join(timeout=5)
+
+
+class TestCoalescing:
+    def test_latest_event_per_key_is_delivered_on_flush(self, event_bus):
+        delivered = []
+        event_bus.subscribe("arrow.positioned", lambda e: delivered.append(e))
+        event_bus.enable_coalescing("arrow.positioned", key=lambda e: e.arrow_color)
+
+        for x in range(10):
+            event_bus.publish(arrow_event("blue", x))
+            event_bus.publish(arrow_event("red", x))
+        assert delivered == []
+
+        assert event_bus.flush_coalesced() == 2
+        assert [(e.arrow_color, e.position_data["x"]) for e in delivered] == [
+            ("blue", 9),
+            ("red", 9),
+        ]
+        assert event_bus.get_event_stats()["arrow.positioned"] == 2
+
+    def test_scheduler_called_once_per_burst(self, event_bus):
+        scheduled = []
+        delivered = []
+        event_bus.subscribe("arrow.positioned", lambda e: delivered.append(e))
+        event_bus.set_flush_scheduler(scheduled.append)
+        event_bus.enable_coalescing("arrow.positioned")
+
+        for x in range(5):
+            event_bus.publish(arrow_event(x=x))
+        assert len(scheduled) == 1
+
+        scheduled.pop()()
+        assert [e.position_data["x"] for e in delivered] == [4]
+
+        event_bus.publish(arrow_event(x=5))
+        assert len(scheduled) == 1
+
+    def test_disable_coalescing_flushes_and_resumes_direct_delivery(
+        self, event_bus
+    ):
+        delivered = []
+        event_bus.subscribe("arrow.positioned", lambda e: delivered.append(e))
+        event_bus.enable_coalescing("arrow.positioned")
+        event_bus.publish(arrow_event(x=1))
+
+        event_bus.disable_coalescing("arrow.positioned")
+        event_bus.publish(arrow_event(x=2))
+
+        assert [e.position_data["x"] for e in delivered] == [1, 2]
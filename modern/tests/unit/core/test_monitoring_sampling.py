@@ -0,0 +1,158 @@
+"""
+Unit tests for monitor_performance sampling
+
+Tests the sampling modes, memory modes and per-thread sample buffers.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from core.monitoring import (
+    MemoryMode,
+    SamplingMode,
+    configure_sampling,
+    monitor_performance,
+    performance_monitor,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_monitor():
+    original_policy = performance_monitor.sampling
+    performance_monitor.clear_metrics()
+    yield performance_monitor
+    performance_monitor.sampling = original_policy
+    performance_monitor.clear_metrics()
+
+
+@monitor_performance("sampled_operation", context={"layer": "test"})
+def sampled_operation(value, scale=1):
+    return value * scale
+
+
+def sample_count(operation="sampled_operation"):
+    stats = performance_monitor.get_operation_stats(operation)
+    return stats.count if stats else 0
+
+
+class TestSamplingModes:
+    def test_all_mode_measures_every_call(self):
+        configure_sampling(mode=SamplingMode.ALL, memory_mode=MemoryMode.NONE)
+        for i in range(25):
+            assert sampled_operation(i) == i
+        assert sample_count() == 25
+
+    def test_off_mode_measures_nothing(self):
+        configure_sampling(mode=SamplingMode.OFF)
+        for i in range(25):
+            assert sampled_operation(i, scale=2) == i * 2
+        assert sample_count() == 0
+
+    def test_every_nth_mode(self):
+        configure_sampling(
+            mode=SamplingMode.EVERY_NTH, every_n=10, memory_mode=MemoryMode.NONE
+        )
+        for i in range(100):
+            sampled_operation(i)
+        assert sample_count() == 10
+
+    def test_interval_mode(self):
+        configure_sampling(
+            mode=SamplingMode.INTERVAL, interval_s=60.0, memory_mode=MemoryMode.NONE
+        )
+        for i in range(100):
+            sampled_operation(i)
+        assert sample_count() == 1
+
+    def test_invalid_every_n_rejected(self):
+        with pytest.raises(ValueError):
+            configure_sampling(every_n=0)
+
+
+class TestMemoryModes:
+    def test_tracemalloc_mode_reports_allocations(self):
+        import tracemalloc
+
+        @monitor_performance("allocating_operation")
+        def allocate():
+            return bytearray(4 * 1024 * 1024)
+
+        configure_sampling(mode=SamplingMode.ALL, memory_mode=MemoryMode.TRACEMALLOC)
+        buffer = allocate()
+
+        stats = performance_monitor.get_operation_stats("allocating_operation")
+        assert stats.max_memory_mb >= 3.9
+        assert not tracemalloc.is_tracing()
+        del buffer
+
+    def test_none_mode_reports_zero(self):
+        configure_sampling(mode=SamplingMode.ALL, memory_mode=MemoryMode.NONE)
+        sampled_operation(1)
+        assert performance_monitor.get_operation_stats("sampled_operation").max_memory_mb == 0
+
+
+class TestThreadBuffers:
+    def test_samples_are_buffered_until_read(self):
+        configure_sampling(
+            mode=SamplingMode.ALL,
+            memory_mode=MemoryMode.NONE,
+            buffer_size=1000,
+            flush_interval_s=60.0,
+        )
+        for i in range(10):
+            sampled_operation(i)
+
+        # Nothing folded in yet; reading statistics flushes the buffers
+        assert len(performance_monitor.metrics) == 0
+        assert sample_count() == 10
+
+    def test_context_is_built_on_flush(self):
+        configure_sampling(mode=SamplingMode.ALL, memory_mode=MemoryMode.NONE)
+        sampled_operation(3, scale=2)
+        performance_monitor.flush()
+
+        context = performance_monitor.metrics[-1].context
+        assert context == {
+            "function": "sampled_operation",
+            "args_count": 1,
+            "kwargs_count": 1,
+            "layer": "test",
+        }
+
+    def test_samples_from_exited_threads_are_kept(self):
+        configure_sampling(
+            mode=SamplingMode.ALL,
+            memory_mode=MemoryMode.NONE,
+            buffer_size=1000,
+            flush_interval_s=60.0,
+        )
+
+        def worker():
+            for i in range(50):
+                sampled_operation(i)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sample_count() == 200
+
+    def test_buffer_flushes_when_full(self):
+        configure_sampling(
+            mode=SamplingMode.ALL,
+            memory_mode=MemoryMode.NONE,
+            buffer_size=5,
+            flush_interval_s=60.0,
+        )
+        for i in range(5):
+            sampled_operation(i)
+        assert len(performance_monitor.metrics) == 5
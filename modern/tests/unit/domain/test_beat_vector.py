@@ -0,0 +1,160 @@
+"""
+Unit tests for BeatVector
+
+Tests that persistent beat edits agree with plain list edits, that beat
+numbers follow position, and that versions share unchanged chunks.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from domain.models.beat_vector import CHUNK_SIZE, BeatVector, _Branch
+from domain.models.core_models import BeatData, SequenceData
+
+
+def make_beats(count, prefix="b"):
+    return [BeatData(id=f"{prefix}{i}", beat_number=i + 1) for i in range(count)]
+
+
+def ids(beats):
+    return [beat.id for beat in beats]
+
+
+def assert_numbered(beats):
+    assert [beat.beat_number for beat in beats] == list(range(1, len(beats) + 1))
+
+
+class TestBeatVectorEdits:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_edits_match_list_model(self, seed):
+        rng = random.Random(seed)
+        vector = BeatVector()
+        model = []
+        counter = 0
+
+        for _ in range(2000):
+            operation = rng.random()
+            if operation < 0.5 or not model:
+                index = rng.randint(0, len(model))
+                beat = BeatData(id=f"n{counter}")
+                counter += 1
+                vector = vector.inserted(index, beat)
+                model.insert(index, beat.id)
+            elif operation < 0.8:
+                index = rng.randrange(len(model))
+                vector = vector.removed(index)
+                model.pop(index)
+            else:
+                index = rng.randrange(len(model))
+                beat = BeatData(id=f"r{counter}")
+                counter += 1
+                vector = vector.replaced(index, beat)
+                model[index] = beat.id
+
+            assert len(vector) == len(model)
+
+        assert ids(vector) == model
+        assert [vector[i].id for i in range(len(model))] == model
+        assert_numbered(vector)
+
+    def test_bulk_build_round_trips(self):
+        beats = make_beats(CHUNK_SIZE * CHUNK_SIZE + 5)
+        vector = BeatVector(beats)
+        assert list(vector) == beats
+        assert vector[-1] == beats[-1]
+        assert vector[3:6] == beats[3:6]
+
+    def test_removing_everything_leaves_empty_vector(self):
+        vector = BeatVector(make_beats(100))
+        for _ in range(100):
+            vector = vector.removed(0)
+        assert len(vector) == 0
+        assert vector == []
+
+    def test_out_of_range_raises(self):
+        vector = BeatVector(make_beats(3))
+        with pytest.raises(IndexError):
+            vector[3]
+        with pytest.raises(IndexError):
+            vector.removed(5)
+        with pytest.raises(IndexError):
+            vector.inserted(4, BeatData())
+
+
+class TestImplicitNumbering:
+    def test_removal_renumbers_later_beats(self):
+        vector = BeatVector(make_beats(5)).removed(1)
+        assert ids(vector) == ["b0", "b2", "b3", "b4"]
+        assert_numbered(vector)
+
+    def test_renumbered_beats_are_stable_within_a_version(self):
+        vector = BeatVector(make_beats(5)).removed(0)
+        assert vector[0] is vector[0]
+        assert vector[0].id == "b1"
+
+    def test_original_version_keeps_its_numbers(self):
+        original = BeatVector(make_beats(5))
+        original.inserted(0, BeatData(id="new"))
+        assert_numbered(original)
+        assert ids(original) == ["b0", "b1", "b2", "b3", "b4"]
+
+
+class TestStructuralSharing:
+    def test_edit_shares_untouched_chunks(self):
+        original = BeatVector(make_beats(CHUNK_SIZE * 8))
+        edited = original.replaced(0, BeatData(id="x"))
+
+        assert isinstance(original._root, _Branch)
+        shared = [
+            old is new
+            for old, new in zip(original._root.children, edited._root.children)
+        ]
+        assert shared[0] is False
+        assert all(shared[1:])
+
+    def test_sequence_edits_share_structure(self):
+        sequence = SequenceData(beats=make_beats(CHUNK_SIZE * 4))
+        edited = sequence.update_beat(1, letter="A")
+
+        assert edited.beats[0].letter == "A"
+        assert sequence.beats[0].letter is None
+        assert edited.beats._root.children[-1] is sequence.beats._root.children[-1]
+
+
+class TestSequenceDataApi:
+    def test_list_construction_still_validates_numbers(self):
+        with pytest.raises(ValueError):
+            SequenceData(beats=[BeatData(beat_number=2)])
+
+    def test_add_insert_remove_update(self):
+        sequence = SequenceData.empty()
+        for beat in make_beats(3):
+            sequence = sequence.add_beat(beat)
+        sequence = sequence.insert_beat(2, BeatData(id="inserted"))
+        assert ids(sequence.beats) == ["b0", "inserted", "b1", "b2"]
+        assert sequence.get_beat(3).id == "b1"
+
+        sequence = sequence.remove_beat(1)
+        assert ids(sequence.beats) == ["inserted", "b1", "b2"]
+        assert_numbered(sequence.beats)
+
+        sequence = sequence.update_beat(2, letter="B")
+        assert sequence.get_beat(2).letter == "B"
+        assert sequence.get_beat(4) is None
+
+    def test_list_style_access_keeps_working(self):
+        sequence = SequenceData(beats=make_beats(3))
+        beats = sequence.beats.copy()
+        beats.append(BeatData(id="b3", beat_number=4))
+        extended = sequence.update(beats=beats)
+
+        assert extended.length == 4
+        assert sequence.beats + [] == make_beats(3)
+        assert SequenceData.from_dict(extended.to_dict()) == extended
@@ -0,0 +1,88 @@
+"""
+Unit tests for the compact core model representation
+
+Tests MotionData interning and slots, and lazy BeatData id generation.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from domain.models.core_models import (
+    BeatData,
+    Location,
+    MotionData,
+    MotionType,
+    RotationDirection,
+)
+
+
+def make_motion(**overrides):
+    fields = dict(
+        motion_type=MotionType.PRO,
+        prop_rot_dir=RotationDirection.CLOCKWISE,
+        start_loc=Location.NORTH,
+        end_loc=Location.EAST,
+        turns=1.0,
+    )
+    fields.update(overrides)
+    return MotionData(**fields)
+
+
+class TestMotionDataInterning:
+    def test_equal_motions_intern_to_same_instance(self):
+        first = make_motion().interned()
+        second = make_motion().interned()
+        assert first is second
+
+    def test_different_motions_stay_distinct(self):
+        assert make_motion().interned() is not make_motion(turns=2.0).interned()
+
+    def test_from_dict_returns_interned_instance(self):
+        motion = make_motion().interned()
+        assert MotionData.from_dict(motion.to_dict()) is motion
+
+    def test_motion_is_slotted_and_frozen(self):
+        motion = make_motion()
+        assert not hasattr(motion, "__dict__")
+        with pytest.raises(AttributeError):
+            motion.turns = 3.0  # type: ignore[misc]
+
+
+class TestBeatDataLazyId:
+    def test_id_generated_on_first_access(self):
+        beat = BeatData(letter="A")
+        assert not beat.has_id
+        beat_id = beat.id
+        assert beat.has_id
+        assert beat.id == beat_id
+
+    def test_explicit_id_is_kept(self):
+        beat = BeatData(id="beat-1")
+        assert beat.has_id
+        assert beat.id == "beat-1"
+
+    def test_update_preserves_id(self):
+        beat = BeatData(letter="A")
+        assert beat.update(beat_number=2).id == beat.id
+
+    def test_fresh_beats_have_distinct_ids(self):
+        assert BeatData().id != BeatData().id
+        assert BeatData() != BeatData()
+
+    def test_serialization_round_trips_id(self):
+        beat = BeatData(letter="A", blue_motion=make_motion().interned())
+        restored = BeatData.from_dict(beat.to_dict())
+        assert restored.id == beat.id
+        assert restored == beat
+        assert pickle.loads(pickle.dumps(beat)).id == beat.id
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            BeatData().missing_attribute  # noqa: B018
@@ -0,0 +1,112 @@
+"""
+Unit tests for the dataset snapshot
+
+Tests snapshot round-tripping, source-hash keying and automatic rebuilds when a
+source file changes.
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from infrastructure.data_path_handler import DataPathHandler
+from infrastructure.dataset_snapshot import (
+    COLUMNS,
+    DatasetSnapshot,
+    DatasetSnapshotStore,
+)
+
+
+class TempDataHandler:
+    """DataPathHandler stand-in rooted at a temporary data directory."""
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = data_dir
+        self.diamond_csv_path = data_dir / "DiamondPictographDataframe.csv"
+        self.box_csv_path = data_dir / "BoxPictographDataframe.csv"
+        self.arrow_placement_dir = data_dir / "arrow_placement"
+
+    load_diamond_dataset = DataPathHandler.load_diamond_dataset
+    load_box_dataset = DataPathHandler.load_box_dataset
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    source = DataPathHandler().data_dir
+    target = tmp_path / "data"
+    target.mkdir()
+    shutil.copy(source / "DiamondPictographDataframe.csv", target)
+    shutil.copy(source / "BoxPictographDataframe.csv", target)
+    shutil.copytree(
+        source / "arrow_placement" / "diamond" / "default",
+        target / "arrow_placement" / "diamond" / "default",
+    )
+    return target
+
+
+@pytest.fixture
+def store(data_dir, tmp_path):
+    return DatasetSnapshotStore(TempDataHandler(data_dir), tmp_path / "cache")
+
+
+class TestDatasetSnapshot:
+    """Test suite for DatasetSnapshotStore and DatasetSnapshot."""
+
+    def test_build_writes_memory_mapped_snapshot(self, store):
+        snapshot = store.load_or_build()
+
+        assert snapshot.path is not None and snapshot.path.exists()
+        assert set(snapshot.columns) == set(COLUMNS)
+        assert len(snapshot.columns["letter"]) > 0
+        assert not snapshot.columns["letter"].flags.writeable
+
+    def test_reload_reads_existing_snapshot(self, store, data_dir, tmp_path):
+        first = store.load_or_build()
+        fresh_store = DatasetSnapshotStore(
+            TempDataHandler(data_dir), tmp_path / "cache"
+        )
+        second = fresh_store.load_or_build()
+
+        assert second.path == first.path
+        assert (second.columns["start_pos"] == first.columns["start_pos"]).all()
+        assert second.vocabularies == first.vocabularies
+
+    def test_placement_json_round_trips(self, store, data_dir):
+        snapshot = store.load_or_build()
+        name = "arrow_placement/diamond/default/default_diamond_pro_placements.json"
+
+        expected = json.loads((data_dir / name).read_text(encoding="utf-8"))
+        assert snapshot.json_blob(name) == expected
+        assert name in snapshot.blob_names("arrow_placement/diamond/")
+        assert snapshot.json_blob("arrow_placement/missing.json") is None
+
+    def test_source_change_rebuilds_snapshot(self, store, data_dir, tmp_path):
+        old_snapshot = store.load_or_build()
+        old_count = len(old_snapshot.columns["letter"])
+
+        # Drop the first five data rows of the box dataset
+        csv_path = data_dir / "BoxPictographDataframe.csv"
+        lines = csv_path.read_text(encoding="utf-8").splitlines()
+        csv_path.write_text("\n".join(lines[:1] + lines[6:]) + "\n", encoding="utf-8")
+
+        fresh_store = DatasetSnapshotStore(
+            TempDataHandler(data_dir), tmp_path / "cache"
+        )
+        new_snapshot = fresh_store.load_or_build()
+
+        assert new_snapshot.path != old_snapshot.path
+        assert not old_snapshot.path.exists()
+        assert len(new_snapshot.columns["letter"]) == old_count - 5
+
+    def test_rejects_foreign_files(self, tmp_path):
+        path = tmp_path / "bogus.tkasnap"
+        path.write_bytes(b"not a snapshot at all")
+        with pytest.raises(ValueError):
+            DatasetSnapshot.open(path)
@@ -0,0 +1,127 @@
+"""
+Unit tests for the settings store
+
+Tests the in-memory document, debounced atomic writes, batching and change
+notifications.
+"""
+
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from infrastructure.file_modes import NEW_FILE_MODE
+from infrastructure.settings_store import SettingsStore, get_settings_store
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "user_settings.json"
+
+
+def read_file(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_loads_existing_file(path):
+    path.write_text(json.dumps({"user_settings": {"theme": "light"}}))
+    store = SettingsStore(path)
+
+    assert store.get("user_settings") == {"theme": "light"}
+    assert store.get("missing", 3) == 3
+
+
+def test_missing_or_invalid_file_loads_empty(path):
+    assert SettingsStore(path).load() == {}
+    path.write_text("{not json")
+    assert SettingsStore(path).load() == {}
+
+
+def test_changes_are_written_once_after_the_delay(path, monkeypatch):
+    store = SettingsStore(path, write_delay=0.2)
+    writes = []
+    write = store._write
+    monkeypatch.setattr(
+        store, "_write", lambda document: write(document) or writes.append(1)
+    )
+
+    for height in range(100, 150):
+        store.set("graph_editor_height", height)
+    timer = store._timer
+
+    assert not path.exists()
+    timer.join()
+    assert writes == [1]
+    assert read_file(path) == {"graph_editor_height": 149}
+    assert not list(path.parent.glob(".user_settings.json.*"))
+
+
+def test_unchanged_values_are_not_written(path):
+    store = SettingsStore(path, write_delay=60)
+    store.set("user_settings", {"theme": "dark"})
+    store.flush()
+
+    assert not store.set("user_settings", {"theme": "dark"})
+    assert store._timer is None
+
+
+def test_stored_values_are_copies(path):
+    store = SettingsStore(path, write_delay=60)
+    settings = {"theme": "dark"}
+    store.set("user_settings", settings)
+
+    settings["theme"] = "light"
+    store.get("user_settings")["theme"] = "light"
+
+    assert store.get("user_settings") == {"theme": "dark"}
+    assert store.set("user_settings", settings)
+
+
+def test_batch_notifies_once_with_all_changes(path):
+    store = SettingsStore(path, write_delay=60)
+    notifications = []
+    store.register_observer(notifications.append)
+
+    with store.batch():
+        store.set("window_maximized", True)
+        with store.batch():
+            store.update({"active_tab": "learn", "window_maximized": False})
+        assert notifications == []
+
+    assert notifications == [{"window_maximized": False, "active_tab": "learn"}]
+    store.flush()
+    assert read_file(path) == {"window_maximized": False, "active_tab": "learn"}
+
+    store.unregister_observer(notifications.append)
+    store.set("active_tab", "write")
+    assert len(notifications) == 1
+
+
+def test_written_file_has_default_or_existing_mode(path):
+    store = SettingsStore(path, write_delay=60)
+    store.set("active_tab", "learn")
+    store.flush()
+    assert stat.S_IMODE(os.stat(path).st_mode) == NEW_FILE_MODE
+
+    os.chmod(path, 0o644)
+    store.set("active_tab", "write")
+    store.flush()
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+
+def test_flush_without_changes_does_nothing(path):
+    SettingsStore(path).flush()
+
+    assert not path.exists()
+
+
+def test_store_is_shared_per_path(path):
+    assert get_settings_store(path) is get_settings_store(str(path))
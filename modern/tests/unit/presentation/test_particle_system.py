@@ -0,0 +1,198 @@
+"""
+Unit tests for the background particle system and frame pacing
+
+Tests the vectorized particle updates, the frame pacer's intervals, and that
+the particle backgrounds animate by elapsed time rather than by frame.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtWidgets import QWidget
+
+from presentation.components.backgrounds.aurora.blob_manager import BlobManager
+from presentation.components.backgrounds.aurora_background import AuroraBackground
+from presentation.components.backgrounds.bubbles_background import (
+    BubblesBackground,
+)
+from presentation.components.backgrounds.frame_pacer import FramePacer
+from presentation.components.backgrounds.particle_system import (
+    FRAME_INTERVAL,
+    ParticleSystem,
+)
+from presentation.components.backgrounds.snowfall.snowflake_field import (
+    SnowflakeField,
+)
+from presentation.components.backgrounds.snowfall_background import (
+    SnowfallBackground,
+)
+from presentation.components.backgrounds.starfield.star_manager import StarManager
+from presentation.components.backgrounds.starfield_background import (
+    StarfieldBackground,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_particles_step_by_velocity():
+    particles = ParticleSystem(4, seed=0)
+    particles.add_attribute("vx", np.array([1.0, 2.0, 3.0, 4.0]))
+    particles.add_attribute("vy", -1.0)
+
+    particles.step(0.5)
+
+    assert particles.x.tolist() == [0.5, 1.0, 1.5, 2.0]
+    assert particles.y.tolist() == [-0.5] * 4
+
+
+def test_respawn_only_changes_masked_particles():
+    particles = ParticleSystem(1000, seed=0)
+    particles.add_attribute("y", particles.uniform(0, 1))
+    particles.add_attribute("image_index", particles.integers(0, 3))
+    mask = particles.y < 0.5
+    kept = particles.image_index[~mask].copy()
+
+    respawned = particles.respawn(mask, y=2.0, image_index=particles.integers(5, 6))
+
+    assert respawned == np.count_nonzero(mask)
+    assert (particles.y[mask] == 2.0).all()
+    assert set(particles.image_index[mask].tolist()) == {5, 6}
+    assert (particles.image_index[~mask] == kept).all()
+
+
+def test_existing_attributes_keep_their_dtype():
+    particles = ParticleSystem(10, seed=0)
+    particles.add_attribute("x", particles.integers(0, 5))
+    particles.add_attribute("image_index", particles.integers(0, 5))
+
+    assert particles.x.dtype == np.float64
+    assert particles.image_index.dtype.kind == "i"
+
+
+def test_reverse_outside():
+    values = np.array([-0.1, 0.5, 1.2])
+    rates = np.array([-1.0, 1.0, 1.0])
+
+    ParticleSystem.reverse_outside(values, rates, 0, 1)
+
+    assert rates.tolist() == [1.0, 1.0, -1.0]
+
+
+def test_frame_pacer_intervals():
+    clock = FakeClock()
+    battery = [False]
+    pacer = FramePacer(clock=clock, battery_probe=lambda: battery[0])
+
+    assert pacer.interval_ms(visible=True) == FramePacer.ACTIVE_INTERVAL_MS
+    assert pacer.interval_ms(visible=False) == FramePacer.HIDDEN_INTERVAL_MS
+    assert (
+        pacer.interval_ms(visible=True, focused=False)
+        == FramePacer.IDLE_INTERVAL_MS
+    )
+
+    clock.now += FramePacer.IDLE_AFTER
+    assert pacer.interval_ms(visible=True) == FramePacer.IDLE_INTERVAL_MS
+    pacer.notify_input()
+    assert pacer.interval_ms(visible=True) == FramePacer.ACTIVE_INTERVAL_MS
+
+    # The battery is only checked again once BATTERY_CHECK_INTERVAL is up
+    battery[0] = True
+    assert pacer.interval_ms(visible=True) == FramePacer.ACTIVE_INTERVAL_MS
+    clock.now += FramePacer.BATTERY_CHECK_INTERVAL
+    pacer.notify_input()
+    assert pacer.interval_ms(visible=True) == FramePacer.BATTERY_INTERVAL_MS
+
+
+def test_frame_pacer_keeps_frames_within_cpu_budget():
+    pacer = FramePacer(clock=FakeClock(), battery_probe=lambda: False)
+    for _ in range(100):
+        pacer.record_frame(0.02)
+
+    assert pacer.interval_ms(visible=True) == pytest.approx(
+        0.02 / FramePacer.CPU_BUDGET * 1000, abs=1
+    )
+
+
+def test_snowflakes_fall_and_respawn_above():
+    field = SnowflakeField(500, 800, 600, 20)
+    start = field.particles.y.copy()
+
+    field.update(0.1)
+
+    fallen = field.particles.y < start
+    assert (field.particles.y[~fallen] > start[~fallen]).all()
+    assert (field.particles.y[fallen] <= 0).all()
+    assert field.particles.image_index.max() < 20
+    assert len(list(field.snowflakes())) == 500
+
+
+@pytest.mark.parametrize(
+    "create, animate, values",
+    [
+        (
+            lambda: StarManager(50),
+            lambda manager, dt: manager.animate_stars(dt),
+            lambda manager: manager.stars.twinkle_phase,
+        ),
+        (
+            lambda: BlobManager(3),
+            lambda manager, dt: manager.animate(dt),
+            lambda manager: manager.blobs.x,
+        ),
+    ],
+)
+def test_animation_follows_elapsed_time(create, animate, values):
+    by_frame = create()
+    by_time = create()
+    by_time.__dict__.update(
+        {
+            name: _copy_particles(value)
+            for name, value in by_frame.__dict__.items()
+            if isinstance(value, ParticleSystem)
+        }
+    )
+
+    for _ in range(4):
+        animate(by_frame, FRAME_INTERVAL / 2)
+    animate(by_time, FRAME_INTERVAL)
+    animate(by_time, FRAME_INTERVAL)
+
+    np.testing.assert_allclose(values(by_frame), values(by_time))
+
+
+def _copy_particles(particles):
+    copy = ParticleSystem(particles.count)
+    for name in particles.attribute_names:
+        copy.add_attribute(name, getattr(particles, name).copy())
+    return copy
+
+
+@pytest.mark.parametrize(
+    "background_class",
+    [SnowfallBackground, StarfieldBackground, AuroraBackground, BubblesBackground],
+)
+def test_backgrounds_animate_and_paint(qapp, background_class):
+    widget = QWidget()
+    widget.resize(320, 240)
+    background = background_class(widget)
+    image = QImage(320, 240, QImage.Format.Format_ARGB32_Premultiplied)
+
+    for dt in (FRAME_INTERVAL, 0.1, 0.01):
+        background.animate_background(dt)
+        painter = QPainter(image)
+        background.paint_background(widget, painter)
+        painter.end()
@@ -0,0 +1,168 @@
+"""
+Unit tests for PictographTileCache
+
+Tests the content hash, memory-bounded eviction, disk persistence across
+cache instances and the tiled PictographComponent path.
+"""
+
+import pytest
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+from PyQt6.QtCore import QPointF, QSize, Qt
+from PyQt6.QtGui import QEnterEvent, QImage
+from PyQt6.QtWidgets import QApplication
+
+from application.services.positioning.position_matching_service import (
+    PositionMatchingService,
+)
+from presentation.components.pictograph.pictograph_component import (
+    PictographComponent,
+)
+from presentation.components.pictograph import pictograph_tile_cache
+from presentation.components.pictograph.pictograph_tile_cache import (
+    PictographTileCache,
+    tile_key,
+)
+
+SIZE = QSize(64, 64)
+
+
+@pytest.fixture(scope="module")
+def options():
+    return PositionMatchingService().get_next_options("alpha1")
+
+
+def solid_image(color=Qt.GlobalColor.red, size=SIZE):
+    image = QImage(size, QImage.Format.Format_ARGB32)
+    image.fill(color)
+    return image
+
+
+class Renderer:
+    """Render callback that counts how often it runs."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return solid_image()
+
+
+class TestTileKey:
+    """Test suite for the content hash."""
+
+    def test_key_is_stable(self, options):
+        assert tile_key(options[0], SIZE) == tile_key(replace(options[0]), SIZE)
+
+    def test_key_covers_content_size_and_visibility(self, options):
+        beat = options[0]
+        hidden_tka = replace(
+            beat, glyph_data=replace(beat.glyph_data, show_tka=False)
+        )
+        keys = {
+            tile_key(beat, SIZE),
+            tile_key(options[1], SIZE),
+            tile_key(beat, QSize(65, 64)),
+            tile_key(hidden_tka, SIZE),
+        }
+        assert len(keys) == 4
+
+    def test_key_covers_assets(self, options, monkeypatch):
+        key = tile_key(options[0], SIZE)
+
+        monkeypatch.setattr(pictograph_tile_cache, "_asset_fingerprint", "changed")
+
+        assert tile_key(options[0], SIZE) != key
+
+
+class TestPictographTileCache:
+    """Test suite for memory and disk tile storage."""
+
+    def test_tile_rendered_once(self, qapp, tmp_path):
+        cache = PictographTileCache(cache_dir=tmp_path)
+        render = Renderer()
+
+        first = cache.get_tile("a", render)
+        second = cache.get_tile("a", render)
+
+        assert render.calls == 1
+        assert second is first
+        assert cache.stats()["hits"] == 1
+
+    def test_tiles_persist_between_sessions(self, qapp, tmp_path):
+        PictographTileCache(cache_dir=tmp_path).get_tile("a", Renderer())
+
+        cache = PictographTileCache(cache_dir=tmp_path)
+        render = Renderer()
+        tile = cache.get_tile("a", render)
+
+        assert render.calls == 0
+        assert cache.stats()["disk_hits"] == 1
+        assert tile.toImage().pixelColor(0, 0).name() == "#ff0000"
+
+    def test_memory_budget_evicts_least_recently_used(self, qapp, tmp_path):
+        tile_bytes = SIZE.width() * SIZE.height() * 4
+        cache = PictographTileCache(
+            cache_dir=tmp_path, max_memory_bytes=2 * tile_bytes
+        )
+        for key in ("a", "b", "a", "c"):
+            cache.get_tile(key, Renderer())
+
+        assert cache.stats()["tiles"] == 2
+        assert cache.stats()["memory_bytes"] <= 2 * tile_bytes
+        cache.get_tile("a", Renderer())
+        assert cache.stats()["disk_hits"] == 0
+
+    def test_disk_budget_prunes_tiles(self, qapp, tmp_path):
+        cache = PictographTileCache(cache_dir=tmp_path, max_disk_bytes=1)
+        for key in ("a", "b", "c"):
+            cache.get_tile(key, Renderer())
+
+        assert len(list(tmp_path.glob("*.png"))) < 3
+
+
+class TestTiledPictographComponent:
+    """Test suite for PictographComponent painting from tiles."""
+
+    def test_repeated_beat_skips_scene_render(self, qapp, tmp_path, options):
+        cache = PictographTileCache(cache_dir=tmp_path)
+        component = PictographComponent()
+        component.enable_tile_cache(cache)
+        component.resize(120, 120)
+        component.move(120, 120)
+        component.show()
+
+        component.update_from_beat(options[0])
+        component.update_from_beat(options[1])
+        assert cache.stats()["misses"] == 2
+
+        component.scene.update_beat = lambda beat: pytest.fail("scene re-rendered")
+        component.update_from_beat(options[0])
+
+        assert cache.stats()["hits"] == 1
+        assert component.grab().size() == component.size()
+        component.cleanup()
+
+    def test_hover_renders_live_scene(self, qapp, tmp_path, options):
+        component = PictographComponent()
+        component.enable_tile_cache(PictographTileCache(cache_dir=tmp_path))
+        component.resize(120, 120)
+        component.move(120, 120)
+        component.show()
+        for option in (options[1], options[0], options[1]):
+            component.update_from_beat(option)
+        assert component._scene_stale
+
+        QApplication.sendEvent(
+            component, QEnterEvent(QPointF(1, 1), QPointF(1, 1), QPointF(121, 121))
+        )
+        assert component.scene.beat_data is options[1]
+        assert component.scene.items()
+        component.cleanup()
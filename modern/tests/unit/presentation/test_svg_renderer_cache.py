@@ -0,0 +1,72 @@
+"""
+Unit tests for SvgRendererCache
+
+Tests that renderers are shared per (svg path, color hex), that the least
+recently used entry is evicted first, and that recoloring matches the
+per-draw transformation the renderers used to apply.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add modern/src to path for imports
+modern_src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(modern_src_path))
+
+
+from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import (
+    COLOR_MAP,
+    SvgRendererCache,
+    apply_color_transformation,
+    get_color_hex,
+)
+
+ARROW = get_image_path("arrows/pro/from_radial/pro_1.0.svg")
+GRID = get_image_path("grid/diamond_grid.svg")
+
+
+class TestSvgRendererCache:
+    """Test suite for the (path, color) renderer cache."""
+
+    def test_same_key_shares_renderer(self, qapp):
+        cache = SvgRendererCache()
+        blue = cache.get_renderer(ARROW, get_color_hex("blue"))
+
+        assert blue.isValid()
+        assert cache.get_renderer(ARROW, get_color_hex("blue")) is blue
+        assert cache.get_renderer(ARROW, get_color_hex("red")) is not blue
+        assert cache.stats() == {"hits": 1, "misses": 2, "size": 2}
+
+    def test_uncolored_renderer(self, qapp):
+        cache = SvgRendererCache()
+        grid = cache.get_renderer(GRID)
+
+        assert grid.isValid()
+        assert cache.get_renderer(GRID) is grid
+
+    def test_least_recently_used_evicted(self, qapp):
+        cache = SvgRendererCache(max_size=2)
+        blue = cache.get_renderer(ARROW, COLOR_MAP["blue"])
+        red = cache.get_renderer(ARROW, COLOR_MAP["red"])
+        cache.get_renderer(ARROW, COLOR_MAP["blue"])
+        cache.get_renderer(GRID)
+
+        assert len(cache) == 2
+        assert cache.get_renderer(ARROW, COLOR_MAP["blue"]) is blue
+        assert cache.get_renderer(ARROW, COLOR_MAP["red"]) is not red
+
+    def test_missing_file_is_invalid(self, qapp):
+        cache = SvgRendererCache()
+        assert not cache.get_renderer("missing.svg", COLOR_MAP["red"]).isValid()
+
+    def test_color_transformation(self):
+        svg = '<style>.st0 { fill: #000000; }</style><path fill="#111111" style="fill: #222222;"/>'
+
+        colored = apply_color_transformation(svg, COLOR_MAP["red"])
+
+        assert "#000000" not in colored and "#111111" not in colored
+        assert colored.count("#ED1C24") == 3
+        assert get_color_hex("RED") == "#ED1C24"
+        assert get_color_hex("green") == COLOR_MAP["blue"]